@@ -0,0 +1,83 @@
+"""
+Benchmark: API memory (RSS) under concurrent document downloads.
+
+Starts N concurrent downloads of the same document from a running API and
+samples the RSS of the API process while they run. With streaming downloads
+peak RSS should stay roughly flat as concurrency grows; with buffered
+downloads it grows by about (concurrency x file size).
+
+Usage (Linux, API running locally; 40MB document already uploaded):
+    python -m benchmarks.download_rss \\
+        --base-url http://localhost:8000/api/v1 --token $ACCESS_TOKEN \\
+        --document-id <uuid> --pid $(pgrep -f "uvicorn src.api.main") --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+import httpx
+
+
+def read_rss_mb(pid: int) -> float:
+    """Resident set size of ``pid`` in MB (summed with its children is up to the caller)."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+async def sample_rss(pid: int, samples: List[float], stop: asyncio.Event, interval: float) -> None:
+    while not stop.is_set():
+        samples.append(read_rss_mb(pid))
+        await asyncio.sleep(interval)
+
+
+async def download(client: httpx.AsyncClient, url: str) -> int:
+    received = 0
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+    return received
+
+
+async def run(args: argparse.Namespace) -> None:
+    url = f"{args.base_url.rstrip('/')}/documents/{args.document_id}/file"
+    headers = {"Authorization": f"Bearer {args.token}"}
+    samples: List[float] = []
+    stop = asyncio.Event()
+    baseline: Optional[float] = read_rss_mb(args.pid) if args.pid else None
+
+    sampler = asyncio.create_task(sample_rss(args.pid, samples, stop, args.interval)) if args.pid else None
+    limits = httpx.Limits(max_connections=args.concurrency)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(headers=headers, timeout=None, limits=limits, follow_redirects=True) as client:
+        sizes = await asyncio.gather(*(download(client, url) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    if sampler:
+        await sampler
+
+    total_mb = sum(sizes) / (1024 * 1024)
+    print(f"downloads:        {len(sizes)} x {sizes[0] / (1024 * 1024):.1f} MB")
+    print(f"elapsed:          {elapsed:.2f} s ({total_mb / elapsed:.1f} MB/s)")
+    if baseline is not None and samples:
+        print(f"API RSS baseline: {baseline:.1f} MB")
+        print(f"API RSS peak:     {max(samples):.1f} MB (+{max(samples) - baseline:.1f} MB)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", required=True, help="Access token")
+    parser.add_argument("--document-id", required=True)
+    parser.add_argument("--pid", type=int, help="API process id to sample RSS from")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.1, help="RSS sampling interval (s)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
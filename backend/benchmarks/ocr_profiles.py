@@ -0,0 +1,119 @@
+"""
+Benchmark: OCR throughput and character accuracy per Paddle engine profile.
+
+Runs every document of a corpus directory through each profile and reports
+pages/sec (OCR only; rasterization is done once up front and model loading
+is timed separately) and character accuracy (1 - character error rate)
+against ground-truth text.
+
+Corpus layout: one file per document (pdf, png, jpg, jpeg) and next to it a
+``<name>.txt`` with the expected text of all its pages. Whitespace is
+normalised before comparing.
+
+Usage (PaddleOCR installed, e.g. inside the worker image):
+    python -m benchmarks.ocr_profiles --corpus /data/ocr-corpus --profiles accurate fast
+    PADDLE_CPU_THREADS=4 python -m benchmarks.ocr_profiles --corpus /data/ocr-corpus
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from src.infrastructure.external.ocr.factory import OCRServiceFactory
+from src.infrastructure.external.ocr.paddle_config import PROFILES
+from src.infrastructure.external.ocr.rasterize import convert_to_images
+
+CORPUS_SUFFIXES = {".pdf": "pdf", ".png": "png", ".jpg": "jpg", ".jpeg": "jpeg"}
+
+
+def normalise(text: str) -> str:
+    return " ".join(text.split())
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance, one NumPy pass per character of ``a``."""
+    if not a or not b:
+        return len(a) or len(b)
+    codes = np.frombuffer(b.encode("utf-32-le"), dtype=np.uint32)
+    index = np.arange(len(b) + 1)
+    row = index.copy()
+    for i, char in enumerate(a, start=1):
+        # Deletion / substitution from the previous row...
+        candidate = np.empty_like(row)
+        candidate[0] = i
+        candidate[1:] = np.minimum(row[1:] + 1, row[:-1] + (codes != ord(char)))
+        # ...then insertions along the row: min over k <= j of candidate[k] + (j - k)
+        row = np.minimum.accumulate(candidate - index) + index
+    return int(row[-1])
+
+
+def character_accuracy(predicted: str, expected: str) -> float:
+    expected, predicted = normalise(expected), normalise(predicted)
+    if not expected:
+        return 1.0 if not predicted else 0.0
+    return max(0.0, 1.0 - edit_distance(predicted, expected) / len(expected))
+
+
+def load_corpus(corpus: Path) -> List[Tuple[str, list, str]]:
+    """(name, page images, expected text) per document with a ground-truth file."""
+    documents = []
+    for path in sorted(corpus.iterdir()):
+        file_type = CORPUS_SUFFIXES.get(path.suffix.lower())
+        truth = path.with_suffix(".txt")
+        if file_type is None or not truth.exists():
+            continue
+        images = convert_to_images(path.read_bytes(), file_type)
+        documents.append((path.name, images, truth.read_text(encoding="utf-8")))
+    return documents
+
+
+def run_profile(profile: str, documents: List[Tuple[str, list, str]], verbose: bool) -> dict:
+    started = time.perf_counter()
+    service = OCRServiceFactory.create("paddleocr", profile=profile)
+    load_seconds = time.perf_counter() - started
+
+    pages = 0
+    ocr_seconds = 0.0
+    accuracies = []
+    for name, images, expected in documents:
+        started = time.perf_counter()
+        result = service.extract_text_from_images(images)
+        elapsed = time.perf_counter() - started
+        accuracy = character_accuracy(result.text, expected)
+        pages += len(images)
+        ocr_seconds += elapsed
+        accuracies.append(accuracy)
+        if verbose:
+            print(f"  {profile:<10} {name:<40} {len(images):>3} pages {elapsed:7.2f} s  accuracy {accuracy:.3f}")
+
+    return {
+        "profile": profile,
+        "load_seconds": load_seconds,
+        "pages": pages,
+        "pages_per_second": pages / ocr_seconds if ocr_seconds else 0.0,
+        "accuracy": sum(accuracies) / len(accuracies) if accuracies else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory with documents and <name>.txt ground truth")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument("--verbose", action="store_true", help="Print a line per document")
+    args = parser.parse_args()
+
+    documents = load_corpus(args.corpus)
+    if not documents:
+        parser.error(f"No documents with ground truth found in {args.corpus}")
+    print(f"corpus: {len(documents)} documents, {sum(len(d[1]) for d in documents)} pages")
+
+    results = [run_profile(profile, documents, args.verbose) for profile in args.profiles]
+    print(f"{'profile':<10} {'model load':>10} {'pages/sec':>10} {'char accuracy':>14}")
+    for r in results:
+        print(f"{r['profile']:<10} {r['load_seconds']:>9.1f}s {r['pages_per_second']:>10.2f} {r['accuracy']:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: Redis queue throughput, per item vs batched, JSON vs versioned orjson.
+
+Against a local Redis (a scratch key prefix is used and deleted afterwards):
+
+- codec:   json.dumps/loads vs encode_message/decode_message on a typical job
+- single:  N x RedisQueue.enqueue, then N x dequeue (one round trip each)
+- batched: enqueue_many + dequeue_many in batches of --batch
+- fair:    FairQueue.enqueue_many into the bulk lane, then dequeue + ack per job
+
+and prints jobs/s for each. Round trips dominate the single path, so the gap
+grows with network latency; run against a remote Redis to see it widen.
+
+Usage:
+    python -m benchmarks.redis_queue_throughput --redis-url redis://localhost:6379/0 --jobs 20000
+"""
+import argparse
+import json
+import os
+import time
+from uuid import uuid4
+
+from src.infrastructure.messaging.fair_queue import FairQueue, Lane
+from src.infrastructure.messaging.redis_queue import RedisQueue
+from src.infrastructure.messaging.serialization import decode_message, encode_message
+
+
+def _job(n: int) -> dict:
+    return {"document_id": str(uuid4()), "user_id": str(uuid4()), "attempt": 0, "n": n}
+
+
+def report(name: str, jobs: int, elapsed: float) -> None:
+    print(f"{name:<8} {jobs:>7} jobs  {elapsed:8.3f} s  {jobs / max(elapsed, 1e-9):12,.0f} jobs/s")
+
+
+def bench_codec(jobs):
+    started = time.perf_counter()
+    for job in jobs:
+        json.loads(json.dumps(job))
+    report("json", len(jobs), time.perf_counter() - started)
+    started = time.perf_counter()
+    for job in jobs:
+        decode_message(encode_message(job))
+    report("orjson", len(jobs), time.perf_counter() - started)
+
+
+def bench_single(queue: RedisQueue, key: str, jobs) -> None:
+    started = time.perf_counter()
+    for job in jobs:
+        queue.enqueue(key, job)
+    for _ in jobs:
+        queue.dequeue(key, timeout=1)
+    report("single", len(jobs), time.perf_counter() - started)
+
+
+def bench_batched(queue: RedisQueue, key: str, jobs, batch: int) -> None:
+    started = time.perf_counter()
+    for start in range(0, len(jobs), batch):
+        queue.enqueue_many(key, jobs[start:start + batch])
+    while queue.dequeue_many(key, batch):
+        pass
+    report("batched", len(jobs), time.perf_counter() - started)
+
+
+def bench_fair(queue: RedisQueue, key: str, jobs, batch: int) -> None:
+    fair = FairQueue(queue, key)
+    started = time.perf_counter()
+    for start in range(0, len(jobs), batch):
+        fair.enqueue_many(Lane.BULK, "bench", jobs[start:start + batch])
+    task = fair.dequeue()
+    while task is not None:
+        fair.ack(task)
+        task = fair.dequeue()
+    report("fair", len(jobs), time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--jobs", type=int, default=20000, help="Jobs per run")
+    parser.add_argument("--batch", type=int, default=500, help="Jobs per enqueue_many/dequeue_many")
+    args = parser.parse_args()
+
+    queue = RedisQueue(args.redis_url)
+    queue.redis_client.ping()
+    prefix = f"bench:{uuid4().hex[:8]}"
+    jobs = [_job(n) for n in range(args.jobs)]
+    try:
+        bench_codec(jobs)
+        bench_single(queue, f"{prefix}:single", jobs)
+        bench_batched(queue, f"{prefix}:batched", jobs, args.batch)
+        bench_fair(queue, f"{prefix}:fair", jobs, args.batch)
+    finally:
+        keys = list(queue.redis_client.scan_iter(f"{prefix}*"))
+        if keys:
+            queue.redis_client.delete(*keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+-- Upgrade an existing database to the month-partitioned audit_trails layout.
+-- Fresh installs get this layout directly from init.sql.
+BEGIN;
+
+ALTER TABLE audit_trails RENAME TO audit_trails_legacy;
+ALTER INDEX IF EXISTS idx_audit_document_id RENAME TO idx_audit_legacy_document_id;
+ALTER INDEX IF EXISTS idx_audit_performed_at RENAME TO idx_audit_legacy_performed_at;
+
+CREATE TABLE audit_trails (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    action VARCHAR(50) NOT NULL,
+    performed_by UUID NOT NULL REFERENCES users(id),
+    performed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    changes JSONB,
+    audit_metadata JSONB,
+    PRIMARY KEY (id, performed_at)
+) PARTITION BY RANGE (performed_at);
+
+CREATE TABLE audit_trails_default PARTITION OF audit_trails DEFAULT;
+
+CREATE INDEX idx_audit_document_id ON audit_trails(document_id);
+CREATE INDEX idx_audit_performed_at ON audit_trails(performed_at);
+
+-- Create monthly partitions from the current month up to months_ahead months ahead
+CREATE OR REPLACE FUNCTION audit_trails_ensure_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE;
+    partition_name TEXT;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        month_start := (date_trunc('month', NOW()) + make_interval(months => i))::DATE;
+        partition_name := 'audit_trails_' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF audit_trails FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + INTERVAL '1 month')::DATE
+            );
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop monthly partitions whose whole range is older than cutoff; returns the number dropped
+CREATE OR REPLACE FUNCTION audit_trails_drop_partitions_before(cutoff TIMESTAMP WITH TIME ZONE)
+RETURNS INTEGER AS $$
+DECLARE
+    part RECORD;
+    dropped INTEGER := 0;
+BEGIN
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'audit_trails'::regclass
+          AND c.relname ~ '^audit_trails_[0-9]{4}_[0-9]{2}$'
+    LOOP
+        IF to_date(substring(part.relname FROM 14), 'YYYY_MM') + INTERVAL '1 month' <= cutoff THEN
+            EXECUTE format('DROP TABLE %I', part.relname);
+            dropped := dropped + 1;
+        END IF;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT audit_trails_ensure_partitions(3);
+
+INSERT INTO audit_trails (id, document_id, action, performed_by, performed_at, changes, audit_metadata)
+SELECT id, document_id, action, performed_by, COALESCE(performed_at, NOW()), changes, audit_metadata
+FROM audit_trails_legacy;
+
+DROP TABLE audit_trails_legacy;
+
+COMMIT;
@@ -0,0 +1,3 @@
+-- Raw OCR text and layout can be offloaded to compressed objects in storage;
+-- raw_text_key references that object and raw_text is left NULL.
+ALTER TABLE extractions ADD COLUMN IF NOT EXISTS raw_text_key VARCHAR(500);
@@ -0,0 +1,31 @@
+-- Bulk re-validation: one validation result per extraction (upserted in bulk)
+-- and a checkpoint table so interrupted jobs resume where they stopped.
+-- Fresh installs get this layout directly from init.sql.
+BEGIN;
+
+-- Keep only the latest result per extraction before enforcing uniqueness
+DELETE FROM validation_results v
+USING validation_results newer
+WHERE v.extraction_id = newer.extraction_id
+  AND (v.validated_at, v.id) < (newer.validated_at, newer.id);
+
+DROP INDEX IF EXISTS idx_validation_extraction_id;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_validation_extraction_id ON validation_results(extraction_id);
+
+CREATE TABLE IF NOT EXISTS revalidation_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    rules_version VARCHAR(64) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    processed INTEGER NOT NULL DEFAULT 0,
+    status_counts JSONB NOT NULL DEFAULT '{}'::jsonb,
+    last_extraction_id UUID,
+    error_message TEXT,
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_revalidation_jobs_status ON revalidation_jobs(status);
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- The exports table doubles as the transactional outbox: PENDING rows are
+-- claimed by the export relay (FOR UPDATE SKIP LOCKED) once next_attempt_at
+-- has passed; failed attempts push next_attempt_at back with backoff.
+ALTER TABLE exports ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW();
+ALTER TABLE exports ADD COLUMN IF NOT EXISTS last_attempt_at TIMESTAMP WITH TIME ZONE;
+
+CREATE INDEX IF NOT EXISTS idx_exports_due ON exports(next_attempt_at) WHERE export_status = 'PENDING';
+
+-- One row per delivery attempt
+CREATE TABLE IF NOT EXISTS export_attempts (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    export_id UUID NOT NULL REFERENCES exports(id) ON DELETE CASCADE,
+    attempt INTEGER NOT NULL,
+    success BOOLEAN NOT NULL,
+    status_code INTEGER,
+    error_message TEXT,
+    duration_ms INTEGER,
+    attempted_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_export_attempts_export_id ON export_attempts(export_id);
@@ -34,6 +34,7 @@ CREATE TABLE IF NOT EXISTS extractions (
     document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
     extraction_method VARCHAR(20) NOT NULL,
     raw_text TEXT,
+    raw_text_key VARCHAR(500),
     structured_data JSONB NOT NULL,
     confidence_scores JSONB,
     extracted_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -54,7 +55,25 @@ CREATE TABLE IF NOT EXISTS validation_results (
     validated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
-CREATE INDEX IF NOT EXISTS idx_validation_extraction_id ON validation_results(extraction_id);
+-- One result per extraction: re-validation upserts on extraction_id
+CREATE UNIQUE INDEX IF NOT EXISTS idx_validation_extraction_id ON validation_results(extraction_id);
+
+-- Checkpoints of bulk re-validation jobs (see src/workers/revalidation_job.py)
+CREATE TABLE IF NOT EXISTS revalidation_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    rules_version VARCHAR(64) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    processed INTEGER NOT NULL DEFAULT 0,
+    status_counts JSONB NOT NULL DEFAULT '{}'::jsonb,
+    last_extraction_id UUID,
+    error_message TEXT,
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_revalidation_jobs_status ON revalidation_jobs(status);
 
 -- Create reviews table
 CREATE TABLE IF NOT EXISTS reviews (
@@ -71,20 +90,70 @@ CREATE TABLE IF NOT EXISTS reviews (
 CREATE INDEX IF NOT EXISTS idx_reviews_document_id ON reviews(document_id);
 CREATE INDEX IF NOT EXISTS idx_reviews_reviewed_by ON reviews(reviewed_by);
 
--- Create audit_trails table
+-- Create audit_trails table, range-partitioned by month on performed_at so
+-- retention pruning is a partition drop instead of a mass DELETE.
 CREATE TABLE IF NOT EXISTS audit_trails (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
     document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
     action VARCHAR(50) NOT NULL,
     performed_by UUID NOT NULL REFERENCES users(id),
-    performed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    performed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     changes JSONB,
-    audit_metadata JSONB
-);
+    audit_metadata JSONB,
+    PRIMARY KEY (id, performed_at)
+) PARTITION BY RANGE (performed_at);
+
+-- Catch-all for rows outside the pre-created monthly partitions
+CREATE TABLE IF NOT EXISTS audit_trails_default PARTITION OF audit_trails DEFAULT;
 
 CREATE INDEX IF NOT EXISTS idx_audit_document_id ON audit_trails(document_id);
 CREATE INDEX IF NOT EXISTS idx_audit_performed_at ON audit_trails(performed_at);
 
+-- Create monthly partitions from the current month up to months_ahead months ahead
+CREATE OR REPLACE FUNCTION audit_trails_ensure_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE;
+    partition_name TEXT;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        month_start := (date_trunc('month', NOW()) + make_interval(months => i))::DATE;
+        partition_name := 'audit_trails_' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF audit_trails FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + INTERVAL '1 month')::DATE
+            );
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop monthly partitions whose whole range is older than cutoff; returns the number dropped
+CREATE OR REPLACE FUNCTION audit_trails_drop_partitions_before(cutoff TIMESTAMP WITH TIME ZONE)
+RETURNS INTEGER AS $$
+DECLARE
+    part RECORD;
+    dropped INTEGER := 0;
+BEGIN
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'audit_trails'::regclass
+          AND c.relname ~ '^audit_trails_[0-9]{4}_[0-9]{2}$'
+    LOOP
+        IF to_date(substring(part.relname FROM 14), 'YYYY_MM') + INTERVAL '1 month' <= cutoff THEN
+            EXECUTE format('DROP TABLE %I', part.relname);
+            dropped := dropped + 1;
+        END IF;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT audit_trails_ensure_partitions(3);
+
 -- Create exports table
 CREATE TABLE IF NOT EXISTS exports (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -95,11 +164,29 @@ CREATE TABLE IF NOT EXISTS exports (
     exported_at TIMESTAMP WITH TIME ZONE,
     retry_count INTEGER DEFAULT 0,
     error_message TEXT,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    -- Outbox scheduling (see migrations/005_export_outbox.sql)
+    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    last_attempt_at TIMESTAMP WITH TIME ZONE
 );
 
 CREATE INDEX IF NOT EXISTS idx_exports_document_id ON exports(document_id);
 CREATE INDEX IF NOT EXISTS idx_exports_status ON exports(export_status);
+CREATE INDEX IF NOT EXISTS idx_exports_due ON exports(next_attempt_at) WHERE export_status = 'PENDING';
+
+-- Delivery attempts of exports
+CREATE TABLE IF NOT EXISTS export_attempts (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    export_id UUID NOT NULL REFERENCES exports(id) ON DELETE CASCADE,
+    attempt INTEGER NOT NULL,
+    success BOOLEAN NOT NULL,
+    status_code INTEGER,
+    error_message TEXT,
+    duration_ms INTEGER,
+    attempted_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_export_attempts_export_id ON export_attempts(export_id);
 
 -- Insert default admin user (password: admin123 - to be changed in production!)
 -- Password hash for 'admin123' using bcrypt
@@ -3,8 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import os
 
-from .routes import auth, documents, extractions, validations, reviews, exports
+from .routes import auth, documents, extractions, validations, reviews, exports, events, admin
 from .routes import health as health_router
+from .dependencies import get_audit_sink
 from ..infrastructure.monitoring.logging import get_logger
 
 logger = get_logger("sortex.api")
@@ -22,7 +23,8 @@ app.add_middleware(
     allow_origins=cors_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type", "Accept", "X-Requested-With"],
+    allow_headers=["Authorization", "Content-Type", "Accept", "X-Requested-With", "If-None-Match"],
+    expose_headers=["ETag"],
     max_age=600,
 )
 
@@ -33,6 +35,8 @@ app.include_router(extractions.router, prefix="/api/v1", tags=["extractions"])
 app.include_router(validations.router, prefix="/api/v1", tags=["validations"])
 app.include_router(reviews.router, prefix="/api/v1", tags=["reviews"])
 app.include_router(exports.router, prefix="/api/v1", tags=["exports"])
+app.include_router(events.router, prefix="/api/v1", tags=["events"])
+app.include_router(admin.router, prefix="/api/v1", tags=["admin"])
 
 
 @app.get("/")
@@ -43,6 +47,14 @@ async def root():
 app.include_router(health_router.router, tags=["health"])
 
 
+@app.on_event("shutdown")
+def flush_audit_sink():
+    """Write any buffered audit events before the process exits."""
+    audit_sink = get_audit_sink()
+    if audit_sink is not None:
+        audit_sink.close()
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     logger.error(
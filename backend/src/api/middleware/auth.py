@@ -1,5 +1,5 @@
 from typing import Optional
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, status, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from uuid import UUID
 
@@ -12,7 +12,30 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> dict:
     """Get current authenticated user from JWT token"""
-    token = credentials.credentials
+    return _user_from_token(credentials.credentials)
+
+
+async def get_stream_user(
+    access_token: Optional[str] = Query(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+) -> dict:
+    """Get current user for event streams.
+
+    Browsers' EventSource cannot set headers, so the access token may also be
+    passed as the ``access_token`` query parameter.
+    """
+    token = credentials.credentials if credentials else access_token
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return _user_from_token(token)
+
+
+def _user_from_token(token: str) -> dict:
+    """Decode an access token into the current-user dict"""
     payload = decode_token(token)
     
     if payload is None:
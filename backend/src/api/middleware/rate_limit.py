@@ -9,6 +9,7 @@ from collections import defaultdict
 import redis
 from fastapi import Request, HTTPException
 
+from ...infrastructure.messaging.redis_client import get_redis
 from ...infrastructure.monitoring.logging import get_logger
 
 logger = get_logger("sortex.middleware.rate_limit")
@@ -33,7 +34,7 @@ class RateLimiter:
 
     def _init_redis(self) -> None:
         try:
-            self._redis = redis.from_url(REDIS_URL, socket_connect_timeout=2)
+            self._redis = get_redis(REDIS_URL)
             self._redis.ping()
         except Exception:
             logger.warning("Redis unavailable for rate limiting — using in-memory fallback")
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+
+from ...application.dtos.dead_letter_dto import (
+    DeadLetterActionDTO, DeadLetterActionResultDTO, DeadLetterEntryDTO, DeadLetterListDTO,
+)
+from ...infrastructure.error_handling.dead_letter_queue import DeadLetterQueue
+from ...infrastructure.auth.rbac import get_permission_checker, Permission
+from ...api.dependencies import get_redis_queue
+from ...infrastructure.monitoring.logging import get_logger
+
+router = APIRouter()
+logger = get_logger("sortex.api.admin")
+
+
+@router.get("/admin/dlq", response_model=DeadLetterListDTO)
+async def list_dead_letters(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    current_user: dict = Depends(get_permission_checker(Permission.ADMIN)),
+    redis_queue=Depends(get_redis_queue),
+):
+    """Failed jobs, newest first (read-only: entries stay in the dead-letter queue)"""
+    dlq = DeadLetterQueue(redis_queue)
+    return DeadLetterListDTO(
+        entries=[DeadLetterEntryDTO(**entry) for entry in dlq.get_failed_jobs(limit=limit, offset=offset)],
+        total=dlq.count(),
+    )
+
+
+@router.post("/admin/dlq/requeue", response_model=DeadLetterActionResultDTO)
+async def requeue_dead_letters(
+    request: DeadLetterActionDTO,
+    current_user: dict = Depends(get_permission_checker(Permission.ADMIN)),
+    redis_queue=Depends(get_redis_queue),
+):
+    """Send failed jobs back to their queue (all of the newest ``limit`` when no ids are given)"""
+    count = DeadLetterQueue(redis_queue).requeue(request.ids, limit=request.limit)
+    logger.info("Dead letters requeued", count=count, user_id=str(current_user["id"]))
+    return DeadLetterActionResultDTO(count=count)
+
+
+@router.post("/admin/dlq/discard", response_model=DeadLetterActionResultDTO)
+async def discard_dead_letters(
+    request: DeadLetterActionDTO,
+    current_user: dict = Depends(get_permission_checker(Permission.ADMIN)),
+    redis_queue=Depends(get_redis_queue),
+):
+    """Drop failed jobs for good"""
+    if not request.ids:
+        raise HTTPException(status_code=400, detail="ids are required")
+    count = DeadLetterQueue(redis_queue).discard(request.ids, limit=request.limit)
+    logger.info("Dead letters discarded", count=count, user_id=str(current_user["id"]))
+    return DeadLetterActionResultDTO(count=count)
@@ -1,33 +1,68 @@
 from datetime import datetime
-from typing import Optional
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from typing import List, Optional
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, BackgroundTasks, Query, Request, Response
+from fastapi.responses import JSONResponse, RedirectResponse
 from uuid import UUID
 from sqlalchemy.orm import Session
 import os
 import threading
 
 from ...application.use_cases.upload_document import UploadDocumentUseCase
-from ...application.use_cases.trigger_extraction import TriggerExtractionUseCase
-from ...application.dtos.document_dto import DocumentDTO, DocumentListDTO
-from ...infrastructure.persistence.repositories import DocumentRepository, AuditTrailRepository, ExtractionRepository
+from ...application.use_cases.bulk_upload_documents import BulkUploadDocumentsUseCase
+from ...application.use_cases.direct_upload import DirectUploadUseCase
+from ...application.use_cases.trigger_extraction import TriggerExtractionUseCase, enqueue_extractions
+from ...infrastructure.messaging.fair_queue import Lane
+from ...application.use_cases.generate_previews import enqueue_previews
+from ...application.dtos.document_dto import (
+    DocumentDTO,
+    DocumentListDTO,
+    BulkUploadResultDTO,
+    DirectUploadDTO,
+    DirectUploadRequest,
+    FinalizeUploadRequest,
+    PagePreviewManifestDTO,
+)
+from ...infrastructure.persistence.repositories import (
+    DocumentRepository, AuditTrailRepository, ExtractionRepository, ValidationResultRepository
+)
 from ...infrastructure.external.storage.base import StorageService
+from ...infrastructure.external.storage.page_previews import PagePreviewStore
 from ...api.middleware.auth import get_current_user
+from ...api.etag import make_etag, is_not_modified, not_modified, set_etag
+from ...api.streaming import stream_file
 from ...infrastructure.auth.rbac import get_permission_checker, Permission
 from ...api.dependencies import (
     get_db_session,
+    get_audit_sink,
+    get_extraction_checkpoint_store,
+    get_ocr_artifact_store,
+    get_page_image_store,
+    get_page_preview_store,
+    get_redis_queue,
     get_storage_service,
     get_database,
     get_ocr_service,
     get_llm_service,
     get_document_type_classifier,
+    get_validation_engine,
 )
 from ...infrastructure.monitoring.logging import get_logger
+from ...infrastructure.monitoring.metrics import MetricsCollector
 from ...domain.entities.document import DocumentStatus
 
 router = APIRouter()
 
 
+def _queue_previews(redis_queue, documents: List[DocumentDTO]) -> None:
+    """Queue page preview rendering; a failure only leaves the documents without previews."""
+    if get_page_preview_store() is None or not documents:
+        return
+    try:
+        enqueue_previews(redis_queue, documents)
+    except Exception as e:
+        get_logger("sortex.api.documents").error("Failed to queue page previews", error=str(e), count=len(documents))
+
+
 @router.post("/documents", response_model=DocumentDTO)
 async def upload_document(
     background_tasks: BackgroundTasks,
@@ -38,6 +73,7 @@ async def upload_document(
     ocr_service=Depends(get_ocr_service),
     llm_service=Depends(get_llm_service),
     document_type_classifier=Depends(get_document_type_classifier),
+    redis_queue=Depends(get_redis_queue),
 ):
     """Upload a document"""
     logger = get_logger("sortex.api.documents")
@@ -46,7 +82,7 @@ async def upload_document(
         logger.info("Document upload started", filename=file.filename, user_id=str(current_user["id"]))
         
         document_repo = DocumentRepository(session)
-        audit_repo = AuditTrailRepository(session)
+        audit_repo = AuditTrailRepository(session, sink=get_audit_sink())
         
         use_case = UploadDocumentUseCase(
             document_repository=document_repo,
@@ -60,14 +96,25 @@ async def upload_document(
         session.commit()
         logger.info("Document upload successful", document_id=str(document.id))
         
-        trigger_uc = TriggerExtractionUseCase(
-            database=get_database(),
-            storage_service=storage_service,
-            ocr_service=ocr_service,
-            llm_service=llm_service,
-            document_type_classifier=document_type_classifier,
-        )
-        background_tasks.add_task(trigger_uc.execute, document.id)
+        try:
+            enqueue_extractions(redis_queue, [document.id], Lane.UPLOAD, current_user["id"])
+        except Exception as e:
+            # No queue: extract in this process after the response
+            logger.warning("Failed to queue extraction, running it in-process", error=str(e), document_id=str(document.id))
+            trigger_uc = TriggerExtractionUseCase(
+                database=get_database(),
+                storage_service=storage_service,
+                ocr_service=ocr_service,
+                llm_service=llm_service,
+                document_type_classifier=document_type_classifier,
+                audit_sink=get_audit_sink(),
+                ocr_artifact_store=get_ocr_artifact_store(),
+                page_image_store=get_page_image_store(),
+                validation_engine=get_validation_engine(),
+                checkpoint_store=get_extraction_checkpoint_store(),
+            )
+            background_tasks.add_task(trigger_uc.execute, document.id)
+        _queue_previews(redis_queue, [document])
         
         return document
     except Exception as e:
@@ -76,6 +123,127 @@ async def upload_document(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/documents/bulk", response_model=BulkUploadResultDTO)
+def bulk_upload_documents(  # sync: runs in the threadpool so long batches don't block the event loop
+    files: List[UploadFile] = File(...),
+    current_user: dict = Depends(get_permission_checker(Permission.UPLOAD)),
+    session: Session = Depends(get_db_session),
+    storage_service: StorageService = Depends(get_storage_service),
+    redis_queue=Depends(get_redis_queue),
+):
+    """Upload many documents at once (multiple files and/or .zip archives).
+
+    Files are streamed to storage one by one; invalid files are reported in
+    ``rejected`` without failing the batch. Accepted documents are committed
+    together and their extractions are queued for the extraction worker.
+    """
+    logger = get_logger("sortex.api.documents")
+    logger.info("Bulk upload started", file_count=len(files), user_id=str(current_user["id"]))
+
+    use_case = BulkUploadDocumentsUseCase(
+        document_repository=DocumentRepository(session),
+        audit_trail_repository=AuditTrailRepository(session, sink=get_audit_sink()),
+        storage_service=storage_service,
+        max_file_size_mb=int(os.getenv("MAX_FILE_SIZE_MB", "10")),
+        allowed_file_types=os.getenv("ALLOWED_FILE_TYPES", "pdf,png,jpg,jpeg").split(","),
+        max_files=int(os.getenv("BULK_UPLOAD_MAX_FILES", "500")),
+    )
+    try:
+        result = use_case.execute([(f.filename, f.file) for f in files], current_user["id"])
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.error("Bulk upload failed", error=str(e), error_type=type(e).__name__)
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        enqueue_extractions(redis_queue, [d.id for d in result.documents], Lane.BULK, current_user["id"])
+    except Exception as e:
+        # Documents stay UPLOADED and can be reprocessed
+        logger.error("Failed to queue bulk extractions", error=str(e), count=result.accepted)
+    _queue_previews(redis_queue, result.documents)
+
+    MetricsCollector.record_bulk_upload(
+        accepted=result.accepted,
+        rejected=len(result.rejected),
+        total_bytes=result.total_bytes,
+        duration=result.elapsed_seconds,
+    )
+    logger.info(
+        "Bulk upload completed",
+        total_files=result.total_files,
+        accepted=result.accepted,
+        rejected=len(result.rejected),
+        total_bytes=result.total_bytes,
+        elapsed_seconds=result.elapsed_seconds,
+        files_per_second=result.files_per_second,
+        megabytes_per_second=result.megabytes_per_second,
+    )
+    return result
+
+
+def _direct_upload_use_case(session: Session, storage_service: StorageService) -> DirectUploadUseCase:
+    return DirectUploadUseCase(
+        document_repository=DocumentRepository(session),
+        audit_trail_repository=AuditTrailRepository(session, sink=get_audit_sink()),
+        storage_service=storage_service,
+        max_file_size_mb=int(os.getenv("MAX_FILE_SIZE_MB", "10")),
+        allowed_file_types=os.getenv("ALLOWED_FILE_TYPES", "pdf,png,jpg,jpeg").split(","),
+        expires_seconds=int(os.getenv("STORAGE_PRESIGNED_UPLOAD_EXPIRY_SECONDS", "900")),
+    )
+
+
+@router.post("/documents/uploads", response_model=DirectUploadDTO)
+async def initiate_direct_upload(
+    body: DirectUploadRequest,
+    current_user: dict = Depends(get_permission_checker(Permission.UPLOAD)),
+    session: Session = Depends(get_db_session),
+    storage_service: StorageService = Depends(get_storage_service),
+):
+    """Start a direct upload: returns a presigned URL to PUT the file to object storage.
+
+    The file bytes never pass through the API. Once the PUT succeeds, call
+    ``POST /documents/uploads/finalize`` with the returned ``upload_token``.
+    """
+    use_case = _direct_upload_use_case(session, storage_service)
+    try:
+        return use_case.initiate(body.filename, body.file_size, current_user["id"])
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/documents/uploads/finalize", response_model=DocumentDTO)
+def finalize_direct_upload(  # sync: stat + ranged GET against storage
+    body: FinalizeUploadRequest,
+    current_user: dict = Depends(get_permission_checker(Permission.UPLOAD)),
+    session: Session = Depends(get_db_session),
+    storage_service: StorageService = Depends(get_storage_service),
+    redis_queue=Depends(get_redis_queue),
+):
+    """Validate a directly uploaded file, create its document and queue extraction"""
+    logger = get_logger("sortex.api.documents")
+
+    use_case = _direct_upload_use_case(session, storage_service)
+    try:
+        document = use_case.finalize(body.upload_token, current_user["id"])
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.error("Direct upload finalize failed", error=str(e), error_type=type(e).__name__)
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.info("Direct upload finalized", document_id=str(document.id), file_size=document.file_size)
+
+    try:
+        enqueue_extractions(redis_queue, [document.id], Lane.UPLOAD, current_user["id"])
+    except Exception as e:
+        # Document stays UPLOADED and can be reprocessed
+        logger.error("Failed to queue extraction", error=str(e), document_id=str(document.id))
+    _queue_previews(redis_queue, [document])
+    return document
+
+
 def _parse_date(value: Optional[str]) -> Optional[datetime]:
     """Parse YYYY-MM-DD string to datetime at start/end of day (caller chooses)."""
     if not value or not value.strip():
@@ -145,14 +313,20 @@ async def list_documents(
 @router.get("/documents/{document_id}", response_model=DocumentDTO)
 async def get_document(
     document_id: UUID,
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_permission_checker(Permission.VIEW)),
     session: Session = Depends(get_db_session),
 ):
-    """Get document by ID"""
+    """Get document by ID (supports If-None-Match)"""
     document_repo = DocumentRepository(session)
     document = document_repo.get_by_id(document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
+    etag = make_etag("document", document.id, document.version, document.updated_at.isoformat())
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     return DocumentDTO.from_entity(document)
 
 
@@ -161,6 +335,7 @@ async def reprocess_document(
     document_id: UUID,
     current_user: dict = Depends(get_permission_checker(Permission.UPLOAD)),
     storage_service: StorageService = Depends(get_storage_service),
+    redis_queue=Depends(get_redis_queue),
 ):
     """Start reprocessing (re-run extraction) for a document. Returns 202 Accepted; extraction runs in background."""
     logger = get_logger("sortex.api.documents")
@@ -180,15 +355,18 @@ async def reprocess_document(
 
         def trigger_extraction():
             extraction_session = db.get_session()
+            extract_use_case = None
             try:
                 from ...application.use_cases.extract_fields import ExtractFieldsUseCase
+                from ...application.use_cases.validate_data import create_auto_validator
                 from ...infrastructure.external.ocr.factory import OCRServiceFactory
                 from ...infrastructure.external.llm.factory import LLMServiceFactory
                 from ...domain.services.document_type_classifier import DocumentTypeClassifier
 
                 extraction_doc_repo = DocumentRepository(extraction_session)
                 extraction_repo = ExtractionRepository(extraction_session)
-                extraction_audit_repo = AuditTrailRepository(extraction_session)
+                extraction_audit_repo = AuditTrailRepository(extraction_session, sink=get_audit_sink())
+                extraction_validation_repo = ValidationResultRepository(extraction_session)
                 extract_use_case = ExtractFieldsUseCase(
                     document_repository=extraction_doc_repo,
                     extraction_repository=extraction_repo,
@@ -197,12 +375,20 @@ async def reprocess_document(
                     llm_service=LLMServiceFactory.create(),
                     storage_service=storage_service,
                     document_type_classifier=DocumentTypeClassifier(),
+                    ocr_artifact_store=get_ocr_artifact_store(),
+                    page_image_store=get_page_image_store(),
+                    validate_data_use_case=create_auto_validator(
+                        extraction_doc_repo, extraction_repo, extraction_validation_repo, get_validation_engine()
+                    ),
                 )
                 extract_use_case.execute(doc_id)
                 extraction_session.commit()
+                extract_use_case.delete_stale_artifacts()
                 logger.info("Reprocess extraction completed", document_id=str(doc_id))
             except Exception as e:
                 extraction_session.rollback()
+                if extract_use_case is not None:
+                    extract_use_case.discard_new_artifact()
                 import traceback
                 logger.error(
                     "Reprocess extraction failed",
@@ -214,8 +400,13 @@ async def reprocess_document(
             finally:
                 extraction_session.close()
 
-        thread = threading.Thread(target=trigger_extraction, daemon=True)
-        thread.start()
+        try:
+            # Someone is waiting on this one: ahead of uploads and bulk backfills
+            enqueue_extractions(redis_queue, [doc_id], Lane.INTERACTIVE, current_user["id"])
+        except Exception as e:
+            logger.warning("Failed to queue reprocessing, running it in-process", error=str(e), document_id=str(doc_id))
+            thread = threading.Thread(target=trigger_extraction, daemon=True)
+            thread.start()
 
         dto = DocumentDTO(
             id=document.id,
@@ -245,27 +436,87 @@ async def reprocess_document(
 @router.get("/documents/{document_id}/file")
 async def download_document(
     document_id: UUID,
+    request: Request,
+    inline: bool = Query(False, description="Serve for in-browser viewing instead of as an attachment"),
     current_user: dict = Depends(get_permission_checker(Permission.VIEW)),
     session: Session = Depends(get_db_session),
     storage_service: StorageService = Depends(get_storage_service),
 ):
-    """Download original document file"""
-    from fastapi.responses import Response
-    
+    """Download original document file (streamed, supports Range requests)"""
     document_repo = DocumentRepository(session)
     document = document_repo.get_by_id(document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
-    
-    file_bytes = storage_service.download_file(document.storage_path)
-    
-    return Response(
-        content=file_bytes,
-        media_type="application/octet-stream",
-        headers={"Content-Disposition": f"attachment; filename={document.original_filename}"},
+
+    if not inline and os.getenv("STORAGE_PRESIGNED_DOWNLOADS", "false").lower() == "true":
+        # Let the client fetch the bytes from object storage directly
+        url = storage_service.presigned_download_url(
+            document.storage_path,
+            expires_seconds=int(os.getenv("STORAGE_PRESIGNED_EXPIRY_SECONDS", "300")),
+            filename=document.original_filename,
+        )
+        if url:
+            return RedirectResponse(url, status_code=307)
+
+    return stream_file(
+        storage_service,
+        document.storage_path,
+        filename=document.original_filename,
+        file_type=document.file_type,
+        range_header=request.headers.get("range"),
+        inline=inline,
     )
 
 
+@router.get("/documents/{document_id}/previews", response_model=PagePreviewManifestDTO)
+async def get_page_previews(
+    document_id: UUID,
+    current_user: dict = Depends(get_permission_checker(Permission.VIEW)),
+    session: Session = Depends(get_db_session),
+    preview_store: Optional[PagePreviewStore] = Depends(get_page_preview_store),
+):
+    """Page count and page sizes of a document's previews (404 until they are rendered)"""
+    if not DocumentRepository(session).get_by_id(document_id):
+        raise HTTPException(status_code=404, detail="Document not found")
+    manifest = preview_store.load_manifest(document_id) if preview_store else None
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="Page previews not available")
+    return manifest
+
+
+@router.get("/documents/{document_id}/previews/{page}")
+async def get_page_preview(
+    document_id: UUID,
+    page: int,
+    current_user: dict = Depends(get_permission_checker(Permission.VIEW)),
+    session: Session = Depends(get_db_session),
+    storage_service: StorageService = Depends(get_storage_service),
+    preview_store: Optional[PagePreviewStore] = Depends(get_page_preview_store),
+):
+    """Low-resolution preview image of page N (1-based)"""
+    if preview_store is None or page < 1:
+        raise HTTPException(status_code=404, detail="Page preview not found")
+    if not DocumentRepository(session).get_by_id(document_id):
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    image_format = preview_store.image_format
+    try:
+        response = stream_file(
+            storage_service,
+            preview_store.page_key(document_id, page, image_format),
+            filename=f"page-{page}.{image_format}",
+            file_type=image_format,
+            inline=True,
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=404, detail="Page preview not found")
+    # Previews never change once rendered
+    response.headers["Cache-Control"] = "private, max-age=86400"
+    return response
+
+
 @router.delete("/documents/{document_id}")
 async def delete_document(
     document_id: UUID,
@@ -282,11 +533,15 @@ async def delete_document(
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
         
-        # Delete file from storage
+        # Delete the file and everything stored under the document's prefix
+        # (OCR artifacts, page images, previews, checkpoints)
+        prefix = f"{document_id}/"
         try:
-            storage_service.delete_file(document.storage_path)
+            storage_service.delete_prefix(prefix)
+            if not document.storage_path.startswith(prefix):
+                storage_service.delete_file(document.storage_path)
         except Exception as e:
-            logger.warning("Failed to delete file from storage", error=str(e), storage_path=document.storage_path)
+            logger.warning("Failed to delete files from storage", error=str(e), storage_path=document.storage_path)
         
         # Delete document (cascade will handle related records)
         document_repo.delete(document_id)
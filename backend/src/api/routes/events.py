@@ -0,0 +1,64 @@
+"""Server-sent event streams of document pipeline events (replaces client polling)."""
+import time
+from typing import AsyncIterator, List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+
+from ...api.middleware.auth import get_stream_user
+from ...infrastructure.auth.rbac import has_permission, Permission
+from ...infrastructure.messaging.event_publisher import subscribe, document_channel, user_channel
+
+router = APIRouter()
+
+KEEPALIVE_SECONDS = 15
+# Browser reconnect delay after a dropped connection
+RETRY_MS = 5000
+
+
+async def _event_stream(request: Request, channels: List[str]) -> AsyncIterator[str]:
+    yield f"retry: {RETRY_MS}\n\n"
+    last_sent = time.monotonic()
+    async for payload in subscribe(channels):
+        if await request.is_disconnected():
+            break
+        if payload is not None:
+            yield f"data: {payload}\n\n"
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= KEEPALIVE_SECONDS:
+            # Comment line: keeps proxies from closing an idle connection
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+
+
+def _sse_response(request: Request, channels: List[str]) -> StreamingResponse:
+    return StreamingResponse(
+        _event_stream(request, channels),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/events/documents/{document_id}")
+async def document_events(
+    document_id: UUID,
+    request: Request,
+    current_user: dict = Depends(get_stream_user),
+):
+    """Stream pipeline events (status changes, extraction/validation completed, ...) for one document"""
+    if not has_permission(current_user["role"], Permission.VIEW):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission '{Permission.VIEW}' required. Your role: '{current_user['role']}'",
+        )
+    return _sse_response(request, [document_channel(document_id)])
+
+
+@router.get("/events/me")
+async def user_events(
+    request: Request,
+    current_user: dict = Depends(get_stream_user),
+):
+    """Stream pipeline events for every document uploaded by the current user"""
+    return _sse_response(request, [user_channel(current_user["id"])])
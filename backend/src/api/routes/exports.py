@@ -3,16 +3,21 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from ...application.use_cases.export_to_tms import ExportToTMSUseCase
+from ...application.use_cases.bulk_review_documents import BulkReviewDocumentsUseCase
+from ...application.use_cases.dispatch_exports import EXPORT_DISPATCH_ENABLED, enqueue_exports
 from ...application.dtos.export_dto import ExportCreateDTO, ExportDTO
+from ...application.dtos.bulk_action_dto import BulkActionResultDTO, BulkExportRequestDTO
 from ...infrastructure.persistence.repositories import (
     DocumentRepository, ExtractionRepository, ReviewRepository,
     ExportRepository, AuditTrailRepository,
 )
 from ...api.middleware.auth import get_current_user
 from ...infrastructure.auth.rbac import get_permission_checker, Permission
-from ...api.dependencies import get_db_session
+from ...api.dependencies import get_db_session, get_audit_sink, get_redis_queue
+from ...infrastructure.monitoring.logging import get_logger
 
 router = APIRouter()
+logger = get_logger("sortex.api.exports")
 
 
 @router.post("/documents/{document_id}/export", response_model=ExportDTO)
@@ -21,14 +26,15 @@ async def create_export(
     export_data: ExportCreateDTO,
     current_user: dict = Depends(get_permission_checker(Permission.EXPORT)),
     session: Session = Depends(get_db_session),
+    redis_queue=Depends(get_redis_queue),
 ):
-    """Export document to TMS"""
+    """Export document to TMS (queued for the export worker unless EXPORT_DISPATCH_ENABLED=false)"""
     try:
         document_repo = DocumentRepository(session)
         extraction_repo = ExtractionRepository(session)
         review_repo = ReviewRepository(session)
         export_repo = ExportRepository(session)
-        audit_repo = AuditTrailRepository(session)
+        audit_repo = AuditTrailRepository(session, sink=get_audit_sink())
         
         use_case = ExportToTMSUseCase(
             document_repository=document_repo,
@@ -36,15 +42,65 @@ async def create_export(
             review_repository=review_repo,
             export_repository=export_repo,
             audit_trail_repository=audit_repo,
+            dispatch_async=EXPORT_DISPATCH_ENABLED,
         )
         
         result = use_case.execute(document_id, export_data, current_user["id"])
         session.commit()
-        return result
     except Exception as e:
         session.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
+    if EXPORT_DISPATCH_ENABLED:
+        try:
+            enqueue_exports(redis_queue, [result.id])
+        except Exception as e:
+            # The export stays PENDING; the client can see it through GET .../export
+            logger.error("Failed to queue export", error=str(e), export_id=str(result.id))
+    return result
+
+
+@router.post("/exports/bulk", response_model=BulkActionResultDTO)
+async def create_bulk_export(
+    request: BulkExportRequestDTO,
+    current_user: dict = Depends(get_permission_checker(Permission.EXPORT)),
+    session: Session = Depends(get_db_session),
+    redis_queue=Depends(get_redis_queue),
+):
+    """Queue TMS exports for many documents in one transaction (needs the export worker)"""
+    if not EXPORT_DISPATCH_ENABLED:
+        raise HTTPException(status_code=400, detail="Bulk export needs EXPORT_DISPATCH_ENABLED=true")
+    try:
+        use_case = BulkReviewDocumentsUseCase(
+            document_repository=DocumentRepository(session),
+            extraction_repository=ExtractionRepository(session),
+            review_repository=ReviewRepository(session),
+            export_repository=ExportRepository(session),
+            audit_trail_repository=AuditTrailRepository(session, sink=get_audit_sink()),
+            session=session,
+        )
+        result = use_case.export(request.document_ids, request.exported_to, current_user["id"])
+        session.commit()
+    except ValueError as e:
+        session.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        session.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    try:
+        enqueue_exports(redis_queue, result.export_ids)
+    except Exception as e:
+        logger.error("Failed to queue exports", error=str(e), exports=len(result.export_ids))
+    logger.info(
+        "Bulk export",
+        processed=len(result.processed),
+        skipped=len(result.skipped),
+        ms_per_document=result.milliseconds_per_document,
+        statements_per_document=result.statements_per_document,
+    )
+    return result
+
 
 @router.get("/documents/{document_id}/export", response_model=ExportDTO)
 async def get_export(
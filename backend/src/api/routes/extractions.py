@@ -1,20 +1,27 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from ...application.use_cases.extract_fields import ExtractFieldsUseCase
-from ...application.dtos.extraction_dto import ExtractionDTO
+from ...application.use_cases.validate_data import create_auto_validator
+from ...application.dtos.extraction_dto import ExtractionDTO, ExtractionSummaryDTO
 from ...infrastructure.persistence.repositories import (
-    DocumentRepository, ExtractionRepository, AuditTrailRepository,
+    DocumentRepository, ExtractionRepository, AuditTrailRepository, ValidationResultRepository,
 )
+from ...infrastructure.external.storage.ocr_artifacts import OCRArtifactStore
 from ...api.middleware.auth import get_current_user
+from ...api.etag import make_etag, is_not_modified, not_modified, set_etag
 from ...infrastructure.auth.rbac import get_permission_checker, Permission
 from ...api.dependencies import (
     get_db_session,
+    get_audit_sink,
+    get_ocr_artifact_store,
+    get_page_image_store,
     get_storage_service,
     get_ocr_service,
     get_llm_service,
     get_document_type_classifier,
+    get_validation_engine,
 )
 
 router = APIRouter()
@@ -23,18 +30,56 @@ router = APIRouter()
 @router.get("/documents/{document_id}/extraction", response_model=ExtractionDTO)
 async def get_extraction(
     document_id: UUID,
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_permission_checker(Permission.VIEW)),
     session: Session = Depends(get_db_session),
+    storage_service=Depends(get_storage_service),
 ):
-    """Get extraction result for document"""
+    """Get full extraction result for document, including raw OCR text (supports If-None-Match)"""
     extraction_repo = ExtractionRepository(session)
-    extraction = extraction_repo.get_by_document_id(document_id)
-    
+    # Extractions are immutable: a new run creates a new row, so the id is the version
+    extraction_id = extraction_repo.get_latest_id(document_id)
+    if not extraction_id:
+        raise HTTPException(status_code=404, detail="Extraction not found")
+    etag = make_etag("extraction", extraction_id, "full")
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    extraction = extraction_repo.get_by_document_id(document_id, full=True)
     if not extraction:
         raise HTTPException(status_code=404, detail="Extraction not found")
+    if extraction.raw_text is None and extraction.raw_text_key:
+        # Raw text was offloaded to object storage
+        extraction.raw_text = OCRArtifactStore(storage_service).load_text(extraction.raw_text_key)
+    set_etag(response, make_etag("extraction", extraction.id, "full"))
     return ExtractionDTO.from_entity(extraction)
 
 
+@router.get("/documents/{document_id}/extraction/summary", response_model=ExtractionSummaryDTO)
+async def get_extraction_summary(
+    document_id: UUID,
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_permission_checker(Permission.VIEW)),
+    session: Session = Depends(get_db_session),
+):
+    """Get extraction result without raw OCR text and metadata (lightweight, for polling and review)"""
+    extraction_repo = ExtractionRepository(session)
+    extraction_id = extraction_repo.get_latest_id(document_id)
+    if not extraction_id:
+        raise HTTPException(status_code=404, detail="Extraction not found")
+    etag = make_etag("extraction", extraction_id, "summary")
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    extraction = extraction_repo.get_by_document_id(document_id)
+    if not extraction:
+        raise HTTPException(status_code=404, detail="Extraction not found")
+    set_etag(response, make_etag("extraction", extraction.id, "summary"))
+    return ExtractionSummaryDTO.from_entity(extraction)
+
+
 @router.post("/documents/{document_id}/extraction/retry")
 async def retry_extraction(
     document_id: UUID,
@@ -44,17 +89,19 @@ async def retry_extraction(
     ocr_service=Depends(get_ocr_service),
     llm_service=Depends(get_llm_service),
     document_type_classifier=Depends(get_document_type_classifier),
+    validation_engine=Depends(get_validation_engine),
 ):
     """Retry extraction for document"""
     from ...infrastructure.monitoring.logging import get_logger
     logger = get_logger("sortex.api.extractions")
     
+    use_case = None
     try:
         logger.info("Extraction retry started", document_id=str(document_id))
         
         document_repo = DocumentRepository(session)
         extraction_repo = ExtractionRepository(session)
-        audit_repo = AuditTrailRepository(session)
+        audit_repo = AuditTrailRepository(session, sink=get_audit_sink())
         
         use_case = ExtractFieldsUseCase(
             document_repository=document_repo,
@@ -64,14 +111,22 @@ async def retry_extraction(
             llm_service=llm_service,
             storage_service=storage_service,
             document_type_classifier=document_type_classifier,
+            ocr_artifact_store=get_ocr_artifact_store(),
+            page_image_store=get_page_image_store(),
+            validate_data_use_case=create_auto_validator(
+                document_repo, extraction_repo, ValidationResultRepository(session), validation_engine
+            ),
         )
         
         result = use_case.execute(document_id)
         session.commit()
+        use_case.delete_stale_artifacts()
         logger.info("Extraction retry successful", document_id=str(document_id))
         return result
     except Exception as e:
         session.rollback()
+        if use_case is not None:
+            use_case.discard_new_artifact()
         import traceback
         error_detail = str(e) or repr(e)
         error_traceback = traceback.format_exc()
@@ -3,11 +3,11 @@ import os
 import time
 
 import httpx
-import redis
 from fastapi import APIRouter
 from sqlalchemy import text
 
 from ...api.dependencies import get_database
+from ...infrastructure.messaging.redis_client import get_redis
 from ...infrastructure.monitoring.logging import get_logger
 
 router = APIRouter()
@@ -37,10 +37,9 @@ def _check_redis() -> dict:
     """Probe Redis with PING."""
     start = time.monotonic()
     try:
-        client = redis.from_url(REDIS_URL, socket_connect_timeout=3)
-        client.ping()
+        # The application's own pool: probes the connections requests use
+        get_redis(REDIS_URL).ping()
         latency_ms = round((time.monotonic() - start) * 1000, 1)
-        client.close()
         return {"status": "up", "latency_ms": latency_ms}
     except Exception as e:
         return {"status": "down", "error": str(e)}
@@ -3,16 +3,23 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from ...application.use_cases.review_document import ReviewDocumentUseCase
+from ...application.use_cases.export_to_tms import ExportToTMSUseCase
+from ...application.use_cases.bulk_review_documents import BulkReviewDocumentsUseCase
+from ...application.use_cases.dispatch_exports import EXPORT_DISPATCH_ENABLED, enqueue_exports, wake_export_relay
+from ...application.use_cases.review_document import APPROVAL_EXPORT_TO
 from ...application.dtos.review_dto import ReviewCreateDTO, ReviewDTO
+from ...application.dtos.bulk_action_dto import BulkActionResultDTO, BulkReviewRequestDTO
 from ...infrastructure.persistence.repositories import (
     DocumentRepository, ExtractionRepository, ReviewRepository,
-    AuditTrailRepository, ValidationResultRepository,
+    AuditTrailRepository, ValidationResultRepository, ExportRepository,
 )
 from ...api.middleware.auth import get_current_user
 from ...infrastructure.auth.rbac import get_permission_checker, Permission
-from ...api.dependencies import get_db_session
+from ...api.dependencies import get_db_session, get_audit_sink, get_redis_queue
+from ...infrastructure.monitoring.logging import get_logger
 
 router = APIRouter()
+logger = get_logger("sortex.api.reviews")
 
 
 @router.get("/documents/{document_id}/review", response_model=ReviewDTO)
@@ -42,7 +49,7 @@ async def create_review(
         document_repo = DocumentRepository(session)
         extraction_repo = ExtractionRepository(session)
         review_repo = ReviewRepository(session)
-        audit_repo = AuditTrailRepository(session)
+        audit_repo = AuditTrailRepository(session, sink=get_audit_sink())
         validation_repo = ValidationResultRepository(session)
 
         use_case = ReviewDocumentUseCase(
@@ -77,12 +84,26 @@ async def update_review(
 
 def _build_review_use_case(session: Session) -> ReviewDocumentUseCase:
     """Helper to instantiate ReviewDocumentUseCase with all dependencies"""
+    document_repo = DocumentRepository(session)
+    extraction_repo = ExtractionRepository(session)
+    review_repo = ReviewRepository(session)
+    audit_repo = AuditTrailRepository(session, sink=get_audit_sink())
+    # Approval exports need the relay: without it approval stays the last step
+    export_use_case = ExportToTMSUseCase(
+        document_repository=document_repo,
+        extraction_repository=extraction_repo,
+        review_repository=review_repo,
+        export_repository=ExportRepository(session),
+        audit_trail_repository=audit_repo,
+        dispatch_async=True,
+    ) if EXPORT_DISPATCH_ENABLED else None
     return ReviewDocumentUseCase(
-        document_repository=DocumentRepository(session),
-        extraction_repository=ExtractionRepository(session),
-        review_repository=ReviewRepository(session),
-        audit_trail_repository=AuditTrailRepository(session),
+        document_repository=document_repo,
+        extraction_repository=extraction_repo,
+        review_repository=review_repo,
+        audit_trail_repository=audit_repo,
         validation_result_repository=ValidationResultRepository(session),
+        export_use_case=export_use_case,
     )
 
 
@@ -91,13 +112,13 @@ async def approve_review(
     document_id: UUID,
     current_user: dict = Depends(get_permission_checker(Permission.REVIEW)),
     session: Session = Depends(get_db_session),
+    redis_queue=Depends(get_redis_queue),
 ):
-    """Approve a review — marks pipeline as complete"""
+    """Approve a review — completes the pipeline or queues the TMS export (APPROVAL_EXPORT_TO)"""
     try:
         use_case = _build_review_use_case(session)
         result = use_case.approve(document_id, current_user["id"])
         session.commit()
-        return result
     except ValueError as e:
         session.rollback()
         raise HTTPException(status_code=404, detail=str(e))
@@ -105,6 +126,14 @@ async def approve_review(
         session.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
+    if use_case.exports_on_approval:
+        try:
+            wake_export_relay(redis_queue)
+        except Exception as e:
+            # The outbox row is committed; the relay picks it up on its next poll
+            logger.warning("Failed to wake export relay", error=str(e), document_id=str(document_id))
+    return result
+
 
 @router.post("/documents/{document_id}/review/reject", response_model=ReviewDTO)
 async def reject_review(
@@ -125,3 +154,78 @@ async def reject_review(
         session.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
+
+
+def _build_bulk_use_case(session: Session) -> BulkReviewDocumentsUseCase:
+    """Helper to instantiate BulkReviewDocumentsUseCase; approval exports need the relay, as above"""
+    return BulkReviewDocumentsUseCase(
+        document_repository=DocumentRepository(session),
+        extraction_repository=ExtractionRepository(session),
+        review_repository=ReviewRepository(session),
+        export_repository=ExportRepository(session),
+        audit_trail_repository=AuditTrailRepository(session, sink=get_audit_sink()),
+        approval_export_to=APPROVAL_EXPORT_TO if EXPORT_DISPATCH_ENABLED else "",
+        session=session,
+    )
+
+
+@router.post("/reviews/bulk/approve", response_model=BulkActionResultDTO)
+async def bulk_approve_reviews(
+    request: BulkReviewRequestDTO,
+    current_user: dict = Depends(get_permission_checker(Permission.REVIEW)),
+    session: Session = Depends(get_db_session),
+    redis_queue=Depends(get_redis_queue),
+):
+    """Approve many reviews in one transaction; documents that cannot be approved are reported as skipped"""
+    try:
+        result = _build_bulk_use_case(session).approve(request.document_ids, current_user["id"])
+        session.commit()
+    except ValueError as e:
+        session.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        session.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if result.export_ids:
+        try:
+            enqueue_exports(redis_queue, result.export_ids)
+        except Exception as e:
+            # The outbox rows are committed; the relay picks them up on its next poll
+            logger.warning("Failed to wake export relay", error=str(e), exports=len(result.export_ids))
+    logger.info(
+        "Bulk approval",
+        processed=len(result.processed),
+        skipped=len(result.skipped),
+        ms_per_document=result.milliseconds_per_document,
+        statements_per_document=result.statements_per_document,
+    )
+    return result
+
+
+@router.post("/reviews/bulk/reject", response_model=BulkActionResultDTO)
+async def bulk_reject_reviews(
+    request: BulkReviewRequestDTO,
+    current_user: dict = Depends(get_permission_checker(Permission.REVIEW)),
+    session: Session = Depends(get_db_session),
+):
+    """Reject many reviews in one transaction"""
+    try:
+        result = _build_bulk_use_case(session).reject(
+            request.document_ids, current_user["id"], request.notes or ""
+        )
+        session.commit()
+    except ValueError as e:
+        session.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        session.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+    logger.info(
+        "Bulk rejection",
+        processed=len(result.processed),
+        skipped=len(result.skipped),
+        ms_per_document=result.milliseconds_per_document,
+        statements_per_document=result.statements_per_document,
+    )
+    return result
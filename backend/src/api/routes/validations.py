@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from uuid import UUID
 from sqlalchemy.orm import Session
 
@@ -8,6 +8,7 @@ from ...infrastructure.persistence.repositories import (
     DocumentRepository, ExtractionRepository, ValidationResultRepository,
 )
 from ...api.middleware.auth import get_current_user
+from ...api.etag import make_etag, is_not_modified, not_modified, set_etag
 from ...api.dependencies import get_db_session, get_validation_engine
 
 router = APIRouter()
@@ -16,11 +17,13 @@ router = APIRouter()
 @router.get("/documents/{document_id}/validation", response_model=ValidationResultDTO)
 async def get_validation(
     document_id: UUID,
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     session: Session = Depends(get_db_session),
     validation_engine=Depends(get_validation_engine),
 ):
-    """Get validation result for document"""
+    """Get validation result for document (supports If-None-Match)"""
     from ...infrastructure.monitoring.logging import get_logger
     logger = get_logger("sortex.api.validations")
     
@@ -30,12 +33,20 @@ async def get_validation(
         validation_repo = ValidationResultRepository(session)
         
         # Check if extraction exists first
-        extraction = extraction_repo.get_by_document_id(document_id)
-        if not extraction:
+        extraction_id = extraction_repo.get_latest_id(document_id)
+        if not extraction_id:
             raise HTTPException(
                 status_code=404,
                 detail="Extraction not found. Please extract the document first.",
             )
+
+        # The result only depends on the extraction, the document type and the
+        # validation rules: skip re-running (and re-persisting) validation when none changed
+        document = document_repo.get_by_id(document_id)
+        document_type = document.document_type.value if document and document.document_type else None
+        etag = make_etag("validation", extraction_id, document_type, validation_engine.rules_version)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
         
         use_case = ValidateDataUseCase(
             document_repository=document_repo,
@@ -46,6 +57,7 @@ async def get_validation(
         
         result = use_case.execute(document_id)
         session.commit()
+        set_etag(response, etag)
         return result
     except HTTPException:
         raise
@@ -0,0 +1,91 @@
+"""
+Streaming file responses with HTTP Range support.
+
+Objects are streamed from storage chunk by chunk (``StorageService.iter_chunks``)
+instead of being read into API memory, and single byte ranges are served
+with 206 Partial Content so in-browser PDF viewers can fetch pages lazily.
+"""
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from ..infrastructure.external.storage.base import StorageService
+
+MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+}
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` Range header into an inclusive (start, end).
+
+    Returns None when the header is absent or not a single byte range (the
+    full object is served). Raises 416 when the range cannot be satisfied.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_s, sep, end_s = header[len("bytes="):].strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if start_s:
+            start = int(start_s)
+            end = int(end_s) if end_s else size - 1
+        else:
+            # Suffix range: last N bytes
+            suffix = int(end_s)
+            if suffix <= 0:
+                raise ValueError
+            start, end = max(size - suffix, 0), size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
+
+
+def content_disposition(filename: str, inline: bool = False) -> str:
+    disposition = "inline" if inline else "attachment"
+    return f"{disposition}; filename*=UTF-8''{quote(filename)}"
+
+
+def stream_file(
+    storage_service: StorageService,
+    file_path: str,
+    filename: str,
+    file_type: str,
+    range_header: Optional[str] = None,
+    inline: bool = False,
+) -> StreamingResponse:
+    """Build a StreamingResponse (200 or 206) for a stored object."""
+    size = storage_service.stat_file(file_path).size
+    byte_range = parse_range(range_header, size)
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": content_disposition(filename, inline=inline),
+    }
+    if byte_range is None:
+        status_code, offset, length = 200, 0, size
+    else:
+        start, end = byte_range
+        status_code, offset, length = 206, start, end - start + 1
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(length)
+
+    return StreamingResponse(
+        storage_service.iter_chunks(file_path, offset=offset, length=length),
+        status_code=status_code,
+        media_type=MEDIA_TYPES.get(file_type.lower(), "application/octet-stream"),
+        headers=headers,
+    )
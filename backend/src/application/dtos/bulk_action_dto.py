@@ -0,0 +1,30 @@
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class BulkReviewRequestDTO(BaseModel):
+    document_ids: List[UUID] = Field(..., min_length=1)
+    # Rejection notes (ignored for approval)
+    notes: Optional[str] = None
+
+
+class BulkExportRequestDTO(BaseModel):
+    document_ids: List[UUID] = Field(..., min_length=1)
+    exported_to: str
+
+
+class SkippedDocumentDTO(BaseModel):
+    document_id: UUID
+    error: str
+
+
+class BulkActionResultDTO(BaseModel):
+    processed: List[UUID]
+    skipped: List[SkippedDocumentDTO]
+    # Exports written to the outbox (bulk export, or approval with APPROVAL_EXPORT_TO)
+    export_ids: List[UUID] = []
+    elapsed_seconds: float
+    # Wall time and SQL statements per processed document
+    milliseconds_per_document: float
+    statements_per_document: Optional[float] = None
@@ -0,0 +1,29 @@
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class DeadLetterEntryDTO(BaseModel):
+    id: str
+    original_queue: str
+    job_data: Dict[str, Any]
+    error_message: str
+    retry_count: int
+    failed_at: str
+    # FairQueue lane/tenant the job is requeued into (absent for plain queues)
+    lane: Optional[str] = None
+    tenant: Optional[str] = None
+
+
+class DeadLetterListDTO(BaseModel):
+    entries: List[DeadLetterEntryDTO]
+    total: int
+
+
+class DeadLetterActionDTO(BaseModel):
+    # None: the newest ``limit`` entries (requeue only)
+    ids: Optional[List[str]] = None
+    limit: int = 1000
+
+
+class DeadLetterActionResultDTO(BaseModel):
+    count: int
@@ -69,3 +69,48 @@ class DocumentListDTO(BaseModel):
             page_size=page_size,
         )
 
+
+
+class RejectedFileDTO(BaseModel):
+    filename: str
+    error: str
+
+
+class BulkUploadResultDTO(BaseModel):
+    documents: List[DocumentDTO]
+    rejected: List[RejectedFileDTO]
+    total_files: int
+    accepted: int
+    total_bytes: int
+    elapsed_seconds: float
+    files_per_second: float
+    megabytes_per_second: float
+
+
+class DirectUploadRequest(BaseModel):
+    filename: str
+    file_size: int
+
+
+class DirectUploadDTO(BaseModel):
+    document_id: UUID
+    upload_url: str
+    method: str = "PUT"
+    upload_token: str
+    expires_at: datetime
+
+
+class FinalizeUploadRequest(BaseModel):
+    upload_token: str
+
+
+class PagePreviewDTO(BaseModel):
+    page: int
+    width: int
+    height: int
+
+
+class PagePreviewManifestDTO(BaseModel):
+    page_count: int
+    format: str
+    pages: List[PagePreviewDTO]
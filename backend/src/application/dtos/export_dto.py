@@ -19,6 +19,8 @@ class ExportDTO(BaseModel):
     exported_at: Optional[datetime]
     retry_count: int
     error_message: Optional[str]
+    # Next delivery attempt of a PENDING export (outbox retries)
+    next_attempt_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -34,5 +36,6 @@ class ExportDTO(BaseModel):
             exported_at=entity.exported_at,
             retry_count=entity.retry_count,
             error_message=entity.error_message,
+            next_attempt_at=entity.next_attempt_at,
         )
 
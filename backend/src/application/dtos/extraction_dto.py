@@ -32,3 +32,26 @@ class ExtractionDTO(BaseModel):
             extraction_metadata=entity.extraction_metadata,
         )
 
+
+class ExtractionSummaryDTO(BaseModel):
+    """Extraction without the heavy raw_text / extraction_metadata columns"""
+    id: UUID
+    document_id: UUID
+    extraction_method: ExtractionMethod
+    structured_data: Dict[str, Any]
+    confidence_scores: Dict[str, Any]
+    extracted_at: datetime
+
+    class Config:
+        from_attributes = True
+
+    @classmethod
+    def from_entity(cls, entity: Extraction) -> "ExtractionSummaryDTO":
+        return cls(
+            id=entity.id,
+            document_id=entity.document_id,
+            extraction_method=entity.extraction_method,
+            structured_data=entity.structured_data,
+            confidence_scores=entity.confidence_scores,
+            extracted_at=entity.extracted_at,
+        )
@@ -24,9 +24,10 @@ DOCUMENT_TYPE_SCHEMAS: Dict[str, Dict[str, Any]] = {
             "invoice_date": {"type": "string"},
             "seller_name": {"type": "string"},
             "buyer_name": {"type": "string"},
+            "subtotal": {"type": "string"},
+            "tax_amount": {"type": "string"},
             "total_amount": {"type": "string"},
             "currency": {"type": "string"},
-            "tax_amount": {"type": "string"},
             "items": {"type": "array"},
         },
     },
@@ -0,0 +1,213 @@
+"""Use case for reviewer bulk actions: approve, reject or export many documents at once."""
+import os
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from ...domain.entities.audit_trail import AuditTrail, AuditAction
+from ...domain.entities.document import Document, DocumentStatus
+from ...domain.entities.export import Export, ExportStatus
+from ...domain.entities.extraction import Extraction
+from ...domain.entities.review import Review
+from ...infrastructure.persistence.database import count_statements
+from ...infrastructure.persistence.repositories import (
+    AuditTrailRepository, DocumentRepository, ExportRepository, ExtractionRepository, ReviewRepository,
+)
+from ...application.dtos.bulk_action_dto import BulkActionResultDTO, SkippedDocumentDTO
+from .export_to_tms import format_export_payload
+from .review_document import APPROVAL_EXPORT_TO
+
+BULK_REVIEW_MAX_DOCUMENTS = int(os.getenv("BULK_REVIEW_MAX_DOCUMENTS", "500"))
+
+
+class BulkReviewDocumentsUseCase:
+    """Applies one reviewer action to many documents with a fixed number of statements.
+
+    Each aggregate type (documents, reviews, extractions) is loaded with one
+    IN query, state transitions are applied in memory, and the changes are
+    written with one bulk statement per table: executemany UPDATEs for
+    documents and reviews, multi-row INSERTs for exports and audit rows.
+    Documents that cannot take the action are skipped and reported; the rest
+    commit together. Exports are outbox rows (PENDING); the caller wakes the
+    export relay once for all of them after commit.
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        extraction_repository: ExtractionRepository,
+        review_repository: ReviewRepository,
+        export_repository: ExportRepository,
+        audit_trail_repository: AuditTrailRepository,
+        approval_export_to: str = APPROVAL_EXPORT_TO,
+        max_documents: int = BULK_REVIEW_MAX_DOCUMENTS,
+        session: Optional[Session] = None,
+    ):
+        self.document_repository = document_repository
+        self.extraction_repository = extraction_repository
+        self.review_repository = review_repository
+        self.export_repository = export_repository
+        self.audit_trail_repository = audit_trail_repository
+        self.approval_export_to = approval_export_to
+        self.max_documents = max_documents
+        # Only used to report statements per document
+        self.session = session
+
+    def approve(self, document_ids: List[UUID], reviewed_by: UUID) -> BulkActionResultDTO:
+        """Approve the reviews; exports go to the outbox when APPROVAL_EXPORT_TO is set."""
+        def run(ids: List[UUID]):
+            reviews = self.review_repository.get_by_document_ids(ids)
+            skipped, approved = self._pair(ids, self._documents(ids), reviews)
+            extractions: Dict[UUID, Extraction] = {}
+            if self.approval_export_to:
+                # Nothing to export: leave the review as it is, like the single approval would
+                extractions = self.extraction_repository.get_latest_by_document_ids(d.id for d in approved)
+                skipped += [self._skip(d.id, "Extraction not found") for d in approved if d.id not in extractions]
+                approved = [d for d in approved if d.id in extractions]
+
+            for document in approved:
+                reviews[document.id].approve()
+            self.review_repository.bulk_update([reviews[d.id] for d in approved])
+
+            audits = [self._audit(d.id, reviewed_by, {"action": "approve", "bulk": True}) for d in approved]
+            exports: List[Export] = []
+            if self.approval_export_to:
+                exports = self._stage_exports(
+                    approved, extractions, reviews, self.approval_export_to, reviewed_by, audits
+                )
+            else:
+                # Pipeline complete
+                for document in approved:
+                    document.update_status(DocumentStatus.EXPORTED)
+                self.document_repository.bulk_update_status(approved)
+            self.audit_trail_repository.create_many(audits)
+            return [d.id for d in approved], skipped, [e.id for e in exports]
+
+        return self._measured(document_ids, run)
+
+    def reject(self, document_ids: List[UUID], reviewed_by: UUID, rejection_notes: str = "") -> BulkActionResultDTO:
+        """Reject the reviews; reviewers can re-edit and resubmit."""
+        def run(ids: List[UUID]):
+            reviews = self.review_repository.get_by_document_ids(ids)
+            skipped = [self._skip(i, "Review not found") for i in ids if i not in reviews]
+            rejected = [reviews[i] for i in ids if i in reviews]
+            for review in rejected:
+                review.reject()
+                if rejection_notes:
+                    review.review_notes = rejection_notes
+            self.review_repository.bulk_update(rejected)
+            self.audit_trail_repository.create_many([
+                self._audit(r.document_id, reviewed_by, {"action": "reject", "notes": rejection_notes, "bulk": True})
+                for r in rejected
+            ])
+            return [r.document_id for r in rejected], skipped, []
+
+        return self._measured(document_ids, run)
+
+    def export(self, document_ids: List[UUID], exported_to: str, exported_by: UUID) -> BulkActionResultDTO:
+        """Write PENDING exports (with review corrections applied) for the export relay."""
+        def run(ids: List[UUID]):
+            documents = self._documents(ids)
+            extractions = self.extraction_repository.get_latest_by_document_ids(documents)
+            skipped = []
+            found = []
+            for document_id in ids:
+                if document_id not in documents:
+                    skipped.append(self._skip(document_id, "Document not found"))
+                elif document_id not in extractions:
+                    skipped.append(self._skip(document_id, "Extraction not found"))
+                else:
+                    found.append(documents[document_id])
+            reviews = self.review_repository.get_by_document_ids(d.id for d in found)
+            audits: List[AuditTrail] = []
+            exports = self._stage_exports(found, extractions, reviews, exported_to, exported_by, audits)
+            self.audit_trail_repository.create_many(audits)
+            return [d.id for d in found], skipped, [e.id for e in exports]
+
+        return self._measured(document_ids, run)
+
+    # ------------------------------------------------------------------
+
+    def _measured(self, document_ids: List[UUID], run) -> BulkActionResultDTO:
+        ids = list(dict.fromkeys(document_ids))
+        if len(ids) > self.max_documents:
+            raise ValueError(f"Too many documents: {len(ids)} (maximum {self.max_documents})")
+        started = time.perf_counter()
+        counter = count_statements(self.session) if self.session is not None else nullcontext(None)
+        with counter as statements:
+            processed, skipped, export_ids = run(ids)
+        elapsed = time.perf_counter() - started
+        per_document = max(len(processed), 1)
+        return BulkActionResultDTO(
+            processed=processed,
+            skipped=skipped,
+            export_ids=export_ids,
+            elapsed_seconds=round(elapsed, 4),
+            milliseconds_per_document=round(elapsed * 1000 / per_document, 3),
+            statements_per_document=round(statements[0] / per_document, 3) if statements else None,
+        )
+
+    def _documents(self, ids: List[UUID]) -> Dict[UUID, Document]:
+        return {d.id: d for d in self.document_repository.get_by_ids(ids)}
+
+    def _pair(
+        self, ids: List[UUID], documents: Dict[UUID, Document], reviews: Dict[UUID, Review]
+    ) -> Tuple[List[SkippedDocumentDTO], List[Document]]:
+        """Split ids into skipped ones and documents that have a review."""
+        skipped, found = [], []
+        for document_id in ids:
+            if document_id not in documents:
+                skipped.append(self._skip(document_id, "Document not found"))
+            elif document_id not in reviews:
+                skipped.append(self._skip(document_id, "Review not found"))
+            else:
+                found.append(documents[document_id])
+        return skipped, found
+
+    def _stage_exports(
+        self,
+        documents: List[Document],
+        extractions: Dict[UUID, Extraction],
+        reviews: Dict[UUID, Review],
+        exported_to: str,
+        exported_by: UUID,
+        audits: List[AuditTrail],
+    ) -> List[Export]:
+        """Insert PENDING exports with one INSERT; appends their audit rows to ``audits``."""
+        exports = []
+        for document in documents:
+            data = dict(extractions[document.id].structured_data or {})
+            review = reviews.get(document.id)
+            if review and review.corrections:
+                data.update(review.corrections)
+            export = Export(
+                id=uuid4(),
+                document_id=document.id,
+                exported_to=exported_to,
+                export_payload=format_export_payload(document, data),
+                export_status=ExportStatus.PENDING,
+            )
+            exports.append(export)
+            audits.append(self._audit(
+                document.id, exported_by, {"export_id": str(export.id), "exported_to": exported_to, "bulk": True},
+                action=AuditAction.EXPORT,
+            ))
+        self.export_repository.bulk_create(exports)
+        return exports
+
+    @staticmethod
+    def _audit(document_id: UUID, performed_by: UUID, changes: dict, action: AuditAction = AuditAction.REVIEW) -> AuditTrail:
+        return AuditTrail(
+            id=uuid4(),
+            document_id=document_id,
+            action=action,
+            performed_by=performed_by,
+            changes=changes,
+        )
+
+    @staticmethod
+    def _skip(document_id: UUID, error: str) -> SkippedDocumentDTO:
+        return SkippedDocumentDTO(document_id=document_id, error=error)
@@ -0,0 +1,212 @@
+"""Use case for bulk document upload (many files and/or zip archives in one request)."""
+import os
+import time
+import zipfile
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from ...domain.entities.document import Document, DocumentStatus
+from ...domain.entities.audit_trail import AuditTrail, AuditAction
+from ...domain.events.document_events import DocumentUploaded
+from ...infrastructure.persistence.repositories import DocumentRepository, AuditTrailRepository
+from ...infrastructure.external.storage.base import StorageService
+from ...application.dtos.document_dto import DocumentDTO, BulkUploadResultDTO, RejectedFileDTO
+from .upload_document import UploadDocumentUseCase, HEAD_BYTES
+
+
+class _HeadReplayReader:
+    """Readable stream that replays the already-consumed head, then the rest of ``stream``.
+
+    Raises ValueError once more than ``max_size`` bytes have been read, so a zip
+    entry lying about its size cannot be streamed past the limit.
+    """
+
+    def __init__(self, head: bytes, stream: BinaryIO, max_size: int):
+        self._head = head
+        self._stream = stream
+        self._max_size = max_size
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if self._head:
+            if size < 0 or size >= len(self._head):
+                data = self._head + self._stream.read(-1 if size < 0 else size - len(self._head))
+                self._head = b""
+            else:
+                data, self._head = self._head[:size], self._head[size:]
+        else:
+            data = self._stream.read(size)
+        self.bytes_read += len(data)
+        if self.bytes_read > self._max_size:
+            raise ValueError(f"File size exceeds maximum of {self._max_size / (1024*1024)}MB")
+        return data
+
+
+class BulkUploadDocumentsUseCase(UploadDocumentUseCase):
+    """Streams many files to storage and inserts their documents + audit rows in one go.
+
+    Each file is validated on its stream head (extension, declared size, magic
+    bytes) and streamed to storage; invalid files are rejected individually.
+    All accepted documents and their audit entries are inserted with one
+    multi-row INSERT each, so the caller commits the batch atomically.
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        audit_trail_repository: AuditTrailRepository,
+        storage_service: StorageService,
+        max_file_size_mb: int = 10,
+        allowed_file_types: list = None,
+        max_files: int = 500,
+    ):
+        super().__init__(
+            document_repository=document_repository,
+            audit_trail_repository=audit_trail_repository,
+            storage_service=storage_service,
+            max_file_size_mb=max_file_size_mb,
+            allowed_file_types=allowed_file_types,
+        )
+        self.max_files = max_files
+
+    def execute(self, files: List[Tuple[str, BinaryIO]], uploaded_by: UUID) -> BulkUploadResultDTO:
+        """
+        Upload a batch of documents.
+
+        Args:
+            files: (filename, file object) pairs; ``.zip`` files are expanded
+            uploaded_by: User ID
+
+        Returns:
+            BulkUploadResultDTO with accepted documents, rejected files and throughput
+        """
+        started = time.perf_counter()
+        documents: List[Document] = []
+        rejected: List[RejectedFileDTO] = []
+        pending_names: Dict[str, int] = {}
+        total_bytes = 0
+        total_files = 0
+
+        for filename, stream, size, error in self._iter_files(files):
+            total_files += 1
+            if total_files > self.max_files:
+                error = f"Batch exceeds {self.max_files} files"
+            if error:
+                rejected.append(RejectedFileDTO(filename=filename, error=error))
+                continue
+            try:
+                document = self._store(filename, stream, size, uploaded_by, pending_names)
+            except Exception as e:
+                rejected.append(RejectedFileDTO(filename=filename, error=str(e)))
+                continue
+            documents.append(document)
+            total_bytes += document.file_size
+
+        try:
+            self.document_repository.bulk_create(documents)
+            self.audit_trail_repository.create_many([
+                AuditTrail(
+                    id=uuid4(),
+                    document_id=d.id,
+                    action=AuditAction.UPLOAD,
+                    performed_by=uploaded_by,
+                    changes={"filename": d.original_filename, "file_size": d.file_size, "bulk": True},
+                )
+                for d in documents
+            ])
+        except Exception:
+            self._delete_objects(documents)
+            raise
+
+        elapsed = time.perf_counter() - started
+        return BulkUploadResultDTO(
+            documents=[DocumentDTO.from_entity(d) for d in documents],
+            rejected=rejected,
+            total_files=total_files,
+            accepted=len(documents),
+            total_bytes=total_bytes,
+            elapsed_seconds=round(elapsed, 3),
+            files_per_second=round(len(documents) / elapsed, 2) if elapsed > 0 else 0.0,
+            megabytes_per_second=round(total_bytes / (1024 * 1024) / elapsed, 2) if elapsed > 0 else 0.0,
+        )
+
+    def _iter_files(
+        self, files: List[Tuple[str, BinaryIO]]
+    ) -> Iterator[Tuple[str, Optional[BinaryIO], int, Optional[str]]]:
+        """Yield (filename, stream, size, error) per file, expanding zip archives entry by entry.
+
+        Zip entries are decompressed lazily while they are streamed to storage.
+        """
+        for filename, file in files:
+            if not (filename or "").lower().endswith(".zip"):
+                file.seek(0, os.SEEK_END)
+                size = file.tell()
+                file.seek(0)
+                yield filename, file, size, None
+                continue
+            try:
+                archive = zipfile.ZipFile(file)
+            except zipfile.BadZipFile:
+                yield filename, None, 0, "Invalid zip archive"
+                continue
+            with archive:
+                for info in archive.infolist():
+                    name = info.filename
+                    if info.is_dir() or name.startswith("__MACOSX/") or os.path.basename(name).startswith("."):
+                        continue
+                    with archive.open(info) as entry:
+                        yield name, entry, info.file_size, None
+
+    def _store(
+        self,
+        filename: str,
+        stream: BinaryIO,
+        size: int,
+        uploaded_by: UUID,
+        pending_names: Dict[str, int],
+    ) -> Document:
+        """Validate one file on its head and stream it to storage. Returns the unsaved Document."""
+        filename = self._sanitize_filename(filename)
+
+        if size > self.max_file_size:
+            raise ValueError(f"File size exceeds maximum of {self.max_file_size / (1024*1024)}MB")
+
+        file_ext = filename.split('.')[-1].lower() if '.' in filename else ''
+        if file_ext not in self.allowed_file_types:
+            raise ValueError(f"File type '{file_ext}' not allowed. Allowed types: {', '.join(self.allowed_file_types)}")
+
+        head = stream.read(HEAD_BYTES)
+        if not self._validate_file_content(head, file_ext):
+            raise ValueError(f"File content does not match extension '{file_ext}'. The file may be corrupted or misnamed.")
+
+        filename = self._deduplicate_filename(filename, uploaded_by, pending_names)
+
+        document_id = uuid4()
+        storage_path = f"{document_id}/{filename}"
+        reader = _HeadReplayReader(head, stream, self.max_file_size)
+        self.storage_service.upload_stream(storage_path, reader, length=size)
+
+        document = Document(
+            id=document_id,
+            original_filename=filename,
+            file_type=file_ext,
+            file_size=size,
+            storage_path=storage_path,
+            uploaded_by=uploaded_by,
+            status=DocumentStatus.UPLOADED,
+        )
+        document.record_event(DocumentUploaded(
+            document_id=document_id,
+            uploaded_by=uploaded_by,
+            timestamp=document.uploaded_at,
+        ))
+        return document
+
+    def _delete_objects(self, documents: List[Document]) -> None:
+        """Best-effort removal of stored objects when the batch insert fails."""
+        for d in documents:
+            try:
+                self.storage_service.delete_file(d.storage_path)
+            except Exception:
+                pass
+
@@ -0,0 +1,189 @@
+"""Use case for direct-to-storage uploads: presigned PUT, then server-side finalize."""
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from ...domain.entities.document import Document, DocumentStatus
+from ...domain.entities.audit_trail import AuditTrail, AuditAction
+from ...domain.events.document_events import DocumentUploaded
+from ...infrastructure.auth.jwt import create_upload_token, decode_token
+from ...infrastructure.persistence.repositories import DocumentRepository, AuditTrailRepository
+from ...infrastructure.external.storage.base import StorageService, STAGING_UPLOAD_PREFIX
+from ...application.dtos.document_dto import DocumentDTO, DirectUploadDTO
+from .upload_document import UploadDocumentUseCase, HEAD_BYTES
+
+
+class DirectUploadUseCase(UploadDocumentUseCase):
+    """Lets clients upload straight to object storage instead of through the API.
+
+    ``initiate`` validates the declared filename and size, reserves a staging
+    key under ``uploads/`` and returns a presigned PUT URL for it together
+    with a signed upload token. After the client has uploaded, ``finalize``
+    copies the object server-side to the document's own key, which the URL
+    cannot reach, checks the copy (size via stat, magic bytes via a ranged GET
+    of its head) and only then creates the document and its audit entry. The
+    staging object is deleted; uploads never finalized are expired by the
+    storage backend.
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        audit_trail_repository: AuditTrailRepository,
+        storage_service: StorageService,
+        max_file_size_mb: int = 10,
+        allowed_file_types: list = None,
+        expires_seconds: int = 900,
+    ):
+        super().__init__(
+            document_repository=document_repository,
+            audit_trail_repository=audit_trail_repository,
+            storage_service=storage_service,
+            max_file_size_mb=max_file_size_mb,
+            allowed_file_types=allowed_file_types,
+        )
+        self.expires_seconds = expires_seconds
+
+    def initiate(self, filename: str, file_size: int, uploaded_by: UUID) -> DirectUploadDTO:
+        """
+        Reserve a storage key and issue a presigned upload URL.
+
+        Args:
+            filename: Original filename
+            file_size: Declared file size in bytes
+            uploaded_by: User ID
+
+        Returns:
+            DirectUploadDTO
+
+        Raises:
+            ValueError: If the file is not acceptable
+            NotImplementedError: If the storage backend cannot presign uploads
+        """
+        filename = self._sanitize_filename(filename)
+
+        if file_size <= 0:
+            raise ValueError("File is empty")
+        if file_size > self.max_file_size:
+            raise ValueError(f"File size exceeds maximum of {self.max_file_size / (1024*1024)}MB")
+
+        file_ext = filename.split('.')[-1].lower() if '.' in filename else ''
+        if file_ext not in self.allowed_file_types:
+            raise ValueError(f"File type '{file_ext}' not allowed. Allowed types: {', '.join(self.allowed_file_types)}")
+
+        document_id = uuid4()
+        storage_path = f"{STAGING_UPLOAD_PREFIX}{document_id}/{filename}"
+        upload_url = self.storage_service.presigned_upload_url(storage_path, expires_seconds=self.expires_seconds)
+        if not upload_url:
+            raise NotImplementedError("Direct uploads are not supported by the storage backend")
+
+        expires_in = timedelta(seconds=self.expires_seconds)
+        token = create_upload_token(
+            {
+                "sub": str(uploaded_by),
+                "document_id": str(document_id),
+                "storage_path": storage_path,
+                "filename": filename,
+                "file_size": file_size,
+            },
+            expires_delta=expires_in,
+        )
+        return DirectUploadDTO(
+            document_id=document_id,
+            upload_url=upload_url,
+            upload_token=token,
+            expires_at=datetime.utcnow() + expires_in,
+        )
+
+    def finalize(self, upload_token: str, uploaded_by: UUID) -> DocumentDTO:
+        """
+        Validate the uploaded object and create its document.
+
+        Args:
+            upload_token: Token returned by ``initiate``
+            uploaded_by: User ID (must match the user who initiated the upload)
+
+        Returns:
+            DocumentDTO
+
+        Raises:
+            ValueError: If the token is invalid or the stored object is rejected
+        """
+        claims = decode_token(upload_token)
+        if not claims or claims.get("type") != "upload" or claims.get("sub") != str(uploaded_by):
+            raise ValueError("Invalid or expired upload token")
+
+        document_id = UUID(claims["document_id"])
+        upload_path = claims["storage_path"]
+        filename = claims["filename"]
+        file_ext = filename.split('.')[-1].lower()
+        # The presigned URL stays valid after finalize: the document gets its own copy
+        storage_path = f"{document_id}/{filename}"
+
+        if self.document_repository.get_by_id(document_id) is not None:
+            raise ValueError("Upload already finalized")
+
+        try:
+            upload_size = self.storage_service.stat_file(upload_path).size
+        except Exception:
+            raise ValueError("Uploaded file not found")
+
+        try:
+            self._check_size(upload_size, claims["file_size"])
+            self.storage_service.copy_file(upload_path, storage_path)
+            # Validate the copy, not the upload key, which may have been overwritten since the stat
+            file_size = self.storage_service.stat_file(storage_path).size
+            self._check_size(file_size, claims["file_size"])
+
+            stream = self.storage_service.open_stream(storage_path, offset=0, length=HEAD_BYTES)
+            try:
+                head = stream.read(HEAD_BYTES)
+            finally:
+                stream.close()
+            if not self._validate_file_content(head, file_ext):
+                raise ValueError(f"File content does not match extension '{file_ext}'. The file may be corrupted or misnamed.")
+        except ValueError:
+            self._delete_object(storage_path)
+            self._delete_object(upload_path)
+            raise
+        self._delete_object(upload_path)
+
+        filename = self._deduplicate_filename(filename, uploaded_by)
+
+        document = Document(
+            id=document_id,
+            original_filename=filename,
+            file_type=file_ext,
+            file_size=file_size,
+            storage_path=storage_path,
+            uploaded_by=uploaded_by,
+            status=DocumentStatus.UPLOADED,
+        )
+        document.record_event(DocumentUploaded(
+            document_id=document_id,
+            uploaded_by=uploaded_by,
+            timestamp=document.uploaded_at,
+        ))
+        saved_document = self.document_repository.create(document)
+
+        self.audit_trail_repository.create(AuditTrail(
+            id=uuid4(),
+            document_id=document_id,
+            action=AuditAction.UPLOAD,
+            performed_by=uploaded_by,
+            changes={"filename": filename, "file_size": file_size, "direct": True},
+        ))
+
+        return DocumentDTO.from_entity(saved_document)
+
+    def _check_size(self, file_size: int, declared_size: int) -> None:
+        if file_size != declared_size:
+            raise ValueError(f"Uploaded size {file_size} does not match declared size {declared_size}")
+        if file_size > self.max_file_size:
+            raise ValueError(f"File size exceeds maximum of {self.max_file_size / (1024*1024)}MB")
+
+    def _delete_object(self, storage_path: str) -> None:
+        """Best-effort removal of a staging or rejected object."""
+        try:
+            self.storage_service.delete_file(storage_path)
+        except Exception:
+            pass
@@ -0,0 +1,263 @@
+"""
+Outbox relay for TMS exports.
+
+Exports are written as PENDING rows of the ``exports`` table in the same
+transaction as the approval/export request that creates them, so nothing is
+lost if the process dies before the TMS is reached. The export worker runs
+``DispatchExportsUseCase`` in a loop; each run
+
+- leases up to ``limit`` due PENDING exports in a short transaction
+  (``FOR UPDATE SKIP LOCKED``, then ``next_attempt_at`` pushed
+  ``EXPORT_LEASE_SECONDS`` ahead and committed), so several relays can run
+  side by side without sending a row twice and no locks are held while the
+  TMS is called,
+- sends them through the pooled ``TMSClient``: grouped per endpoint, in TMS
+  batch payloads when the client's ``batch_size`` > 1, at most
+  ``concurrency`` requests in flight, each with the export id as
+  idempotency key,
+- records, in a second transaction, one ``export_attempts`` row per export
+  and writes all export statuses, and the EXPORTED documents, with one bulk
+  statement each.
+
+If the relay dies or the recording transaction fails after sending, the
+lease expires and the exports are sent again; the idempotency key lets the
+TMS drop the duplicates. Claiming counts the attempt, so an export whose
+result can never be recorded still runs out of ``EXPORT_MAX_ATTEMPTS``: once
+out, it is marked FAILED at its next claim instead of being sent.
+
+Failed transient attempts stay PENDING with ``next_attempt_at`` pushed back
+by exponential backoff (``retry.backoff_delay``); permanent failures (TMS
+rejections, 4xx) and exports out of attempts become FAILED.
+
+The Redis ``exports`` queue (``enqueue_exports``) only wakes the relay up
+early; the rows are the source of truth.
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID, uuid4
+
+import httpx
+from sqlalchemy.orm import Session
+
+from ...domain.entities.document import DocumentStatus
+from ...domain.entities.export import Export
+from ...domain.entities.export_attempt import ExportAttempt
+from ...domain.events.document_events import ExportCompleted
+from ...infrastructure.error_handling.error_categorizer import ErrorCategorizer
+from ...infrastructure.error_handling.retry import backoff_delay
+from ...infrastructure.external.tms.client import TMSClient
+from ...infrastructure.messaging.redis_queue import RedisQueue
+from ...infrastructure.monitoring.logging import get_logger
+from ...infrastructure.monitoring.metrics import MetricsCollector
+from ...infrastructure.persistence.repositories import (
+    DocumentRepository, ExportAttemptRepository, ExportRepository,
+)
+
+logger = get_logger("sortex.application.dispatch_exports")
+
+EXPORT_QUEUE = "exports"
+# false: the export route sends synchronously, inside the request (no export worker needed)
+EXPORT_DISPATCH_ENABLED = os.getenv("EXPORT_DISPATCH_ENABLED", "true").lower() == "true"
+# Exports claimed per relay run (one locking query, one bulk update)
+EXPORT_DISPATCH_BATCH = int(os.getenv("EXPORT_DISPATCH_BATCH", "200"))
+# TMS requests in flight per worker
+EXPORT_CONCURRENCY = int(os.getenv("EXPORT_CONCURRENCY", "8"))
+# Attempts before an export is given up (FAILED)
+EXPORT_MAX_ATTEMPTS = int(os.getenv("EXPORT_MAX_ATTEMPTS", "8"))
+EXPORT_RETRY_INITIAL_DELAY = float(os.getenv("EXPORT_RETRY_INITIAL_DELAY", "30"))
+EXPORT_RETRY_MAX_DELAY = float(os.getenv("EXPORT_RETRY_MAX_DELAY", "3600"))
+# How long claimed exports are hidden from other relays; must exceed the time to send a batch
+EXPORT_LEASE_SECONDS = float(os.getenv("EXPORT_LEASE_SECONDS", "600"))
+
+LEASES_EXHAUSTED_ERROR = "Out of attempts: earlier deliveries were sent but their results were never recorded"
+
+# HTTP statuses worth retrying; other 4xx mean the TMS refused the payload
+_RETRYABLE_STATUS = {408, 425, 429}
+
+
+def enqueue_exports(redis_queue: RedisQueue, export_ids: Iterable[UUID]) -> int:
+    """Wake the export relay for new exports (one round trip). Returns the queue length."""
+    return redis_queue.enqueue_many(EXPORT_QUEUE, [{"export_id": str(export_id)} for export_id in export_ids])
+
+
+def wake_export_relay(redis_queue: RedisQueue) -> None:
+    """Wake the export relay without naming the exports (it claims whatever is due)."""
+    redis_queue.enqueue(EXPORT_QUEUE, {})
+
+
+class Delivery(NamedTuple):
+    """Outcome of sending one export"""
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+    retryable: bool = False
+    duration_ms: int = 0
+
+
+class DispatchExportsUseCase:
+    """Relay due outbox exports to the TMS (see module docstring)."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        tms_client: TMSClient,
+        concurrency: int = EXPORT_CONCURRENCY,
+        max_attempts: int = EXPORT_MAX_ATTEMPTS,
+        lease_seconds: float = EXPORT_LEASE_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.tms_client = tms_client
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+
+    async def execute(self, limit: int = EXPORT_DISPATCH_BATCH) -> Dict[str, int]:
+        """
+        Send one batch of due exports.
+
+        Returns:
+            Counts of "success", "retry" (rescheduled) and "failed" exports;
+            all zero when nothing was due
+        """
+        counts = {"success": 0, "retry": 0, "failed": 0}
+        exports = self._claim(limit)
+        if not exports:
+            return counts
+
+        # Attempts used up by leases that expired without a recorded result
+        exhausted = {export.id for export in exports if export.retry_count >= self.max_attempts}
+        started = time.monotonic()
+        deliveries = await self._send([export for export in exports if export.id not in exhausted])
+        duration = time.monotonic() - started
+        deliveries.update({export_id: Delivery(LEASES_EXHAUSTED_ERROR) for export_id in exhausted})
+
+        session = self.session_factory()
+        try:
+            export_repo = ExportRepository(session)
+            attempted_at = datetime.utcnow()
+            attempts = []
+            succeeded = []
+            for export in exports:
+                delivery = deliveries[export.id]
+                attempts.append(ExportAttempt(
+                    id=uuid4(),
+                    export_id=export.id,
+                    attempt=export.retry_count + 1,
+                    success=delivery.error is None,
+                    status_code=delivery.status_code,
+                    error_message=delivery.error,
+                    duration_ms=delivery.duration_ms,
+                    attempted_at=attempted_at,
+                ))
+                export.last_attempt_at = attempted_at
+                if delivery.error is None:
+                    export.mark_success()
+                    succeeded.append(export)
+                    counts["success"] += 1
+                elif delivery.retryable and export.retry_count + 1 < self.max_attempts:
+                    export.schedule_retry(
+                        delivery.error,
+                        backoff_delay(export.retry_count + 1, EXPORT_RETRY_INITIAL_DELAY, EXPORT_RETRY_MAX_DELAY),
+                    )
+                    counts["retry"] += 1
+                else:
+                    export.mark_failed(delivery.error)
+                    counts["failed"] += 1
+
+            export_repo.bulk_update(exports)
+            ExportAttemptRepository(session).bulk_create(attempts)
+            self._mark_documents_exported(DocumentRepository(session), succeeded)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        MetricsCollector.record_export_batch(
+            succeeded=counts["success"], failed=counts["retry"] + counts["failed"], duration=duration
+        )
+        logger.info("Exports dispatched", duration_seconds=round(duration, 3), **counts)
+        return counts
+
+    def _claim(self, limit: int) -> List[Export]:
+        """Lease due exports in their own short transaction."""
+        session = self.session_factory()
+        try:
+            lease_until = datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+            exports = ExportRepository(session).claim_due(limit, lease_until)
+            session.commit()
+            return exports
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    async def _send(self, exports: List[Export]) -> Dict[UUID, Delivery]:
+        """Send all exports, returning the delivery outcome per export id."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send_chunk(endpoint: str, chunk: List[Export]) -> List[Tuple[UUID, Delivery]]:
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    if len(chunk) == 1 and self.tms_client.batch_size == 1:
+                        status_code = await self.tms_client.send(
+                            endpoint, chunk[0].export_payload, idempotency_key=str(chunk[0].id)
+                        )
+                        errors = [None]
+                    else:
+                        status_code, errors = await self.tms_client.send_batch(
+                            endpoint, [e.export_payload for e in chunk], [str(e.id) for e in chunk]
+                        )
+                    elapsed = int((time.monotonic() - started) * 1000)
+                    # Items the TMS rejected in a successful request will not pass on retry
+                    deliveries = [Delivery(error, status_code, False, elapsed) for error in errors]
+                except Exception as e:
+                    elapsed = int((time.monotonic() - started) * 1000)
+                    deliveries = [self._failed_delivery(e, elapsed)] * len(chunk)
+            return [(export.id, delivery) for export, delivery in zip(chunk, deliveries)]
+
+        results = await asyncio.gather(*(send_chunk(endpoint, chunk) for endpoint, chunk in self._chunks(exports)))
+        return {export_id: delivery for chunk_result in results for export_id, delivery in chunk_result}
+
+    @staticmethod
+    def _failed_delivery(error: Exception, duration_ms: int) -> Delivery:
+        message = f"{type(error).__name__}: {error}"
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return Delivery(message, status_code, status_code >= 500 or status_code in _RETRYABLE_STATUS, duration_ms)
+        return Delivery(message, None, ErrorCategorizer.should_retry(error), duration_ms)
+
+    def _chunks(self, exports: List[Export]) -> List[Tuple[str, List[Export]]]:
+        """Group exports by endpoint and split the groups into TMS batches."""
+        by_endpoint: Dict[str, List[Export]] = {}
+        for export in exports:
+            by_endpoint.setdefault(export.exported_to, []).append(export)
+        size = self.tms_client.batch_size
+        return [
+            (endpoint, group[start:start + size])
+            for endpoint, group in by_endpoint.items()
+            for start in range(0, len(group), size)
+        ]
+
+    @staticmethod
+    def _mark_documents_exported(document_repo: DocumentRepository, exports: List[Export]) -> None:
+        if not exports:
+            return
+        export_by_document = {e.document_id: e for e in exports}
+        documents = document_repo.get_by_ids(export_by_document)
+        now = datetime.utcnow()
+        for document in documents:
+            export = export_by_document[document.id]
+            document.record_event(ExportCompleted(
+                document_id=document.id,
+                export_id=export.id,
+                status=export.export_status.value,
+                timestamp=now,
+            ))
+            document.update_status(DocumentStatus.EXPORTED)
+        document_repo.bulk_update_status(documents)
@@ -7,12 +7,27 @@ import os
 from ...domain.entities.document import DocumentStatus
 from ...domain.entities.export import Export, ExportStatus
 from ...domain.entities.audit_trail import AuditTrail, AuditAction
+from ...domain.events.document_events import ExportCompleted
 from ...infrastructure.persistence.repositories import (
     DocumentRepository, ExtractionRepository, ReviewRepository,
     ExportRepository, AuditTrailRepository
 )
 from ...application.dtos.export_dto import ExportCreateDTO, ExportDTO
 
+# Shared by synchronous exports so keep-alive connections to the TMS are reused
+_http_client = httpx.Client(timeout=30.0)
+
+
+def format_export_payload(document, data: Dict[str, Any]) -> Dict[str, Any]:
+    """TMS payload of a document's extracted (and reviewed) fields"""
+    return {
+        "document_id": str(document.id),
+        "document_type": document.document_type.value if document.document_type else "UNKNOWN", # for example: "CMR", "INVOICE", "DELIVERY_NOTE"
+        "original_filename": document.original_filename,
+        "data": data, # The extracted structured fields
+        "exported_at": datetime.utcnow().isoformat(),
+    }
+
 
 class ExportToTMSUseCase:
     """Use case for exporting documents to TMS"""
@@ -26,6 +41,7 @@ class ExportToTMSUseCase:
         audit_trail_repository: AuditTrailRepository,
         tms_api_url: str = None,
         tms_api_key: str = None,
+        dispatch_async: bool = False,
     ):
         self.document_repository = document_repository
         self.extraction_repository = extraction_repository
@@ -35,6 +51,9 @@ class ExportToTMSUseCase:
         # TODO: Production TMS API URL and key will be used in production
         self.tms_api_url = tms_api_url or os.getenv("TMS_API_URL", "http://mock-tms:8080/api")
         self.tms_api_key = tms_api_key or os.getenv("TMS_API_KEY", "")
+        # Leave the export PENDING for the export worker (the caller queues it
+        # with enqueue_exports after commit) instead of sending it here
+        self.dispatch_async = dispatch_async
     
     def execute(self, document_id: UUID, export_data: ExportCreateDTO, exported_by: UUID) -> ExportDTO:
         """
@@ -78,12 +97,21 @@ class ExportToTMSUseCase:
         saved_export = self.export_repository.create(export)
         
         # Attempt export
+        if self.dispatch_async:
+            self._record_audit(document_id, saved_export, export_data, exported_by)
+            return ExportDTO.from_entity(saved_export)
         try:
-            self._send_to_tms(export_payload, export_data.exported_to)
+            self._send_to_tms(export_payload, export_data.exported_to, saved_export.id)
             saved_export.mark_success()
             self.export_repository.update(saved_export)
             
             # Update document status
+            document.record_event(ExportCompleted(
+                document_id=document_id,
+                export_id=saved_export.id,
+                status=saved_export.export_status.value,
+                timestamp=datetime.utcnow(),
+            ))
             document.update_status(DocumentStatus.EXPORTED)
             self.document_repository.update(document)
         except Exception as e:
@@ -91,36 +119,33 @@ class ExportToTMSUseCase:
             self.export_repository.update(saved_export)
             raise
         
-        # Create audit trail
+        self._record_audit(document_id, saved_export, export_data, exported_by)
+        
+        return ExportDTO.from_entity(saved_export)
+
+    def _record_audit(self, document_id: UUID, export: Export, export_data: ExportCreateDTO, exported_by: UUID) -> None:
+        """Create audit trail"""
         audit_trail = AuditTrail(
             id=uuid4(),
             document_id=document_id,
             action=AuditAction.EXPORT,
             performed_by=exported_by,
-            changes={"export_id": str(saved_export.id), "exported_to": export_data.exported_to},
+            changes={"export_id": str(export.id), "exported_to": export_data.exported_to},
         )
         self.audit_trail_repository.create(audit_trail)
-        
-        return ExportDTO.from_entity(saved_export)
     
     def _format_export_payload(self, document, data: Dict[str, Any]) -> Dict[str, Any]:
         """Format data for TMS export"""
-        return {
-            "document_id": str(document.id),
-            "document_type": document.document_type.value if document.document_type else "UNKNOWN", # for example: "CMR", "INVOICE", "DELIVERY_NOTE"
-            "original_filename": document.original_filename,
-            "data": data, # The extracted structured fields
-            "exported_at": datetime.utcnow().isoformat(),
-        }
+        return format_export_payload(document, data)
     
-    def _send_to_tms(self, payload: Dict[str, Any], endpoint: str) -> None:
+    def _send_to_tms(self, payload: Dict[str, Any], endpoint: str, export_id: UUID) -> None:
         """Send data to TMS API"""
         url = f"{self.tms_api_url}/{endpoint}"
-        headers = {}
+        # Same key as the export relay would send (see tms/client.py)
+        headers = {"Idempotency-Key": str(export_id)}
         if self.tms_api_key:
             headers["Authorization"] = f"Bearer {self.tms_api_key}"
         
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
+        response = _http_client.post(url, json=payload, headers=headers)
+        response.raise_for_status()
 
@@ -1,20 +1,47 @@
+import os
 from uuid import UUID, uuid4
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from ...domain.entities.document import DocumentStatus
+from PIL import Image
+
+from ...domain.entities.document import Document, DocumentStatus, DocumentType
 from ...domain.entities.extraction import Extraction, ExtractionMethod
 from ...domain.entities.audit_trail import AuditTrail, AuditAction
+from ...domain.events.document_events import ExtractionCompleted
 from ...domain.services.document_type_classifier import DocumentTypeClassifier
 from ...domain.services.layout_analyzer import LayoutAnalyzer
+from ...domain.services.page_relevance import PageRelevanceScorer
 from ...infrastructure.persistence.repositories import (
     DocumentRepository, ExtractionRepository, AuditTrailRepository
 )
-from ...infrastructure.external.ocr.base import OCRService
+from ...infrastructure.external.ocr.base import OCRService, OCRResult, merge_page_results
+from ...infrastructure.external.ocr.pdf_text_layer import read_text_layer, DEFAULT_MIN_CHARS_PER_PAGE
+from ...infrastructure.external.ocr.rasterize import convert_to_images
 from ...infrastructure.external.llm.base import LLMService
 from ...infrastructure.external.storage.base import StorageService
+from ...infrastructure.external.storage.extraction_checkpoints import ExtractionCheckpointStore
+from ...infrastructure.external.storage.ocr_artifacts import (
+    OCRArtifactStore, ocr_result_from_payload, ocr_result_to_payload,
+)
+from ...infrastructure.external.storage.page_images import PageImageStore
 from ...infrastructure.external.llm.base import LLMExtractionResult
 from ...application.dtos.extraction_dto import ExtractionDTO
 from ...application.extraction_schemas import get_extraction_schema
+from ...infrastructure.error_handling.error_categorizer import ErrorCategorizer
+from ...infrastructure.monitoring.logging import get_logger
+from .validate_data import ValidateDataUseCase
+
+logger = get_logger("sortex.application.extract_fields")
+
+# Read born-digital PDF pages from their embedded text layer instead of OCRing them
+PDF_TEXT_LAYER_ENABLED = os.getenv("PDF_TEXT_LAYER_ENABLED", "true").lower() == "true"
+PDF_TEXT_LAYER_MIN_CHARS = int(os.getenv("PDF_TEXT_LAYER_MIN_CHARS", str(DEFAULT_MIN_CHARS_PER_PAGE)))
+# Two-pass OCR for long PDFs: a cheap pass picks the pages that get full layout/table OCR
+SELECTIVE_OCR_ENABLED = os.getenv("SELECTIVE_OCR_ENABLED", "false").lower() == "true"
+SELECTIVE_OCR_MIN_PAGES = int(os.getenv("SELECTIVE_OCR_MIN_PAGES", "6"))
+# Cheap pass resolution as a fraction of the OCR resolution (200 DPI -> 100 DPI)
+SELECTIVE_OCR_QUICK_PASS_FACTOR = 2
 
 
 class ExtractFieldsUseCase:
@@ -29,6 +56,10 @@ class ExtractFieldsUseCase:
         llm_service: LLMService,
         storage_service: StorageService,
         document_type_classifier: DocumentTypeClassifier,
+        ocr_artifact_store: Optional[OCRArtifactStore] = None,
+        page_image_store: Optional[PageImageStore] = None,
+        validate_data_use_case: Optional[ValidateDataUseCase] = None,
+        checkpoint_store: Optional[ExtractionCheckpointStore] = None,
     ):
         self.document_repository = document_repository
         self.extraction_repository = extraction_repository
@@ -37,14 +68,32 @@ class ExtractFieldsUseCase:
         self.llm_service = llm_service
         self.storage_service = storage_service
         self.document_type_classifier = document_type_classifier
+        self.ocr_artifact_store = ocr_artifact_store
+        self.page_image_store = page_image_store
+        # Chained validation stage (see create_auto_validator); None stops at EXTRACTED
+        self.validate_data_use_case = validate_data_use_case
+        # Stage outputs of failed attempts, for resume=True retries; None: retries start over
+        self.checkpoint_store = checkpoint_store
+        self.page_relevance_scorer = PageRelevanceScorer()
+        # OCR artifacts of the extractions replaced by execute(); see delete_stale_artifacts
+        self.stale_artifact_keys: List[str] = []
+        # OCR artifact uploaded by execute() for the new extraction; see discard_new_artifact
+        self.new_artifact_key: Optional[str] = None
     
-    def execute(self, document_id: UUID) -> ExtractionDTO:
+    def execute(self, document_id: UUID, resume: bool = False, retry_llm_errors: bool = False) -> ExtractionDTO:
         """
         Extract fields from document.
-        
+
+        The pipeline runs in stages (download + OCR, classify, LLM, persist).
+        When an attempt fails, the outputs of the stages it finished are
+        checkpointed; a retry with ``resume`` skips them.
+
         Args:
             document_id: Document ID
-        
+            resume: Continue from the checkpoints of a failed attempt
+            retry_llm_errors: Raise transient LLM errors (the retry resumes at
+                the LLM stage) instead of saving an OCR-only extraction
+
         Returns:
             ExtractionDTO
         """
@@ -57,30 +106,34 @@ class ExtractFieldsUseCase:
         document.update_status(DocumentStatus.PROCESSING)
         self.document_repository.update(document)
         
+        # Outputs of the stages done so far; on failure the new ones are checkpointed
+        stages = self._load_checkpoints(document_id) if resume else {}
+        resumed = set(stages)
         try:
-            # Download file from storage
-            file_bytes = self.storage_service.download_file(document.storage_path)
-            
-            # Run OCR
-            ocr_result = self.ocr_service.extract_text_from_bytes(file_bytes, document.file_type)
-            
-            # Classify document type with confidence scoring
-            classification = self.document_type_classifier.classify_with_confidence(
-                ocr_result.text,
-                {"filename": document.original_filename},
-                llm_service=self.llm_service,
-            )
-            document.update_document_type(classification.document_type)
+            if "ocr" not in stages:
+                # Download the file and run OCR (or read the PDF text layer)
+                file_bytes = self.storage_service.download_file(document.storage_path)
+                stages["ocr"] = self._run_ocr(document, file_bytes)
+            ocr_result, ocr_metadata = stages["ocr"]
 
-            classification_metadata = {
-                "classification_confidence": classification.confidence,
-                "classification_method": classification.method,
-                "classification_runner_up": classification.runner_up_type.value if classification.runner_up_type else None,
-                "classification_runner_up_confidence": classification.runner_up_confidence,
-            }
+            if "classify" not in stages:
+                # Classify document type with confidence scoring
+                classification = self.document_type_classifier.classify_with_confidence(
+                    ocr_result.text,
+                    {"filename": document.original_filename},
+                    llm_service=self.llm_service,
+                )
+                stages["classify"] = (classification.document_type, {
+                    "classification_confidence": classification.confidence,
+                    "classification_method": classification.method,
+                    "classification_runner_up": classification.runner_up_type.value if classification.runner_up_type else None,
+                    "classification_runner_up_confidence": classification.runner_up_confidence,
+                })
+            document_type, classification_metadata = stages["classify"]
+            document.update_document_type(document_type)
 
             # Get extraction schema based on document type
-            schema = get_extraction_schema(classification.document_type.value)
+            schema = get_extraction_schema(document_type.value)
 
             # Build layout-aware context from PP-Structure regions (preferred)
             # or fall back to raw layout data
@@ -90,46 +143,58 @@ class ExtractFieldsUseCase:
                 layout_context = analyzer.format_for_llm(ocr_result.regions, char_budget=3500)
 
             # Run LLM extraction
-            try:
-                llm_result = self.llm_service.extract_fields(
-                    ocr_result.text,
-                    classification.document_type.value,
-                    schema,
-                    layout_context=layout_context
-                )
-            except Exception as llm_error:
-                # Log the error for debugging
-                import traceback
-                error_details = {
-                    "error": str(llm_error),
-                    "error_type": type(llm_error).__name__,
-                    "traceback": traceback.format_exc()
-                }
-                # If LLM fails, create a basic extraction with OCR only
-                
-                llm_result = LLMExtractionResult(
-                    structured_data={},  # Empty structured data
-                    confidence_scores={},
-                    metadata={
-                        "error": str(llm_error),
-                        "error_type": type(llm_error).__name__,
-                        "fallback": "ocr_only"
-                    }
-                )
-            
+            if "llm" in stages:
+                llm_result = stages["llm"]
+            else:
+                try:
+                    llm_result = stages["llm"] = self.llm_service.extract_fields(
+                        ocr_result.text,
+                        document_type.value,
+                        schema,
+                        layout_context=layout_context
+                    )
+                except Exception as llm_error:
+                    if retry_llm_errors and ErrorCategorizer.should_retry(llm_error):
+                        raise
+                    # If LLM fails, create a basic extraction with OCR only
+                    # (not checkpointed: a retry should try the LLM again)
+                    llm_result = LLMExtractionResult(
+                        structured_data={},  # Empty structured data
+                        confidence_scores={},
+                        metadata={
+                            "error": str(llm_error),
+                            "error_type": type(llm_error).__name__,
+                            "fallback": "ocr_only"
+                        }
+                    )
+
             # Delete any existing extraction for this document (for reprocessing)
+            self.stale_artifact_keys = list(self.extraction_repository.get_raw_text_keys(document_id))
             self.extraction_repository.delete_by_document_id(document_id)
 
+            # Offload full OCR text + layout to storage when configured,
+            # keeping only the object key on the extractions row
+            extraction_id = uuid4()
+            raw_text = ocr_result.text
+            raw_text_key = None
+            if self.ocr_artifact_store is not None:
+                raw_text_key = self.new_artifact_key = self.ocr_artifact_store.save(
+                    document_id, extraction_id, ocr_result
+                )
+                raw_text = None
+
             # Create extraction entity
             extraction = Extraction(
-                id=uuid4(),
+                id=extraction_id,
                 document_id=document_id,
                 extraction_method=ExtractionMethod.OCR_LLM,
-                raw_text=ocr_result.text,
+                raw_text=raw_text,
+                raw_text_key=raw_text_key,
                 structured_data=llm_result.structured_data,
                 confidence_scores=llm_result.confidence_scores,
                 extraction_metadata={
                     "ocr_provider": type(self.ocr_service).__name__,
+                    **ocr_metadata,
                     "llm_provider": llm_result.metadata.get("provider"),
                     "llm_model": llm_result.metadata.get("model"),
                     "ocr_regions_count": len(ocr_result.regions),
@@ -139,6 +204,7 @@ class ExtractFieldsUseCase:
                     "layout_formatted_chars": len(layout_context) if layout_context else 0,
                     **llm_result.metadata,
                     **classification_metadata,
+                    **({"resumed_stages": sorted(resumed)} if resumed else {}),
                 }
             )
 
@@ -146,7 +212,17 @@ class ExtractFieldsUseCase:
             saved_extraction = self.extraction_repository.create(extraction)
             
             # Update document status
+            document.record_event(ExtractionCompleted(
+                document_id=document_id,
+                extraction_id=saved_extraction.id,
+                timestamp=datetime.utcnow(),
+            ))
             document.update_status(DocumentStatus.EXTRACTED)
+
+            # Validate the in-memory extraction in the same transaction
+            # (document -> VALIDATED) instead of waiting for the validations route
+            if self.validate_data_use_case is not None:
+                self.validate_data_use_case.validate_extraction(document, saved_extraction)
             self.document_repository.update(document)
             
             # Create audit trail
@@ -165,5 +241,149 @@ class ExtractFieldsUseCase:
             # Update status to FAILED
             document.update_status(DocumentStatus.FAILED)
             self.document_repository.update(document)
+            self._save_checkpoints(document_id, {k: v for k, v in stages.items() if k not in resumed})
+            self.discard_new_artifact()
             raise
 
+    def delete_stale_artifacts(self) -> None:
+        """Delete the OCR artifacts of the replaced extractions. Call after the transaction commits."""
+        artifact_store = self.ocr_artifact_store or OCRArtifactStore(self.storage_service)
+        for key in self.stale_artifact_keys:
+            try:
+                artifact_store.delete(key)
+            except Exception as e:
+                logger.warning("Failed to delete stale OCR artifact", key=key, error=str(e))
+        self.stale_artifact_keys = []
+        self.new_artifact_key = None
+
+    def discard_new_artifact(self) -> None:
+        """Delete the OCR artifact uploaded for the new extraction. Call when its transaction rolls back."""
+        key, self.new_artifact_key = self.new_artifact_key, None
+        self.stale_artifact_keys = []
+        if key is None:
+            return
+        try:
+            (self.ocr_artifact_store or OCRArtifactStore(self.storage_service)).delete(key)
+        except Exception as e:
+            logger.warning("Failed to delete orphaned OCR artifact", key=key, error=str(e))
+
+    def _load_checkpoints(self, document_id: UUID) -> Dict[str, Any]:
+        """Stage outputs checkpointed by a failed attempt, in the form ``execute`` keeps them."""
+        if self.checkpoint_store is None:
+            return {}
+        try:
+            payloads = self.checkpoint_store.load(document_id)
+        except Exception as e:
+            logger.warning("Failed to load extraction checkpoints, starting over", document_id=str(document_id), error=str(e))
+            return {}
+        stages: Dict[str, Any] = {}
+        if "ocr" in payloads:
+            stages["ocr"] = (ocr_result_from_payload(payloads["ocr"]["result"]), payloads["ocr"]["metadata"])
+        if "classify" in payloads:
+            stages["classify"] = (DocumentType(payloads["classify"]["document_type"]), payloads["classify"]["metadata"])
+        if "llm" in payloads:
+            stages["llm"] = LLMExtractionResult(**payloads["llm"])
+        return stages
+
+    def _save_checkpoints(self, document_id: UUID, stages: Dict[str, Any]) -> None:
+        """Checkpoint the stages a failed attempt finished (best effort: the retry redoes what is missing)."""
+        if self.checkpoint_store is None or not stages:
+            return
+        payloads = {}
+        if "ocr" in stages:
+            ocr_result, ocr_metadata = stages["ocr"]
+            payloads["ocr"] = {"result": ocr_result_to_payload(ocr_result), "metadata": ocr_metadata}
+        if "classify" in stages:
+            document_type, classification_metadata = stages["classify"]
+            payloads["classify"] = {"document_type": document_type.value, "metadata": classification_metadata}
+        if "llm" in stages:
+            llm_result = stages["llm"]
+            payloads["llm"] = {
+                "structured_data": llm_result.structured_data,
+                "confidence_scores": llm_result.confidence_scores,
+                "metadata": llm_result.metadata,
+            }
+        try:
+            self.checkpoint_store.save(document_id, payloads)
+        except Exception as e:
+            logger.warning("Failed to save extraction checkpoints", document_id=str(document_id), error=str(e))
+
+    def _run_ocr(self, document: Document, file_bytes: bytes) -> Tuple[OCRResult, Dict[str, Any]]:
+        """
+        Get text and layout for a document.
+
+        PDF pages with an embedded text layer are read directly; only pages
+        without one (scans, image-only pages) are OCRed.
+
+        Returns:
+            (OCRResult, metadata describing where the text came from)
+        """
+        text_layer = read_text_layer(file_bytes) if document.file_type == "pdf" and PDF_TEXT_LAYER_ENABLED else None
+        missing = text_layer.missing_pages(PDF_TEXT_LAYER_MIN_CHARS) if text_layer else []
+        if text_layer is None or not text_layer.pages or len(missing) == len(text_layer.pages):
+            return self._ocr_document(document, file_bytes)
+
+        ocr_pages = {}
+        for index, image in zip(missing, self._page_images(document, file_bytes, missing)):
+            ocr_pages[index] = self.ocr_service.extract_text_from_images([image])
+        return text_layer.to_ocr_result(ocr_pages), {
+            "ocr_source": "mixed" if missing else "text_layer",
+            "text_layer_pages": len(text_layer.pages) - len(missing),
+            "ocr_pages": len(missing),
+        }
+
+    def _ocr_document(self, document: Document, file_bytes: bytes) -> Tuple[OCRResult, Dict[str, Any]]:
+        """OCR the document (on its stored page images when available)."""
+        images = None
+        if self.page_image_store is not None:
+            images = self.page_image_store.get_or_render(document.id, file_bytes, document.file_type)
+        if SELECTIVE_OCR_ENABLED and document.file_type == "pdf":
+            if images is None:
+                images = convert_to_images(file_bytes, document.file_type)
+            if len(images) >= SELECTIVE_OCR_MIN_PAGES:
+                return self._selective_ocr(document, images)
+        if images is not None:
+            return self.ocr_service.extract_text_from_images(images), {"ocr_source": "ocr"}
+        return self.ocr_service.extract_text_from_bytes(file_bytes, document.file_type), {"ocr_source": "ocr"}
+
+    def _selective_ocr(self, document: Document, images: List[Image.Image]) -> Tuple[OCRResult, Dict[str, Any]]:
+        """
+        Two-pass OCR: quick text for every page at reduced resolution, then full
+        OCR only for the pages most relevant to the document type (up to its
+        page budget). Other pages keep their quick-pass text. Providers without
+        a quick mode get a single full pass.
+        """
+        factor = SELECTIVE_OCR_QUICK_PASS_FACTOR
+        quick_texts = self.ocr_service.extract_page_texts_fast([image.reduce(factor) for image in images])
+        if quick_texts is None:
+            return self.ocr_service.extract_text_from_images(images), {"ocr_source": "ocr"}
+
+        classification = self.document_type_classifier.classify_with_confidence(
+            "\n".join(quick_texts),
+            {"filename": document.original_filename},
+        )
+        document_type = classification.document_type.value
+        field_names = get_extraction_schema(document_type).get("properties", {}).keys()
+        selected = self.page_relevance_scorer.select_pages(quick_texts, document_type, field_names)
+
+        selected_set = set(selected)
+        pages = [
+            self.ocr_service.extract_text_from_images([image]) if index in selected_set else OCRResult(text=quick_texts[index])
+            for index, image in enumerate(images)
+        ]
+        return merge_page_results(pages), {
+            "ocr_source": "ocr",
+            "selective_ocr_document_type": document_type,
+            "full_ocr_pages": [index + 1 for index in selected],
+            "page_count": len(images),
+        }
+
+    def _page_images(self, document: Document, file_bytes: bytes, indexes: List[int]) -> List[Image.Image]:
+        """Images of the given 0-based PDF pages; renders only those pages without a page store."""
+        if self.page_image_store is not None:
+            images = self.page_image_store.get_or_render(document.id, file_bytes, document.file_type)
+            return [images[i] for i in indexes]
+        return [
+            convert_to_images(file_bytes, document.file_type, first_page=i + 1, last_page=i + 1)[0]
+            for i in indexes
+        ]
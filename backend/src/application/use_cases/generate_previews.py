@@ -0,0 +1,74 @@
+"""Use case for rendering page previews of an uploaded document (run by the preview worker)."""
+import time
+from typing import Any, Dict, Iterable, Optional
+from uuid import UUID
+
+from ...infrastructure.external.storage.base import StorageService
+from ...infrastructure.external.storage.page_images import PageImageStore
+from ...infrastructure.external.storage.page_previews import PagePreviewStore
+from ...infrastructure.messaging.redis_queue import RedisQueue
+from ...application.dtos.document_dto import DocumentDTO
+from ...infrastructure.monitoring.logging import get_logger
+
+logger = get_logger("sortex.application.generate_previews")
+
+PREVIEW_QUEUE = "previews"
+
+
+def enqueue_previews(redis_queue: RedisQueue, documents: Iterable[DocumentDTO]) -> int:
+    """Queue preview jobs for the preview worker in one round trip. Returns the queue length.
+
+    Jobs carry the storage path and file type so the worker does not need the database.
+    """
+    return redis_queue.enqueue_many(
+        PREVIEW_QUEUE,
+        [
+            {"document_id": str(d.id), "storage_path": d.storage_path, "file_type": d.file_type}
+            for d in documents
+        ],
+    )
+
+
+class GeneratePreviewsUseCase:
+    """Downloads a document and stores low-resolution page previews for the review UI.
+
+    With a PageImageStore, previews are downscaled from the document's stored
+    page images, so the file is rasterized once for previews and OCR together.
+    """
+
+    def __init__(
+        self,
+        storage_service: StorageService,
+        preview_store: PagePreviewStore,
+        page_image_store: Optional[PageImageStore] = None,
+    ):
+        self.storage_service = storage_service
+        self.preview_store = preview_store
+        self.page_image_store = page_image_store
+
+    def execute(self, document_id: UUID, storage_path: str, file_type: str) -> Dict[str, Any]:
+        """
+        Render previews for one document.
+
+        Args:
+            document_id: Document ID
+            storage_path: Storage key of the original file
+            file_type: File type (pdf, png, jpg, ...)
+
+        Returns:
+            Preview manifest
+        """
+        started = time.perf_counter()
+        file_bytes = self.storage_service.download_file(storage_path)
+        file_type = file_type.lower()
+        images = None
+        if self.page_image_store is not None:
+            images = self.page_image_store.get_or_render(document_id, file_bytes, file_type)
+        manifest = self.preview_store.generate(document_id, file_bytes, file_type, images=images)
+        logger.info(
+            "Page previews generated",
+            document_id=str(document_id),
+            page_count=manifest["page_count"],
+            duration_seconds=round(time.perf_counter() - started, 3),
+        )
+        return manifest
@@ -0,0 +1,60 @@
+"""
+Scheduled maintenance of the month-partitioned ``audit_trails`` table.
+
+Creates the partitions for the next ``AUDIT_PARTITION_MONTHS_AHEAD`` months
+before rows arrive for them (rows without a partition land in the default
+partition, which later partitions cannot be carved out of cheaply), and
+applies retention by dropping the monthly partitions entirely older than
+``AUDIT_RETENTION_DAYS``. Idempotent: the extraction worker runs it at start
+and every ``AUDIT_MAINTENANCE_INTERVAL_SECONDS``.
+"""
+import os
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from ...infrastructure.monitoring.logging import get_logger
+from ...infrastructure.persistence.repositories import AuditTrailRepository
+
+logger = get_logger("sortex.audit_partitions")
+
+AUDIT_PARTITION_MONTHS_AHEAD = int(os.getenv("AUDIT_PARTITION_MONTHS_AHEAD", "3"))
+# 0 keeps the audit history forever
+AUDIT_RETENTION_DAYS = int(os.getenv("AUDIT_RETENTION_DAYS", "0"))
+AUDIT_MAINTENANCE_INTERVAL_SECONDS = float(os.getenv("AUDIT_MAINTENANCE_INTERVAL_SECONDS", "3600"))
+
+
+class MaintainAuditPartitionsUseCase:
+    """Create upcoming audit_trails partitions and drop expired ones."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        months_ahead: int = AUDIT_PARTITION_MONTHS_AHEAD,
+        retention_days: int = AUDIT_RETENTION_DAYS,
+    ):
+        self.session_factory = session_factory
+        self.months_ahead = months_ahead
+        self.retention_days = retention_days
+
+    def execute(self, now: Optional[datetime] = None) -> int:
+        """Run one maintenance pass. Returns the number of partitions dropped."""
+        session = self.session_factory()
+        try:
+            audit_repo = AuditTrailRepository(session)
+            audit_repo.ensure_partitions(self.months_ahead)
+            dropped = 0
+            if self.retention_days > 0:
+                cutoff = (now or datetime.utcnow()) - timedelta(days=self.retention_days)
+                dropped = audit_repo.drop_partitions_before(cutoff)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        if dropped:
+            logger.info("Expired audit partitions dropped", dropped=dropped, retention_days=self.retention_days)
+        return dropped
@@ -0,0 +1,219 @@
+"""
+Bulk re-validation of every extraction after the validation rules change.
+
+Extractions are streamed in id order from a server-side cursor, validated in
+a process pool and written back with one upsert per batch. Each batch is
+committed together with the job checkpoint (last extraction id), so a
+stopped or failed job resumes after the last written batch. Batches are
+written in the order they were read, which keeps the checkpoint exact.
+"""
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from ...domain.entities.document import DocumentType
+from ...domain.entities.revalidation_job import RevalidationJob, RevalidationJobStatus
+from ...domain.entities.validation_result import ValidationResult, ValidationStatus
+from ...domain.services.validation_engine import ValidationEngine
+from ...infrastructure.monitoring.logging import get_logger
+from ...infrastructure.persistence.repositories import (
+    ExtractionRepository, RevalidationJobRepository, ValidationResultRepository,
+)
+
+logger = get_logger("sortex.revalidation")
+
+Row = Tuple[UUID, Optional[str], Dict[str, Any]]
+# (extraction id, document type value, status value, errors)
+Outcome = Tuple[UUID, str, str, List[Dict[str, Any]]]
+
+_worker_engine: Optional[ValidationEngine] = None
+
+
+def _init_worker(rules: Dict[str, Dict[str, Any]]) -> None:
+    """Process pool initializer: compile the rules once per worker process."""
+    global _worker_engine
+    _worker_engine = ValidationEngine(rules)
+
+
+def _validate_in_worker(rows: List[Row]) -> List[Outcome]:
+    return validate_rows(_worker_engine, rows)
+
+
+def validate_rows(engine: ValidationEngine, rows: List[Row]) -> List[Outcome]:
+    """Validate one batch. Documents without a type pass, as in ValidateDataUseCase."""
+    outcomes = []
+    for extraction_id, document_type, data in rows:
+        if not document_type:
+            outcomes.append((extraction_id, "UNKNOWN", ValidationStatus.PASSED.value, []))
+            continue
+        try:
+            errors = engine.validate(DocumentType(document_type), data)
+        except ValueError:
+            # Type no longer known to the domain: nothing to validate against
+            errors = []
+        outcomes.append((
+            extraction_id,
+            document_type,
+            engine.get_validation_status(errors).value,
+            [{"field": e.field, "message": e.message, "severity": e.severity} for e in errors],
+        ))
+    return outcomes
+
+
+class RevalidateExtractionsUseCase:
+    """Re-validate all extractions against the engine's current rules (see module docstring)."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        validation_engine: ValidationEngine,
+        batch_size: int = 2000,
+        workers: int = 1,
+    ):
+        self.session_factory = session_factory
+        self.validation_engine = validation_engine
+        self.batch_size = batch_size
+        # workers <= 1 validates in-process (small databases, tests)
+        self.workers = workers
+        # Batches validated ahead of the writer; bounds memory use
+        self.max_in_flight = max(2, workers * 2)
+
+    def execute(self, job_id: Optional[UUID] = None) -> RevalidationJob:
+        """
+        Run (or resume) a re-validation job.
+
+        Args:
+            job_id: Job to resume. By default an unfinished job for the current
+                rules is resumed, or a new one started.
+
+        Returns:
+            The finished job
+        """
+        write_session = self.session_factory()
+        read_session = self.session_factory()
+        pool = None
+        try:
+            job_repo = RevalidationJobRepository(write_session)
+            job = self._start_job(job_repo, write_session, job_id)
+            write_session.commit()
+            logger.info(
+                "Revalidation started",
+                job_id=str(job.id),
+                rules_version=job.rules_version,
+                total=job.total,
+                resume_after=str(job.last_extraction_id) if job.last_extraction_id else None,
+            )
+
+            if self.workers > 1:
+                pool = ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=_init_worker, initargs=(self.validation_engine.rules,)
+                )
+            batches = ExtractionRepository(read_session).iter_validation_batches(
+                after_id=job.last_extraction_id, batch_size=self.batch_size
+            )
+            result_repo = ValidationResultRepository(write_session)
+            started = time.monotonic()
+            processed_at_start = job.processed
+            try:
+                for outcomes in self._validated(batches, pool):
+                    self._write_batch(job, job_repo, result_repo, outcomes)
+                    write_session.commit()
+                    self._log_progress(job, started, processed_at_start)
+            except Exception as e:
+                write_session.rollback()
+                # Back to the last committed checkpoint
+                job = job_repo.get_by_id(job.id)
+                job.mark_failed(f"{type(e).__name__}: {e}")
+                job_repo.update(job)
+                write_session.commit()
+                logger.error("Revalidation failed", job_id=str(job.id), error=str(e), processed=job.processed)
+                raise
+
+            job.mark_completed()
+            job_repo.update(job)
+            write_session.commit()
+            logger.info("Revalidation completed", job_id=str(job.id), processed=job.processed, **job.status_counts)
+            return job
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            read_session.close()
+            write_session.close()
+
+    def _start_job(self, job_repo: RevalidationJobRepository, session: Session, job_id: Optional[UUID]) -> RevalidationJob:
+        version = self.validation_engine.rules_version
+        if job_id is not None:
+            job = job_repo.get_by_id(job_id)
+            if job is None:
+                raise ValueError(f"Revalidation job {job_id} not found")
+            if job.status == RevalidationJobStatus.COMPLETED:
+                raise ValueError(f"Revalidation job {job_id} already completed")
+            if job.rules_version != version:
+                raise ValueError(
+                    f"Revalidation job {job_id} was started with rules {job.rules_version}; "
+                    f"current rules are {version}. Start a new job."
+                )
+        else:
+            job = job_repo.get_resumable(version)
+        if job is not None:
+            job.resume()
+            return job_repo.update(job)
+        total = ExtractionRepository(session).count()
+        return job_repo.create(RevalidationJob(id=uuid4(), rules_version=version, total=total))
+
+    def _validated(self, batches, pool: Optional[ProcessPoolExecutor]):
+        """Yield validated batches in read order, keeping up to max_in_flight batches in the pool."""
+        if pool is None:
+            for rows in batches:
+                yield validate_rows(self.validation_engine, rows)
+            return
+        in_flight: Deque[Future] = deque()
+        for rows in batches:
+            in_flight.append(pool.submit(_validate_in_worker, rows))
+            if len(in_flight) >= self.max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    def _write_batch(
+        self,
+        job: RevalidationJob,
+        job_repo: RevalidationJobRepository,
+        result_repo: ValidationResultRepository,
+        outcomes: List[Outcome],
+    ) -> None:
+        if not outcomes:
+            return
+        results = []
+        counts: Dict[str, int] = {}
+        for extraction_id, document_type, status, errors in outcomes:
+            results.append(ValidationResult(
+                id=uuid4(),
+                extraction_id=extraction_id,
+                validation_rules={"document_type": document_type, "rules_version": job.rules_version},
+                validation_status=ValidationStatus(status),
+                validation_errors=errors,
+            ))
+            counts[status] = counts.get(status, 0) + 1
+        result_repo.bulk_upsert(results)
+        job.record_batch(outcomes[-1][0], counts)
+        job_repo.update(job)
+
+    @staticmethod
+    def _log_progress(job: RevalidationJob, started: float, processed_at_start: int) -> None:
+        elapsed = time.monotonic() - started
+        rate = (job.processed - processed_at_start) / elapsed if elapsed > 0 else 0.0
+        remaining = max(job.total - job.processed, 0)
+        logger.info(
+            "Revalidation progress",
+            job_id=str(job.id),
+            processed=job.processed,
+            total=job.total,
+            percent=round(100.0 * job.processed / job.total, 1) if job.total else 100.0,
+            rows_per_second=round(rate),
+            eta_seconds=round(remaining / rate) if rate else None,
+        )
@@ -1,15 +1,24 @@
+import os
 from uuid import UUID, uuid4
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, Optional
 
 from ...domain.entities.document import DocumentStatus
 from ...domain.entities.review import Review, ReviewStatus
 from ...domain.entities.validation_result import ValidationStatus
 from ...domain.entities.audit_trail import AuditTrail, AuditAction
+from ...domain.events.document_events import ReviewSubmitted
 from ...infrastructure.persistence.repositories import (
     DocumentRepository, ExtractionRepository, ReviewRepository,
     AuditTrailRepository, ValidationResultRepository,
 )
 from ...application.dtos.review_dto import ReviewCreateDTO, ReviewDTO
+from ...application.dtos.export_dto import ExportCreateDTO
+from .export_to_tms import ExportToTMSUseCase
+
+# TMS endpoint approved documents are exported to (through the export outbox);
+# empty: approval completes the pipeline without a TMS export
+APPROVAL_EXPORT_TO = os.getenv("APPROVAL_EXPORT_TO", "")
 
 
 class ReviewDocumentUseCase:
@@ -22,12 +31,20 @@ class ReviewDocumentUseCase:
         review_repository: ReviewRepository,
         audit_trail_repository: AuditTrailRepository,
         validation_result_repository: ValidationResultRepository,
+        export_use_case: Optional[ExportToTMSUseCase] = None,
+        approval_export_to: str = APPROVAL_EXPORT_TO,
     ):
         self.document_repository = document_repository
         self.extraction_repository = extraction_repository
         self.review_repository = review_repository
         self.audit_trail_repository = audit_trail_repository
         self.validation_result_repository = validation_result_repository
+        self.export_use_case = export_use_case
+        self.approval_export_to = approval_export_to
+
+    @property
+    def exports_on_approval(self) -> bool:
+        return self.export_use_case is not None and bool(self.approval_export_to)
     
     def execute(self, document_id: UUID, review_data: ReviewCreateDTO, reviewed_by: UUID) -> ReviewDTO:
         """
@@ -78,6 +95,12 @@ class ReviewDocumentUseCase:
             saved_review = self.review_repository.create(review)
         
         # Update document status
+        document.record_event(ReviewSubmitted(
+            document_id=document_id,
+            review_id=saved_review.id,
+            reviewed_by=reviewed_by,
+            timestamp=datetime.utcnow(),
+        ))
         document.update_status(DocumentStatus.REVIEWED)
         self.document_repository.update(document)
         
@@ -94,7 +117,12 @@ class ReviewDocumentUseCase:
         return ReviewDTO.from_entity(saved_review)
     
     def approve(self, document_id: UUID, reviewed_by: UUID) -> ReviewDTO:
-        """Approve review — marks pipeline as complete (EXPORTED)"""
+        """
+        Approve review. With an approval export configured the export is
+        written as a PENDING outbox row in this transaction and the relay
+        marks the document EXPORTED once the TMS accepts it; otherwise the
+        pipeline is complete (EXPORTED) right away.
+        """
         review = self.review_repository.get_by_document_id(document_id)
         if not review:
             raise ValueError(f"Review not found for document {document_id}")
@@ -102,9 +130,13 @@ class ReviewDocumentUseCase:
         review.approve()
         saved_review = self.review_repository.update(review)
 
-        # Pipeline complete
         document = self.document_repository.get_by_id(document_id)
-        if document:
+        if document and self.exports_on_approval:
+            self.export_use_case.execute(
+                document_id, ExportCreateDTO(exported_to=self.approval_export_to), reviewed_by
+            )
+        elif document:
+            # Pipeline complete
             document.update_status(DocumentStatus.EXPORTED)
             self.document_repository.update(document)
 
@@ -1,6 +1,8 @@
 """Use case for triggering extraction in the background with retry and dead-letter support."""
 import os
+import time
 import traceback
+from typing import Any, Iterable, Optional
 from uuid import UUID
 
 from ...infrastructure.persistence.database import Database
@@ -8,22 +10,48 @@ from ...infrastructure.persistence.repositories import (
     DocumentRepository,
     ExtractionRepository,
     AuditTrailRepository,
+    ValidationResultRepository,
 )
 from ...infrastructure.external.ocr.base import OCRService
 from ...infrastructure.external.llm.base import LLMService
 from ...infrastructure.external.storage.base import StorageService
+from ...infrastructure.external.storage.extraction_checkpoints import ExtractionCheckpointStore
+from ...infrastructure.external.storage.ocr_artifacts import OCRArtifactStore
+from ...infrastructure.external.storage.page_images import PageImageStore
 from ...infrastructure.error_handling.error_categorizer import ErrorCategorizer
-from ...infrastructure.error_handling.retry import retry_with_backoff, PermanentError
+from ...infrastructure.error_handling.retry import backoff_delay
 from ...infrastructure.messaging.redis_queue import RedisQueue
+from ...infrastructure.messaging.fair_queue import FairQueue, Lane, create_fair_queue
 from ...infrastructure.error_handling.dead_letter_queue import DeadLetterQueue
 from ...domain.services.document_type_classifier import DocumentTypeClassifier
+from ...domain.services.validation_engine import ValidationEngine
 from .extract_fields import ExtractFieldsUseCase
+from .validate_data import create_auto_validator
 from ...infrastructure.monitoring.logging import get_logger
 
 logger = get_logger("sortex.application.trigger_extraction")
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 MAX_RETRIES = int(os.getenv("EXTRACTION_MAX_RETRIES", "3"))
+# Backoff before retry n: RETRY_INITIAL_DELAY * 2^(n-1) seconds plus jitter, capped
+RETRY_INITIAL_DELAY = 2.0
+RETRY_MAX_DELAY = 30.0
+EXTRACTION_QUEUE = "extraction"
+REQUEUE_TENANT = "dlq"
+
+
+def extraction_queue(redis_queue: RedisQueue) -> FairQueue:
+    """The extraction FairQueue (lane/tenant weights from EXTRACTION_LANE_WEIGHTS / EXTRACTION_TENANT_WEIGHTS)."""
+    return create_fair_queue(redis_queue, EXTRACTION_QUEUE)
+
+
+def enqueue_extractions(redis_queue: RedisQueue, document_ids: Iterable[UUID], lane: Lane, tenant: Any) -> int:
+    """Queue extraction jobs of one tenant (the uploading user) in one round trip. Returns the lane's depth."""
+    return extraction_queue(redis_queue).enqueue_many(
+        lane,
+        tenant,
+        [{"document_id": str(document_id)} for document_id in document_ids],
+    )
 
 
 class TriggerExtractionUseCase:
@@ -36,73 +64,146 @@ class TriggerExtractionUseCase:
         ocr_service: OCRService,
         llm_service: LLMService,
         document_type_classifier: DocumentTypeClassifier,
+        audit_sink=None,
+        ocr_artifact_store: Optional[OCRArtifactStore] = None,
+        page_image_store: Optional[PageImageStore] = None,
+        validation_engine: Optional[ValidationEngine] = None,
+        checkpoint_store: Optional[ExtractionCheckpointStore] = None,
+        retry_queue: Optional[FairQueue] = None,
     ):
         self.database = database
         self.storage_service = storage_service
         self.ocr_service = ocr_service
         self.llm_service = llm_service
         self.document_type_classifier = document_type_classifier
+        self.audit_sink = audit_sink
+        self.ocr_artifact_store = ocr_artifact_store
+        self.page_image_store = page_image_store
+        self.validation_engine = validation_engine or ValidationEngine()
+        self.checkpoint_store = checkpoint_store
+        # Where retries are rescheduled (the extraction queue in workers); None: retry in this thread
+        self.retry_queue = retry_queue
 
-    def execute(self, document_id: UUID) -> None:
-        """Run extraction with automatic retry for transient failures."""
+    def execute(
+        self, document_id: UUID, lane: Optional[Lane] = None, tenant: Optional[str] = None, attempt: int = 0
+    ) -> None:
+        """
+        Run extraction; transient failures are retried up to MAX_RETRIES times.
 
-        @retry_with_backoff(max_retries=MAX_RETRIES, initial_delay=2.0, max_delay=30.0)
-        def _run_extraction() -> None:
-            session = self.database.get_session()
+        A retry resumes at the stage that failed (see ExtractFieldsUseCase).
+        With a ``retry_queue`` it is rescheduled there after the backoff delay
+        as a job carrying ``attempt``, and this call returns so the worker can
+        take the next job; without one this call sleeps and retries.
+        Permanent errors and exhausted retries go to the DLQ.
+
+        ``lane``/``tenant`` say where a queued job came from; retries and the
+        DLQ entry keep them so the job comes back in the same lane.
+        """
+        while True:
             try:
-                document_repo = DocumentRepository(session)
-                extraction_repo = ExtractionRepository(session)
-                audit_repo = AuditTrailRepository(session)
-                extract_uc = ExtractFieldsUseCase(
-                    document_repository=document_repo,
-                    extraction_repository=extraction_repo,
-                    audit_trail_repository=audit_repo,
-                    ocr_service=self.ocr_service,
-                    llm_service=self.llm_service,
-                    storage_service=self.storage_service,
-                    document_type_classifier=self.document_type_classifier,
-                )
-                extract_uc.execute(document_id)
-                session.commit()
-                logger.info("Extraction completed", document_id=str(document_id))
+                self._run_extraction(document_id, attempt)
+                return
             except Exception as e:
-                session.rollback()
-                # Categorise the error so the retry decorator knows whether to retry
-                is_retryable = ErrorCategorizer.should_retry(e)
-                if not is_retryable:
-                    raise PermanentError(str(e)) from e
+                if not ErrorCategorizer.should_retry(e) or attempt >= MAX_RETRIES:
+                    logger.error(
+                        "Extraction failed — sending to DLQ",
+                        error=str(e),
+                        error_type=type(e).__name__,
+                        document_id=str(document_id),
+                        attempts=attempt + 1,
+                        traceback=traceback.format_exc(),
+                    )
+                    if self.checkpoint_store is not None:
+                        # A requeue from the DLQ starts over
+                        self.checkpoint_store.clear(document_id)
+                    self._send_to_dlq(document_id, e, lane, tenant, attempt)
+                    return
+                attempt += 1
+                delay = backoff_delay(attempt, RETRY_INITIAL_DELAY, RETRY_MAX_DELAY)
                 logger.warning(
                     "Extraction attempt failed (will retry)",
                     error=str(e),
                     error_type=type(e).__name__,
                     document_id=str(document_id),
+                    retry=attempt,
+                    delay_seconds=round(delay, 1),
                 )
-                raise  # let retry_with_backoff handle it
-            finally:
-                session.close()
+                if self._schedule_retry(document_id, lane, tenant, attempt, delay):
+                    return
+                time.sleep(delay)
 
+    def _run_extraction(self, document_id: UUID, attempt: int) -> None:
+        """One attempt in its own session; resumes from checkpoints on retries."""
+        session = self.database.get_session()
+        extract_uc = None
         try:
-            _run_extraction()
-        except Exception as e:
-            logger.error(
-                "Extraction failed after retries — sending to DLQ",
-                error=str(e),
-                error_type=type(e).__name__,
-                document_id=str(document_id),
-                traceback=traceback.format_exc(),
+            document_repo = DocumentRepository(session)
+            extraction_repo = ExtractionRepository(session)
+            audit_repo = AuditTrailRepository(session, sink=self.audit_sink)
+            extract_uc = ExtractFieldsUseCase(
+                document_repository=document_repo,
+                extraction_repository=extraction_repo,
+                audit_trail_repository=audit_repo,
+                ocr_service=self.ocr_service,
+                llm_service=self.llm_service,
+                storage_service=self.storage_service,
+                document_type_classifier=self.document_type_classifier,
+                ocr_artifact_store=self.ocr_artifact_store,
+                page_image_store=self.page_image_store,
+                validate_data_use_case=create_auto_validator(
+                    document_repo, extraction_repo, ValidationResultRepository(session), self.validation_engine
+                ),
+                checkpoint_store=self.checkpoint_store,
+            )
+            # Transient LLM errors are retried; the last attempt saves an OCR-only extraction instead
+            extract_uc.execute(document_id, resume=attempt > 0, retry_llm_errors=attempt < MAX_RETRIES)
+            session.commit()
+            logger.info("Extraction completed", document_id=str(document_id), attempt=attempt)
+        except Exception:
+            session.rollback()
+            if extract_uc is not None:
+                extract_uc.discard_new_artifact()
+            raise
+        finally:
+            session.close()
+        extract_uc.delete_stale_artifacts()
+        # Also after fresh attempts: checkpoints of an earlier failed run must not outlive the extraction
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.clear(document_id)
+
+    def _schedule_retry(
+        self, document_id: UUID, lane: Optional[Lane], tenant: Optional[str], attempt: int, delay: float
+    ) -> bool:
+        """Put the retry on the retry queue. False (retry in this thread) without a queue or if Redis fails."""
+        if self.retry_queue is None:
+            return False
+        try:
+            self.retry_queue.enqueue_delayed(
+                lane or Lane.BULK,
+                tenant or REQUEUE_TENANT,
+                {"document_id": str(document_id), "attempt": attempt},
+                delay,
             )
-            self._send_to_dlq(document_id, e)
+            return True
+        except Exception as e:
+            logger.warning("Failed to schedule extraction retry, retrying in-process", error=str(e), document_id=str(document_id))
+            return False
 
-    def _send_to_dlq(self, document_id: UUID, error: Exception) -> None:
+    def _send_to_dlq(
+        self, document_id: UUID, error: Exception, lane: Optional[Lane], tenant: Optional[str], retry_count: int
+    ) -> None:
         """Best-effort enqueue to the dead-letter queue."""
         try:
             redis_queue = RedisQueue(REDIS_URL)
             dlq = DeadLetterQueue(redis_queue)
             dlq.enqueue_failed_job(
-                original_queue="extraction",
+                original_queue=EXTRACTION_QUEUE,
                 job_data={"document_id": str(document_id)},
                 error_message=str(error),
-                retry_count=MAX_RETRIES,
+                retry_count=retry_count,
+                # Jobs that never went through the queue are requeued as one shared bulk tenant
+                lane=lane or Lane.BULK,
+                tenant=tenant or REQUEUE_TENANT,
             )
             logger.info("Document sent to DLQ", document_id=str(document_id))
         except Exception as dlq_error:
@@ -1,10 +1,11 @@
 from uuid import UUID, uuid4
 from datetime import datetime
-from typing import BinaryIO
+from typing import BinaryIO, Dict, Optional
 import re
 
 from ...domain.entities.document import Document, DocumentStatus
 from ...domain.entities.audit_trail import AuditTrail, AuditAction
+from ...domain.events.document_events import DocumentUploaded
 from ...infrastructure.persistence.repositories import DocumentRepository, AuditTrailRepository
 from ...infrastructure.external.storage.base import StorageService
 from ...application.dtos.document_dto import DocumentDTO
@@ -18,6 +19,8 @@ MAGIC_BYTES = {
     "jpeg": [b"\xff\xd8\xff"],
 }
 
+# Longest magic-byte signature we check; only this much of a file is needed to validate it
+HEAD_BYTES = max(len(sig) for sigs in MAGIC_BYTES.values() for sig in sigs)
 
 
 class UploadDocumentUseCase:
@@ -95,11 +98,14 @@ class UploadDocumentUseCase:
                 return True
         return False
 
-    def _deduplicate_filename(self, filename: str, uploaded_by: UUID) -> str:
+    def _deduplicate_filename(self, filename: str, uploaded_by: UUID, pending: Optional[Dict[str, int]] = None) -> str:
         """
         If a document with the same filename already exists for this user,
         append a suffix like (2), (3), etc.
 
+        ``pending`` counts names already taken by not-yet-inserted documents of
+        the same batch (bulk upload); it is updated in place.
+
         Examples:
             invoice.pdf  -> invoice.pdf        (first upload)
             invoice.pdf  -> invoice (2).pdf    (second upload)
@@ -121,6 +127,10 @@ class UploadDocumentUseCase:
         existing_count = self.document_repository.count_by_filename_prefix(
             stripped, extension, uploaded_by
         )
+        if pending is not None:
+            key = f"{stripped}{extension}"
+            existing_count += pending.get(key, 0)
+            pending[key] = pending.get(key, 0) + 1
 
         if existing_count == 0:
             return filename  # No conflict
@@ -179,6 +189,11 @@ class UploadDocumentUseCase:
             uploaded_by=uploaded_by,
             status=DocumentStatus.UPLOADED,
         )
+        document.record_event(DocumentUploaded(
+            document_id=document_id,
+            uploaded_by=uploaded_by,
+            timestamp=document.uploaded_at,
+        ))
         
         # Save document
         saved_document = self.document_repository.create(document)
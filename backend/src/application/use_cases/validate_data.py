@@ -1,13 +1,21 @@
+import os
+from typing import Optional
 from uuid import UUID, uuid4
+from datetime import datetime
 
-from ...domain.entities.document import DocumentStatus
+from ...domain.entities.document import Document, DocumentStatus
+from ...domain.entities.extraction import Extraction
 from ...domain.entities.validation_result import ValidationResult, ValidationStatus
+from ...domain.events.document_events import ValidationCompleted
 from ...domain.services.validation_engine import ValidationEngine
 from ...infrastructure.persistence.repositories import (
     DocumentRepository, ExtractionRepository, ValidationResultRepository
 )
 from ...application.dtos.validation_dto import ValidationResultDTO
 
+# Validate right after extraction, in the extraction's transaction (document goes straight to VALIDATED)
+AUTO_VALIDATE_ENABLED = os.getenv("AUTO_VALIDATE_ENABLED", "true").lower() == "true"
+
 
 class ValidateDataUseCase:
     """Use case for validating extracted data"""
@@ -43,7 +51,26 @@ class ValidateDataUseCase:
         extraction = self.extraction_repository.get_by_document_id(document_id)
         if not extraction:
             raise ValueError(f"Extraction not found for document {document_id}")
-        
+
+        # Delete any existing validation result for this extraction (dedup)
+        self.validation_result_repository.delete_by_extraction_id(extraction.id)
+
+        saved_result = self.validate_extraction(document, extraction)
+        self.document_repository.update(document)
+
+        return ValidationResultDTO.from_entity(saved_result)
+
+    def validate_extraction(self, document: Document, extraction: Extraction) -> ValidationResult:
+        """
+        Validate an extraction already in memory and store the result.
+
+        Records ValidationCompleted on the document and moves it to VALIDATED;
+        persisting the document is left to the caller, so the extraction
+        pipeline saves it once for both stages.
+
+        Returns:
+            The saved ValidationResult
+        """
         # Run validation
         if not document.document_type:
             # If document type is unknown, skip validation or use a default
@@ -61,13 +88,13 @@ class ValidateDataUseCase:
         # Convert ValidationError objects to dicts for the entity
         errors_dict = [{"field": e.field, "message": e.message, "severity": e.severity} for e in errors]
 
-        # Delete any existing validation result for this extraction (dedup)
-        self.validation_result_repository.delete_by_extraction_id(extraction.id)
-
         validation_result = ValidationResult(
             id=uuid4(),
             extraction_id=extraction.id,
-            validation_rules={"document_type": document.document_type.value if document.document_type else "UNKNOWN"},
+            validation_rules={
+                "document_type": document.document_type.value if document.document_type else "UNKNOWN",
+                "rules_version": self.validation_engine.rules_version,
+            },
             validation_status=status,
             validation_errors=errors_dict,
         )
@@ -76,8 +103,29 @@ class ValidateDataUseCase:
         saved_result = self.validation_result_repository.create(validation_result)
 
         # Update document status to VALIDATED
+        document.record_event(ValidationCompleted(
+            document_id=document.id,
+            validation_id=saved_result.id,
+            status=status.value,
+            timestamp=datetime.utcnow(),
+        ))
         document.update_status(DocumentStatus.VALIDATED)
-        self.document_repository.update(document)
 
-        return ValidationResultDTO.from_entity(saved_result)
+        return saved_result
+
 
+def create_auto_validator(
+    document_repository: DocumentRepository,
+    extraction_repository: ExtractionRepository,
+    validation_result_repository: ValidationResultRepository,
+    validation_engine: ValidationEngine,
+) -> Optional[ValidateDataUseCase]:
+    """Validation stage chained after extraction, or None when AUTO_VALIDATE_ENABLED is off."""
+    if not AUTO_VALIDATE_ENABLED:
+        return None
+    return ValidateDataUseCase(
+        document_repository=document_repository,
+        extraction_repository=extraction_repository,
+        validation_result_repository=validation_result_repository,
+        validation_engine=validation_engine,
+    )
@@ -1,8 +1,10 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, List, Optional
 from uuid import UUID, uuid4
 
+from ..events.document_events import DocumentStatusChanged
+
 
 class DocumentStatus(str, Enum):
     UPLOADED = "UPLOADED"
@@ -59,11 +61,26 @@ class Document:
         self.uploaded_at = uploaded_at or datetime.utcnow()
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self._events: List[Any] = []
     
     def update_status(self, new_status: DocumentStatus) -> None:
         """Update document status"""
         self.status = new_status
         self.updated_at = datetime.utcnow()
+        self.record_event(DocumentStatusChanged(
+            document_id=self.id,
+            status=new_status.value,
+            timestamp=self.updated_at,
+        ))
+
+    def record_event(self, event: Any) -> None:
+        """Record a domain event; the repository publishes it when the document is saved"""
+        self._events.append(event)
+
+    def pull_events(self) -> List[Any]:
+        """Return and clear the recorded domain events"""
+        events, self._events = self._events, []
+        return events
     
     def update_document_type(self, document_type: DocumentType) -> None:
         """Update document type"""
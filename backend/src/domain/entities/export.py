@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, Optional
 from uuid import UUID, uuid4
@@ -24,6 +24,8 @@ class Export:
         retry_count: int = 0,
         error_message: Optional[str] = None,
         created_at: Optional[datetime] = None,
+        next_attempt_at: Optional[datetime] = None,
+        last_attempt_at: Optional[datetime] = None,
     ):
         self.id = id
         self.document_id = document_id
@@ -34,6 +36,9 @@ class Export:
         self.retry_count = retry_count
         self.error_message = error_message
         self.created_at = created_at or datetime.utcnow()
+        # Outbox scheduling: a PENDING export is sent once next_attempt_at has passed
+        self.next_attempt_at = next_attempt_at or self.created_at
+        self.last_attempt_at = last_attempt_at
     
     def mark_success(self) -> None:
         """Mark export as successful"""
@@ -47,6 +52,13 @@ class Export:
         self.error_message = error_message
         self.retry_count += 1
     
+    def schedule_retry(self, error_message: str, delay_seconds: float) -> None:
+        """Record a failed attempt and keep the export PENDING until the retry is due"""
+        self.export_status = ExportStatus.PENDING
+        self.error_message = error_message
+        self.retry_count += 1
+        self.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+
     def increment_retry(self) -> None:
         """Increment retry count"""
         self.retry_count += 1
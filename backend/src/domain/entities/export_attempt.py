@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+class ExportAttempt:
+    """One delivery attempt of an export to the TMS"""
+
+    def __init__(
+        self,
+        id: UUID,
+        export_id: UUID,
+        attempt: int,
+        success: bool,
+        status_code: Optional[int] = None,
+        error_message: Optional[str] = None,
+        duration_ms: Optional[int] = None,
+        attempted_at: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.export_id = export_id
+        self.attempt = attempt
+        self.success = success
+        self.status_code = status_code
+        self.error_message = error_message
+        self.duration_ms = duration_ms
+        self.attempted_at = attempted_at or datetime.utcnow()
@@ -22,6 +22,7 @@ class Extraction:
         raw_text: Optional[str] = None,
         confidence_scores: Optional[Dict[str, Any]] = None,
         extraction_metadata: Optional[Dict[str, Any]] = None,
+        raw_text_key: Optional[str] = None,
         extracted_at: Optional[datetime] = None,
         created_at: Optional[datetime] = None,
     ):
@@ -32,6 +33,7 @@ class Extraction:
         self.structured_data = structured_data
         self.confidence_scores = confidence_scores or {}
         self.extraction_metadata = extraction_metadata or {}
+        self.raw_text_key = raw_text_key  # Storage key of offloaded OCR text/layout, if any
         self.extracted_at = extracted_at or datetime.utcnow()
         self.created_at = created_at or datetime.utcnow()
     
@@ -0,0 +1,65 @@
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Optional
+from uuid import UUID
+
+
+class RevalidationJobStatus(str, Enum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class RevalidationJob:
+    """Bulk re-validation of all extractions against one version of the validation rules.
+
+    ``last_extraction_id`` is the checkpoint: every extraction with a smaller
+    id has been re-validated, so an interrupted job continues after it.
+    """
+
+    def __init__(
+        self,
+        id: UUID,
+        rules_version: str,
+        status: RevalidationJobStatus = RevalidationJobStatus.RUNNING,
+        total: int = 0,
+        processed: int = 0,
+        status_counts: Optional[Dict[str, int]] = None,
+        last_extraction_id: Optional[UUID] = None,
+        error_message: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.rules_version = rules_version
+        self.status = status
+        self.total = total
+        self.processed = processed
+        self.status_counts = status_counts or {}
+        self.last_extraction_id = last_extraction_id
+        self.error_message = error_message
+        self.started_at = started_at or datetime.utcnow()
+        self.updated_at = updated_at or self.started_at
+        self.finished_at = finished_at
+
+    def record_batch(self, last_extraction_id: UUID, status_counts: Dict[str, int]) -> None:
+        """Advance the checkpoint past a written batch."""
+        self.last_extraction_id = last_extraction_id
+        for status, count in status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+            self.processed += count
+        self.updated_at = datetime.utcnow()
+
+    def resume(self) -> None:
+        self.status = RevalidationJobStatus.RUNNING
+        self.error_message = None
+
+    def mark_completed(self) -> None:
+        self.status = RevalidationJobStatus.COMPLETED
+        self.finished_at = self.updated_at = datetime.utcnow()
+
+    def mark_failed(self, error_message: str) -> None:
+        self.status = RevalidationJobStatus.FAILED
+        self.error_message = error_message
+        self.updated_at = datetime.utcnow()
@@ -11,6 +11,14 @@ class DocumentUploaded:
     timestamp: datetime
 
 
+@dataclass
+class DocumentStatusChanged:
+    """Domain event: Document moved to a new pipeline status"""
+    document_id: UUID
+    status: str
+    timestamp: datetime
+
+
 @dataclass
 class ExtractionCompleted:
     """Domain event: Extraction completed"""
@@ -0,0 +1,90 @@
+"""
+Page relevance scoring for selective OCR of long documents.
+
+Given cheap per-page text (low resolution, no layout analysis) and the
+classified document type, pages are scored by how many of that type's
+classification keywords and schema field labels they contain. Only the
+best pages, up to the type's page budget, get full layout/table OCR.
+"""
+import json
+import os
+from typing import Dict, Iterable, List
+
+from .classification_config import CLASSIFICATION_PROFILES
+
+# Pages per document type that receive full OCR; types not listed use DEFAULT_PAGE_BUDGET
+PAGE_BUDGETS: Dict[str, int] = {
+    "CMR": 2,
+    "INVOICE": 3,
+    "DELIVERY_NOTE": 2,
+    "BILL_OF_LADING": 3,
+    "AIR_WAYBILL": 2,
+    "SEA_WAYBILL": 2,
+    "PACKING_LIST": 4,
+    "CUSTOMS_DECLARATION": 4,
+    "CERTIFICATE_OF_ORIGIN": 2,
+    "DANGEROUS_GOODS_DECLARATION": 3,
+    "FREIGHT_BILL": 3,
+    "UNKNOWN": 5,
+}
+DEFAULT_PAGE_BUDGET = 3
+
+# Fields tend to sit at the start of a packet; earlier pages get a small bonus
+POSITION_BONUS = 1.0
+# Weight of a schema field label (e.g. "INVOICE NUMBER") found on a page
+FIELD_LABEL_WEIGHT = 1.0
+
+
+def _load_budgets() -> Dict[str, int]:
+    """PAGE_BUDGETS with overrides from OCR_PAGE_BUDGETS (JSON, e.g. '{"INVOICE": 5}')."""
+    budgets = dict(PAGE_BUDGETS)
+    override = os.getenv("OCR_PAGE_BUDGETS")
+    if override:
+        budgets.update({k.upper(): int(v) for k, v in json.loads(override).items()})
+    return budgets
+
+
+class PageRelevanceScorer:
+    """Domain service that picks the pages worth a full OCR pass."""
+
+    def __init__(self, budgets: Dict[str, int] = None, default_budget: int = DEFAULT_PAGE_BUDGET):
+        self._budgets = budgets if budgets is not None else _load_budgets()
+        self._default_budget = default_budget
+        self._keywords = {
+            doc_type: [
+                (keyword.upper(), weight)
+                for keywords in profile.get("keywords", {}).values()
+                for keyword, weight in keywords
+            ]
+            for doc_type, profile in CLASSIFICATION_PROFILES.items()
+        }
+
+    def budget_for(self, document_type: str) -> int:
+        return self._budgets.get(document_type, self._default_budget)
+
+    def score_pages(self, page_texts: List[str], document_type: str, field_names: Iterable[str] = ()) -> List[float]:
+        """Relevance score per page (higher is more relevant)."""
+        keywords = self._keywords.get(document_type, [])
+        labels = [name.replace("_", " ").upper() for name in field_names]
+        page_count = len(page_texts)
+        scores = []
+        for index, text in enumerate(page_texts):
+            upper = text.upper()
+            score = sum(weight for keyword, weight in keywords if keyword in upper)
+            score += FIELD_LABEL_WEIGHT * sum(1 for label in labels if label in upper)
+            score += POSITION_BONUS * (page_count - index) / page_count
+            scores.append(score)
+        return scores
+
+    def select_pages(self, page_texts: List[str], document_type: str, field_names: Iterable[str] = ()) -> List[int]:
+        """0-based indexes of the pages to OCR in full, in page order.
+
+        The first page is always included: it carries the header fields of
+        virtually every document type.
+        """
+        budget = self.budget_for(document_type)
+        if len(page_texts) <= budget:
+            return list(range(len(page_texts)))
+        scores = self.score_pages(page_texts, document_type, field_names)
+        ranked = sorted(range(1, len(page_texts)), key=lambda i: scores[i], reverse=True)
+        return sorted([0] + ranked[:max(budget - 1, 0)])
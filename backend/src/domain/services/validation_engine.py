@@ -1,9 +1,36 @@
-from typing import Dict, Any, List
+import hashlib
+import json
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from ..entities.document import DocumentType
 from ..entities.validation_result import ValidationStatus, ValidationError
+from .validation_rules import CompiledRuleSet, compile_rule_set
 
-# Config-driven validation rules for new document types
-VALIDATION_RULES: Dict[str, Dict[str, List[str]]] = {
+# Declarative validation rules per document type (DSL described in validation_rules.py)
+VALIDATION_RULES: Dict[str, Dict[str, Any]] = {
+    "CMR": {
+        "required_fields": ["shipper_name", "consignee_name", "date_of_consignment"],
+        "date_fields": ["date_of_consignment"],
+        "numeric_fields": [],
+    },
+    "INVOICE": {
+        "required_fields": ["invoice_number", "invoice_date", "total_amount"],
+        "date_fields": ["invoice_date"],
+        "numeric_fields": ["subtotal", "tax_amount", "total_amount"],
+        "ranges": {"tax_amount": (0, None), "total_amount": (0, None)},
+        "cross_field": [
+            {"check": "sum", "fields": ["subtotal", "tax_amount"], "equals": "total_amount", "tolerance": 0.02},
+        ],
+        # Only an unparseable total fails the invoice; the other amount checks flag it for review
+        "severities": {
+            "numeric_fields": {"subtotal": "warning", "tax_amount": "warning"},
+            "ranges": {"tax_amount": "warning", "total_amount": "warning"},
+        },
+    },
+    "DELIVERY_NOTE": {
+        "required_fields": ["delivery_date", "recipient_name"],
+        "date_fields": ["delivery_date"],
+        "numeric_fields": [],
+    },
     "BILL_OF_LADING": {
         "required_fields": ["bl_number", "shipper_name", "consignee_name", "port_of_loading", "port_of_discharge"],
         "date_fields": ["date_of_issue"],
@@ -13,6 +40,8 @@ VALIDATION_RULES: Dict[str, Dict[str, List[str]]] = {
         "required_fields": ["awb_number", "shipper_name", "consignee_name", "airport_of_departure"],
         "date_fields": ["date_of_issue"],
         "numeric_fields": [],
+        # IATA air waybill: 3-digit airline prefix + 8-digit serial
+        "patterns": {"awb_number": r"^\d{3}[- ]?\d{4}\s?\d{4}$"},
     },
     "SEA_WAYBILL": {
         "required_fields": ["swb_number", "shipper_name", "consignee_name", "port_of_loading"],
@@ -23,11 +52,16 @@ VALIDATION_RULES: Dict[str, Dict[str, List[str]]] = {
         "required_fields": ["packing_list_number", "shipper_name"],
         "date_fields": ["date"],
         "numeric_fields": ["gross_weight", "net_weight"],
+        "ranges": {"gross_weight": (0, None), "net_weight": (0, None)},
+        "cross_field": [
+            {"check": "lte", "field": "net_weight", "than": "gross_weight"},
+        ],
     },
     "CUSTOMS_DECLARATION": {
         "required_fields": ["declaration_number", "goods_description"],
         "date_fields": ["date_of_declaration"],
         "numeric_fields": ["customs_value", "duty_amount"],
+        "ranges": {"customs_value": (0, None), "duty_amount": (0, None)},
     },
     "CERTIFICATE_OF_ORIGIN": {
         "required_fields": ["certificate_number", "country_of_origin", "exporter_name"],
@@ -38,17 +72,38 @@ VALIDATION_RULES: Dict[str, Dict[str, List[str]]] = {
         "required_fields": ["un_number", "proper_shipping_name", "hazard_class", "shipper_name"],
         "date_fields": ["date_of_issue"],
         "numeric_fields": [],
+        "patterns": {"un_number": r"(?i)^(UN\s?)?\d{4}$"},
     },
     "FREIGHT_BILL": {
         "required_fields": ["freight_bill_number", "shipper_name", "origin", "destination"],
         "date_fields": ["date_of_issue"],
         "numeric_fields": ["freight_charges", "total_amount"],
+        "ranges": {"freight_charges": (0, None), "total_amount": (0, None)},
+        "cross_field": [
+            {"check": "lte", "field": "freight_charges", "than": "total_amount"},
+        ],
     },
 }
 
 
+def rules_version(rules: Dict[str, Dict[str, Any]]) -> str:
+    """Fingerprint of a rule set; stored with each validation result to spot stale ones."""
+    canonical = json.dumps(rules, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
 class ValidationEngine:
-    """Domain service for validating extracted data"""
+    """Domain service for validating extracted data.
+
+    Rules are compiled once per document type when the engine is created.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.rules = rules if rules is not None else VALIDATION_RULES
+        self.rules_version = rules_version(self.rules)
+        self._rule_sets: Dict[str, CompiledRuleSet] = {
+            document_type: compile_rule_set(type_rules) for document_type, type_rules in self.rules.items()
+        }
 
     def validate(self, document_type: DocumentType, extracted_data: Dict[str, Any]) -> List[ValidationError]:
         """
@@ -61,135 +116,25 @@ class ValidationEngine:
         Returns:
             List of validation errors
         """
-        errors = []
+        type_value = document_type.value if document_type else "UNKNOWN"
+        rule_set = self._rule_sets.get(type_value)
+        if rule_set is None:
+            return []
+        return rule_set.validate(extracted_data or {})
 
-        # Legacy methods for original 3 types
-        if document_type == DocumentType.CMR:
-            errors.extend(self._validate_cmr(extracted_data))
-        elif document_type == DocumentType.INVOICE:
-            errors.extend(self._validate_invoice(extracted_data))
-        elif document_type == DocumentType.DELIVERY_NOTE:
-            errors.extend(self._validate_delivery_note(extracted_data))
-        else:
-            # Config-driven validation for new types
-            type_value = document_type.value if document_type else "UNKNOWN"
-            rules = VALIDATION_RULES.get(type_value)
-            if rules:
-                errors.extend(self._validate_required(extracted_data, rules.get("required_fields", [])))
-                errors.extend(self._validate_dates(extracted_data, rules.get("date_fields", [])))
-                errors.extend(self._validate_numerics(extracted_data, rules.get("numeric_fields", [])))
-
-        return errors
-    
-    def _validate_cmr(self, data: Dict[str, Any]) -> List[ValidationError]:
-        """Validate CMR document fields"""
-        errors = []
-        required_fields = ["shipper_name", "consignee_name", "date_of_consignment"]
-        
-        for field in required_fields:
-            if not data.get(field):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Required field '{field}' is missing",
-                    severity="error"
-                ))
-        
-        # Validate date format if present
-        if "date_of_consignment" in data and data["date_of_consignment"]:
-            # Basic date validation (can be enhanced)
-            if not isinstance(data["date_of_consignment"], str):
-                errors.append(ValidationError(
-                    field="date_of_consignment",
-                    message="Date must be a valid string",
-                    severity="error"
-                ))
-        
-        return errors
-    
-    def _validate_invoice(self, data: Dict[str, Any]) -> List[ValidationError]:
-        """Validate Invoice document fields"""
-        errors = []
-        required_fields = ["invoice_number", "invoice_date", "total_amount"]
-        
-        for field in required_fields:
-            if not data.get(field):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Required field '{field}' is missing",
-                    severity="error"
-                ))
-        
-        # Validate amount format
-        if "total_amount" in data and data["total_amount"]:
-            try:
-                float(str(data["total_amount"]).replace(",", "").replace("€", "").replace("$", ""))
-            except ValueError:
-                errors.append(ValidationError(
-                    field="total_amount",
-                    message="Total amount must be a valid number",
-                    severity="error"
-                ))
-        
-        return errors
-    
-    def _validate_delivery_note(self, data: Dict[str, Any]) -> List[ValidationError]:
-        """Validate Delivery Note document fields"""
-        errors = []
-        required_fields = ["delivery_date", "recipient_name"]
-        
-        for field in required_fields:
-            if not data.get(field):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Required field '{field}' is missing",
-                    severity="error"
-                ))
-        
-        return errors
-    
-    def _validate_required(self, data: Dict[str, Any], required_fields: List[str]) -> List[ValidationError]:
-        """Validate that required fields are present."""
-        errors = []
-        for field in required_fields:
-            if not data.get(field):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Required field '{field}' is missing",
-                    severity="error"
-                ))
-        return errors
+    def validate_batch(
+        self, items: Iterable[Tuple[DocumentType, Dict[str, Any]]]
+    ) -> List[List[ValidationError]]:
+        """
+        Validate many extractions at once (e.g. re-validation after a rule change).
 
-    def _validate_dates(self, data: Dict[str, Any], date_fields: List[str]) -> List[ValidationError]:
-        """Validate that date fields are valid strings."""
-        errors = []
-        for field in date_fields:
-            value = data.get(field)
-            if value and not isinstance(value, str):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Date field '{field}' must be a valid string",
-                    severity="error"
-                ))
-        return errors
+        Args:
+            items: (document type, extracted data) pairs
 
-    def _validate_numerics(self, data: Dict[str, Any], numeric_fields: List[str]) -> List[ValidationError]:
-        """Validate that numeric fields are parseable numbers."""
-        errors = []
-        for field in numeric_fields:
-            value = data.get(field)
-            if value:
-                try:
-                    cleaned = str(value).replace(",", "").replace(" ", "")
-                    for symbol in ["$", "EUR", "USD", "GBP", "CHF", "€", "£"]:
-                        cleaned = cleaned.replace(symbol, "")
-                    float(cleaned)
-                except ValueError:
-                    errors.append(ValidationError(
-                        field=field,
-                        message=f"Field '{field}' must be a valid number",
-                        severity="error"
-                    ))
-        return errors
+        Returns:
+            Validation errors per item, in input order
+        """
+        return [self.validate(document_type, data) for document_type, data in items]
 
     def get_validation_status(self, errors: List[ValidationError]) -> ValidationStatus:
         """Determine validation status from errors"""
@@ -201,4 +146,3 @@ class ValidationEngine:
             return ValidationStatus.FAILED
         
         return ValidationStatus.WARNING
-
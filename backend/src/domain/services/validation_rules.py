@@ -0,0 +1,250 @@
+"""
+Compiler for the declarative validation rules in ``validation_engine.VALIDATION_RULES``.
+
+A rule set describes one document type::
+
+    {
+        "required_fields": ["invoice_number", ...],      # present and non-empty
+        "date_fields": ["invoice_date"],                 # string in one of "date_formats"
+        "date_formats": ["%Y-%m-%d", ...],               # optional, DEFAULT_DATE_FORMATS otherwise
+        "numeric_fields": ["total_amount"],              # number once currency/separators are stripped
+        "ranges": {"total_amount": (0, None)},           # inclusive bounds, None = open
+        "patterns": {"awb_number": r"^\\d{3}-?\\d{8}$"},   # regex (warning when not matched)
+        "cross_field": [
+            {"check": "sum", "fields": ["subtotal", "tax_amount"], "equals": "total_amount", "tolerance": 0.02},
+            {"check": "lte", "field": "net_weight", "than": "gross_weight"},
+        ],
+        "severities": {                                  # optional, per field: "error" (default) or "warning"
+            "numeric_fields": {"subtotal": "warning"},
+            "ranges": {"total_amount": "warning"},
+        },
+    }
+
+``compile_rule_set`` turns it into a ``CompiledRuleSet``: per field, a flat
+list of closures (regexes compiled once), followed by the cross-field
+checks. Validation is a single pass over the fields; numeric values are
+parsed once and shared with the cross-field checks.
+"""
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..entities.validation_result import ValidationError
+
+DEFAULT_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d.%m.%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d-%m-%Y",
+    "%Y/%m/%d",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+)
+# Cross-field sums may differ by rounding
+DEFAULT_TOLERANCE = 0.01
+
+# Currency markers and separators stripped before parsing a number
+_NUMBER_NOISE = re.compile(r"[\s,$€£]|EUR|USD|GBP|CHF")
+
+# check(value, numbers, errors): value of the field, parsed numbers so far
+FieldCheck = Callable[[Any, Dict[str, float], List[ValidationError]], None]
+CrossCheck = Callable[[Dict[str, float], List[ValidationError]], None]
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """Parse an extracted amount/weight ("€1,500.00", "USD 500", 42). None if not a number."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    try:
+        return float(_NUMBER_NOISE.sub("", str(value)))
+    except ValueError:
+        return None
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == ""
+
+
+class CompiledRuleSet:
+    """Validation closures of one document type."""
+
+    __slots__ = ("field_checks", "cross_checks")
+
+    def __init__(self, field_checks: List[Tuple[str, List[FieldCheck]]], cross_checks: List[CrossCheck]):
+        self.field_checks = field_checks
+        self.cross_checks = cross_checks
+
+    def validate(self, data: Dict[str, Any]) -> List[ValidationError]:
+        errors: List[ValidationError] = []
+        numbers: Dict[str, float] = {}
+        get = data.get
+        for field, checks in self.field_checks:
+            value = get(field)
+            for check in checks:
+                check(value, numbers, errors)
+        for check in self.cross_checks:
+            check(numbers, errors)
+        return errors
+
+
+# ---------------------------------------------------------------------------
+# Field checks
+# ---------------------------------------------------------------------------
+
+def _required(field: str) -> FieldCheck:
+    message = f"Required field '{field}' is missing"
+
+    def check(value, numbers, errors):
+        if not value:
+            errors.append(ValidationError(field=field, message=message, severity="error"))
+    return check
+
+
+def _date(field: str, formats: Tuple[str, ...]) -> FieldCheck:
+    type_message = f"Date field '{field}' must be a valid string"
+    format_message = f"Date field '{field}' is not in a recognised date format"
+
+    def check(value, numbers, errors):
+        if not value:
+            return
+        if not isinstance(value, str):
+            errors.append(ValidationError(field=field, message=type_message, severity="error"))
+            return
+        text = value.strip()
+        for fmt in formats:
+            try:
+                datetime.strptime(text, fmt)
+                return
+            except ValueError:
+                continue
+        errors.append(ValidationError(field=field, message=format_message, severity="warning"))
+    return check
+
+
+def _numeric(field: str, severity: str = "error") -> FieldCheck:
+    message = f"Field '{field}' must be a valid number"
+
+    def check(value, numbers, errors):
+        if _is_empty(value):
+            return
+        number = parse_number(value)
+        if number is None:
+            errors.append(ValidationError(field=field, message=message, severity=severity))
+        else:
+            numbers[field] = number
+    return check
+
+
+def _range(field: str, minimum: Optional[float], maximum: Optional[float], severity: str = "error") -> FieldCheck:
+    if maximum is None:
+        message = f"Field '{field}' must be at least {minimum}"
+    elif minimum is None:
+        message = f"Field '{field}' must be at most {maximum}"
+    else:
+        message = f"Field '{field}' must be between {minimum} and {maximum}"
+
+    def check(value, numbers, errors):
+        number = numbers.get(field)
+        if number is None:
+            return
+        if (minimum is not None and number < minimum) or (maximum is not None and number > maximum):
+            errors.append(ValidationError(field=field, message=message, severity=severity))
+    return check
+
+
+def _pattern(field: str, pattern: str) -> FieldCheck:
+    regex = re.compile(pattern)
+    message = f"Field '{field}' does not match the expected format"
+
+    def check(value, numbers, errors):
+        if value and isinstance(value, str) and not regex.match(value.strip()):
+            errors.append(ValidationError(field=field, message=message, severity="warning"))
+    return check
+
+
+# ---------------------------------------------------------------------------
+# Cross-field checks
+# ---------------------------------------------------------------------------
+
+def _sum_check(spec: Dict[str, Any]) -> CrossCheck:
+    parts: List[str] = list(spec["fields"])
+    total: str = spec["equals"]
+    tolerance = float(spec.get("tolerance", DEFAULT_TOLERANCE))
+    severity = spec.get("severity", "warning")
+    label = " + ".join(parts)
+
+    def check(numbers, errors):
+        if total not in numbers or any(part not in numbers for part in parts):
+            return
+        expected = sum(numbers[part] for part in parts)
+        if abs(expected - numbers[total]) > tolerance:
+            errors.append(ValidationError(
+                field=total,
+                message=f"'{total}' ({numbers[total]:.2f}) does not match {label} ({expected:.2f})",
+                severity=severity,
+            ))
+    return check
+
+
+def _lte_check(spec: Dict[str, Any]) -> CrossCheck:
+    field: str = spec["field"]
+    other: str = spec["than"]
+    severity = spec.get("severity", "warning")
+    message = f"'{field}' must not exceed '{other}'"
+
+    def check(numbers, errors):
+        if field in numbers and other in numbers and numbers[field] > numbers[other]:
+            errors.append(ValidationError(field=field, message=message, severity=severity))
+    return check
+
+
+_CROSS_CHECKS: Dict[str, Callable[[Dict[str, Any]], CrossCheck]] = {
+    "sum": _sum_check,
+    "lte": _lte_check,
+}
+
+
+def _cross_fields(spec: Dict[str, Any]) -> List[str]:
+    if spec["check"] == "sum":
+        return [*spec["fields"], spec["equals"]]
+    return [spec["field"], spec["than"]]
+
+
+def compile_rule_set(rules: Dict[str, Any]) -> CompiledRuleSet:
+    """Compile one document type's declarative rules (see module docstring)."""
+    date_formats = tuple(rules.get("date_formats") or DEFAULT_DATE_FORMATS)
+    ranges: Dict[str, Tuple[Optional[float], Optional[float]]] = rules.get("ranges", {})
+    cross_specs: List[Dict[str, Any]] = rules.get("cross_field", [])
+    severities: Dict[str, Dict[str, str]] = rules.get("severities", {})
+    numeric_severity = severities.get("numeric_fields", {})
+    range_severity = severities.get("ranges", {})
+    for spec in cross_specs:
+        if spec.get("check") not in _CROSS_CHECKS:
+            raise ValueError(f"Unknown cross-field check: {spec.get('check')}")
+
+    # Fields used in ranges and cross-field checks are numeric by definition
+    numeric = list(dict.fromkeys([
+        *rules.get("numeric_fields", []),
+        *ranges,
+        *(field for spec in cross_specs for field in _cross_fields(spec)),
+    ]))
+
+    checks: Dict[str, List[FieldCheck]] = {}
+    for field in rules.get("required_fields", []):
+        checks.setdefault(field, []).append(_required(field))
+    for field in rules.get("date_fields", []):
+        checks.setdefault(field, []).append(_date(field, date_formats))
+    for field in numeric:
+        checks.setdefault(field, []).append(_numeric(field, numeric_severity.get(field, "error")))
+    for field, (minimum, maximum) in ranges.items():
+        checks[field].append(_range(field, minimum, maximum, range_severity.get(field, "error")))
+    for field, pattern in rules.get("patterns", {}).items():
+        checks.setdefault(field, []).append(_pattern(field, pattern))
+
+    return CompiledRuleSet(
+        field_checks=list(checks.items()),
+        cross_checks=[_CROSS_CHECKS[spec["check"]](spec) for spec in cross_specs],
+    )
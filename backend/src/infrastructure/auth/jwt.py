@@ -45,6 +45,13 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+def create_upload_token(data: dict, expires_delta: timedelta) -> str:
+    """Create JWT binding a direct (presigned) upload to its uploader and storage key"""
+    to_encode = data.copy()
+    to_encode.update({"exp": datetime.utcnow() + expires_delta, "type": "upload"})
+    return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+
+
 def decode_token(token: str) -> Optional[dict]:
     """Decode JWT token"""
     try:
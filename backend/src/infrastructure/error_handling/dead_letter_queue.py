@@ -1,26 +1,34 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 from uuid import UUID, uuid4
-import json
 
 from ..messaging.redis_queue import RedisQueue
+from ..messaging.serialization import decode_message
+from ..messaging.fair_queue import Lane, create_fair_queue
 
 
 class DeadLetterQueue:
-    """Dead letter queue for failed jobs"""
-    
+    """Dead letter queue for failed jobs.
+
+    Entries are JSON objects on a Redis list, newest first. Inspection is
+    non-destructive; ``requeue`` sends entries back to their original queue
+    (into their FairQueue lane when the entry records one) and removes them.
+    """
+
     def __init__(self, redis_queue: RedisQueue, dlq_name: str = "dlq"):
         self.redis_queue = redis_queue
         self.dlq_name = dlq_name
-    
+
     def enqueue_failed_job(
         self,
         original_queue: str,
         job_data: Dict[str, Any],
         error_message: str,
-        retry_count: int
+        retry_count: int,
+        lane: Optional[Lane] = None,
+        tenant: Optional[str] = None,
     ) -> None:
-        """Add failed job to dead letter queue"""
+        """Add failed job to dead letter queue (``lane``/``tenant``: FairQueue it came from)"""
         dlq_entry = {
             "id": str(uuid4()),
             "original_queue": original_queue,
@@ -29,16 +37,60 @@ class DeadLetterQueue:
             "retry_count": retry_count,
             "failed_at": datetime.utcnow().isoformat(),
         }
+        if lane is not None:
+            dlq_entry["lane"] = Lane(lane).value
+            dlq_entry["tenant"] = str(tenant)
         self.redis_queue.enqueue(self.dlq_name, dlq_entry)
-    
-    def get_failed_jobs(self, limit: int = 100) -> list[Dict[str, Any]]:
-        """Get failed jobs from DLQ (for manual review)"""
-        jobs = []
-        for _ in range(limit):
-            job = self.redis_queue.dequeue(self.dlq_name, timeout=0)
-            if job:
-                jobs.append(job)
+
+    def get_failed_jobs(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get failed jobs from DLQ for manual review, newest first (entries stay in the DLQ)"""
+        return [decode_message(raw) for raw in self._raw_entries(offset, limit)]
+
+    def count(self) -> int:
+        return self.redis_queue.get_queue_length(self.dlq_name)
+
+    def requeue(self, entry_ids: Optional[Iterable[str]] = None, limit: int = 1000) -> int:
+        """
+        Send entries back to their original queue and remove them from the DLQ.
+
+        Args:
+            entry_ids: Entries to requeue; None requeues the newest ``limit`` entries
+            limit: Most entries looked at
+
+        Returns:
+            Number of entries requeued
+        """
+        selected = self._select(entry_ids, limit)
+        batches: Dict[Tuple[str, Optional[str], Optional[str]], List[Dict[str, Any]]] = {}
+        for _, entry in selected:
+            key = (entry["original_queue"], entry.get("lane"), entry.get("tenant"))
+            batches.setdefault(key, []).append(entry["job_data"])
+        # Enqueue before removing: a crash in between duplicates a job rather than losing it
+        for (queue_name, lane, tenant), jobs in batches.items():
+            if lane:
+                create_fair_queue(self.redis_queue, queue_name).enqueue_many(Lane(lane), tenant, jobs)
             else:
-                break
-        return jobs
+                self.redis_queue.enqueue_many(queue_name, jobs)
+        return self._remove_raw(raw for raw, _ in selected)
+
+    def discard(self, entry_ids: Iterable[str], limit: int = 1000) -> int:
+        """Remove entries without requeueing them. Returns the number removed."""
+        return self._remove_raw(raw for raw, _ in self._select(entry_ids, limit))
+
+    def _raw_entries(self, offset: int, limit: int) -> List[bytes]:
+        return self.redis_queue.redis_client.lrange(self.dlq_name, offset, offset + limit - 1)
+
+    def _select(self, entry_ids: Optional[Iterable[str]], limit: int) -> List[Tuple[bytes, Dict[str, Any]]]:
+        wanted = None if entry_ids is None else {str(i) for i in entry_ids}
+        selected = []
+        for raw in self._raw_entries(0, limit):
+            entry = decode_message(raw)
+            if wanted is None or entry.get("id") in wanted:
+                selected.append((raw, entry))
+        return selected
 
+    def _remove_raw(self, raw_entries: Iterable[bytes]) -> int:
+        pipe = self.redis_queue.redis_client.pipeline(transaction=False)
+        for raw in raw_entries:
+            pipe.lrem(self.dlq_name, 1, raw)
+        return sum(pipe.execute())
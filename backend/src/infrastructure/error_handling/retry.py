@@ -16,6 +16,23 @@ class PermanentError(Exception):
     pass
 
 
+def backoff_delay(
+    attempt: int,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0,
+    exponential_base: float = 2.0,
+    jitter: bool = True
+) -> float:
+    """
+    Delay before retry number ``attempt`` (1 = first retry): exponential
+    backoff with up to 25% random jitter, capped at ``max_delay``.
+    """
+    delay = initial_delay * exponential_base ** (attempt - 1)
+    if jitter:
+        delay += delay * 0.25 * random.random()
+    return min(delay, max_delay)
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
@@ -37,7 +54,6 @@ def retry_with_backoff(
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
             last_exception = None
-            delay = initial_delay
             
             for attempt in range(max_retries + 1):
                 try:
@@ -49,18 +65,7 @@ def retry_with_backoff(
                     last_exception = e
                     
                     if attempt < max_retries:
-                        # Calculate delay with exponential backoff
-                        if jitter:
-                            # Add random jitter (0 to 25% of delay)
-                            jitter_amount = delay * 0.25 * random.random()
-                            actual_delay = delay + jitter_amount
-                        else:
-                            actual_delay = delay
-                        
-                        actual_delay = min(actual_delay, max_delay)
-                        
-                        time.sleep(actual_delay)
-                        delay *= exponential_base
+                        time.sleep(backoff_delay(attempt + 1, initial_delay, max_delay, exponential_base, jitter))
                     else:
                         # Max retries reached
                         raise RetryableError(f"Max retries ({max_retries}) exceeded") from last_exception
@@ -1,17 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
+
+from PIL import Image
+
+from .layout import Layout
 
 
 class OCRResult:
     """OCR extraction result"""
 
-    def __init__(self, text: str, layout: List[Dict[str, Any]] = None,
+    def __init__(self, text: str, layout: Union[Layout, List[Dict[str, Any]]] = None,
                  regions: List[Dict[str, Any]] = None):
         self.text = text
-        self.layout = layout or []  # List of text blocks with coordinates
+        # Text blocks with coordinates; OCR services produce a columnar Layout
+        self.layout = layout if layout is not None else Layout()
         self.regions = regions or []  # PP-Structure regions: type, bbox, content
 
 
+def merge_page_results(pages: List[OCRResult]) -> OCRResult:
+    """Combine single-page results into one document result, numbering pages by list position."""
+    layout = Layout()
+    regions: List[Dict[str, Any]] = []
+    for index, page in enumerate(pages):
+        layout.extend(page.layout, page=index)
+        regions.extend({**region, "page": index} for region in page.regions)
+    return OCRResult(text="\n".join(page.text for page in pages), layout=layout, regions=regions)
+
+
 class OCRService(ABC):
     """Abstract OCR service interface"""
     
@@ -42,3 +57,33 @@ class OCRService(ABC):
         """
         pass
 
+    @abstractmethod
+    def extract_text_from_images(self, images: List[Image.Image]) -> OCRResult:
+        """
+        Extract text from already rasterized pages.
+
+        Lets callers rasterize a document once and reuse the page images
+        (see ``storage/page_images.py``).
+
+        Args:
+            images: One image per page
+
+        Returns:
+            OCRResult with text and layout information
+        """
+        pass
+
+    def extract_page_texts_fast(self, images: List[Image.Image]) -> Optional[List[str]]:
+        """
+        Cheap text per page, used to decide which pages deserve a full OCR pass.
+
+        Providers with a lighter mode than their full pipeline override this.
+        The default has none: a quick pass would cost as much as the full one.
+
+        Args:
+            images: One image per page (typically at reduced resolution)
+
+        Returns:
+            Text per page, or None if the provider has no quick mode
+        """
+        return None
@@ -2,7 +2,9 @@ from typing import Optional
 import os
 
 from .base import OCRService
+from .paddle_config import load_paddle_config
 from .paddleocr_service import PaddleOCRService
+from .preprocess import create_image_preprocessor
 from .tesseract_service import TesseractOCRService
 
 
@@ -10,12 +12,13 @@ class OCRServiceFactory:
     """Factory for creating OCR service instances"""
     
     @staticmethod
-    def create(provider: Optional[str] = None) -> OCRService:
+    def create(provider: Optional[str] = None, profile: Optional[str] = None) -> OCRService:
         """
         Create OCR service instance.
         
         Args:
             provider: Provider name ('paddleocr' or 'tesseract')
+            profile: PaddleOCR engine profile ('accurate' or 'fast'; default OCR_PROFILE)
         
         Returns:
             OCRService instance
@@ -23,7 +26,10 @@ class OCRServiceFactory:
         provider = provider or os.getenv("DEFAULT_OCR_PROVIDER", "paddleocr").lower()
         
         if provider == "paddleocr":
-            return PaddleOCRService()
+            return PaddleOCRService(
+                config=load_paddle_config(profile),
+                preprocessor=create_image_preprocessor(),
+            )
         elif provider == "tesseract":
             return TesseractOCRService()
         else:
@@ -0,0 +1,196 @@
+"""
+Columnar storage for OCR layout entries (one per recognised word or line).
+
+Dense pages produce tens of thousands of entries. Kept as dicts with nested
+bbox dicts, each costs around a kilobyte and is slow to serialize. ``Layout``
+stores them column by column in typed arrays, with all texts in a single
+string buffer addressed by offsets. Indexing and iteration still yield the
+familiar ``{"text", "confidence", "bbox": {x, y, width, height}, "page"}``
+dicts; they are built on access and are not stored.
+"""
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+_FLOAT_COLUMNS = ("x", "y", "width", "height", "confidence")
+# Pending texts are joined into one chunk of the buffer every this many appends
+_CHUNK_SIZE = 1024
+
+
+class Layout:
+    """Compact, append-only sequence of OCR layout entries."""
+
+    __slots__ = (
+        "_page", "_x", "_y", "_width", "_height", "_confidence", "_start", "_end", "_chunks", "_pending", "_size",
+    )
+
+    def __init__(self):
+        self._page = array("i")
+        self._x = array("d")
+        self._y = array("d")
+        self._width = array("d")
+        self._height = array("d")
+        self._confidence = array("d")
+        self._start = array("q")
+        self._end = array("q")
+        # Text buffer: joined chunks plus texts appended since the last join
+        self._chunks: List[str] = []
+        self._pending: List[str] = []
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def append(
+        self, text: str, confidence: float, x: float, y: float, width: float, height: float, page: int
+    ) -> None:
+        self._page.append(page)
+        self._x.append(x)
+        self._y.append(y)
+        self._width.append(width)
+        self._height.append(height)
+        self._confidence.append(confidence)
+        self._start.append(self._size)
+        self._pending.append(text)
+        self._size += len(text)
+        self._end.append(self._size)
+        if len(self._pending) >= _CHUNK_SIZE:
+            self._chunks.append("".join(self._pending))
+            self._pending = []
+
+    def append_dict(self, entry: Dict[str, Any], page: Optional[int] = None) -> None:
+        """Append an entry in dict form (``page`` overrides the entry's page)."""
+        bbox = entry.get("bbox") or {}
+        self.append(
+            entry.get("text", ""),
+            float(entry.get("confidence", 1.0)),
+            float(bbox.get("x", 0.0)),
+            float(bbox.get("y", 0.0)),
+            float(bbox.get("width", 0.0)),
+            float(bbox.get("height", 0.0)),
+            entry.get("page", 0) if page is None else page,
+        )
+
+    def extend(self, entries: Union["Layout", Iterable[Dict[str, Any]]], page: Optional[int] = None) -> None:
+        """Append all entries of another Layout (column copy) or of dicts; ``page`` renumbers them."""
+        if not isinstance(entries, Layout):
+            for entry in entries:
+                self.append_dict(entry, page)
+            return
+        count = len(entries)
+        self._page.extend(entries._page if page is None else array("i", [page]) * count)
+        for name in _FLOAT_COLUMNS:
+            getattr(self, f"_{name}").extend(getattr(entries, f"_{name}"))
+        offset = self._size
+        self._start.extend(start + offset for start in entries._start)
+        self._end.extend(end + offset for end in entries._end)
+        if self._pending:
+            self._chunks.append("".join(self._pending))
+            self._pending = []
+        self._chunks.append(entries._buffer())
+        self._size += entries._size
+
+    def scale(self, factor: float, start: int = 0) -> None:
+        """Multiply the bboxes of entries ``start``.. by ``factor`` (in place)."""
+        if factor == 1.0:
+            return
+        for column in (self._x, self._y, self._width, self._height):
+            for i in range(start, len(column)):
+                column[i] *= factor
+
+    def map_boxes(
+        self,
+        transform: Callable[[float, float, float, float], Tuple[float, float, float, float]],
+        start: int = 0,
+    ) -> None:
+        """Replace the bboxes of entries ``start``.. by ``transform(x, y, width, height)`` (in place)."""
+        for i in range(start, len(self)):
+            self._x[i], self._y[i], self._width[i], self._height[i] = transform(
+                self._x[i], self._y[i], self._width[i], self._height[i]
+            )
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _buffer(self) -> str:
+        if self._pending or len(self._chunks) != 1:
+            self._chunks = ["".join(self._chunks + self._pending)]
+            self._pending = []
+        return self._chunks[0]
+
+    def text_at(self, index: int) -> str:
+        return self._buffer()[self._start[index]:self._end[index]]
+
+    def texts(self) -> Iterator[str]:
+        buffer = self._buffer()
+        return (buffer[start:end] for start, end in zip(self._start, self._end))
+
+    def entry(self, index: int) -> Dict[str, Any]:
+        """Dict view of one entry."""
+        return {
+            "text": self.text_at(index),
+            "confidence": self._confidence[index],
+            "bbox": {
+                "x": self._x[index],
+                "y": self._y[index],
+                "width": self._width[index],
+                "height": self._height[index],
+            },
+            "page": self._page[index],
+        }
+
+    def __len__(self) -> int:
+        return len(self._page)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self.entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("layout index out of range")
+        return self.entry(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.entry(i) for i in range(len(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Layout, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Layout({len(self)} entries)"
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_columns(self) -> Dict[str, Any]:
+        """JSON-ready columnar form (see ``from_columns``)."""
+        return {
+            "text": self._buffer(),
+            "start": self._start.tolist(),
+            "end": self._end.tolist(),
+            "page": self._page.tolist(),
+            **{name: getattr(self, f"_{name}").tolist() for name in _FLOAT_COLUMNS},
+        }
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any]) -> "Layout":
+        layout = cls()
+        layout._page.extend(columns["page"])
+        layout._start.extend(columns["start"])
+        layout._end.extend(columns["end"])
+        for name in _FLOAT_COLUMNS:
+            getattr(layout, f"_{name}").extend(columns[name])
+        layout._chunks = [columns["text"]]
+        layout._size = len(columns["text"])
+        return layout
+
+    @classmethod
+    def from_dicts(cls, entries: Iterable[Dict[str, Any]]) -> "Layout":
+        layout = cls()
+        layout.extend(entries)
+        return layout
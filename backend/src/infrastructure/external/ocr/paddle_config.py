@@ -0,0 +1,104 @@
+"""
+Inference settings for the PaddleOCR engines, selected per deployment.
+
+``OCR_PROFILE`` picks a named profile; individual ``PADDLE_*`` env vars
+override single settings of that profile, so workers can be tuned to their
+hardware (threads, MKLDNN, batch sizes, model variants) without code changes.
+``python -m benchmarks.ocr_profiles`` compares the profiles on a corpus.
+"""
+import os
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class PaddleEngineConfig:
+    lang: str = "en"
+    use_gpu: bool = False
+    # Paddle inference threads per engine; workers running several processes should lower this
+    cpu_threads: int = 10
+    enable_mkldnn: bool = False
+    # Text lines recognised per inference call
+    rec_batch_num: int = 6
+    cls_batch_num: int = 6
+    # Pages are resized so their long side is at most this for text detection
+    det_limit_side_len: int = 960
+    ocr_version: str = "PP-OCRv4"
+    layout: bool = True
+    table: bool = True
+    # Custom/lighter inference models; None uses the ocr_version defaults
+    det_model_dir: Optional[str] = None
+    rec_model_dir: Optional[str] = None
+
+    def _common_kwargs(self) -> Dict[str, Any]:
+        kwargs = {
+            "lang": self.lang,
+            "use_gpu": self.use_gpu,
+            "cpu_threads": self.cpu_threads,
+            "enable_mkldnn": self.enable_mkldnn,
+            "rec_batch_num": self.rec_batch_num,
+            "det_limit_side_len": self.det_limit_side_len,
+            "ocr_version": self.ocr_version,
+        }
+        if self.det_model_dir:
+            kwargs["det_model_dir"] = self.det_model_dir
+        if self.rec_model_dir:
+            kwargs["rec_model_dir"] = self.rec_model_dir
+        return kwargs
+
+    def structure_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for ``PPStructure``."""
+        return {
+            **self._common_kwargs(),
+            "layout": self.layout,
+            "table": self.table,
+            "ocr": True,
+            "recovery": False,
+        }
+
+    def ocr_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for the basic ``PaddleOCR`` engine (fallback and quick pass)."""
+        return {**self._common_kwargs(), "cls_batch_num": self.cls_batch_num}
+
+
+PROFILES: Dict[str, PaddleEngineConfig] = {
+    # Layout + table recognition with the default models
+    "accurate": PaddleEngineConfig(),
+    # Lighter PP-OCRv3 det/rec models, smaller detection input, larger recognition
+    # batches and no table recognition (tables come back as plain text regions)
+    "fast": PaddleEngineConfig(
+        enable_mkldnn=True,
+        rec_batch_num=16,
+        det_limit_side_len=736,
+        ocr_version="PP-OCRv3",
+        table=False,
+    ),
+}
+DEFAULT_PROFILE = "accurate"
+
+# env var -> (field, parser)
+_OVERRIDES = {
+    "PADDLE_USE_GPU": ("use_gpu", lambda v: v.lower() == "true"),
+    "PADDLE_CPU_THREADS": ("cpu_threads", int),
+    "PADDLE_ENABLE_MKLDNN": ("enable_mkldnn", lambda v: v.lower() == "true"),
+    "PADDLE_REC_BATCH_NUM": ("rec_batch_num", int),
+    "PADDLE_CLS_BATCH_NUM": ("cls_batch_num", int),
+    "PADDLE_DET_LIMIT_SIDE_LEN": ("det_limit_side_len", int),
+    "PADDLE_OCR_VERSION": ("ocr_version", str),
+    "PADDLE_TABLE": ("table", lambda v: v.lower() == "true"),
+    "PADDLE_DET_MODEL_DIR": ("det_model_dir", str),
+    "PADDLE_REC_MODEL_DIR": ("rec_model_dir", str),
+}
+
+
+def load_paddle_config(profile: Optional[str] = None) -> PaddleEngineConfig:
+    """Config of ``profile`` (default: OCR_PROFILE env) with PADDLE_* env overrides applied."""
+    name = (profile or os.getenv("OCR_PROFILE", DEFAULT_PROFILE)).lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown OCR profile: {name}")
+    overrides = {
+        field_name: parse(os.environ[env])
+        for env, (field_name, parse) in _OVERRIDES.items()
+        if os.getenv(env)
+    }
+    return replace(PROFILES[name], **overrides)
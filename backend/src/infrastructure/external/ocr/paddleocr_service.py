@@ -1,13 +1,15 @@
-import io
 import logging
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import numpy as np
 from PIL import Image
-from pdf2image import convert_from_bytes
 from paddleocr import PaddleOCR, PPStructure
 
 from .base import OCRService, OCRResult
+from .layout import Layout
+from .paddle_config import PaddleEngineConfig
+from .preprocess import ImagePreprocessor, PreprocessedPage
+from .rasterize import convert_to_images
 
 logger = logging.getLogger(__name__)
 
@@ -17,25 +19,26 @@ class PaddleOCRService(OCRService):
 
     Uses PP-Structure for layout-aware document understanding:
     detects titles, text blocks, tables (with HTML), figures, and lists.
+    Pages go through ``preprocessor`` (downscale, deskew, ...) first when one
+    is given; coordinates are mapped back to the original page images.
+    Engine options (threads, MKLDNN, batch sizes, models) come from ``config``.
     """
 
-    def __init__(self):
-        self.engine = PPStructure(
-            show_log=False,
-            lang='en',
-            use_gpu=False,
-            layout=True,
-            table=True,
-            ocr=True,
-            recovery=False,
-        )
+    def __init__(
+        self,
+        config: Optional[PaddleEngineConfig] = None,
+        preprocessor: Optional[ImagePreprocessor] = None,
+    ):
+        self.config = config or PaddleEngineConfig()
+        self.preprocessor = preprocessor
+        self.engine = PPStructure(show_log=False, **self.config.structure_kwargs())
         # Basic OCR as fallback when PP-Structure returns empty
         self._basic_ocr = None
 
     def _get_basic_ocr(self) -> PaddleOCR:
         """Lazy-load basic PaddleOCR for fallback."""
         if self._basic_ocr is None:
-            self._basic_ocr = PaddleOCR(use_angle_cls=True, lang='en', use_gpu=False)
+            self._basic_ocr = PaddleOCR(use_angle_cls=True, show_log=False, **self.config.ocr_kwargs())
         return self._basic_ocr
 
     def extract_text(self, file_path: str) -> OCRResult:
@@ -47,26 +50,19 @@ class PaddleOCRService(OCRService):
 
     def extract_text_from_bytes(self, file_bytes: bytes, file_type: str) -> OCRResult:
         """Extract text from bytes using PP-Structure"""
-        images = self._convert_to_images(file_bytes, file_type)
+        return self.extract_text_from_images(self._convert_to_images(file_bytes, file_type))
 
+    def extract_text_from_images(self, images: List[Image.Image]) -> OCRResult:
+        """Extract text from page images using PP-Structure"""
         all_text: List[str] = []
-        layout: List[Dict[str, Any]] = []
+        layout = Layout()
         regions: List[Dict[str, Any]] = []
 
-        for page_idx, img in enumerate(images):
-            if isinstance(img, Image.Image):
-                # PP-Structure expects 3-channel RGB; convert RGBA/palette images
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                img_array = np.array(img)
-            else:
-                img_array = img
-                # Handle numpy arrays with 4 channels (RGBA)
-                if img_array.ndim == 3 and img_array.shape[2] == 4:
-                    img_array = img_array[:, :, :3]
-
+        pages = self._prepare_pages(images)
+        for page_idx, page in enumerate(pages):
+            layout_start, regions_start = len(layout), len(regions)
             try:
-                result = self.engine(img_array)
+                result = self.engine(page.image)
             except Exception as e:
                 logger.warning("PP-Structure failed on page %d: %s", page_idx, e)
                 continue
@@ -141,33 +137,27 @@ class PaddleOCRService(OCRService):
                     })
 
             all_text.append(" ".join(page_text))
+            layout.map_boxes(page.box_to_original, start=layout_start)
+            self._to_original(regions[regions_start:], page)
 
         full_text = "\n".join(all_text)
 
         # Fallback: if PP-Structure returned nothing, use basic PaddleOCR
         if not full_text.strip() and not regions:
             logger.info("PP-Structure returned empty results, falling back to basic PaddleOCR")
-            return self._basic_ocr_fallback(images)
+            return self._basic_ocr_fallback(pages)
 
         return OCRResult(text=full_text, layout=layout, regions=regions)
 
-    def _basic_ocr_fallback(self, images: List[Image.Image]) -> OCRResult:
+    def _basic_ocr_fallback(self, pages: List[PreprocessedPage]) -> OCRResult:
         """Run basic PaddleOCR when PP-Structure returns empty."""
         ocr = self._get_basic_ocr()
         all_text: List[str] = []
-        layout: List[Dict[str, Any]] = []
-
-        for img_idx, img in enumerate(images):
-            if isinstance(img, Image.Image):
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                img_array = np.array(img)
-            else:
-                img_array = img
-                if img_array.ndim == 3 and img_array.shape[2] == 4:
-                    img_array = img_array[:, :, :3]
+        layout = Layout()
 
-            result = ocr.ocr(img_array, cls=True)
+        for img_idx, page in enumerate(pages):
+            layout_start = len(layout)
+            result = ocr.ocr(page.image, cls=True)
 
             page_text: List[str] = []
             if result and result[0]:
@@ -184,34 +174,73 @@ class PaddleOCRService(OCRService):
 
                             if box and len(box) >= 4:
                                 page_text.append(text)
-                                layout.append({
-                                    "text": text,
-                                    "confidence": confidence,
-                                    "bbox": {
-                                        "x": float(box[0][0]),
-                                        "y": float(box[0][1]),
-                                        "width": float(box[2][0] - box[0][0]),
-                                        "height": float(box[2][1] - box[0][1]),
-                                    },
-                                    "page": img_idx,
-                                })
+                                layout.append(
+                                    text,
+                                    float(confidence),
+                                    float(box[0][0]),
+                                    float(box[0][1]),
+                                    float(box[2][0] - box[0][0]),
+                                    float(box[2][1] - box[0][1]),
+                                    img_idx,
+                                )
                         except (ValueError, IndexError, TypeError):
                             continue
 
             all_text.append(" ".join(page_text))
+            layout.map_boxes(page.box_to_original, start=layout_start)
 
         full_text = "\n".join(all_text)
         return OCRResult(text=full_text, layout=layout)
 
+    def extract_page_texts_fast(self, images: List[Image.Image]) -> List[str]:
+        """Quick text per page: basic detection + recognition, no layout/table analysis or angle classifier."""
+        ocr = self._get_basic_ocr()
+        texts: List[str] = []
+        for page in self._prepare_pages(images):
+            result = ocr.ocr(page.image, cls=False)
+            words = []
+            for line in (result[0] if result and result[0] else []):
+                if line and len(line) >= 2 and isinstance(line[1], (tuple, list)) and line[1]:
+                    words.append(str(line[1][0]))
+            texts.append(" ".join(words))
+        return texts
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def _prepare_pages(self, images: List[Any]) -> List[PreprocessedPage]:
+        """Preprocessed pages, or the images as-is (RGB arrays) without a preprocessor."""
+        if self.preprocessor is not None:
+            return self.preprocessor.process_pages(images)
+        return [PreprocessedPage(image=self._to_array(img)) for img in images]
+
+    @staticmethod
+    def _to_original(entries: List[Dict[str, Any]], page: PreprocessedPage) -> None:
+        """Map region bboxes from the processed page back to original page pixels (in place)."""
+        for entry in entries:
+            bbox = entry["bbox"]
+            x, y, width, height = page.box_to_original(bbox["x"], bbox["y"], bbox["width"], bbox["height"])
+            entry["bbox"] = {"x": x, "y": y, "width": width, "height": height}
+
+    @staticmethod
+    def _to_array(img: Any) -> np.ndarray:
+        """PIL image or array -> 3-channel RGB array as expected by PaddleOCR."""
+        if isinstance(img, Image.Image):
+            # PP-Structure expects 3-channel RGB; convert RGBA/palette images
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            return np.array(img)
+        # Handle numpy arrays with 4 channels (RGBA)
+        if img.ndim == 3 and img.shape[2] == 4:
+            return img[:, :, :3]
+        return img
+
     @staticmethod
     def _process_ocr_line(
         line: Any,
         page_idx: int,
-        layout: List[Dict[str, Any]],
+        layout: Layout,
         block_texts: List[str],
     ) -> None:
         """Extract text and bbox from a single OCR line result."""
@@ -241,30 +270,26 @@ class PaddleOCRService(OCRService):
             if box and isinstance(box, (list, tuple)) and len(box) >= 4:
                 if isinstance(box[0], (list, tuple)):
                     # Quad format: [[x1,y1],[x2,y2],[x3,y3],[x4,y4]]
-                    layout.append({
-                        "text": text,
-                        "confidence": float(confidence),
-                        "bbox": {
-                            "x": float(box[0][0]),
-                            "y": float(box[0][1]),
-                            "width": float(box[2][0] - box[0][0]),
-                            "height": float(box[2][1] - box[0][1]),
-                        },
-                        "page": page_idx,
-                    })
+                    layout.append(
+                        text,
+                        float(confidence),
+                        float(box[0][0]),
+                        float(box[0][1]),
+                        float(box[2][0] - box[0][0]),
+                        float(box[2][1] - box[0][1]),
+                        page_idx,
+                    )
                 else:
                     # [x1, y1, x2, y2] format
-                    layout.append({
-                        "text": text,
-                        "confidence": float(confidence),
-                        "bbox": {
-                            "x": float(box[0]),
-                            "y": float(box[1]),
-                            "width": float(box[2] - box[0]),
-                            "height": float(box[3] - box[1]),
-                        },
-                        "page": page_idx,
-                    })
+                    layout.append(
+                        text,
+                        float(confidence),
+                        float(box[0]),
+                        float(box[1]),
+                        float(box[2] - box[0]),
+                        float(box[3] - box[1]),
+                        page_idx,
+                    )
         except (ValueError, IndexError, TypeError):
             pass
 
@@ -285,9 +310,4 @@ class PaddleOCRService(OCRService):
     @staticmethod
     def _convert_to_images(file_bytes: bytes, file_type: str) -> List[Image.Image]:
         """Convert file bytes to PIL Images"""
-        if file_type == 'pdf':
-            return convert_from_bytes(file_bytes)
-        elif file_type in ['png', 'jpg', 'jpeg']:
-            return [Image.open(io.BytesIO(file_bytes))]
-        else:
-            raise ValueError(f"Unsupported file type: {file_type}")
+        return convert_to_images(file_bytes, file_type)
@@ -0,0 +1,141 @@
+"""
+Embedded text layer of born-digital PDFs (poppler's ``pdftotext -bbox-layout``).
+
+Digital PDFs already contain their text with exact positions, so OCR is both
+slow and less accurate for them. ``read_text_layer`` returns the text layer
+per page; pages without enough text (scans, image-only pages) are reported
+by ``PdfTextLayer.missing_pages`` so only those go through OCR.
+
+Coordinates are scaled from PDF points to pixels at ``OCR_DPI`` so layout
+entries line up with those produced by the OCR services.
+"""
+import os
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .base import OCRResult
+from .layout import Layout
+from .rasterize import OCR_DPI
+from ...monitoring.logging import get_logger
+
+logger = get_logger("sortex.ocr.text_layer")
+
+PDF_POINTS_PER_INCH = 72
+# A page with fewer characters than this is treated as having no usable text layer
+DEFAULT_MIN_CHARS_PER_PAGE = 25
+PDFTOTEXT_TIMEOUT_SECONDS = 30
+
+
+@dataclass
+class TextLayerPage:
+    """Text layer of one page: line-level layout and block-level regions."""
+    layout: Layout = field(default_factory=Layout)
+    regions: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return " ".join(r["content"] for r in self.regions)
+
+    @property
+    def char_count(self) -> int:
+        return sum(len(text.replace(" ", "")) for text in self.layout.texts())
+
+
+@dataclass
+class PdfTextLayer:
+    pages: List[TextLayerPage]
+
+    def missing_pages(self, min_chars: int = DEFAULT_MIN_CHARS_PER_PAGE) -> List[int]:
+        """0-based indexes of pages whose text layer is missing or too sparse."""
+        return [i for i, page in enumerate(self.pages) if page.char_count < min_chars]
+
+    def to_ocr_result(self, ocr_pages: Optional[Dict[int, OCRResult]] = None) -> OCRResult:
+        """Build an OCRResult from the text layer, using ``ocr_pages`` (page index -> OCR of that page) where given."""
+        ocr_pages = ocr_pages or {}
+        texts: List[str] = []
+        layout = Layout()
+        regions: List[Dict[str, Any]] = []
+        for index, page in enumerate(self.pages):
+            ocr = ocr_pages.get(index)
+            if ocr is None:
+                texts.append(page.text)
+                layout.extend(page.layout)
+                regions.extend(page.regions)
+                continue
+            # OCR of a single page reports it as page 0
+            texts.append(ocr.text)
+            layout.extend(ocr.layout, page=index)
+            regions.extend({**region, "page": index} for region in ocr.regions)
+        return OCRResult(text="\n".join(texts), layout=layout, regions=regions)
+
+
+def _local(tag: str) -> str:
+    """Tag name without the XHTML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _bbox(element: ET.Element, scale: float) -> Dict[str, float]:
+    x_min = float(element.get("xMin", 0)) * scale
+    y_min = float(element.get("yMin", 0)) * scale
+    x_max = float(element.get("xMax", 0)) * scale
+    y_max = float(element.get("yMax", 0)) * scale
+    return {"x": x_min, "y": y_min, "width": x_max - x_min, "height": y_max - y_min}
+
+
+def parse_bbox_layout(xhtml: str, dpi: int = OCR_DPI) -> PdfTextLayer:
+    """Parse ``pdftotext -bbox-layout`` output into per-page layout and regions."""
+    scale = dpi / PDF_POINTS_PER_INCH
+    root = ET.fromstring(xhtml)
+    pages: List[TextLayerPage] = []
+    for page_el in (el for el in root.iter() if _local(el.tag) == "page"):
+        index = len(pages)
+        page = TextLayerPage()
+        for block_el in (el for el in page_el.iter() if _local(el.tag) == "block"):
+            block_lines: List[str] = []
+            for line_el in (el for el in block_el.iter() if _local(el.tag) == "line"):
+                words = [w.text.strip() for w in line_el if _local(w.tag) == "word" and w.text and w.text.strip()]
+                if not words:
+                    continue
+                text = " ".join(words)
+                block_lines.append(text)
+                bbox = _bbox(line_el, scale)
+                page.layout.append(text, 1.0, bbox["x"], bbox["y"], bbox["width"], bbox["height"], index)
+            if block_lines:
+                page.regions.append({
+                    "type": "text",
+                    "bbox": _bbox(block_el, scale),
+                    "page": index,
+                    "content": " ".join(block_lines),
+                })
+        # Reading order top-to-bottom, like the PP-Structure output
+        page.regions.sort(key=lambda r: r["bbox"]["y"])
+        pages.append(page)
+    return PdfTextLayer(pages=pages)
+
+
+def read_text_layer(file_bytes: bytes, dpi: int = OCR_DPI) -> Optional[PdfTextLayer]:
+    """Run pdftotext on a PDF. Returns None when the text layer cannot be read (OCR then handles the file)."""
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(file_bytes)
+        completed = subprocess.run(
+            ["pdftotext", "-bbox-layout", "-enc", "UTF-8", path, "-"],
+            capture_output=True,
+            timeout=PDFTOTEXT_TIMEOUT_SECONDS,
+        )
+        if completed.returncode != 0:
+            logger.warning("pdftotext failed", returncode=completed.returncode, stderr=completed.stderr[:500].decode("utf-8", "replace"))
+            return None
+        return parse_bbox_layout(completed.stdout.decode("utf-8", "replace"), dpi=dpi)
+    except FileNotFoundError:
+        logger.warning("pdftotext not installed; PDF text layer disabled")
+        return None
+    except (subprocess.TimeoutExpired, ET.ParseError) as e:
+        logger.warning("Could not read PDF text layer", error=str(e), error_type=type(e).__name__)
+        return None
+    finally:
+        os.remove(path)
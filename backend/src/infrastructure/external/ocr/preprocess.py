@@ -0,0 +1,243 @@
+"""
+Page image preprocessing applied before OCR inference.
+
+OCR cost grows with the number of pixels fed to the models, and phone
+photos or 600 DPI scans carry far more resolution than recognition needs.
+Pages are therefore capped to a target long edge, converted to grayscale,
+turned upright (portrait/landscape), deskewed and contrast-normalised
+before they reach PP-Structure. Each step can be toggled through env vars.
+
+Coordinates produced by OCR on a processed page are in the downscaled,
+rotated and deskewed frame; ``PreprocessedPage.box_to_original`` undoes
+those transforms to map them back to the original page image.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from ...monitoring.metrics import MetricsCollector
+
+# A4 at 200 DPI (the OCR rasterization resolution) is 2339 px: rendered PDFs pass untouched
+DEFAULT_TARGET_LONG_EDGE = 2400
+# Skew and orientation are estimated on a thumbnail of this long edge
+ANALYSIS_LONG_EDGE = 800
+MAX_SKEW_DEGREES = 10.0
+# Smaller angles are not worth the interpolation
+MIN_SKEW_DEGREES = 0.3
+# The page turned by 90 degrees must score this much better to be rotated
+ORIENTATION_RATIO = 1.5
+COARSE_SKEW_STEP = 1.0
+FINE_SKEW_STEP = 0.1
+CLAHE_CLIP_LIMIT = 2.0
+CLAHE_TILE_GRID = (8, 8)
+
+
+@dataclass
+class PreprocessConfig:
+    target_long_edge: int = DEFAULT_TARGET_LONG_EDGE
+    grayscale: bool = True
+    deskew: bool = True
+    detect_orientation: bool = True
+    normalize_contrast: bool = True
+
+
+@dataclass
+class PreprocessedPage:
+    """A page ready for OCR: 3-channel RGB array plus the transform applied to it."""
+    image: np.ndarray
+    # Original pixels per processed pixel (>= 1.0)
+    scale: float = 1.0
+    # Clockwise rotation applied to turn the page upright (0 or 90)
+    rotation: int = 0
+    # Counter-clockwise deskew rotation applied about the page centre (0.0: none)
+    skew_degrees: float = 0.0
+    # (width, height) after downscaling, before rotation; needed to undo a 90 degree turn
+    base_size: Optional[Tuple[int, int]] = None
+
+    @property
+    def pixels(self) -> int:
+        return int(self.image.shape[0] * self.image.shape[1])
+
+    def points_to_original(self, points: np.ndarray) -> np.ndarray:
+        """Map (N, 2) processed-page points back to original page pixels."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.skew_degrees:
+            height, width = self.image.shape[:2]
+            matrix = cv2.invertAffineTransform(
+                cv2.getRotationMatrix2D((width / 2, height / 2), self.skew_degrees, 1.0)
+            )
+            points = points @ matrix[:, :2].T + matrix[:, 2]
+        if self.rotation == 90:
+            base_height = self.base_size[1] if self.base_size else self.image.shape[1]
+            # Clockwise turn sends (x, y) to (height - y, x)
+            points = np.column_stack((points[:, 1], base_height - points[:, 0]))
+        return points * self.scale
+
+    def box_to_original(self, x: float, y: float, width: float, height: float) -> Tuple[float, float, float, float]:
+        """Axis-aligned (x, y, width, height) in original page pixels of a processed-page box."""
+        if not self.skew_degrees and not self.rotation:
+            return x * self.scale, y * self.scale, width * self.scale, height * self.scale
+        corners = self.points_to_original(
+            [(x, y), (x + width, y), (x + width, y + height), (x, y + height)]
+        )
+        left, top = corners.min(axis=0)
+        right, bottom = corners.max(axis=0)
+        return float(left), float(top), float(right - left), float(bottom - top)
+
+
+def _env_flag(name: str, default: bool = True) -> bool:
+    return os.getenv(name, "true" if default else "false").lower() == "true"
+
+
+def _projection_score(binary: np.ndarray) -> float:
+    """Variance of the row profile: sharp peaks when text lines are horizontal."""
+    return float(np.var(binary.sum(axis=1, dtype=np.float64)))
+
+
+def _rotate(image: np.ndarray, degrees: float, border_value: int = 0) -> np.ndarray:
+    height, width = image.shape[:2]
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), degrees, 1.0)
+    return cv2.warpAffine(
+        image, matrix, (width, height),
+        flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=border_value,
+    )
+
+
+class ImagePreprocessor:
+    """Normalises page images for OCR (see module docstring)."""
+
+    def __init__(self, config: PreprocessConfig = None):
+        self.config = config or PreprocessConfig()
+        self._clahe = cv2.createCLAHE(clipLimit=CLAHE_CLIP_LIMIT, tileGridSize=CLAHE_TILE_GRID)
+
+    def process(self, image: Any) -> PreprocessedPage:
+        """Preprocess one PIL image or array."""
+        started = time.perf_counter()
+        array = self._to_rgb_array(image)
+        input_pixels = int(array.shape[0] * array.shape[1])
+
+        array, scale = self._downscale(array)
+        base_size = (array.shape[1], array.shape[0])
+        gray = cv2.cvtColor(array, cv2.COLOR_RGB2GRAY)
+        work = gray if self.config.grayscale else array
+
+        rotation = 0
+        skew = 0.0
+        if self.config.detect_orientation or self.config.deskew:
+            binary = self._analysis_binary(gray)
+            coarse, score = self._best_angle(binary, self._coarse_angles())
+            if self.config.detect_orientation:
+                turned = cv2.rotate(binary, cv2.ROTATE_90_CLOCKWISE)
+                turned_coarse, turned_score = self._best_angle(turned, self._coarse_angles())
+                if turned_score > score * ORIENTATION_RATIO:
+                    rotation = 90
+                    work = cv2.rotate(work, cv2.ROTATE_90_CLOCKWISE)
+                    binary, coarse = turned, turned_coarse
+            if self.config.deskew:
+                skew = self._refine_skew(binary, coarse)
+                if abs(skew) < MIN_SKEW_DEGREES:
+                    skew = 0.0
+                else:
+                    work = _rotate(work, skew, border_value=255 if work.ndim == 2 else (255, 255, 255))
+
+        if self.config.normalize_contrast:
+            work = self._normalize_contrast(work)
+
+        # PaddleOCR models take 3-channel input
+        if work.ndim == 2:
+            work = cv2.cvtColor(work, cv2.COLOR_GRAY2RGB)
+
+        page = PreprocessedPage(
+            image=work, scale=scale, rotation=rotation, skew_degrees=skew, base_size=base_size,
+        )
+        MetricsCollector.record_ocr_preprocess(input_pixels, page.pixels, time.perf_counter() - started)
+        return page
+
+    def process_pages(self, images: List[Any]) -> List[PreprocessedPage]:
+        return [self.process(image) for image in images]
+
+    # ------------------------------------------------------------------
+    # Steps
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_rgb_array(image: Any) -> np.ndarray:
+        if isinstance(image, Image.Image):
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            return np.asarray(image)
+        if image.ndim == 2:
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        if image.shape[2] == 4:
+            return np.ascontiguousarray(image[:, :, :3])
+        return image
+
+    def _downscale(self, array: np.ndarray):
+        """Cap the long edge at the target. Never upscales. Returns (array, scale)."""
+        long_edge = max(array.shape[:2])
+        target = self.config.target_long_edge
+        if not target or long_edge <= target:
+            return array, 1.0
+        scale = long_edge / target
+        height, width = array.shape[:2]
+        size = (max(1, round(width / scale)), max(1, round(height / scale)))
+        return cv2.resize(array, size, interpolation=cv2.INTER_AREA), scale
+
+    @staticmethod
+    def _analysis_binary(gray: np.ndarray) -> np.ndarray:
+        """Small inverted binary image (text = 1) used to estimate orientation and skew."""
+        long_edge = max(gray.shape[:2])
+        if long_edge > ANALYSIS_LONG_EDGE:
+            factor = ANALYSIS_LONG_EDGE / long_edge
+            gray = cv2.resize(gray, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA)
+        _, binary = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+        return binary
+
+    # Skew: projection-profile search on the analysis image. Text lines give the row
+    # profile its sharpest peaks when they are horizontal; comparing the best score of
+    # the page and the page turned by 90 degrees also tells whether it lies sideways.
+
+    @staticmethod
+    def _coarse_angles() -> np.ndarray:
+        return np.arange(-MAX_SKEW_DEGREES, MAX_SKEW_DEGREES + COARSE_SKEW_STEP / 2, COARSE_SKEW_STEP)
+
+    @staticmethod
+    def _best_angle(binary: np.ndarray, angles: np.ndarray):
+        """(angle, score) of the rotation with the sharpest row profile."""
+        scores = [_projection_score(_rotate(binary, angle)) for angle in angles]
+        best = int(np.argmax(scores))
+        return float(angles[best]), scores[best]
+
+    def _refine_skew(self, binary: np.ndarray, coarse: float) -> float:
+        """Skew in degrees (counter-clockwise rotation that straightens the text), to 0.1 degree."""
+        if not binary.any():
+            return 0.0
+        angles = np.arange(coarse - COARSE_SKEW_STEP, coarse + COARSE_SKEW_STEP + FINE_SKEW_STEP / 2, FINE_SKEW_STEP)
+        angle, _ = self._best_angle(binary, angles)
+        return round(angle, 1)
+
+    def _normalize_contrast(self, work: np.ndarray) -> np.ndarray:
+        """CLAHE on the luminance: lifts faded thermal prints and uneven phone lighting."""
+        if work.ndim == 2:
+            return self._clahe.apply(work)
+        lab = cv2.cvtColor(work, cv2.COLOR_RGB2LAB)
+        lab[:, :, 0] = self._clahe.apply(lab[:, :, 0])
+        return cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
+
+
+def create_image_preprocessor() -> Optional[ImagePreprocessor]:
+    """Return an ImagePreprocessor configured from env, or None when OCR_PREPROCESS_ENABLED=false."""
+    if not _env_flag("OCR_PREPROCESS_ENABLED"):
+        return None
+    return ImagePreprocessor(PreprocessConfig(
+        target_long_edge=int(os.getenv("OCR_TARGET_LONG_EDGE", str(DEFAULT_TARGET_LONG_EDGE))),
+        grayscale=_env_flag("OCR_GRAYSCALE"),
+        deskew=_env_flag("OCR_DESKEW"),
+        detect_orientation=_env_flag("OCR_DETECT_ORIENTATION"),
+        normalize_contrast=_env_flag("OCR_NORMALIZE_CONTRAST"),
+    ))
@@ -0,0 +1,32 @@
+"""
+Document rasterization shared by the OCR services and the page preview pipeline.
+"""
+import io
+from typing import List, Optional
+
+from PIL import Image
+
+# pdf2image's default resolution, used for OCR
+OCR_DPI = 200
+
+
+def convert_to_images(
+    file_bytes: bytes,
+    file_type: str,
+    dpi: int = OCR_DPI,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+) -> List[Image.Image]:
+    """Convert file bytes to one PIL image per page.
+
+    PDFs are rendered with poppler at ``dpi``, optionally only pages
+    ``first_page``..``last_page`` (1-based); images are returned as a single page.
+    """
+    if file_type == 'pdf':
+        # Imported here so image-only callers do not need poppler/pdf2image
+        from pdf2image import convert_from_bytes
+        return convert_from_bytes(file_bytes, dpi=dpi, first_page=first_page, last_page=last_page)
+    elif file_type in ['png', 'jpg', 'jpeg']:
+        return [Image.open(io.BytesIO(file_bytes))]
+    else:
+        raise ValueError(f"Unsupported file type: {file_type}")
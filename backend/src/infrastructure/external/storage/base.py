@@ -1,5 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO, Iterator, List, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Presigned direct uploads land here until finalized; backends expire what is never finalized
+STAGING_UPLOAD_PREFIX = "uploads/"
+STAGING_UPLOAD_EXPIRY_DAYS = 1
+
+
+@dataclass
+class StoredFileInfo:
+    """Metadata of a stored object"""
+    size: int
+    etag: Optional[str] = None
+    content_type: Optional[str] = None
 
 
 class StorageService(ABC):
@@ -19,6 +34,24 @@ class StorageService(ABC):
             Storage path/key
         """
         pass
+
+    def upload_stream(self, file_path: str, stream: BinaryIO, length: int = -1, content_type: str = None) -> str:
+        """
+        Upload file from a readable stream.
+
+        Backends that support streaming uploads override this; the default
+        reads the stream into memory.
+
+        Args:
+            file_path: Storage path/key
+            stream: Readable binary stream
+            length: Number of bytes, or -1 if unknown
+            content_type: MIME type
+
+        Returns:
+            Storage path/key
+        """
+        return self.upload_file(file_path, stream.read(), content_type=content_type)
     
     @abstractmethod
     def download_file(self, file_path: str) -> bytes:
@@ -56,3 +89,143 @@ class StorageService(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_files(self, prefix: str) -> List[str]:
+        """
+        List the keys of all objects under a prefix.
+
+        Args:
+            prefix: Key prefix (e.g. ``"{document_id}/"``)
+
+        Returns:
+            Storage paths/keys
+        """
+        pass
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete all objects under a prefix.
+
+        Backends override this with a batch delete; the default deletes the
+        listed objects one by one.
+
+        Args:
+            prefix: Key prefix (e.g. ``"{document_id}/"``)
+
+        Returns:
+            Number of objects deleted
+        """
+        keys = self.list_files(prefix)
+        for key in keys:
+            self.delete_file(key)
+        return len(keys)
+
+    def copy_file(self, source_path: str, destination_path: str) -> str:
+        """
+        Copy an object to another key.
+
+        Backends override this with a server-side copy; the default downloads
+        and re-uploads the object.
+
+        Args:
+            source_path: Storage path/key to copy
+            destination_path: Storage path/key of the copy
+
+        Returns:
+            Destination path/key
+        """
+        return self.upload_file(destination_path, self.download_file(source_path))
+
+    def stat_file(self, file_path: str) -> StoredFileInfo:
+        """
+        Get object metadata without downloading it.
+
+        Backends override this; the default downloads the object.
+
+        Args:
+            file_path: Storage path/key
+
+        Returns:
+            StoredFileInfo
+        """
+        return StoredFileInfo(size=len(self.download_file(file_path)))
+
+    def open_stream(self, file_path: str, offset: int = 0, length: Optional[int] = None) -> BinaryIO:
+        """
+        Open a readable stream over an object (or a byte range of it).
+
+        The caller must close the stream. Backends override this to stream
+        from the server; the default downloads the object into memory.
+
+        Args:
+            file_path: Storage path/key
+            offset: First byte to read
+            length: Number of bytes to read, or None for the rest of the object
+
+        Returns:
+            Readable binary stream
+        """
+        data = self.download_file(file_path)
+        end = None if length is None else offset + length
+        return BytesIO(data[offset:end])
+
+    def iter_chunks(
+        self,
+        file_path: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Iterate over an object (or a byte range of it) in chunks of at most ``chunk_size`` bytes.
+
+        Args:
+            file_path: Storage path/key
+            offset: First byte to read
+            length: Number of bytes to read, or None for the rest of the object
+            chunk_size: Maximum chunk size
+
+        Yields:
+            File chunks
+        """
+        stream = self.open_stream(file_path, offset=offset, length=length)
+        try:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            stream.close()
+
+    def presigned_download_url(
+        self,
+        file_path: str,
+        expires_seconds: int = 300,
+        filename: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Get a time-limited URL clients can download the object from directly.
+
+        Args:
+            file_path: Storage path/key
+            expires_seconds: URL validity
+            filename: Download filename (Content-Disposition)
+
+        Returns:
+            URL, or None if the backend does not support presigned URLs
+        """
+        return None
+
+    def presigned_upload_url(self, file_path: str, expires_seconds: int = 900) -> Optional[str]:
+        """
+        Get a time-limited URL clients can PUT the object to directly.
+
+        Args:
+            file_path: Storage path/key
+            expires_seconds: URL validity
+
+        Returns:
+            URL, or None if the backend does not support presigned URLs
+        """
+        return None
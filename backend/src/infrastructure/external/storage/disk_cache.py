@@ -0,0 +1,258 @@
+"""
+Local disk read-through cache in front of a StorageService (used by workers).
+
+Extraction retries and reprocessing download the same object several times.
+``DiskCacheStorageService`` keeps a size-bounded LRU of objects on local disk:
+
+- entries are named ``{sha256(path)}.{sha256(etag)}``, so a cached copy is only
+  served while its ETag still matches the object in storage (one stat call
+  instead of a full download);
+- misses are streamed from storage into a temp file that is atomically
+  renamed into place, so concurrent readers never see partial files;
+- hits are read through ``mmap`` so repeated reads of the same object are
+  served from the OS page cache;
+- least recently used entries are evicted once ``max_bytes`` is exceeded.
+
+Writes and deletes go to the wrapped service and drop the cached copies.
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import BinaryIO, List, Optional
+
+from .base import StorageService, StoredFileInfo, DEFAULT_CHUNK_SIZE
+from ...monitoring.logging import get_logger
+from ...monitoring.metrics import MetricsCollector
+
+logger = get_logger("sortex.storage.cache")
+
+_TMP_PREFIX = ".tmp-"
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class DiskCacheStorageService(StorageService):
+    """Caching StorageService decorator with an on-disk, ETag-validated LRU."""
+
+    def __init__(self, storage_service: StorageService, cache_dir: str, max_bytes: int):
+        self.storage_service = storage_service
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # entry name -> size, oldest first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    # --- cache bookkeeping ---
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU order from the entries already on disk (by mtime)."""
+        found = []
+        for name in os.listdir(self.cache_dir):
+            full = os.path.join(self.cache_dir, name)
+            if name.startswith(_TMP_PREFIX):
+                # Left behind by a crash mid-download
+                self._remove(full)
+                continue
+            try:
+                st = os.stat(full)
+            except FileNotFoundError:
+                continue
+            found.append((st.st_mtime, name, st.st_size))
+        for _mtime, name, size in sorted(found):
+            self._entries[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _entry_name(self, file_path: str, etag: str) -> str:
+        return f"{_digest(file_path)}.{_digest(etag)}"
+
+    def _entry_path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+
+    @staticmethod
+    def _remove(full_path: str) -> None:
+        try:
+            os.remove(full_path)
+        except FileNotFoundError:
+            pass
+
+    def _touch(self, name: str, size: int) -> None:
+        with self._lock:
+            if name not in self._entries:
+                self._total_bytes += size
+            self._entries[name] = size
+            self._entries.move_to_end(name)
+        try:
+            # mtime carries the LRU order across restarts and worker processes
+            os.utime(self._entry_path(name))
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, name: str) -> None:
+        with self._lock:
+            size = self._entries.pop(name, None)
+            if size is not None:
+                self._total_bytes -= size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in ``max_bytes``."""
+        with self._lock:
+            victims = []
+            while self._total_bytes > self.max_bytes and self._entries:
+                name, size = self._entries.popitem(last=False)
+                self._total_bytes -= size
+                victims.append(name)
+        for name in victims:
+            self._remove(self._entry_path(name))
+
+    def _invalidate(self, file_path: str) -> None:
+        """Remove every cached version of ``file_path``."""
+        prefix = f"{_digest(file_path)}."
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix):
+                self._forget(name)
+                self._remove(self._entry_path(name))
+
+    def _fill(self, file_path: str, name: str) -> int:
+        """Stream the object from storage into the cache. Returns its size."""
+        fd, tmp_path = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=self.cache_dir)
+        try:
+            size = 0
+            stream = self.storage_service.open_stream(file_path)
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    while True:
+                        chunk = stream.read(DEFAULT_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        out.write(chunk)
+                        size += len(chunk)
+            finally:
+                stream.close()
+            os.replace(tmp_path, self._entry_path(name))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._invalidate_other_versions(file_path, name)
+        self._touch(name, size)
+        self._evict()
+        return size
+
+    def _invalidate_other_versions(self, file_path: str, keep: str) -> None:
+        prefix = f"{_digest(file_path)}."
+        for other in [n for n in list(self._entries) if n.startswith(prefix) and n != keep]:
+            self._forget(other)
+            self._remove(self._entry_path(other))
+
+    def _read(self, name: str, offset: int = 0, length: Optional[int] = None) -> Optional[bytes]:
+        """Read a cached entry (or a byte range of it) via mmap; None if it is missing."""
+        try:
+            with open(self._entry_path(name), "rb") as fh:
+                size = os.fstat(fh.fileno()).st_size
+                if size == 0:
+                    data = b""
+                else:
+                    with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        end = size if length is None else min(offset + length, size)
+                        data = mm[offset:end]
+        except FileNotFoundError:
+            # Evicted by another worker process sharing the directory
+            self._forget(name)
+            return None
+        self._touch(name, size)
+        return data
+
+    def _cached_name(self, file_path: str) -> Optional[str]:
+        """Cache entry name for the object's current ETag, or None if it should not be cached."""
+        info = self.storage_service.stat_file(file_path)
+        if not info.etag or info.size > self.max_bytes:
+            return None
+        return self._entry_name(file_path, info.etag)
+
+    def _read_through(self, file_path: str, offset: int = 0, length: Optional[int] = None) -> Optional[bytes]:
+        name = self._cached_name(file_path)
+        if name is None:
+            return None
+        data = self._read(name, offset, length)
+        MetricsCollector.record_storage_cache(hit=data is not None)
+        if data is None:
+            try:
+                self._fill(file_path, name)
+            except OSError as e:
+                # Disk full / unwritable cache: serve from storage instead
+                logger.warning("Storage cache fill failed", error=str(e), storage_path=file_path)
+                return None
+            data = self._read(name, offset, length)
+        return data
+
+    # --- StorageService ---
+
+    def upload_file(self, file_path: str, file_data: bytes, content_type: str = None) -> str:
+        self._invalidate(file_path)
+        return self.storage_service.upload_file(file_path, file_data, content_type=content_type)
+
+    def upload_stream(self, file_path: str, stream: BinaryIO, length: int = -1, content_type: str = None) -> str:
+        self._invalidate(file_path)
+        return self.storage_service.upload_stream(file_path, stream, length=length, content_type=content_type)
+
+    def copy_file(self, source_path: str, destination_path: str) -> str:
+        self._invalidate(destination_path)
+        return self.storage_service.copy_file(source_path, destination_path)
+
+    def download_file(self, file_path: str) -> bytes:
+        data = self._read_through(file_path)
+        if data is None:
+            return self.storage_service.download_file(file_path)
+        return data
+
+    def open_stream(self, file_path: str, offset: int = 0, length: Optional[int] = None) -> BinaryIO:
+        data = self._read_through(file_path, offset, length)
+        if data is None:
+            return self.storage_service.open_stream(file_path, offset=offset, length=length)
+        return BytesIO(data)
+
+    def delete_file(self, file_path: str) -> None:
+        self._invalidate(file_path)
+        self.storage_service.delete_file(file_path)
+
+    def list_files(self, prefix: str) -> List[str]:
+        return self.storage_service.list_files(prefix)
+
+    def delete_prefix(self, prefix: str) -> int:
+        for file_path in self.storage_service.list_files(prefix):
+            self._invalidate(file_path)
+        return self.storage_service.delete_prefix(prefix)
+
+    def file_exists(self, file_path: str) -> bool:
+        return self.storage_service.file_exists(file_path)
+
+    def stat_file(self, file_path: str) -> StoredFileInfo:
+        return self.storage_service.stat_file(file_path)
+
+    def presigned_download_url(
+        self,
+        file_path: str,
+        expires_seconds: int = 300,
+        filename: Optional[str] = None,
+    ) -> Optional[str]:
+        return self.storage_service.presigned_download_url(file_path, expires_seconds=expires_seconds, filename=filename)
+
+    def presigned_upload_url(self, file_path: str, expires_seconds: int = 900) -> Optional[str]:
+        return self.storage_service.presigned_upload_url(file_path, expires_seconds=expires_seconds)
+
+
+def create_disk_cache(storage_service: StorageService) -> StorageService:
+    """Wrap ``storage_service`` in a DiskCacheStorageService when STORAGE_CACHE_DIR is set."""
+    cache_dir = os.getenv("STORAGE_CACHE_DIR")
+    if not cache_dir:
+        return storage_service
+    max_bytes = int(os.getenv("STORAGE_CACHE_MAX_MB", "2048")) * 1024 * 1024
+    return DiskCacheStorageService(storage_service, cache_dir, max_bytes)
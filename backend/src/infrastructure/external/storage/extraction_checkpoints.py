@@ -0,0 +1,70 @@
+import gzip
+import json
+import os
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from .base import StorageService
+from ...monitoring.logging import get_logger
+
+logger = get_logger("sortex.storage.extraction_checkpoints")
+
+
+class ExtractionCheckpointStore:
+    """Outputs of the extraction stages a failed attempt got through.
+
+    When an attempt fails, ``ExtractFieldsUseCase`` stores the output of each
+    stage it finished (OCR, classification, LLM extraction) under
+    ``{document_id}/checkpoints/{stage}.json.gz``; the retry loads them and
+    resumes at the stage that failed instead of downloading and OCRing the
+    file again. Successful attempts write nothing. Checkpoints are deleted
+    once the extraction is committed or the job is dead-lettered.
+    """
+
+    CONTENT_TYPE = "application/gzip"
+    # Pipeline order: a stage's checkpoint is only usable with all earlier ones
+    STAGES = ("ocr", "classify", "llm")
+
+    def __init__(self, storage_service: StorageService, compression_level: int = 6):
+        self.storage_service = storage_service
+        self.compression_level = compression_level
+
+    @staticmethod
+    def key_for(document_id: UUID, stage: str) -> str:
+        return f"{document_id}/checkpoints/{stage}.json.gz"
+
+    def save(self, document_id: UUID, stages: Dict[str, Dict[str, Any]]) -> None:
+        """Store stage outputs (``{stage: JSON-serializable payload}``)."""
+        for stage, payload in stages.items():
+            data = gzip.compress(
+                json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8"),
+                compresslevel=self.compression_level,
+            )
+            self.storage_service.upload_file(self.key_for(document_id, stage), data, content_type=self.CONTENT_TYPE)
+
+    def load(self, document_id: UUID) -> Dict[str, Dict[str, Any]]:
+        """Stored outputs of the leading completed stages (empty: start from scratch)."""
+        stages = {}
+        for stage in self.STAGES:
+            key = self.key_for(document_id, stage)
+            if not self.storage_service.file_exists(key):
+                break
+            stages[stage] = json.loads(gzip.decompress(self.storage_service.download_file(key)))
+        return stages
+
+    def clear(self, document_id: UUID) -> None:
+        """Delete the document's checkpoints (best effort: leftovers are overwritten by the next failure)."""
+        for stage in self.STAGES:
+            key = self.key_for(document_id, stage)
+            try:
+                if self.storage_service.file_exists(key):
+                    self.storage_service.delete_file(key)
+            except Exception as e:
+                logger.warning("Failed to delete extraction checkpoint", key=key, error=str(e))
+
+
+def create_extraction_checkpoint_store(storage_service: StorageService) -> Optional[ExtractionCheckpointStore]:
+    """Return an ExtractionCheckpointStore unless EXTRACTION_CHECKPOINTS=false."""
+    if os.getenv("EXTRACTION_CHECKPOINTS", "true").lower() != "true":
+        return None
+    return ExtractionCheckpointStore(storage_service)
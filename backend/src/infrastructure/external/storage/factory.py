@@ -27,13 +27,18 @@ class StorageServiceFactory:
             secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
             bucket_name = os.getenv("MINIO_BUCKET_NAME", "documents")
             use_ssl = os.getenv("MINIO_USE_SSL", "false").lower() == "true"
+            # Browser-reachable endpoint for presigned URLs (optional)
+            public_endpoint = os.getenv("MINIO_PUBLIC_ENDPOINT") or None
+            public_use_ssl = os.getenv("MINIO_PUBLIC_USE_SSL")
             
             return MinIOStorageService(
                 endpoint=endpoint,
                 access_key=access_key,
                 secret_key=secret_key,
                 bucket_name=bucket_name,
-                use_ssl=use_ssl
+                use_ssl=use_ssl,
+                public_endpoint=public_endpoint,
+                public_use_ssl=None if public_use_ssl is None else public_use_ssl.lower() == "true",
             )
         else:
             raise ValueError(f"Unknown storage provider: {provider}")
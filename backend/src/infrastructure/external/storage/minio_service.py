@@ -1,14 +1,57 @@
-from io import BytesIO
+from datetime import timedelta
+from io import BytesIO, RawIOBase
+from typing import List, Optional
+from urllib.parse import quote
+
 from minio import Minio
+from minio.commonconfig import CopySource, ENABLED, Filter
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from minio.lifecycleconfig import Expiration, LifecycleConfig, Rule
+
+from .base import StorageService, StoredFileInfo, STAGING_UPLOAD_EXPIRY_DAYS, STAGING_UPLOAD_PREFIX
+from ...monitoring.logging import get_logger
+
+logger = get_logger("sortex.storage.minio")
+
+
+class _ObjectStream(RawIOBase):
+    """Readable wrapper over a MinIO GET response that releases the connection on close"""
+
+    def __init__(self, response):
+        self._response = response
 
-from .base import StorageService
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._response.read(None if size is None or size < 0 else size)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._response.close()
+            self._response.release_conn()
+        super().close()
 
 
 class MinIOStorageService(StorageService):
     """MinIO S3-compatible storage implementation"""
     
-    def __init__(self, endpoint: str, access_key: str, secret_key: str, bucket_name: str, use_ssl: bool = False):
+    def __init__(
+        self,
+        endpoint: str,
+        access_key: str,
+        secret_key: str,
+        bucket_name: str,
+        use_ssl: bool = False,
+        public_endpoint: Optional[str] = None,
+        public_use_ssl: Optional[bool] = None,
+    ):
         self.client = Minio(
             endpoint,
             access_key=access_key,
@@ -17,6 +60,20 @@ class MinIOStorageService(StorageService):
         )
         self.bucket_name = bucket_name
         self._ensure_bucket_exists()
+        self._ensure_staging_expiry()
+
+        # Presigned URLs are signed for the host the browser will call, which
+        # differs from the internal endpoint behind docker/nginx. The region is
+        # fixed so signing does not need a round trip to that host.
+        self.presign_client = None
+        if public_endpoint:
+            self.presign_client = Minio(
+                public_endpoint,
+                access_key=access_key,
+                secret_key=secret_key,
+                secure=use_ssl if public_use_ssl is None else public_use_ssl,
+                region="us-east-1",
+            )
     
     def _ensure_bucket_exists(self):
         """Ensure bucket exists, create if not"""
@@ -26,6 +83,25 @@ class MinIOStorageService(StorageService):
         except S3Error as e:
             raise Exception(f"Failed to create bucket: {e}")
     
+    # Lifecycle rule id of the staging upload expiry
+    STAGING_RULE_ID = "expire-staging-uploads"
+
+    def _ensure_staging_expiry(self):
+        """Expire direct uploads that were never finalized (lifecycle rule on the staging prefix)"""
+        try:
+            config = self.client.get_bucket_lifecycle(self.bucket_name)
+            rules = [r for r in (config.rules if config else []) if r.rule_id != self.STAGING_RULE_ID]
+            rules.append(Rule(
+                ENABLED,
+                rule_filter=Filter(prefix=STAGING_UPLOAD_PREFIX),
+                rule_id=self.STAGING_RULE_ID,
+                expiration=Expiration(days=STAGING_UPLOAD_EXPIRY_DAYS),
+            ))
+            self.client.set_bucket_lifecycle(self.bucket_name, LifecycleConfig(rules))
+        except S3Error as e:
+            # Not fatal: abandoned uploads just stay until removed by hand
+            logger.warning("Failed to set staging upload expiry", error=str(e))
+
     def upload_file(self, file_path: str, file_data: bytes, content_type: str = None) -> str:
         """Upload file to MinIO"""
         try:
@@ -40,6 +116,24 @@ class MinIOStorageService(StorageService):
         except S3Error as e:
             raise Exception(f"Failed to upload file: {e}")
     
+    # Multipart part size when the stream length is unknown (MinIO minimum is 5 MiB)
+    STREAM_PART_SIZE = 10 * 1024 * 1024
+
+    def upload_stream(self, file_path: str, stream, length: int = -1, content_type: str = None) -> str:
+        """Upload file to MinIO from a stream without buffering it in memory"""
+        try:
+            self.client.put_object(
+                self.bucket_name,
+                file_path,
+                stream,
+                length=length,
+                part_size=self.STREAM_PART_SIZE if length < 0 else 0,
+                content_type=content_type or "application/octet-stream"
+            )
+            return file_path
+        except S3Error as e:
+            raise Exception(f"Failed to upload file: {e}")
+    
     def download_file(self, file_path: str) -> bytes:
         """Download file from MinIO"""
         try:
@@ -51,6 +145,66 @@ class MinIOStorageService(StorageService):
         except S3Error as e:
             raise Exception(f"Failed to download file: {e}")
     
+    def copy_file(self, source_path: str, destination_path: str) -> str:
+        """Server-side copy within the bucket (no bytes pass through the API)"""
+        try:
+            self.client.copy_object(self.bucket_name, destination_path, CopySource(self.bucket_name, source_path))
+            return destination_path
+        except S3Error as e:
+            raise Exception(f"Failed to copy file: {e}")
+
+    def stat_file(self, file_path: str) -> StoredFileInfo:
+        """Get object size/ETag from MinIO without downloading it"""
+        try:
+            stat = self.client.stat_object(self.bucket_name, file_path)
+            return StoredFileInfo(size=stat.size, etag=stat.etag, content_type=stat.content_type)
+        except S3Error as e:
+            raise Exception(f"Failed to stat file: {e}")
+
+    def open_stream(self, file_path: str, offset: int = 0, length: Optional[int] = None):
+        """Open a streaming (optionally ranged) GET on a MinIO object"""
+        try:
+            response = self.client.get_object(
+                self.bucket_name,
+                file_path,
+                offset=offset,
+                length=length or 0,
+            )
+            return _ObjectStream(response)
+        except S3Error as e:
+            raise Exception(f"Failed to download file: {e}")
+
+    def presigned_download_url(
+        self,
+        file_path: str,
+        expires_seconds: int = 300,
+        filename: Optional[str] = None,
+    ) -> Optional[str]:
+        """Presigned GET URL on the public MinIO endpoint (None if not configured)"""
+        if self.presign_client is None:
+            return None
+        response_headers = None
+        if filename:
+            response_headers = {
+                "response-content-disposition": f"attachment; filename*=UTF-8''{quote(filename)}"
+            }
+        return self.presign_client.presigned_get_object(
+            self.bucket_name,
+            file_path,
+            expires=timedelta(seconds=expires_seconds),
+            response_headers=response_headers,
+        )
+    
+    def presigned_upload_url(self, file_path: str, expires_seconds: int = 900) -> Optional[str]:
+        """Presigned PUT URL on the public MinIO endpoint (None if not configured)"""
+        if self.presign_client is None:
+            return None
+        return self.presign_client.presigned_put_object(
+            self.bucket_name,
+            file_path,
+            expires=timedelta(seconds=expires_seconds),
+        )
+
     def delete_file(self, file_path: str) -> None:
         """Delete file from MinIO"""
         try:
@@ -58,6 +212,22 @@ class MinIOStorageService(StorageService):
         except S3Error as e:
             raise Exception(f"Failed to delete file: {e}")
     
+    def list_files(self, prefix: str) -> List[str]:
+        """List object keys under a prefix"""
+        try:
+            return [obj.object_name for obj in self.client.list_objects(self.bucket_name, prefix=prefix, recursive=True)]
+        except S3Error as e:
+            raise Exception(f"Failed to list files: {e}")
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete all objects under a prefix with batched DeleteObjects requests"""
+        keys = self.list_files(prefix)
+        # remove_objects is lazy: the deletes are sent while the errors are iterated
+        errors = list(self.client.remove_objects(self.bucket_name, (DeleteObject(key) for key in keys)))
+        if errors:
+            raise Exception(f"Failed to delete {len(errors)} of {len(keys)} files under {prefix}: {errors[0]}")
+        return len(keys)
+
     def file_exists(self, file_path: str) -> bool:
         """Check if file exists"""
         try:
@@ -0,0 +1,81 @@
+import gzip
+import json
+import os
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from .base import StorageService
+from ..ocr.base import OCRResult
+from ..ocr.layout import Layout
+
+
+def ocr_result_to_payload(ocr_result: OCRResult) -> Dict[str, Any]:
+    """JSON-serializable form of an OCR result (a columnar ``Layout`` as an object of arrays)."""
+    layout = ocr_result.layout
+    return {
+        "text": ocr_result.text,
+        "layout": layout.to_columns() if isinstance(layout, Layout) else layout,
+        "regions": ocr_result.regions,
+    }
+
+
+def ocr_result_from_payload(payload: Dict[str, Any]) -> OCRResult:
+    """Inverse of ``ocr_result_to_payload``."""
+    layout = payload.get("layout")
+    return OCRResult(
+        text=payload.get("text", ""),
+        layout=Layout.from_columns(layout) if isinstance(layout, dict) else layout,
+        regions=payload.get("regions"),
+    )
+
+
+class OCRArtifactStore:
+    """Stores full OCR output (text, layout, regions) as gzip-compressed JSON objects.
+
+    Keeps large OCR payloads out of the extractions table: the row only holds
+    the object key (``extractions.raw_text_key``). A columnar ``Layout`` is
+    stored in its columnar form (an object of arrays) and loaded back as one.
+    """
+
+    CONTENT_TYPE = "application/gzip"
+
+    def __init__(self, storage_service: StorageService, compression_level: int = 6):
+        self.storage_service = storage_service
+        self.compression_level = compression_level
+
+    @staticmethod
+    def key_for(document_id: UUID, extraction_id: UUID) -> str:
+        """Object key for an extraction's OCR artifact, next to the original file."""
+        return f"{document_id}/ocr/{extraction_id}.json.gz"
+
+    def save(self, document_id: UUID, extraction_id: UUID, ocr_result: OCRResult) -> str:
+        """Compress and upload the OCR result. Returns the storage key."""
+        data = gzip.compress(
+            json.dumps(ocr_result_to_payload(ocr_result), separators=(",", ":"), default=str).encode("utf-8"),
+            compresslevel=self.compression_level,
+        )
+        key = self.key_for(document_id, extraction_id)
+        self.storage_service.upload_file(key, data, content_type=self.CONTENT_TYPE)
+        return key
+
+    def load(self, key: str) -> Dict[str, Any]:
+        """Download and decompress an OCR artifact."""
+        data = self.storage_service.download_file(key)
+        payload = json.loads(gzip.decompress(data))
+        if isinstance(payload.get("layout"), dict):
+            payload["layout"] = Layout.from_columns(payload["layout"])
+        return payload
+
+    def load_text(self, key: str) -> str:
+        """Return only the raw OCR text of an artifact."""
+        return self.load(key).get("text", "")
+
+    def delete(self, key: str) -> None:
+        self.storage_service.delete_file(key)
+
+
+def create_ocr_artifact_store(storage_service: StorageService) -> Optional[OCRArtifactStore]:
+    """Return an OCRArtifactStore when OCR_ARTIFACT_OFFLOAD is enabled, else None."""
+    if os.getenv("OCR_ARTIFACT_OFFLOAD", "false").lower() != "true":
+        return None
+    return OCRArtifactStore(storage_service)
@@ -0,0 +1,98 @@
+import io
+import json
+import os
+from typing import List, Optional
+from uuid import UUID
+
+from PIL import Image
+
+from .base import StorageService
+from ..ocr.rasterize import convert_to_images, OCR_DPI
+from ...monitoring.logging import get_logger
+
+logger = get_logger("sortex.storage.page_images")
+
+
+class PageImageStore:
+    """Per-document rasterized pages, stored once and reused by every consumer.
+
+    Rasterizing a PDF with poppler is one of the most expensive steps of the
+    pipeline. The first consumer (OCR provider, reprocess, preview worker)
+    renders the pages and stores them as PNGs under
+    ``{document_id}/pages/{dpi}/``; later consumers load them instead.
+    ``manifest.json`` is written last and marks a complete set.
+    """
+
+    CONTENT_TYPE = "image/png"
+    # zlib level: page scans compress well already at low levels, and encoding must stay cheap
+    COMPRESS_LEVEL = 3
+
+    def __init__(self, storage_service: StorageService):
+        self.storage_service = storage_service
+
+    @staticmethod
+    def prefix_for(document_id: UUID, dpi: int) -> str:
+        return f"{document_id}/pages/{dpi}"
+
+    @classmethod
+    def manifest_key(cls, document_id: UUID, dpi: int) -> str:
+        return f"{cls.prefix_for(document_id, dpi)}/manifest.json"
+
+    @classmethod
+    def page_key(cls, document_id: UUID, dpi: int, page: int) -> str:
+        """Object key of one page image (pages are 1-based)."""
+        return f"{cls.prefix_for(document_id, dpi)}/page-{page}.png"
+
+    def load(self, document_id: UUID, dpi: int = OCR_DPI) -> Optional[List[Image.Image]]:
+        """Return the stored pages, or None if they have not been rendered at ``dpi``."""
+        manifest_key = self.manifest_key(document_id, dpi)
+        if not self.storage_service.file_exists(manifest_key):
+            return None
+        manifest = json.loads(self.storage_service.download_file(manifest_key))
+        images = []
+        for page in range(1, manifest["page_count"] + 1):
+            image = Image.open(io.BytesIO(self.storage_service.download_file(self.page_key(document_id, dpi, page))))
+            image.load()
+            images.append(image)
+        return images
+
+    def save(self, document_id: UUID, images: List[Image.Image], dpi: int = OCR_DPI) -> None:
+        """Store rendered pages, then the manifest."""
+        for page, image in enumerate(images, start=1):
+            buf = io.BytesIO()
+            image.save(buf, format="PNG", compress_level=self.COMPRESS_LEVEL)
+            self.storage_service.upload_file(
+                self.page_key(document_id, dpi, page), buf.getvalue(), content_type=self.CONTENT_TYPE
+            )
+        self.storage_service.upload_file(
+            self.manifest_key(document_id, dpi),
+            json.dumps({"dpi": dpi, "page_count": len(images)}).encode("utf-8"),
+            content_type="application/json",
+        )
+
+    def get_or_render(
+        self, document_id: UUID, file_bytes: bytes, file_type: str, dpi: int = OCR_DPI
+    ) -> List[Image.Image]:
+        """Load the pages at ``dpi``, rasterizing and storing them on first use.
+
+        Only PDFs are stored: image uploads already are a single page and
+        decoding them is cheaper than a storage round trip.
+        """
+        if file_type != "pdf":
+            return convert_to_images(file_bytes, file_type, dpi=dpi)
+        images = self.load(document_id, dpi)
+        if images is None:
+            images = convert_to_images(file_bytes, file_type, dpi=dpi)
+            try:
+                self.save(document_id, images, dpi)
+            except Exception as e:
+                # The pages are still usable; the next consumer renders them again
+                logger.warning("Failed to store page images", document_id=str(document_id), error=str(e))
+        return images
+
+
+def create_page_image_store(storage_service: StorageService) -> Optional[PageImageStore]:
+    """Return a PageImageStore unless PAGE_IMAGE_ARTIFACTS=false."""
+    if os.getenv("PAGE_IMAGE_ARTIFACTS", "true").lower() != "true":
+        return None
+    return PageImageStore(storage_service)
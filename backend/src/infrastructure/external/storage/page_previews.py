@@ -0,0 +1,110 @@
+import io
+import json
+import os
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from PIL import Image
+
+from .base import StorageService
+from ..ocr.rasterize import convert_to_images
+
+# Low resolution is enough for on-screen review; pages are also capped in width
+PREVIEW_DPI = 72
+PREVIEW_MAX_WIDTH = 1024
+
+_CONTENT_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+
+
+class PagePreviewStore:
+    """Renders and stores low-resolution per-page preview images.
+
+    Objects live next to the original file under ``{document_id}/previews/``:
+    one image per page plus ``manifest.json`` (page count, format, page sizes),
+    which is written last and marks the previews as complete.
+    """
+
+    def __init__(self, storage_service: StorageService, image_format: str = "webp", quality: int = 70):
+        if image_format not in _CONTENT_TYPES:
+            raise ValueError(f"Unsupported preview format: {image_format}")
+        self.storage_service = storage_service
+        self.image_format = image_format
+        self.quality = quality
+
+    @staticmethod
+    def prefix_for(document_id: UUID) -> str:
+        return f"{document_id}/previews"
+
+    @classmethod
+    def manifest_key(cls, document_id: UUID) -> str:
+        return f"{cls.prefix_for(document_id)}/manifest.json"
+
+    @classmethod
+    def page_key(cls, document_id: UUID, page: int, image_format: str) -> str:
+        """Object key of a page preview (pages are 1-based)."""
+        return f"{cls.prefix_for(document_id)}/page-{page}.{image_format}"
+
+    @staticmethod
+    def content_type(image_format: str) -> str:
+        return _CONTENT_TYPES[image_format]
+
+    def generate(
+        self,
+        document_id: UUID,
+        file_bytes: bytes,
+        file_type: str,
+        images: Optional[List[Image.Image]] = None,
+    ) -> Dict[str, Any]:
+        """Upload a preview per page and the manifest. Returns the manifest.
+
+        ``images`` are already rendered pages (e.g. from PageImageStore) that are
+        downscaled instead of rasterizing the file again.
+        """
+        if images is None:
+            images = convert_to_images(file_bytes, file_type, dpi=PREVIEW_DPI)
+        pages = []
+        for number, image in enumerate(images, start=1):
+            data, width, height = self._encode(image)
+            self.storage_service.upload_file(
+                self.page_key(document_id, number, self.image_format),
+                data,
+                content_type=self.content_type(self.image_format),
+            )
+            pages.append({"page": number, "width": width, "height": height})
+
+        manifest = {"page_count": len(pages), "format": self.image_format, "pages": pages}
+        self.storage_service.upload_file(
+            self.manifest_key(document_id),
+            json.dumps(manifest).encode("utf-8"),
+            content_type="application/json",
+        )
+        return manifest
+
+    def load_manifest(self, document_id: UUID) -> Optional[Dict[str, Any]]:
+        """Return the manifest, or None if previews have not been generated (yet)."""
+        key = self.manifest_key(document_id)
+        if not self.storage_service.file_exists(key):
+            return None
+        return json.loads(self.storage_service.download_file(key))
+
+    def _encode(self, image: Image.Image):
+        """Downscale and encode one page. Returns (bytes, width, height)."""
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        if image.width > PREVIEW_MAX_WIDTH:
+            # Uploaded photos/scans and OCR-resolution pages are larger than needed
+            image.thumbnail((PREVIEW_MAX_WIDTH, PREVIEW_MAX_WIDTH * 4))
+        buf = io.BytesIO()
+        image.save(buf, format=self.image_format.upper(), quality=self.quality)
+        return buf.getvalue(), image.width, image.height
+
+
+def create_page_preview_store(storage_service: StorageService) -> Optional[PagePreviewStore]:
+    """Return a PagePreviewStore unless PAGE_PREVIEWS_ENABLED=false."""
+    if os.getenv("PAGE_PREVIEWS_ENABLED", "true").lower() != "true":
+        return None
+    return PagePreviewStore(
+        storage_service,
+        image_format=os.getenv("PAGE_PREVIEW_FORMAT", "webp").lower(),
+        quality=int(os.getenv("PAGE_PREVIEW_QUALITY", "70")),
+    )
@@ -0,0 +1,96 @@
+"""
+Asynchronous TMS API client used by the export dispatcher.
+
+One ``httpx.AsyncClient`` is shared by all exports of a worker, so
+connections (and TLS sessions) to the TMS are kept alive and reused instead
+of being opened per document; ``max_connections`` bounds the pool.
+
+With ``batch_size`` > 1 exports to the same endpoint are sent together as
+``POST {api_url}/{endpoint}/batch`` with ``{"items": [payload, ...]}``. The
+TMS may answer with ``{"results": [{"status": "ok" | "error", "error": ...}]}``
+(one entry per item, in order) to reject single items; any other 2xx answer
+accepts the whole batch.
+
+Exports can be delivered more than once (a relay dies after the TMS accepted
+them), so every export carries its id as idempotency key: the
+``Idempotency-Key`` header on single POSTs, an ``idempotency_key`` field on
+each batch item.
+"""
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+TMS_API_URL = os.getenv("TMS_API_URL", "http://mock-tms:8080/api")
+TMS_API_KEY = os.getenv("TMS_API_KEY", "")
+# 1 = one POST per document (TMS endpoints without a batch route)
+TMS_BATCH_SIZE = int(os.getenv("TMS_BATCH_SIZE", "1"))
+TMS_MAX_CONNECTIONS = int(os.getenv("TMS_MAX_CONNECTIONS", "10"))
+TMS_TIMEOUT_SECONDS = float(os.getenv("TMS_TIMEOUT_SECONDS", "30"))
+
+
+class TMSClient:
+    """Pooled async client for the TMS export API (see module docstring)."""
+
+    def __init__(
+        self,
+        api_url: str = TMS_API_URL,
+        api_key: str = TMS_API_KEY,
+        batch_size: int = TMS_BATCH_SIZE,
+        max_connections: int = TMS_MAX_CONNECTIONS,
+        timeout: float = TMS_TIMEOUT_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.api_url = api_url.rstrip("/")
+        self.batch_size = max(1, batch_size)
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+
+    async def send(self, endpoint: str, payload: Dict[str, Any], idempotency_key: Optional[str] = None) -> int:
+        """POST one export and return the HTTP status; raises httpx.HTTPError on failure."""
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        response = await self._client.post(f"{self.api_url}/{endpoint}", json=payload, headers=headers)
+        response.raise_for_status()
+        return response.status_code
+
+    async def send_batch(
+        self, endpoint: str, payloads: List[Dict[str, Any]], idempotency_keys: Optional[List[str]] = None
+    ) -> Tuple[int, List[Optional[str]]]:
+        """
+        POST several exports in one request (``idempotency_keys``: one per payload).
+
+        Returns:
+            HTTP status and an error message per payload (None = accepted).
+            A failed request raises httpx.HTTPError instead.
+        """
+        items = payloads
+        if idempotency_keys:
+            items = [{**payload, "idempotency_key": key} for payload, key in zip(payloads, idempotency_keys)]
+        response = await self._client.post(f"{self.api_url}/{endpoint}/batch", json={"items": items})
+        response.raise_for_status()
+        results = None
+        if response.content:
+            try:
+                results = response.json().get("results")
+            except (ValueError, AttributeError):
+                results = None
+        if not isinstance(results, list) or len(results) != len(payloads):
+            return response.status_code, [None] * len(payloads)
+        return response.status_code, [
+            None if str(r.get("status", "ok")).lower() == "ok" else str(r.get("error") or "Rejected by TMS")
+            for r in results
+        ]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "TMSClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
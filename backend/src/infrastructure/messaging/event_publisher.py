@@ -0,0 +1,114 @@
+"""
+Domain event fan-out over Redis pub/sub.
+
+Repositories stage the events recorded on an aggregate on the SQLAlchemy
+session that saved it (``stage_domain_events``). ``DomainEventPublisher``
+publishes them once that session commits, so subscribers never see a status
+that was rolled back. Each event goes to the document's channel and to the
+channel of the user who owns the document; the SSE endpoints in
+``api/routes/events.py`` relay those channels to browsers.
+
+Publishing is best effort: if Redis is unavailable the event is logged and
+dropped, and clients fall back to polling.
+"""
+import json
+import os
+from dataclasses import asdict
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from .redis_client import get_redis
+from ..monitoring.logging import get_logger
+from ..persistence.database import Database
+
+logger = get_logger("sortex.messaging.events")
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+CHANNEL_PREFIX = "sortex:events"
+
+_STAGED_KEY = "pending_domain_events"
+
+
+def document_channel(document_id: UUID) -> str:
+    return f"{CHANNEL_PREFIX}:document:{document_id}"
+
+
+def user_channel(user_id: UUID) -> str:
+    return f"{CHANNEL_PREFIX}:user:{user_id}"
+
+
+def serialize_event(event: Any) -> str:
+    """JSON payload sent to subscribers: the event fields plus its type name."""
+    payload = {"type": type(event).__name__, **asdict(event)}
+    return json.dumps(payload, default=str)
+
+
+def stage_domain_events(session: Session, owner_id: UUID, events: Iterable[Any]) -> None:
+    """Stage events on ``session``; they are published only if it commits."""
+    staged = [(owner_id, e) for e in events]
+    if staged:
+        session.info.setdefault(_STAGED_KEY, []).extend(staged)
+
+
+class DomainEventPublisher:
+    """Publishes committed domain events to Redis pub/sub."""
+
+    def __init__(self, database: Database, redis_url: str = REDIS_URL):
+        self.redis_client = get_redis(redis_url)
+        sa_event.listen(database.SessionLocal, "after_commit", self._on_commit)
+        sa_event.listen(database.SessionLocal, "after_rollback", self._on_rollback)
+
+    def _on_commit(self, session: Session) -> None:
+        staged = session.info.pop(_STAGED_KEY, None)
+        if staged:
+            self.publish(staged)
+
+    def _on_rollback(self, session: Session) -> None:
+        session.info.pop(_STAGED_KEY, None)
+
+    def publish(self, staged: List[Tuple[UUID, Any]]) -> None:
+        """Publish (owner_id, event) pairs in one round trip."""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for owner_id, event in staged:
+                payload = serialize_event(event)
+                pipe.publish(document_channel(event.document_id), payload)
+                if owner_id is not None:
+                    pipe.publish(user_channel(owner_id), payload)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to publish domain events", error=str(e), count=len(staged))
+
+
+def create_event_publisher(database: Database) -> Optional[DomainEventPublisher]:
+    """Return a publisher unless DOMAIN_EVENTS_ENABLED=false."""
+    if os.getenv("DOMAIN_EVENTS_ENABLED", "true").lower() != "true":
+        return None
+    return DomainEventPublisher(database)
+
+
+async def subscribe(channels: List[str], poll_timeout: float = 1.0) -> AsyncIterator[Optional[str]]:
+    """Yield raw event payloads published on ``channels``.
+
+    Yields None every ``poll_timeout`` seconds without a message so callers can
+    send keep-alives and check for client disconnects.
+    """
+    client = aioredis.from_url(REDIS_URL)
+    pubsub = client.pubsub()
+    try:
+        await pubsub.subscribe(*channels)
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=poll_timeout)
+            if message is None:
+                yield None
+                continue
+            data = message["data"]
+            yield data.decode("utf-8") if isinstance(data, bytes) else data
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+        await client.aclose()
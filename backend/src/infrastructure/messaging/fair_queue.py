@@ -0,0 +1,402 @@
+"""
+Priority lanes with per-tenant weighted fair queuing on top of ``RedisQueue``.
+
+A ``FairQueue`` named ``q`` keeps one Redis list per (lane, tenant) and
+schedules across them in two steps, atomically in a Lua script so any
+number of API processes and workers can share it:
+
+1. Lane: smooth weighted round robin over the lanes that have work
+   (``q:credit``). With the default weights interactive:upload:bulk =
+   16:4:1, a waiting interactive job is served almost at once while bulk
+   backfills still make progress.
+2. Tenant: start-time fair queuing inside the lane. Active tenants sit in a
+   sorted set ``q:lane:<lane>:tenants`` scored by virtual time; the lowest
+   is served and advances by 1 / weight. A tenant that was idle rejoins at
+   the lane's virtual clock, so idleness does not bank credit, and one
+   tenant's 2,000 jobs only delay another tenant's next job by one slot.
+
+Per-lane depth is kept in ``q:depth`` (one HGETALL for the metrics). Every
+enqueued job also pushes a token onto ``q:wake`` (bounded), which idle
+workers block on with BRPOP.
+
+Delivery is at least once. A dequeued job is moved, in the same script, to
+``q:processing`` under a delivery id with a lease in ``q:leases`` (deadline
+= now + visibility timeout). The consumer ``ack``s it when done, and keeps
+the lease alive with ``leased`` while it works. ``reclaim`` puts jobs whose
+lease expired (the worker died) back at the front of their tenant's queue;
+after ``max_deliveries`` expired leases a job goes to the dead-letter queue
+instead, so a job that kills its worker cannot take the whole fleet down.
+
+Retries wait on the queue, not in a worker: ``enqueue_delayed`` parks a
+task in the sorted set ``q:delayed`` scored by due time, and the dequeue
+script moves due tasks into their tenant's queue before it schedules.
+
+The scripts build key names at run time, so the queue needs a single Redis
+node (not Redis Cluster), like the rest of the messaging code.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from uuid import uuid4
+
+from .redis_queue import RedisQueue
+from .serialization import decode_message, encode_message
+from ..monitoring.logging import get_logger
+from ..monitoring.metrics import MetricsCollector
+
+logger = get_logger("sortex.messaging.fair_queue")
+
+
+class Lane(str, Enum):
+    """Priority lanes, highest first"""
+    INTERACTIVE = "interactive"  # a user is waiting: manual reprocess/retry
+    UPLOAD = "upload"            # fresh single uploads
+    BULK = "bulk"                # bulk uploads and backfills
+
+
+DEFAULT_LANE_WEIGHTS = {Lane.INTERACTIVE: 16, Lane.UPLOAD: 4, Lane.BULK: 1}
+# Wake tokens kept at most; more would only cause empty wake-ups
+WAKE_LIMIT = 1000
+DEFAULT_VISIBILITY_TIMEOUT = 300
+DEFAULT_MAX_DELIVERIES = 3
+# Due delayed tasks moved per dequeue
+PROMOTE_LIMIT = 100
+# Same list as infrastructure.error_handling.dead_letter_queue.DeadLetterQueue
+DEAD_LETTER_QUEUE = "dlq"
+
+# Put a tenant with queued work into its lane's rotation (no-op if it already is)
+_ACTIVATE = """
+local function activate(lane_key, tenant)
+    if not redis.call('ZSCORE', lane_key .. ':tenants', tenant) then
+        local clock = tonumber(redis.call('GET', lane_key .. ':clock') or '0')
+        local finish = tonumber(redis.call('HGET', lane_key .. ':finish', tenant) or '0')
+        redis.call('HDEL', lane_key .. ':finish', tenant)
+        redis.call('ZADD', lane_key .. ':tenants', math.max(clock, finish), tenant)
+    end
+end
+"""
+
+_ENQUEUE = _ACTIVATE + """
+local prefix, lane, tenant, weight, wake_limit = ARGV[1], ARGV[2], ARGV[3], ARGV[4], tonumber(ARGV[5])
+local lane_key = prefix .. ':lane:' .. lane
+local list = lane_key .. ':t:' .. tenant
+for i = 6, #ARGV do
+    redis.call('LPUSH', list, ARGV[i])
+end
+local count = #ARGV - 5
+if weight ~= '' then
+    redis.call('HSET', prefix .. ':weights', tenant, weight)
+else
+    redis.call('HDEL', prefix .. ':weights', tenant)
+end
+activate(lane_key, tenant)
+for i = 1, math.min(count, wake_limit) do
+    redis.call('LPUSH', prefix .. ':wake', '1')
+end
+redis.call('LTRIM', prefix .. ':wake', 0, wake_limit - 1)
+return redis.call('HINCRBY', prefix .. ':depth', lane, count)
+"""
+
+# Versioned messages (see serialization.py): 0x01 + JSON, or legacy plain JSON
+_MESSAGES = """
+local function decode(message)
+    if string.byte(message, 1) == 1 then
+        return cjson.decode(string.sub(message, 2))
+    end
+    return cjson.decode(message)
+end
+local function encode(value)
+    return '\\1' .. cjson.encode(value)
+end
+"""
+
+_DEQUEUE = _ACTIVATE + _MESSAGES + """
+local prefix, deadline, now, promote_limit = ARGV[1], ARGV[2], ARGV[3], tonumber(ARGV[4])
+-- Delayed tasks that are due join the back of their tenant's queue
+for _, member in ipairs(redis.call('ZRANGEBYSCORE', prefix .. ':delayed', '-inf', now, 'LIMIT', 0, promote_limit)) do
+    redis.call('ZREM', prefix .. ':delayed', member)
+    local entry = decode(member)
+    local lane_key = prefix .. ':lane:' .. entry.lane
+    redis.call('LPUSH', lane_key .. ':t:' .. entry.tenant, entry.job)
+    activate(lane_key, entry.tenant)
+    redis.call('HINCRBY', prefix .. ':depth', entry.lane, 1)
+end
+local best, best_credit, total = nil, nil, 0
+for i = 5, #ARGV, 2 do
+    local lane, weight = ARGV[i], tonumber(ARGV[i + 1])
+    if redis.call('ZCARD', prefix .. ':lane:' .. lane .. ':tenants') > 0 then
+        total = total + weight
+        local credit = tonumber(redis.call('HINCRBYFLOAT', prefix .. ':credit', lane, weight))
+        if best == nil or credit > best_credit then
+            best, best_credit = lane, credit
+        end
+    end
+end
+if best == nil then
+    return nil
+end
+redis.call('HINCRBYFLOAT', prefix .. ':credit', best, -total)
+
+local lane_key = prefix .. ':lane:' .. best
+local head = redis.call('ZRANGE', lane_key .. ':tenants', 0, 0, 'WITHSCORES')
+local tenant, start = head[1], tonumber(head[2])
+local list = lane_key .. ':t:' .. tenant
+local job = redis.call('RPOP', list)
+local weight = tonumber(redis.call('HGET', prefix .. ':weights', tenant) or '1')
+local finish = start + 1 / weight
+redis.call('SET', lane_key .. ':clock', start)
+if redis.call('LLEN', list) == 0 then
+    redis.call('ZREM', lane_key .. ':tenants', tenant)
+    redis.call('HSET', lane_key .. ':finish', tenant, finish)
+    if redis.call('ZCARD', lane_key .. ':tenants') == 0 then
+        redis.call('HSET', prefix .. ':credit', best, 0)
+    end
+else
+    redis.call('ZADD', lane_key .. ':tenants', finish, tenant)
+end
+if not job then
+    return nil
+end
+redis.call('HINCRBY', prefix .. ':depth', best, -1)
+local id = redis.call('INCR', prefix .. ':seq')
+redis.call('HSET', prefix .. ':processing', id, cjson.encode({lane = best, tenant = tenant, job = job}))
+redis.call('ZADD', prefix .. ':leases', deadline, id)
+return {best, tenant, job, tostring(id)}
+"""
+
+_RECLAIM = _ACTIVATE + _MESSAGES + """
+local prefix, now, max_deliveries, limit = ARGV[1], ARGV[2], tonumber(ARGV[3]), tonumber(ARGV[4])
+local dead_letter_queue, failed_at, wake_limit = ARGV[5], ARGV[6], tonumber(ARGV[7])
+local requeued, dead = 0, 0
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', prefix .. ':leases', '-inf', now, 'LIMIT', 0, limit)) do
+    local raw = redis.call('HGET', prefix .. ':processing', id)
+    redis.call('HDEL', prefix .. ':processing', id)
+    redis.call('ZREM', prefix .. ':leases', id)
+    if raw then
+        local entry = cjson.decode(raw)
+        local job = decode(entry.job)
+        local deliveries = (tonumber(job._deliveries) or 0) + 1
+        if deliveries >= max_deliveries then
+            job._deliveries = nil
+            redis.call('LPUSH', dead_letter_queue, encode({
+                id = prefix .. ':' .. id,
+                original_queue = prefix,
+                job_data = job,
+                error_message = 'Lease expired on ' .. deliveries .. ' deliveries (worker died or hung)',
+                retry_count = deliveries,
+                failed_at = failed_at,
+                lane = entry.lane,
+                tenant = entry.tenant,
+            }))
+            dead = dead + 1
+        else
+            job._deliveries = deliveries
+            local lane_key = prefix .. ':lane:' .. entry.lane
+            -- Front of the tenant's queue: it was next before
+            redis.call('RPUSH', lane_key .. ':t:' .. entry.tenant, encode(job))
+            activate(lane_key, entry.tenant)
+            redis.call('HINCRBY', prefix .. ':depth', entry.lane, 1)
+            redis.call('LPUSH', prefix .. ':wake', '1')
+            requeued = requeued + 1
+        end
+    end
+end
+redis.call('LTRIM', prefix .. ':wake', 0, wake_limit - 1)
+return {requeued, dead}
+"""
+
+
+def parse_weights(value: Optional[str]) -> Dict[str, float]:
+    """Parse ``"name=weight,name=weight"`` (env format). Weights must be positive."""
+    weights = {}
+    for item in (value or "").split(","):
+        if not item.strip():
+            continue
+        name, _, weight = item.partition("=")
+        if float(weight) <= 0:
+            raise ValueError(f"Weight of '{name.strip()}' must be positive")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+class ScheduledTask(NamedTuple):
+    """A dequeued task with the lane and tenant it was scheduled from"""
+    lane: Lane
+    tenant: str
+    task: Dict[str, Any]
+    # Lease handle for ack/extend
+    delivery_id: str = ""
+    # 1 on the first delivery, +1 per expired lease
+    deliveries: int = 1
+
+
+class FairQueue:
+    """Priority-lane, per-tenant fair queue (see module docstring)."""
+
+    def __init__(
+        self,
+        redis_queue: RedisQueue,
+        name: str,
+        lane_weights: Optional[Mapping[Union[Lane, str], float]] = None,
+        tenant_weights: Optional[Mapping[str, float]] = None,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        max_deliveries: int = DEFAULT_MAX_DELIVERIES,
+        dead_letter_queue: str = DEAD_LETTER_QUEUE,
+    ):
+        self.redis_client = redis_queue.redis_client
+        self.name = name
+        self.visibility_timeout = visibility_timeout
+        self.max_deliveries = max_deliveries
+        self.dead_letter_queue = dead_letter_queue
+        weights = {**DEFAULT_LANE_WEIGHTS, **{Lane(k): v for k, v in (lane_weights or {}).items()}}
+        # Dequeue script arguments, highest-priority lane first (it wins ties)
+        self._lane_args: List[str] = []
+        for lane in Lane:
+            self._lane_args += [lane.value, repr(float(weights[lane]))]
+        self.tenant_weights = dict(tenant_weights or {})
+        self._enqueue = self.redis_client.register_script(_ENQUEUE)
+        self._dequeue = self.redis_client.register_script(_DEQUEUE)
+        self._reclaim = self.redis_client.register_script(_RECLAIM)
+
+    def enqueue(self, lane: Lane, tenant: Any, task: Dict[str, Any]) -> int:
+        """Enqueue one task. Returns the lane's depth."""
+        return self.enqueue_many(lane, tenant, [task])
+
+    def enqueue_many(self, lane: Lane, tenant: Any, tasks: Iterable[Dict[str, Any]]) -> int:
+        """Enqueue tasks of one tenant in a lane with a single script call. Returns the lane's depth."""
+        payloads = [encode_message(t) for t in tasks]
+        lane = Lane(lane)
+        if not payloads:
+            return self.depths()[lane]
+        tenant = str(tenant)
+        weight = self.tenant_weights.get(tenant)
+        depth = self._enqueue(args=[
+            self.name, lane.value, tenant, "" if weight is None else repr(float(weight)), WAKE_LIMIT, *payloads,
+        ])
+        MetricsCollector.update_queue_depth(f"{self.name}:{lane.value}", int(depth))
+        return int(depth)
+
+    def enqueue_delayed(self, lane: Lane, tenant: Any, task: Dict[str, Any], delay: float) -> None:
+        """Enqueue a task ``delay`` seconds from now (behind the tenant's queued tasks once due)."""
+        member = encode_message({
+            "id": uuid4().hex,
+            "lane": Lane(lane).value,
+            "tenant": str(tenant),
+            # Kept encoded so the script pushes it unchanged
+            "job": encode_message(task).decode(),
+        })
+        self.redis_client.zadd(f"{self.name}:delayed", {member: time.time() + delay})
+
+    def dequeue(self, timeout: int = 0) -> Optional[ScheduledTask]:
+        """
+        Lease the next task by lane and tenant share; waits up to ``timeout``
+        seconds (0: don't wait). ``ack`` it within the visibility timeout.
+        """
+        result = self._pop()
+        if result is None and timeout:
+            if self.redis_client.brpop(f"{self.name}:wake", timeout=timeout) is None:
+                return None
+            result = self._pop()
+        if result is None:
+            return None
+        lane, tenant, data, delivery_id = result
+        lane, tenant, delivery_id = (v.decode() if isinstance(v, bytes) else v for v in (lane, tenant, delivery_id))
+        task = decode_message(data)
+        deliveries = task.pop("_deliveries", 0) + 1
+        return ScheduledTask(Lane(lane), tenant, task, delivery_id, deliveries)
+
+    def _pop(self):
+        now = time.time()
+        return self._dequeue(args=[
+            self.name, repr(now + self.visibility_timeout), repr(now), PROMOTE_LIMIT, *self._lane_args,
+        ])
+
+    def ack(self, task: ScheduledTask) -> bool:
+        """Finish a delivery. False if its lease had expired and the task was reclaimed."""
+        pipe = self.redis_client.pipeline()
+        pipe.hdel(f"{self.name}:processing", task.delivery_id)
+        pipe.zrem(f"{self.name}:leases", task.delivery_id)
+        removed, _ = pipe.execute()
+        return bool(removed)
+
+    def extend(self, task: ScheduledTask, seconds: Optional[float] = None) -> bool:
+        """Push the lease deadline to now + ``seconds`` (visibility timeout). False if already reclaimed."""
+        deadline = time.time() + (seconds or self.visibility_timeout)
+        return bool(self.redis_client.zadd(f"{self.name}:leases", {task.delivery_id: deadline}, xx=True, ch=True))
+
+    @contextmanager
+    def leased(self, task: ScheduledTask) -> Iterator[None]:
+        """Extend the task's lease every third of the visibility timeout while the block runs."""
+        stop = threading.Event()
+
+        def heartbeat() -> None:
+            while not stop.wait(self.visibility_timeout / 3):
+                try:
+                    if not self.extend(task):
+                        logger.warning("Lease lost", queue=self.name, delivery_id=task.delivery_id)
+                        return
+                except Exception as e:
+                    # Transient Redis error: the next beat retries
+                    logger.warning("Lease extension failed", queue=self.name, error=str(e))
+
+        thread = threading.Thread(target=heartbeat, name=f"{self.name}-lease", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def reclaim(self, limit: int = 1000) -> Tuple[int, int]:
+        """
+        Requeue tasks whose lease expired; dead-letter those out of deliveries.
+        Safe to call from every worker. Returns (requeued, dead-lettered).
+        """
+        requeued, dead = self._reclaim(args=[
+            self.name, repr(time.time()), self.max_deliveries, limit,
+            self.dead_letter_queue, datetime.utcnow().isoformat(), WAKE_LIMIT,
+        ])
+        if requeued or dead:
+            logger.warning("Reclaimed expired leases", queue=self.name, requeued=requeued, dead_lettered=dead)
+        return int(requeued), int(dead)
+
+    def in_flight(self) -> int:
+        """Tasks leased and not yet acked"""
+        return self.redis_client.zcard(f"{self.name}:leases")
+
+    def delayed(self) -> int:
+        """Tasks waiting for their delay to pass"""
+        return self.redis_client.zcard(f"{self.name}:delayed")
+
+    def depths(self) -> Dict[Lane, int]:
+        """Queued tasks per lane"""
+        raw = self.redis_client.hgetall(f"{self.name}:depth")
+        counts = {(k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()}
+        return {lane: counts.get(lane.value, 0) for lane in Lane}
+
+    def report_depths(self) -> Dict[Lane, int]:
+        """Publish per-lane depth on the ``queue_depth`` gauge (label ``<queue>:<lane>``)."""
+        depths = self.depths()
+        for lane, depth in depths.items():
+            MetricsCollector.update_queue_depth(f"{self.name}:{lane.value}", depth)
+        MetricsCollector.update_queue_depth(f"{self.name}:in_flight", self.in_flight())
+        MetricsCollector.update_queue_depth(f"{self.name}:delayed", self.delayed())
+        return depths
+
+
+def create_fair_queue(redis_queue: RedisQueue, name: str) -> FairQueue:
+    """FairQueue configured from ``<NAME>_LANE_WEIGHTS``, ``_TENANT_WEIGHTS``, ``_VISIBILITY_TIMEOUT``, ``_MAX_DELIVERIES``."""
+    prefix = name.upper()
+    return FairQueue(
+        redis_queue,
+        name,
+        lane_weights=parse_weights(os.getenv(f"{prefix}_LANE_WEIGHTS")),
+        tenant_weights=parse_weights(os.getenv(f"{prefix}_TENANT_WEIGHTS")),
+        visibility_timeout=float(os.getenv(f"{prefix}_VISIBILITY_TIMEOUT", str(DEFAULT_VISIBILITY_TIMEOUT))),
+        max_deliveries=int(os.getenv(f"{prefix}_MAX_DELIVERIES", str(DEFAULT_MAX_DELIVERIES))),
+    )
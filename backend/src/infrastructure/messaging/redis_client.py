@@ -0,0 +1,44 @@
+"""
+Process-wide Redis connection pools.
+
+Every component that talks to Redis (queues, DLQ, rate limiter, domain
+events, health checks) gets its client from ``get_redis``, so a process
+keeps one pool of reusable connections per Redis URL instead of one per
+component. redis-py pools are thread-safe and reset themselves in a forked
+child. The pools block: when every connection is in use, a caller waits up to
+``REDIS_POOL_TIMEOUT`` seconds for one to be released instead of failing at
+once with "Too many connections".
+"""
+import os
+import threading
+from typing import Dict
+
+import redis
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+# Connections kept per process and URL (blocking BRPOPs hold one each)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+# Longest wait for a free pooled connection before redis.ConnectionError is raised
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "10"))
+
+_pools: Dict[str, redis.BlockingConnectionPool] = {}
+_lock = threading.Lock()
+
+
+def get_redis(redis_url: str = REDIS_URL) -> redis.Redis:
+    """Client on the shared connection pool for ``redis_url`` (cheap; no connection is opened here)."""
+    pool = _pools.get(redis_url)
+    if pool is None:
+        with _lock:
+            pool = _pools.get(redis_url)
+            if pool is None:
+                pool = redis.BlockingConnectionPool.from_url(
+                    redis_url,
+                    max_connections=REDIS_MAX_CONNECTIONS,
+                    timeout=REDIS_POOL_TIMEOUT,
+                    socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                    health_check_interval=30,
+                )
+                _pools[redis_url] = pool
+    return redis.Redis(connection_pool=pool)
@@ -1,28 +1,60 @@
-import json
-import redis
-from typing import Any, Dict, Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional
+
+from .redis_client import get_redis
+from .serialization import decode_message, encode_message
+
+# Values per LPUSH in enqueue_many; larger batches are pipelined in chunks
+ENQUEUE_CHUNK_SIZE = 1000
 
 
 class RedisQueue:
-    """Redis-based message queue"""
-    
+    """Redis-based message queue (messages in the versioned format of ``serialization``)"""
+
     def __init__(self, redis_url: str):
-        self.redis_client = redis.from_url(redis_url)
-    
+        # Shared per-process connection pool
+        self.redis_client = get_redis(redis_url)
+
     def enqueue(self, queue_name: str, task: Dict[str, Any]) -> None:
         """Enqueue a task"""
-        self.redis_client.lpush(queue_name, json.dumps(task))
-    
+        self.redis_client.lpush(queue_name, encode_message(task))
+
+    def enqueue_many(self, queue_name: str, tasks: List[Dict[str, Any]]) -> int:
+        """Enqueue several tasks in one round trip (one pipelined LPUSH per chunk). Returns the new queue length."""
+        if not tasks:
+            return self.get_queue_length(queue_name)
+        messages = [encode_message(t) for t in tasks]
+        if len(messages) <= ENQUEUE_CHUNK_SIZE:
+            return self.redis_client.lpush(queue_name, *messages)
+        pipe = self.redis_client.pipeline(transaction=False)
+        for start in range(0, len(messages), ENQUEUE_CHUNK_SIZE):
+            pipe.lpush(queue_name, *messages[start:start + ENQUEUE_CHUNK_SIZE])
+        return pipe.execute()[-1]
+
     def dequeue(self, queue_name: str, timeout: int = 0) -> Optional[Dict[str, Any]]:
         """Dequeue a task"""
         result = self.redis_client.brpop(queue_name, timeout=timeout)
         if result:
             _, data = result
-            return json.loads(data)
+            return decode_message(data)
         return None
-    
+
+    def dequeue_many(self, queue_name: str, max_items: int, timeout: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Pop up to ``max_items`` tasks, oldest first, in one round trip (RPOP with COUNT).
+
+        With ``timeout``, waits up to that many seconds for the first task
+        (BRPOP) when the queue is empty, then takes the rest without waiting.
+        """
+        result = self.redis_client.rpop(queue_name, max_items)
+        if not result and timeout is not None:
+            first = self.redis_client.brpop(queue_name, timeout=timeout)
+            if first is None:
+                return []
+            result = [first[1]]
+            if max_items > 1:
+                result += self.redis_client.rpop(queue_name, max_items - 1) or []
+        return [decode_message(data) for data in result or []]
+
     def get_queue_length(self, queue_name: str) -> int:
         """Get queue length"""
         return self.redis_client.llen(queue_name)
-
@@ -33,6 +33,48 @@ export_attempts_total = Counter(
     ['status']  # success, failure
 )
 
+bulk_upload_files_total = Counter(
+    'sortex_bulk_upload_files_total',
+    'Files received through bulk upload',
+    ['result']  # accepted, rejected
+)
+
+bulk_upload_bytes_total = Counter(
+    'sortex_bulk_upload_bytes_total',
+    'Bytes stored through bulk upload'
+)
+
+bulk_upload_duration_seconds = Histogram(
+    'sortex_bulk_upload_duration_seconds',
+    'Time spent ingesting one bulk upload batch',
+    buckets=[1, 5, 15, 30, 60, 120, 300]
+)
+
+storage_cache_requests_total = Counter(
+    'sortex_storage_cache_requests_total',
+    'Worker disk cache lookups for stored objects',
+    ['result']  # hit, miss
+)
+
+ocr_page_pixels = Histogram(
+    'sortex_ocr_page_pixels',
+    'Pixels per page before and after OCR preprocessing',
+    ['stage'],  # input, ocr
+    buckets=[250_000, 500_000, 1_000_000, 2_000_000, 4_000_000, 8_000_000, 16_000_000, 32_000_000]
+)
+
+ocr_preprocess_duration_seconds = Histogram(
+    'sortex_ocr_preprocess_duration_seconds',
+    'Time spent preprocessing one page image before OCR',
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2]
+)
+
+export_batch_duration_seconds = Histogram(
+    'sortex_export_batch_duration_seconds',
+    'Time spent sending one dispatched batch of exports to the TMS',
+    buckets=[0.1, 0.5, 1, 2.5, 5, 10, 30, 60]
+)
+
 queue_depth = Gauge(
     'sortex_queue_depth',
     'Current queue depth',
@@ -48,6 +90,15 @@ class MetricsCollector:
         """Record document upload"""
         document_uploads_total.inc()
     
+    @staticmethod
+    def record_bulk_upload(accepted: int, rejected: int, total_bytes: int, duration: float):
+        """Record one bulk upload batch"""
+        document_uploads_total.inc(accepted)
+        bulk_upload_files_total.labels(result="accepted").inc(accepted)
+        bulk_upload_files_total.labels(result="rejected").inc(rejected)
+        bulk_upload_bytes_total.inc(total_bytes)
+        bulk_upload_duration_seconds.observe(duration)
+    
     @staticmethod
     def record_extraction(success: bool, duration: float):
         """Record extraction"""
@@ -66,6 +117,25 @@ class MetricsCollector:
         status = "success" if success else "failure"
         export_attempts_total.labels(status=status).inc()
     
+    @staticmethod
+    def record_export_batch(succeeded: int, failed: int, duration: float):
+        """Record one dispatched export batch"""
+        export_attempts_total.labels(status="success").inc(succeeded)
+        export_attempts_total.labels(status="failure").inc(failed)
+        export_batch_duration_seconds.observe(duration)
+    
+    @staticmethod
+    def record_storage_cache(hit: bool):
+        """Record a storage disk cache lookup"""
+        storage_cache_requests_total.labels(result="hit" if hit else "miss").inc()
+    
+    @staticmethod
+    def record_ocr_preprocess(input_pixels: int, output_pixels: int, duration: float):
+        """Record preprocessing of one page"""
+        ocr_page_pixels.labels(stage="input").observe(input_pixels)
+        ocr_page_pixels.labels(stage="ocr").observe(output_pixels)
+        ocr_preprocess_duration_seconds.observe(duration)
+    
     @staticmethod
     def update_queue_depth(queue_name: str, depth: int):
         """Update queue depth"""
@@ -0,0 +1,199 @@
+"""
+Write-behind sink for audit trail events.
+
+Audit rows used to be inserted (and flushed) inside every business
+transaction. The buffered sink instead stages each ``AuditTrail`` on the
+session that produced it, hands the staged events to an in-process buffer
+once that session commits, and bulk-inserts the buffer from a background
+thread whenever ``AUDIT_FLUSH_INTERVAL_SECONDS`` elapses or
+``AUDIT_BATCH_SIZE`` events are waiting.
+
+Durability guarantees:
+  - An event is never written for a transaction that rolled back; events are
+    only buffered from the session's ``after_commit`` hook.
+  - Events buffered in memory are flushed on graceful shutdown (``close()``,
+    wired to the FastAPI shutdown event). A hard crash (SIGKILL, OOM) loses at
+    most one flush interval / one batch worth of events per process.
+  - If a batch insert fails, rows are retried one by one so that a single bad
+    event (e.g. its document was deleted in the meantime) does not drop the
+    rest of the batch. Rows that still fail are logged and discarded.
+
+Set ``AUDIT_SINK_MODE=sync`` to keep the original behaviour (insert + flush in
+the caller's transaction); tests and one-off scripts use that mode.
+"""
+import os
+import threading
+from collections import deque
+from typing import Deque, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ...domain.entities.audit_trail import AuditTrail
+from ..monitoring.logging import get_logger
+from .database import Database
+from .repositories.audit_trail_repository import AuditTrailRepository
+
+logger = get_logger("sortex.persistence.audit_sink")
+
+_STAGED_KEY = "pending_audit_trails"
+
+
+class BufferedAuditSink:
+    """Buffers committed audit events and bulk-inserts them on a timer or size threshold."""
+
+    def __init__(
+        self,
+        database: Database,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+        max_buffer_size: int = 50_000,
+    ):
+        self.database = database
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffer_size = max_buffer_size
+
+        self._buffer: Deque[AuditTrail] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        event.listen(database.SessionLocal, "after_commit", self._on_commit)
+        event.listen(database.SessionLocal, "after_rollback", self._on_rollback)
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def record(self, session: Session, audit_trail: AuditTrail) -> None:
+        """Stage an audit event; it is buffered only if ``session`` commits."""
+        if not session.in_transaction():
+            # Make sure a later rollback() fires after_rollback and drops the event
+            session.begin()
+        session.info.setdefault(_STAGED_KEY, []).append(audit_trail)
+
+    def _on_commit(self, session: Session) -> None:
+        staged = session.info.pop(_STAGED_KEY, None)
+        if not staged:
+            return
+        with self._lock:
+            self._buffer.extend(staged)
+            pending = len(self._buffer)
+        self._ensure_started()
+
+        if pending >= self.max_buffer_size:
+            # Writer is falling behind: apply back-pressure on the producer.
+            self.flush()
+        elif pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _on_rollback(self, session: Session) -> None:
+        session.info.pop(_STAGED_KEY, None)
+
+    # ------------------------------------------------------------------
+    # Writer side
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-sink-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break  # close() performs the final flush
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("Audit flush failed", error=str(e), error_type=type(e).__name__)
+
+    def _take_batch(self) -> List[AuditTrail]:
+        with self._lock:
+            count = min(self.batch_size, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def flush(self) -> int:
+        """Write every buffered event. Returns the number of rows inserted."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return written
+                written += self._write_batch(batch)
+
+    def _write_batch(self, batch: List[AuditTrail]) -> int:
+        session = self.database.get_session()
+        try:
+            AuditTrailRepository(session).bulk_create(batch)
+            session.commit()
+            return len(batch)
+        except Exception as e:
+            session.rollback()
+            logger.warning(
+                "Audit batch insert failed, retrying row by row",
+                error=str(e),
+                batch_size=len(batch),
+            )
+        finally:
+            session.close()
+        return self._write_rows(batch)
+
+    def _write_rows(self, batch: List[AuditTrail]) -> int:
+        written = 0
+        for audit_trail in batch:
+            session = self.database.get_session()
+            try:
+                AuditTrailRepository(session).bulk_create([audit_trail])
+                session.commit()
+                written += 1
+            except Exception as e:
+                session.rollback()
+                logger.error(
+                    "Dropping audit event",
+                    error=str(e),
+                    audit_id=str(audit_trail.id),
+                    document_id=str(audit_trail.document_id),
+                    action=audit_trail.action.value,
+                )
+            finally:
+                session.close()
+        return written
+
+    def pending_count(self) -> int:
+        """Number of committed events waiting to be written."""
+        with self._lock:
+            return len(self._buffer)
+
+    def close(self) -> None:
+        """Stop the writer thread and flush whatever is still buffered."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval_seconds + 5)
+        self.flush()
+
+
+def create_audit_sink(database: Database) -> Optional[BufferedAuditSink]:
+    """Build the audit sink configured by ``AUDIT_SINK_MODE`` (``buffered`` or ``sync``)."""
+    mode = os.getenv("AUDIT_SINK_MODE", "buffered").lower()
+    if mode == "sync":
+        return None
+    if mode != "buffered":
+        raise ValueError(f"Unknown audit sink mode: {mode}")
+    return BufferedAuditSink(
+        database,
+        batch_size=int(os.getenv("AUDIT_BATCH_SIZE", "500")),
+        flush_interval_seconds=float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "1.0")),
+    )
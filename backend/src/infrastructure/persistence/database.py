@@ -1,6 +1,9 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 Base = declarative_base()
@@ -29,3 +32,23 @@ class Database:
         """Create all tables"""
         Base.metadata.create_all(bind=self.engine)
 
+
+
+@contextmanager
+def count_statements(session: Session) -> Iterator[List[int]]:
+    """Count SQL statements sent on the session's connection inside the block.
+
+    Yields a one-element list holding the running count (an executemany
+    counts once, as it is one round trip).
+    """
+    connection = session.connection()
+    count = [0]
+
+    def _count(*_args) -> None:
+        count[0] += 1
+
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        yield count
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
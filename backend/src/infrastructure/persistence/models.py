@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, BigInteger, Text, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, Text, ForeignKey, JSON, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
 
 from .database import Base
@@ -47,11 +47,13 @@ class ExtractionModel(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False)
     extraction_method = Column(String(20), nullable=False)
-    raw_text = Column(Text)
+    # Large columns are deferred: only loaded when a query undefers them
+    raw_text = deferred(Column(Text))
+    raw_text_key = Column(String(500))
     structured_data = Column(JSONB, nullable=False)
     confidence_scores = Column(JSONB)
     extracted_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    extraction_metadata = Column(JSONB)
+    extraction_metadata = deferred(Column(JSONB))
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     
     # Relationships
@@ -63,7 +65,7 @@ class ValidationResultModel(Base):
     __tablename__ = "validation_results"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    extraction_id = Column(UUID(as_uuid=True), ForeignKey("extractions.id"), nullable=False)
+    extraction_id = Column(UUID(as_uuid=True), ForeignKey("extractions.id"), nullable=False, unique=True)
     validation_rules = Column(JSONB, nullable=False)
     validation_status = Column(String(20), nullable=False)
     validation_errors = Column(JSONB)
@@ -73,6 +75,22 @@ class ValidationResultModel(Base):
     extraction = relationship("ExtractionModel", back_populates="validation_results")
 
 
+class RevalidationJobModel(Base):
+    __tablename__ = "revalidation_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    rules_version = Column(String(64), nullable=False)
+    status = Column(String(20), nullable=False)
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    status_counts = Column(JSONB, nullable=False, default=dict)
+    last_extraction_id = Column(UUID(as_uuid=True))
+    error_message = Column(Text)
+    started_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime(timezone=True))
+
+
 class ReviewModel(Base):
     __tablename__ = "reviews"
     
@@ -96,7 +114,8 @@ class AuditTrailModel(Base):
     document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False)
     action = Column(String(50), nullable=False)
     performed_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    performed_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    # Part of the primary key: audit_trails is range-partitioned by performed_at
+    performed_at = Column(DateTime(timezone=True), primary_key=True, default=datetime.utcnow)
     changes = Column(JSONB)
     audit_metadata = Column(JSONB)
     
@@ -116,7 +135,23 @@ class ExportModel(Base):
     retry_count = Column(Integer, default=0)
     error_message = Column(Text)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    # Outbox: PENDING rows are claimed by the export relay once next_attempt_at has passed
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    last_attempt_at = Column(DateTime(timezone=True))
     
     # Relationships
     document = relationship("DocumentModel", back_populates="exports")
 
+
+class ExportAttemptModel(Base):
+    __tablename__ = "export_attempts"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    export_id = Column(UUID(as_uuid=True), ForeignKey("exports.id", ondelete="CASCADE"), nullable=False, index=True)
+    attempt = Column(Integer, nullable=False)
+    success = Column(Boolean, nullable=False)
+    status_code = Column(Integer)
+    error_message = Column(Text)
+    duration_ms = Column(Integer)
+    attempted_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
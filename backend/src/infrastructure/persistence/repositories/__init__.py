@@ -6,6 +6,8 @@ from .validation_repository import ValidationResultRepository
 from .review_repository import ReviewRepository
 from .audit_trail_repository import AuditTrailRepository
 from .export_repository import ExportRepository
+from .export_attempt_repository import ExportAttemptRepository
+from .revalidation_job_repository import RevalidationJobRepository
 
 __all__ = [
     "UserRepository",
@@ -15,4 +17,6 @@ __all__ = [
     "ReviewRepository",
     "AuditTrailRepository",
     "ExportRepository",
+    "ExportAttemptRepository",
+    "RevalidationJobRepository",
 ]
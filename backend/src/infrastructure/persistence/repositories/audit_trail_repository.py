@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import List
 from uuid import UUID
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
 
 from ....domain.entities.audit_trail import AuditTrail, AuditAction
@@ -9,11 +11,18 @@ from ..models import AuditTrailModel
 class AuditTrailRepository:
     """Repository for AuditTrail entity"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, sink=None):
         self.session = session
+        # Optional BufferedAuditSink; when set, create() defers the insert
+        # until the session commits instead of flushing immediately.
+        self.sink = sink
 
     def create(self, audit_trail: AuditTrail) -> AuditTrail:
         """Create a new audit trail entry"""
+        if self.sink is not None:
+            self.sink.record(self.session, audit_trail)
+            return audit_trail
+
         model = AuditTrailModel(
             id=audit_trail.id,
             document_id=audit_trail.document_id,
@@ -27,6 +36,33 @@ class AuditTrailRepository:
         self.session.flush()
         return self._to_entity(model)
 
+    def create_many(self, audit_trails: List[AuditTrail]) -> int:
+        """Create many audit trail entries: through the sink if set, else in one INSERT."""
+        if self.sink is not None:
+            for audit_trail in audit_trails:
+                self.sink.record(self.session, audit_trail)
+            return len(audit_trails)
+        return self.bulk_create(audit_trails)
+
+    def bulk_create(self, audit_trails: List[AuditTrail]) -> int:
+        """Insert many audit trail entries in a single multi-row INSERT."""
+        if not audit_trails:
+            return 0
+        rows = [
+            {
+                "id": a.id,
+                "document_id": a.document_id,
+                "action": a.action.value,
+                "performed_by": a.performed_by,
+                "changes": a.changes,
+                "audit_metadata": a.metadata,
+                "performed_at": a.performed_at,
+            }
+            for a in audit_trails
+        ]
+        self.session.execute(insert(AuditTrailModel), rows)
+        return len(rows)
+
     def get_by_document_id(self, document_id: UUID, limit: int = 100) -> List[AuditTrail]:
         """Get audit trails by document ID"""
         models = self.session.query(AuditTrailModel).filter(
@@ -34,6 +70,21 @@ class AuditTrailRepository:
         ).order_by(AuditTrailModel.performed_at.desc()).limit(limit).all()
         return [self._to_entity(m) for m in models]
 
+    def ensure_partitions(self, months_ahead: int = 3) -> None:
+        """Create monthly audit_trails partitions up to ``months_ahead`` months from now (PostgreSQL)."""
+        self.session.execute(
+            text("SELECT audit_trails_ensure_partitions(:months_ahead)"),
+            {"months_ahead": months_ahead},
+        )
+
+    def drop_partitions_before(self, cutoff: datetime) -> int:
+        """Retention pruning: drop monthly partitions entirely older than ``cutoff``. Returns partitions dropped."""
+        result = self.session.execute(
+            text("SELECT audit_trails_drop_partitions_before(:cutoff)"),
+            {"cutoff": cutoff},
+        )
+        return result.scalar() or 0
+
     def _to_entity(self, model: AuditTrailModel) -> AuditTrail:
         """Convert model to entity"""
         return AuditTrail(
@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, update
 
 from ....domain.entities.document import Document, DocumentStatus, DocumentType
 from ..models import DocumentModel
+from ...messaging.event_publisher import stage_domain_events
 
 
 class DocumentRepository:
@@ -32,13 +33,48 @@ class DocumentRepository:
         )
         self.session.add(model)
         self.session.flush()
+        stage_domain_events(self.session, document.uploaded_by, document.pull_events())
         return self._to_entity(model)
 
+    def bulk_create(self, documents: List[Document]) -> int:
+        """Insert many documents in a single multi-row INSERT."""
+        if not documents:
+            return 0
+        rows = [
+            {
+                "id": d.id,
+                "original_filename": d.original_filename,
+                "file_type": d.file_type,
+                "file_size": d.file_size,
+                "storage_path": d.storage_path,
+                "uploaded_by": d.uploaded_by,
+                "status": d.status.value,
+                "document_type": d.document_type.value if d.document_type else None,
+                "version": d.version,
+                "uploaded_at": d.uploaded_at,
+                "created_at": d.created_at,
+                "updated_at": d.updated_at,
+            }
+            for d in documents
+        ]
+        self.session.execute(insert(DocumentModel), rows)
+        for d in documents:
+            stage_domain_events(self.session, d.uploaded_by, d.pull_events())
+        return len(rows)
+
     def get_by_id(self, document_id: UUID) -> Optional[Document]:
         """Get document by ID"""
         model = self.session.query(DocumentModel).filter(DocumentModel.id == document_id).first()
         return self._to_entity(model) if model else None
 
+    def get_by_ids(self, document_ids: Iterable[UUID]) -> List[Document]:
+        """Get several documents in one query (order not preserved)"""
+        ids = list(document_ids)
+        if not ids:
+            return []
+        models = self.session.query(DocumentModel).filter(DocumentModel.id.in_(ids)).all()
+        return [self._to_entity(model) for model in models]
+
     def list(
         self,
         skip: int = 0,
@@ -121,8 +157,22 @@ class DocumentRepository:
             model.version = document.version
             model.updated_at = document.updated_at
             self.session.flush()
+            stage_domain_events(self.session, document.uploaded_by, document.pull_events())
         return self._to_entity(model)
 
+    def bulk_update_status(self, documents: List[Document]) -> int:
+        """Persist status changes of many documents with one executemany UPDATE"""
+        if not documents:
+            return 0
+        self.session.execute(update(DocumentModel), [
+            {"id": d.id, "status": d.status.value, "updated_at": d.updated_at}
+            for d in documents
+        ])
+        self.session.flush()
+        for d in documents:
+            stage_domain_events(self.session, d.uploaded_by, d.pull_events())
+        return len(documents)
+
     def delete(self, document_id: UUID) -> None:
         """Delete document by ID"""
         model = self.session.query(DocumentModel).filter(DocumentModel.id == document_id).first()
@@ -0,0 +1,53 @@
+from typing import List
+from uuid import UUID
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ....domain.entities.export_attempt import ExportAttempt
+from ..models import ExportAttemptModel
+
+
+class ExportAttemptRepository:
+    """Repository for ExportAttempt entity (delivery history of exports)"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def bulk_create(self, attempts: List[ExportAttempt]) -> int:
+        """Insert many attempts in a single multi-row INSERT"""
+        if not attempts:
+            return 0
+        self.session.execute(insert(ExportAttemptModel), [
+            {
+                "id": a.id,
+                "export_id": a.export_id,
+                "attempt": a.attempt,
+                "success": a.success,
+                "status_code": a.status_code,
+                "error_message": a.error_message,
+                "duration_ms": a.duration_ms,
+                "attempted_at": a.attempted_at,
+            }
+            for a in attempts
+        ])
+        return len(attempts)
+
+    def list_by_export_id(self, export_id: UUID) -> List[ExportAttempt]:
+        """Attempts of one export, oldest first"""
+        models = self.session.query(ExportAttemptModel).filter(
+            ExportAttemptModel.export_id == export_id
+        ).order_by(ExportAttemptModel.attempt).all()
+        return [self._to_entity(model) for model in models]
+
+    def _to_entity(self, model: ExportAttemptModel) -> ExportAttempt:
+        """Convert model to entity"""
+        return ExportAttempt(
+            id=model.id,
+            export_id=model.export_id,
+            attempt=model.attempt,
+            success=model.success,
+            status_code=model.status_code,
+            error_message=model.error_message,
+            duration_ms=model.duration_ms,
+            attempted_at=model.attempted_at,
+        )
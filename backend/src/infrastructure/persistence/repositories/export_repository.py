@@ -1,5 +1,7 @@
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, List, Optional
 from uuid import UUID
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from ....domain.entities.export import Export, ExportStatus
@@ -24,11 +26,35 @@ class ExportRepository:
             retry_count=export.retry_count,
             error_message=export.error_message,
             created_at=export.created_at,
+            next_attempt_at=export.next_attempt_at,
+            last_attempt_at=export.last_attempt_at,
         )
         self.session.add(model)
         self.session.flush()
         return self._to_entity(model)
 
+    def bulk_create(self, exports: List[Export]) -> int:
+        """Insert many exports in a single multi-row INSERT"""
+        if not exports:
+            return 0
+        self.session.execute(insert(ExportModel), [
+            {
+                "id": e.id,
+                "document_id": e.document_id,
+                "exported_to": e.exported_to,
+                "export_payload": e.export_payload,
+                "export_status": e.export_status.value,
+                "exported_at": e.exported_at,
+                "retry_count": e.retry_count,
+                "error_message": e.error_message,
+                "created_at": e.created_at,
+                "next_attempt_at": e.next_attempt_at,
+                "last_attempt_at": e.last_attempt_at,
+            }
+            for e in exports
+        ])
+        return len(exports)
+
     def get_by_document_id(self, document_id: UUID) -> Optional[Export]:
         """Get export by document ID"""
         model = self.session.query(ExportModel).filter(
@@ -36,6 +62,44 @@ class ExportRepository:
         ).first()
         return self._to_entity(model) if model else None
 
+    def get_by_ids(self, export_ids: Iterable[UUID], status: Optional[ExportStatus] = None) -> List[Export]:
+        """Load several exports in one query, optionally only those in ``status``"""
+        ids = list(export_ids)
+        if not ids:
+            return []
+        query = self.session.query(ExportModel).filter(ExportModel.id.in_(ids))
+        if status is not None:
+            query = query.filter(ExportModel.export_status == status.value)
+        return [self._to_entity(model) for model in query.all()]
+
+    def claim_due(self, limit: int, lease_until: datetime, now: Optional[datetime] = None) -> List[Export]:
+        """
+        Lease up to ``limit`` PENDING exports whose next attempt is due (oldest
+        first) by pushing their ``next_attempt_at`` to ``lease_until``. Rows
+        locked by another relay are skipped, so several relays can poll
+        concurrently. Commit right away: other relays see the lease, and an
+        export whose relay dies before recording a result is due again once
+        the lease expires.
+
+        The attempt is counted when it is claimed (``retry_count`` + 1 in the
+        database), so leases that expire without a recorded result use up
+        attempts too. The returned exports carry the count from before the
+        claim.
+        """
+        models = self.session.query(ExportModel).filter(
+            ExportModel.export_status == ExportStatus.PENDING.value,
+            ExportModel.next_attempt_at <= (now or datetime.utcnow()),
+        ).order_by(ExportModel.next_attempt_at).limit(limit).with_for_update(skip_locked=True).all()
+        exports = [self._to_entity(model) for model in models]
+        if models:
+            self.session.execute(
+                update(ExportModel)
+                .where(ExportModel.id.in_([model.id for model in models]))
+                .values(next_attempt_at=lease_until, retry_count=ExportModel.retry_count + 1)
+                .execution_options(synchronize_session=False)
+            )
+        return exports
+
     def update(self, export: Export) -> Export:
         """Update export"""
         model = self.session.query(ExportModel).filter(ExportModel.id == export.id).first()
@@ -44,9 +108,30 @@ class ExportRepository:
             model.exported_at = export.exported_at
             model.retry_count = export.retry_count
             model.error_message = export.error_message
+            model.next_attempt_at = export.next_attempt_at
+            model.last_attempt_at = export.last_attempt_at
             self.session.flush()
         return self._to_entity(model)
 
+    def bulk_update(self, exports: List[Export]) -> int:
+        """Persist status/retry fields of many exports with one executemany UPDATE"""
+        if not exports:
+            return 0
+        self.session.execute(update(ExportModel), [
+            {
+                "id": e.id,
+                "export_status": e.export_status.value,
+                "exported_at": e.exported_at,
+                "retry_count": e.retry_count,
+                "error_message": e.error_message,
+                "next_attempt_at": e.next_attempt_at,
+                "last_attempt_at": e.last_attempt_at,
+            }
+            for e in exports
+        ])
+        self.session.flush()
+        return len(exports)
+
     def _to_entity(self, model: ExportModel) -> Export:
         """Convert model to entity"""
         return Export(
@@ -59,4 +144,6 @@ class ExportRepository:
             retry_count=model.retry_count,
             error_message=model.error_message,
             created_at=model.created_at,
+            next_attempt_at=model.next_attempt_at,
+            last_attempt_at=model.last_attempt_at,
         )
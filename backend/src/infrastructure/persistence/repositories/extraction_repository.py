@@ -1,9 +1,10 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, undefer
 
 from ....domain.entities.extraction import Extraction, ExtractionMethod
-from ..models import ExtractionModel
+from ..models import DocumentModel, ExtractionModel
 
 
 class ExtractionRepository:
@@ -19,6 +20,7 @@ class ExtractionRepository:
             document_id=extraction.document_id,
             extraction_method=extraction.extraction_method.value,
             raw_text=extraction.raw_text,
+            raw_text_key=extraction.raw_text_key,
             structured_data=extraction.structured_data,
             confidence_scores=extraction.confidence_scores,
             extraction_metadata=extraction.extraction_metadata,
@@ -29,12 +31,51 @@ class ExtractionRepository:
         self.session.flush()
         return self._to_entity(model)
 
-    def get_by_document_id(self, document_id: UUID) -> Optional[Extraction]:
-        """Get the latest extraction by document ID"""
-        model = self.session.query(ExtractionModel).filter(
+    def get_by_document_id(self, document_id: UUID, full: bool = False) -> Optional[Extraction]:
+        """Get the latest extraction by document ID.
+
+        raw_text and extraction_metadata are deferred columns and are only
+        loaded when ``full`` is True; otherwise they are None / {} on the entity.
+        """
+        query = self.session.query(ExtractionModel).filter(
+            ExtractionModel.document_id == document_id
+        )
+        if full:
+            query = query.options(
+                undefer(ExtractionModel.raw_text),
+                undefer(ExtractionModel.extraction_metadata),
+            )
+        model = query.order_by(ExtractionModel.extracted_at.desc()).first()
+        return self._to_entity(model, full=full) if model else None
+
+    def get_latest_by_document_ids(self, document_ids: Iterable[UUID]) -> Dict[UUID, Extraction]:
+        """Latest extraction per document for several documents in one query (deferred columns not loaded)"""
+        ids = list(document_ids)
+        if not ids:
+            return {}
+        models = self.session.query(ExtractionModel).filter(
+            ExtractionModel.document_id.in_(ids)
+        ).order_by(ExtractionModel.document_id, ExtractionModel.extracted_at.desc()).all()
+        latest: Dict[UUID, Extraction] = {}
+        for model in models:
+            if model.document_id not in latest:
+                latest[model.document_id] = self._to_entity(model, full=False)
+        return latest
+
+    def get_latest_id(self, document_id: UUID) -> Optional[UUID]:
+        """Get the ID of the latest extraction for a document without loading the row (ETag probe)."""
+        row = self.session.query(ExtractionModel.id).filter(
             ExtractionModel.document_id == document_id
         ).order_by(ExtractionModel.extracted_at.desc()).first()
-        return self._to_entity(model) if model else None
+        return row[0] if row else None
+
+    def get_raw_text_keys(self, document_id: UUID) -> List[str]:
+        """OCR artifact keys of a document's extractions (to delete with them)."""
+        rows = self.session.query(ExtractionModel.raw_text_key).filter(
+            ExtractionModel.document_id == document_id,
+            ExtractionModel.raw_text_key.isnot(None),
+        ).all()
+        return [row[0] for row in rows]
 
     def delete_by_document_id(self, document_id: UUID) -> int:
         """Delete all extractions for a document. Returns count of deleted records."""
@@ -44,16 +85,38 @@ class ExtractionRepository:
         self.session.flush()
         return deleted
 
-    def _to_entity(self, model: ExtractionModel) -> Extraction:
-        """Convert model to entity"""
+    def count(self) -> int:
+        return self.session.query(func.count(ExtractionModel.id)).scalar() or 0
+
+    def iter_validation_batches(
+        self, after_id: Optional[UUID] = None, batch_size: int = 2000
+    ) -> Iterator[List[Tuple[UUID, Optional[str], Dict[str, Any]]]]:
+        """Stream (extraction id, document type, structured data) in id order, ``batch_size`` rows at a time.
+
+        Rows come from a server-side cursor, so memory stays flat however many
+        extractions there are. ``after_id`` continues a previous pass (keyset).
+        The session must not be committed while the iterator is in use.
+        """
+        query = select(
+            ExtractionModel.id, DocumentModel.document_type, ExtractionModel.structured_data
+        ).join(DocumentModel, DocumentModel.id == ExtractionModel.document_id).order_by(ExtractionModel.id)
+        if after_id is not None:
+            query = query.where(ExtractionModel.id > after_id)
+        result = self.session.execute(query.execution_options(stream_results=True, yield_per=batch_size))
+        for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+    def _to_entity(self, model: ExtractionModel, full: bool = True) -> Extraction:
+        """Convert model to entity (skipping deferred columns unless ``full``)"""
         return Extraction(
             id=model.id,
             document_id=model.document_id,
             extraction_method=ExtractionMethod(model.extraction_method),
-            raw_text=model.raw_text,
+            raw_text=model.raw_text if full else None,
             structured_data=model.structured_data,
             confidence_scores=model.confidence_scores or {},
-            extraction_metadata=model.extraction_metadata or {},
+            extraction_metadata=(model.extraction_metadata or {}) if full else {},
+            raw_text_key=model.raw_text_key,
             extracted_at=model.extracted_at,
             created_at=model.created_at,
         )
@@ -0,0 +1,72 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from ....domain.entities.revalidation_job import RevalidationJob, RevalidationJobStatus
+from ..models import RevalidationJobModel
+
+
+class RevalidationJobRepository:
+    """Repository for RevalidationJob entity (bulk re-validation checkpoints)"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def create(self, job: RevalidationJob) -> RevalidationJob:
+        """Create a new job"""
+        model = RevalidationJobModel(id=job.id)
+        self._apply(model, job)
+        self.session.add(model)
+        self.session.flush()
+        return self._to_entity(model)
+
+    def get_by_id(self, job_id: UUID) -> Optional[RevalidationJob]:
+        model = self.session.get(RevalidationJobModel, job_id)
+        return self._to_entity(model) if model else None
+
+    def get_resumable(self, rules_version: str) -> Optional[RevalidationJob]:
+        """Latest unfinished (running or failed) job for the same rules, if any"""
+        model = self.session.query(RevalidationJobModel).filter(
+            RevalidationJobModel.rules_version == rules_version,
+            RevalidationJobModel.status != RevalidationJobStatus.COMPLETED.value,
+        ).order_by(RevalidationJobModel.started_at.desc()).first()
+        return self._to_entity(model) if model else None
+
+    def update(self, job: RevalidationJob) -> RevalidationJob:
+        """Persist progress/status of a job"""
+        model = self.session.get(RevalidationJobModel, job.id)
+        if not model:
+            raise ValueError(f"Revalidation job {job.id} not found")
+        self._apply(model, job)
+        self.session.flush()
+        return self._to_entity(model)
+
+    @staticmethod
+    def _apply(model: RevalidationJobModel, job: RevalidationJob) -> None:
+        model.rules_version = job.rules_version
+        model.status = job.status.value
+        model.total = job.total
+        model.processed = job.processed
+        # New dict so the JSONB change is detected
+        model.status_counts = dict(job.status_counts)
+        model.last_extraction_id = job.last_extraction_id
+        model.error_message = job.error_message
+        model.started_at = job.started_at
+        model.updated_at = job.updated_at
+        model.finished_at = job.finished_at
+
+    def _to_entity(self, model: RevalidationJobModel) -> RevalidationJob:
+        """Convert model to entity"""
+        return RevalidationJob(
+            id=model.id,
+            rules_version=model.rules_version,
+            status=RevalidationJobStatus(model.status),
+            total=model.total or 0,
+            processed=model.processed or 0,
+            status_counts=dict(model.status_counts or {}),
+            last_extraction_id=model.last_extraction_id,
+            error_message=model.error_message,
+            started_at=model.started_at,
+            updated_at=model.updated_at,
+            finished_at=model.finished_at,
+        )
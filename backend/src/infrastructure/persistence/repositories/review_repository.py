@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from ....domain.entities.review import Review, ReviewStatus
@@ -35,6 +36,30 @@ class ReviewRepository:
         ).first()
         return self._to_entity(model) if model else None
 
+    def get_by_document_ids(self, document_ids: Iterable[UUID]) -> Dict[UUID, Review]:
+        """Reviews of several documents in one query, by document ID"""
+        ids = list(document_ids)
+        if not ids:
+            return {}
+        models = self.session.query(ReviewModel).filter(ReviewModel.document_id.in_(ids)).all()
+        return {model.document_id: self._to_entity(model) for model in models}
+
+    def bulk_update(self, reviews: List[Review]) -> int:
+        """Persist status/notes of many reviews with one executemany UPDATE"""
+        if not reviews:
+            return 0
+        self.session.execute(update(ReviewModel), [
+            {
+                "id": r.id,
+                "review_status": r.review_status.value,
+                "review_notes": r.review_notes,
+                "reviewed_at": r.reviewed_at,
+            }
+            for r in reviews
+        ])
+        self.session.flush()
+        return len(reviews)
+
     def update(self, review: Review) -> Review:
         """Update review"""
         model = self.session.query(ReviewModel).filter(ReviewModel.id == review.id).first()
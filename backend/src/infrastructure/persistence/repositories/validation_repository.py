@@ -1,5 +1,6 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 from uuid import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from ....domain.entities.validation_result import ValidationResult, ValidationStatus
@@ -31,6 +32,34 @@ class ValidationResultRepository:
         self.session.flush()
         return self._to_entity(model)
 
+    def bulk_upsert(self, validation_results: List[ValidationResult]) -> int:
+        """Insert or replace the result of each extraction in one multi-row statement (PostgreSQL)."""
+        if not validation_results:
+            return 0
+        rows = [
+            {
+                "id": v.id,
+                "extraction_id": v.extraction_id,
+                "validation_rules": v.validation_rules,
+                "validation_status": v.validation_status.value,
+                "validation_errors": v.validation_errors,
+                "validated_at": v.validated_at,
+            }
+            for v in validation_results
+        ]
+        stmt = pg_insert(ValidationResultModel)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ValidationResultModel.extraction_id],
+            set_={
+                "validation_rules": stmt.excluded.validation_rules,
+                "validation_status": stmt.excluded.validation_status,
+                "validation_errors": stmt.excluded.validation_errors,
+                "validated_at": stmt.excluded.validated_at,
+            },
+        )
+        self.session.execute(stmt, rows)
+        return len(rows)
+
     def get_by_extraction_id(self, extraction_id: UUID) -> Optional[ValidationResult]:
         """Get validation result by extraction ID (latest first)"""
         model = self.session.query(ValidationResultModel).filter(
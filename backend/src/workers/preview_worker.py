@@ -0,0 +1,92 @@
+"""
+Preview worker: consumes page preview jobs from the Redis ``previews`` queue.
+
+Jobs are queued after every upload (``enqueue_previews``). Previews are cheap
+compared to extraction, so they run in their own worker and are available
+long before OCR finishes. With ``PAGE_PREVIEWS_ENABLED=false`` the worker
+renders nothing and discards the jobs still queued from before (it keeps
+running so a restarting container does not loop).
+
+Run with: python -m src.workers.preview_worker
+"""
+import os
+import signal
+from typing import Optional
+from uuid import UUID
+
+from ..application.use_cases.generate_previews import GeneratePreviewsUseCase, PREVIEW_QUEUE
+from ..infrastructure.external.storage.factory import StorageServiceFactory
+from ..infrastructure.external.storage.page_images import create_page_image_store
+from ..infrastructure.external.storage.page_previews import create_page_preview_store
+from ..infrastructure.messaging.redis_queue import RedisQueue
+from ..infrastructure.monitoring.logging import get_logger
+
+logger = get_logger("sortex.workers.previews")
+
+# BRPOP timeout, so shutdown signals are noticed between jobs
+POLL_TIMEOUT_SECONDS = 5
+
+
+class PreviewWorker:
+    """Blocking loop that pops preview jobs and renders them one at a time."""
+
+    def __init__(self, redis_queue: RedisQueue, use_case: Optional[GeneratePreviewsUseCase]):
+        self.redis_queue = redis_queue
+        # None when previews are disabled: jobs are discarded
+        self.use_case = use_case
+        self._stopping = False
+
+    def stop(self, *_args) -> None:
+        logger.info("Preview worker stopping")
+        self._stopping = True
+
+    def run(self) -> None:
+        logger.info("Preview worker started", queue=PREVIEW_QUEUE, enabled=self.use_case is not None)
+        while not self._stopping:
+            job = self.redis_queue.dequeue(PREVIEW_QUEUE, timeout=POLL_TIMEOUT_SECONDS)
+            if job is None:
+                continue
+            self.process(job)
+
+    def process(self, job: dict) -> None:
+        try:
+            document_id = UUID(job["document_id"])
+            storage_path = job["storage_path"]
+            file_type = job["file_type"]
+        except (KeyError, ValueError, TypeError):
+            logger.error("Discarding malformed preview job", job=job)
+            return
+        if self.use_case is None:
+            logger.info("Page previews disabled, discarding preview job", document_id=str(document_id))
+            return
+        try:
+            self.use_case.execute(document_id, storage_path, file_type)
+        except Exception as e:
+            # Previews are best effort: the review UI falls back to the original file
+            logger.error(
+                "Page preview generation failed",
+                document_id=str(document_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+
+def main() -> None:
+    storage_service = StorageServiceFactory.create()
+    preview_store = create_page_preview_store(storage_service)
+    use_case = None
+    if preview_store is None:
+        logger.warning("Page previews are disabled (PAGE_PREVIEWS_ENABLED=false); preview jobs will be discarded")
+    else:
+        use_case = GeneratePreviewsUseCase(storage_service, preview_store, create_page_image_store(storage_service))
+    worker = PreviewWorker(
+        redis_queue=RedisQueue(os.getenv("REDIS_URL", "redis://redis:6379/0")),
+        use_case=use_case,
+    )
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
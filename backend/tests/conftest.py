@@ -1,4 +1,5 @@
 """Shared pytest fixtures for Sortex backend tests."""
+import hashlib
 import os
 
 # Must be set before any application import touches jwt.py
@@ -17,7 +18,7 @@ from src.domain.services.document_type_classifier import DocumentTypeClassifier
 from src.domain.services.validation_engine import ValidationEngine
 from src.infrastructure.external.llm.base import LLMExtractionResult, LLMService
 from src.infrastructure.external.ocr.base import OCRResult, OCRService
-from src.infrastructure.external.storage.base import StorageService
+from src.infrastructure.external.storage.base import StorageService, StoredFileInfo
 from src.infrastructure.persistence.repositories import (
     AuditTrailRepository,
     DocumentRepository,
@@ -73,6 +74,54 @@ def mock_storage_service():
     return create_autospec(StorageService, instance=True)
 
 
+class InMemoryStorage(StorageService):
+    """Dict-backed storage; relies on the StorageService defaults for streams and copies."""
+
+    def __init__(self):
+        self.objects = {}
+        self.content_types = {}
+        # Full downloads (GETs)
+        self.gets = 0
+
+    def upload_file(self, file_path, file_data, content_type=None):
+        self.objects[file_path] = file_data
+        self.content_types[file_path] = content_type
+        return file_path
+
+    def download_file(self, file_path):
+        self.gets += 1
+        return self.objects[file_path]
+
+    def delete_file(self, file_path):
+        self.objects.pop(file_path, None)
+        self.content_types.pop(file_path, None)
+
+    def file_exists(self, file_path):
+        return file_path in self.objects
+
+    def list_files(self, prefix):
+        return [key for key in self.objects if key.startswith(prefix)]
+
+    def stat_file(self, file_path):
+        data = self.objects[file_path]
+        return StoredFileInfo(
+            size=len(data), etag=hashlib.md5(data).hexdigest(), content_type=self.content_types.get(file_path),
+        )
+
+
+@pytest.fixture
+def in_memory_storage():
+    return InMemoryStorage()
+
+
+@pytest.fixture
+def stored(mock_storage_service, in_memory_storage):
+    """Back ``mock_storage_service`` with ``in_memory_storage`` (calls are still recorded); returns its objects."""
+    for name in ("upload_file", "download_file", "delete_file", "file_exists", "list_files", "delete_prefix", "stat_file"):
+        getattr(mock_storage_service, name).side_effect = getattr(in_memory_storage, name)
+    return in_memory_storage.objects
+
+
 # ---------------------------------------------------------------------------
 # Sample data fixtures
 # ---------------------------------------------------------------------------
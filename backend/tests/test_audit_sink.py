@@ -0,0 +1,120 @@
+"""Tests for BufferedAuditSink — commit-gated buffering and batched flushes."""
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.maintain_audit_partitions import MaintainAuditPartitionsUseCase
+from src.domain.entities.audit_trail import AuditAction, AuditTrail
+from src.infrastructure.persistence.audit_sink import BufferedAuditSink
+from src.infrastructure.persistence.database import Database
+from src.infrastructure.persistence.repositories import AuditTrailRepository
+
+
+def _event() -> AuditTrail:
+    return AuditTrail(id=uuid4(), document_id=uuid4(), action=AuditAction.UPLOAD, performed_by=uuid4())
+
+
+@pytest.fixture
+def sink():
+    # Long interval so the background writer never races the assertions
+    sink = BufferedAuditSink(Database("sqlite://"), batch_size=2, flush_interval_seconds=60)
+    yield sink
+    sink._stopped.set()
+    sink._wakeup.set()
+
+
+@pytest.fixture
+def mock_repo_cls():
+    with patch("src.infrastructure.persistence.audit_sink.AuditTrailRepository") as repo_cls:
+        yield repo_cls
+
+
+class TestCommitGating:
+
+    def test_events_buffered_only_after_commit(self, sink):
+        session = sink.database.get_session()
+        sink.record(session, _event())
+        assert sink.pending_count() == 0
+        session.commit()
+        assert sink.pending_count() == 1
+        session.close()
+
+    def test_rollback_discards_staged_events(self, sink):
+        session = sink.database.get_session()
+        sink.record(session, _event())
+        session.rollback()
+        session.commit()
+        assert sink.pending_count() == 0
+        session.close()
+
+    def test_repository_defers_to_sink(self, sink):
+        session = sink.database.get_session()
+        event = _event()
+        returned = AuditTrailRepository(session, sink=sink).create(event)
+        assert returned is event
+        session.commit()
+        assert sink.pending_count() == 1
+        session.close()
+
+
+class TestFlush:
+
+    def test_flush_writes_in_batches(self, sink, mock_repo_cls):
+        sink._buffer.extend(_event() for _ in range(5))
+        written = sink.flush()
+        assert written == 5
+        batch_sizes = [len(c.args[0]) for c in mock_repo_cls.return_value.bulk_create.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+        assert sink.pending_count() == 0
+
+    def test_failed_batch_retried_row_by_row(self, sink, mock_repo_cls):
+        bad, good = _event(), _event()
+
+        def bulk_create(rows):
+            if bad in rows:
+                raise RuntimeError("foreign key violation")
+            return len(rows)
+
+        mock_repo_cls.return_value.bulk_create.side_effect = bulk_create
+        sink._buffer.extend([bad, good])
+        assert sink.flush() == 1
+
+
+class TestPartitionMaintenance:
+
+    @pytest.fixture
+    def maintenance_repo(self):
+        with patch("src.application.use_cases.maintain_audit_partitions.AuditTrailRepository") as repo_cls:
+            repo_cls.return_value.drop_partitions_before.return_value = 2
+            yield repo_cls.return_value
+
+    def test_creates_partitions_and_keeps_history_without_retention(self, maintenance_repo):
+        session = MagicMock()
+
+        dropped = MaintainAuditPartitionsUseCase(lambda: session, months_ahead=4, retention_days=0).execute()
+
+        assert dropped == 0
+        maintenance_repo.ensure_partitions.assert_called_once_with(4)
+        maintenance_repo.drop_partitions_before.assert_not_called()
+        session.commit.assert_called_once()
+
+    def test_drops_partitions_past_retention(self, maintenance_repo):
+        session = MagicMock()
+
+        dropped = MaintainAuditPartitionsUseCase(lambda: session, retention_days=365).execute(now=datetime(2026, 6, 1))
+
+        assert dropped == 2
+        maintenance_repo.drop_partitions_before.assert_called_once_with(datetime(2025, 6, 1))
+        session.commit.assert_called_once()
+
+    def test_failure_rolls_back(self, maintenance_repo):
+        session = MagicMock()
+        maintenance_repo.ensure_partitions.side_effect = RuntimeError("relation already exists")
+
+        with pytest.raises(RuntimeError):
+            MaintainAuditPartitionsUseCase(lambda: session).execute()
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
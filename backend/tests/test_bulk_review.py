@@ -0,0 +1,184 @@
+"""Tests for bulk approve/reject/export (BulkReviewDocumentsUseCase)."""
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from src.application.use_cases.bulk_review_documents import BulkReviewDocumentsUseCase
+from src.domain.entities.audit_trail import AuditAction
+from src.domain.entities.document import Document, DocumentStatus
+from src.domain.entities.export import ExportStatus
+from src.domain.entities.extraction import Extraction, ExtractionMethod
+from src.domain.entities.review import Review, ReviewStatus
+from src.infrastructure.persistence.database import Database, count_statements
+from src.infrastructure.persistence.repositories import (
+    AuditTrailRepository, DocumentRepository, ExportRepository, ExtractionRepository, ReviewRepository,
+)
+
+
+def _document():
+    document = Document(
+        id=uuid4(),
+        original_filename="cmr.pdf",
+        file_type="pdf",
+        file_size=1024,
+        storage_path="uploads/cmr.pdf",
+        uploaded_by=uuid4(),
+    )
+    document.status = DocumentStatus.REVIEWED
+    return document
+
+
+@pytest.fixture
+def documents():
+    return [_document() for _ in range(3)]
+
+
+@pytest.fixture
+def repos(documents):
+    repos = {
+        "document": create_autospec(DocumentRepository, instance=True),
+        "extraction": create_autospec(ExtractionRepository, instance=True),
+        "review": create_autospec(ReviewRepository, instance=True),
+        "export": create_autospec(ExportRepository, instance=True),
+        "audit": create_autospec(AuditTrailRepository, instance=True),
+    }
+    repos["document"].get_by_ids.return_value = list(documents)
+    repos["review"].get_by_document_ids.return_value = {
+        d.id: Review(id=uuid4(), document_id=d.id, reviewed_by=uuid4(), corrections={"total": i})
+        for i, d in enumerate(documents)
+    }
+    repos["extraction"].get_latest_by_document_ids.return_value = {
+        d.id: Extraction(
+            id=uuid4(),
+            document_id=d.id,
+            extraction_method=ExtractionMethod.OCR_LLM,
+            raw_text=None,
+            structured_data={"shipper_name": "Acme", "total": -1},
+            confidence_scores={},
+        )
+        for d in documents
+    }
+    return repos
+
+
+def _use_case(repos, approval_export_to=""):
+    return BulkReviewDocumentsUseCase(
+        document_repository=repos["document"],
+        extraction_repository=repos["extraction"],
+        review_repository=repos["review"],
+        export_repository=repos["export"],
+        audit_trail_repository=repos["audit"],
+        approval_export_to=approval_export_to,
+    )
+
+
+class TestBulkApprove:
+
+    def test_one_load_and_one_write_per_table(self, repos, documents):
+        ids = [d.id for d in documents]
+        result = _use_case(repos).approve(ids, uuid4())
+
+        assert result.processed == ids
+        assert result.skipped == []
+        assert result.export_ids == []
+        repos["review"].get_by_document_ids.assert_called_once()
+        repos["document"].get_by_ids.assert_called_once()
+        repos["extraction"].get_latest_by_document_ids.assert_not_called()
+
+        reviews = repos["review"].bulk_update.call_args.args[0]
+        assert [r.review_status for r in reviews] == [ReviewStatus.APPROVED] * 3
+        updated = repos["document"].bulk_update_status.call_args.args[0]
+        assert [d.status for d in updated] == [DocumentStatus.EXPORTED] * 3
+        audits = repos["audit"].create_many.call_args.args[0]
+        assert [a.action for a in audits] == [AuditAction.REVIEW] * 3
+        repos["document"].update.assert_not_called()
+        repos["review"].update.assert_not_called()
+
+    def test_missing_documents_and_reviews_are_skipped(self, repos, documents):
+        missing = uuid4()
+        del repos["review"].get_by_document_ids.return_value[documents[1].id]
+
+        result = _use_case(repos).approve([documents[0].id, documents[1].id, missing], uuid4())
+
+        assert result.processed == [documents[0].id]
+        assert {s.document_id: s.error for s in result.skipped} == {
+            documents[1].id: "Review not found",
+            missing: "Document not found",
+        }
+        assert len(repos["review"].bulk_update.call_args.args[0]) == 1
+
+    def test_duplicate_ids_are_processed_once(self, repos, documents):
+        result = _use_case(repos).approve([documents[0].id, documents[0].id], uuid4())
+
+        assert result.processed == [documents[0].id]
+        assert len(repos["audit"].create_many.call_args.args[0]) == 1
+
+    def test_approval_export_writes_outbox_rows(self, repos, documents):
+        ids = [d.id for d in documents]
+        result = _use_case(repos, "shipments").approve(ids, uuid4())
+
+        exports = repos["export"].bulk_create.call_args.args[0]
+        assert result.export_ids == [e.id for e in exports]
+        assert {e.export_status for e in exports} == {ExportStatus.PENDING}
+        assert {e.exported_to for e in exports} == {"shipments"}
+        # Review corrections win over the extracted value
+        assert [e.export_payload["data"]["total"] for e in exports] == [0, 1, 2]
+        # Documents stay REVIEWED until the relay delivers
+        repos["document"].bulk_update_status.assert_not_called()
+        audits = repos["audit"].create_many.call_args.args[0]
+        assert sorted(a.action.value for a in audits) == sorted(["REVIEW"] * 3 + ["EXPORT"] * 3)
+
+    def test_documents_without_extraction_are_not_approved_when_exporting(self, repos, documents):
+        del repos["extraction"].get_latest_by_document_ids.return_value[documents[2].id]
+
+        result = _use_case(repos, "shipments").approve([d.id for d in documents], uuid4())
+
+        assert result.processed == [documents[0].id, documents[1].id]
+        assert result.skipped[0].document_id == documents[2].id
+        assert len(repos["review"].bulk_update.call_args.args[0]) == 2
+        assert len(repos["export"].bulk_create.call_args.args[0]) == 2
+
+    def test_too_many_documents(self, repos):
+        use_case = _use_case(repos)
+        use_case.max_documents = 2
+
+        with pytest.raises(ValueError, match="Too many documents"):
+            use_case.approve([uuid4() for _ in range(3)], uuid4())
+        repos["review"].get_by_document_ids.assert_not_called()
+
+
+class TestBulkRejectAndExport:
+
+    def test_reject_sets_notes(self, repos, documents):
+        result = _use_case(repos).reject([d.id for d in documents], uuid4(), "Wrong consignee")
+
+        reviews = repos["review"].bulk_update.call_args.args[0]
+        assert {r.review_status for r in reviews} == {ReviewStatus.REJECTED}
+        assert {r.review_notes for r in reviews} == {"Wrong consignee"}
+        assert len(result.processed) == 3
+        repos["document"].get_by_ids.assert_not_called()
+
+    def test_export_skips_documents_without_extraction(self, repos, documents):
+        del repos["extraction"].get_latest_by_document_ids.return_value[documents[0].id]
+
+        result = _use_case(repos).export([d.id for d in documents], "shipments", uuid4())
+
+        assert result.processed == [documents[1].id, documents[2].id]
+        assert result.skipped[0].error == "Extraction not found"
+        repos["export"].bulk_create.assert_called_once()
+        assert len(result.export_ids) == 2
+        repos["review"].bulk_update.assert_not_called()
+
+
+def test_count_statements():
+    session = Database("sqlite://").get_session()
+    try:
+        with count_statements(session) as statements:
+            session.execute(text("SELECT 1"))
+            session.execute(text("SELECT 2"))
+        session.execute(text("SELECT 3"))
+        assert statements[0] == 2
+    finally:
+        session.close()
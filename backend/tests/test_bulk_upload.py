@@ -0,0 +1,106 @@
+"""Tests for BulkUploadDocumentsUseCase — streaming ingestion, zip expansion, batch inserts."""
+import io
+import zipfile
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.bulk_upload_documents import BulkUploadDocumentsUseCase
+
+PDF = b"%PDF-1.7\n" + b"x" * 100
+PNG = b"\x89PNG\r\n\x1a\n" + b"y" * 50
+
+
+@pytest.fixture
+def chunked_stored(mock_storage_service, stored, in_memory_storage):
+    """``stored``, with ``upload_stream`` reading the stream in small chunks like the MinIO client does."""
+    def upload_stream(path, stream, length=-1, content_type=None):
+        chunks = []
+        while True:
+            chunk = stream.read(7)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return in_memory_storage.upload_file(path, b"".join(chunks), content_type)
+
+    mock_storage_service.upload_stream.side_effect = upload_stream
+    return stored
+
+
+@pytest.fixture
+def use_case(mock_document_repo, mock_audit_repo, mock_storage_service):
+    mock_document_repo.count_by_filename_prefix.return_value = 0
+    return BulkUploadDocumentsUseCase(
+        document_repository=mock_document_repo,
+        audit_trail_repository=mock_audit_repo,
+        storage_service=mock_storage_service,
+        max_file_size_mb=1,
+    )
+
+
+def _zip(entries) -> io.BytesIO:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+class TestBulkUpload:
+
+    def test_streams_files_and_inserts_batch_once(self, use_case, chunked_stored, mock_document_repo, mock_audit_repo):
+        result = use_case.execute(
+            [("a.pdf", io.BytesIO(PDF)), ("b.png", io.BytesIO(PNG))],
+            uuid4(),
+        )
+
+        assert result.accepted == 2
+        assert result.rejected == []
+        assert sorted(chunked_stored.values()) == sorted([PDF, PNG])
+        mock_document_repo.bulk_create.assert_called_once()
+        assert len(mock_document_repo.bulk_create.call_args.args[0]) == 2
+        mock_audit_repo.create_many.assert_called_once()
+        assert result.total_bytes == len(PDF) + len(PNG)
+
+    def test_zip_entries_expanded(self, use_case, chunked_stored):
+        archive = _zip({"scans/one.pdf": PDF, "two.pdf": PDF, "__MACOSX/._one.pdf": b"junk", "scans/": b""})
+        result = use_case.execute([("batch.zip", archive)], uuid4())
+
+        assert result.accepted == 2
+        assert {d.original_filename for d in result.documents} == {"one.pdf", "two.pdf"}
+
+    def test_invalid_files_rejected_individually(self, use_case, chunked_stored):
+        result = use_case.execute(
+            [
+                ("good.pdf", io.BytesIO(PDF)),
+                ("fake.pdf", io.BytesIO(b"not a pdf at all")),
+                ("notes.txt", io.BytesIO(b"hello")),
+                ("broken.zip", io.BytesIO(b"PK-not-really")),
+            ],
+            uuid4(),
+        )
+
+        assert result.accepted == 1
+        assert {r.filename for r in result.rejected} == {"fake.pdf", "notes.txt", "broken.zip"}
+        assert len(chunked_stored) == 1
+
+    def test_oversized_file_rejected(self, use_case, chunked_stored):
+        big = b"%PDF" + b"z" * (2 * 1024 * 1024)
+        result = use_case.execute([("big.pdf", io.BytesIO(big))], uuid4())
+        assert result.accepted == 0
+        assert "exceeds" in result.rejected[0].error
+
+    def test_duplicate_names_within_batch(self, use_case, chunked_stored):
+        result = use_case.execute(
+            [("inv.pdf", io.BytesIO(PDF)), ("inv.pdf", io.BytesIO(PDF))],
+            uuid4(),
+        )
+        assert [d.original_filename for d in result.documents] == ["inv.pdf", "inv (2).pdf"]
+
+    def test_stored_objects_removed_when_insert_fails(self, use_case, chunked_stored, mock_document_repo, mock_storage_service):
+        mock_document_repo.bulk_create.side_effect = RuntimeError("db down")
+        with pytest.raises(RuntimeError):
+            use_case.execute([("a.pdf", io.BytesIO(PDF))], uuid4())
+        mock_storage_service.delete_file.assert_called_once()
+        assert chunked_stored == {}
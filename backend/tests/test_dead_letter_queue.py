@@ -0,0 +1,59 @@
+"""Tests for dead-letter inspection, requeue and discard."""
+import pytest
+
+from src.infrastructure.error_handling.dead_letter_queue import DeadLetterQueue
+from src.infrastructure.messaging.fair_queue import FairQueue, Lane
+from src.infrastructure.messaging.redis_queue import RedisQueue
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_queue():
+    queue = RedisQueue("redis://localhost:6379/0")
+    queue.redis_client = fakeredis.FakeRedis()
+    return queue
+
+
+@pytest.fixture
+def dlq(redis_queue):
+    dlq = DeadLetterQueue(redis_queue)
+    dlq.enqueue_failed_job("extraction", {"document_id": "d1"}, "OCR failed", 3, lane=Lane.UPLOAD, tenant="u1")
+    dlq.enqueue_failed_job("extraction", {"document_id": "d2"}, "OCR failed", 3, lane=Lane.BULK, tenant="u2")
+    dlq.enqueue_failed_job("previews", {"document_id": "d3"}, "Render failed", 1)
+    return dlq
+
+
+def test_inspection_is_not_destructive(dlq):
+    first = dlq.get_failed_jobs()
+    second = dlq.get_failed_jobs()
+
+    assert first == second
+    assert [e["job_data"]["document_id"] for e in first] == ["d3", "d2", "d1"]
+    assert [e["job_data"]["document_id"] for e in dlq.get_failed_jobs(limit=1, offset=1)] == ["d2"]
+    assert dlq.count() == 3
+
+
+def test_requeue_selected_into_original_lane(dlq, redis_queue):
+    entry_id = dlq.get_failed_jobs()[2]["id"]
+
+    assert dlq.requeue([entry_id]) == 1
+
+    task = FairQueue(redis_queue, "extraction").dequeue()
+    assert (task.lane, task.tenant, task.task) == (Lane.UPLOAD, "u1", {"document_id": "d1"})
+    assert dlq.count() == 2
+
+
+def test_requeue_all(dlq, redis_queue):
+    assert dlq.requeue() == 3
+
+    assert dlq.count() == 0
+    assert FairQueue(redis_queue, "extraction").depths() == {Lane.INTERACTIVE: 0, Lane.UPLOAD: 1, Lane.BULK: 1}
+    assert redis_queue.dequeue_many("previews", 10) == [{"document_id": "d3"}]
+
+
+def test_discard(dlq):
+    entry_id = dlq.get_failed_jobs()[0]["id"]
+
+    assert dlq.discard([entry_id, "unknown"]) == 1
+    assert [e["job_data"]["document_id"] for e in dlq.get_failed_jobs()] == ["d2", "d1"]
@@ -0,0 +1,145 @@
+"""Tests for DirectUploadUseCase — presigned PUT reservation and server-side finalize."""
+import io
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.direct_upload import DirectUploadUseCase
+from src.infrastructure.external.storage.base import StoredFileInfo
+
+PDF = b"%PDF-1.7\n" + b"x" * 100
+
+
+@pytest.fixture
+def use_case(mock_document_repo, mock_audit_repo, mock_storage_service):
+    mock_document_repo.count_by_filename_prefix.return_value = 0
+    mock_document_repo.get_by_id.return_value = None
+    mock_document_repo.create.side_effect = lambda d: d
+    mock_storage_service.presigned_upload_url.return_value = "https://files.example.com/put?sig=1"
+    return DirectUploadUseCase(
+        document_repository=mock_document_repo,
+        audit_trail_repository=mock_audit_repo,
+        storage_service=mock_storage_service,
+        max_file_size_mb=1,
+    )
+
+
+def _stored(storage, data):
+    storage.stat_file.return_value = StoredFileInfo(size=len(data))
+    storage.open_stream.side_effect = lambda path, offset=0, length=None: io.BytesIO(data[offset:offset + length])
+
+
+class TestInitiate:
+
+    def test_reserves_key_and_presigns_put(self, use_case, mock_storage_service):
+        user_id = uuid4()
+        upload = use_case.initiate("../invoice.pdf", len(PDF), user_id)
+
+        path = mock_storage_service.presigned_upload_url.call_args.args[0]
+        assert path == f"uploads/{upload.document_id}/invoice.pdf"
+        assert upload.upload_url.startswith("https://")
+        assert upload.method == "PUT"
+        assert upload.upload_token
+
+    def test_rejects_disallowed_type_and_size(self, use_case, mock_storage_service):
+        with pytest.raises(ValueError, match="not allowed"):
+            use_case.initiate("run.exe", 10, uuid4())
+        with pytest.raises(ValueError, match="exceeds"):
+            use_case.initiate("big.pdf", 2 * 1024 * 1024, uuid4())
+        with pytest.raises(ValueError, match="empty"):
+            use_case.initiate("empty.pdf", 0, uuid4())
+        mock_storage_service.presigned_upload_url.assert_not_called()
+
+    def test_unsupported_backend(self, use_case, mock_storage_service):
+        mock_storage_service.presigned_upload_url.return_value = None
+        with pytest.raises(NotImplementedError):
+            use_case.initiate("invoice.pdf", len(PDF), uuid4())
+
+
+class TestFinalize:
+
+    def test_validates_object_and_creates_document(self, use_case, mock_storage_service, mock_document_repo, mock_audit_repo):
+        user_id = uuid4()
+        upload = use_case.initiate("invoice.pdf", len(PDF), user_id)
+        _stored(mock_storage_service, PDF)
+
+        document = use_case.finalize(upload.upload_token, user_id)
+
+        assert document.id == upload.document_id
+        assert document.file_size == len(PDF)
+        assert document.storage_path == f"{upload.document_id}/invoice.pdf"
+        # Validated and served from a copy the presigned URL cannot overwrite
+        mock_storage_service.copy_file.assert_called_once_with(
+            f"uploads/{upload.document_id}/invoice.pdf", document.storage_path
+        )
+        assert mock_storage_service.open_stream.call_args.args[0] == document.storage_path
+        mock_storage_service.delete_file.assert_called_once_with(f"uploads/{upload.document_id}/invoice.pdf")
+        # Only the head of the object is fetched, not the whole file
+        kwargs = mock_storage_service.open_stream.call_args.kwargs
+        assert kwargs["offset"] == 0 and kwargs["length"] < 16
+        mock_storage_service.download_file.assert_not_called()
+        mock_document_repo.create.assert_called_once()
+        assert mock_audit_repo.create.call_args.args[0].changes["direct"] is True
+
+    def test_size_mismatch_deletes_object(self, use_case, mock_storage_service, mock_document_repo):
+        user_id = uuid4()
+        upload = use_case.initiate("invoice.pdf", len(PDF), user_id)
+        _stored(mock_storage_service, PDF + b"extra")
+
+        with pytest.raises(ValueError, match="does not match declared size"):
+            use_case.finalize(upload.upload_token, user_id)
+        mock_storage_service.copy_file.assert_not_called()
+        deleted = {call.args[0] for call in mock_storage_service.delete_file.call_args_list}
+        assert f"uploads/{upload.document_id}/invoice.pdf" in deleted
+        mock_document_repo.create.assert_not_called()
+
+    def test_overwrite_after_stat_is_caught_on_the_copy(self, use_case, mock_storage_service, mock_document_repo):
+        user_id = uuid4()
+        upload = use_case.initiate("invoice.pdf", len(PDF), user_id)
+        _stored(mock_storage_service, PDF)
+        mock_storage_service.stat_file.side_effect = [StoredFileInfo(size=len(PDF)), StoredFileInfo(size=len(PDF) * 2)]
+
+        with pytest.raises(ValueError, match="does not match declared size"):
+            use_case.finalize(upload.upload_token, user_id)
+        deleted = {call.args[0] for call in mock_storage_service.delete_file.call_args_list}
+        assert deleted == {f"{upload.document_id}/invoice.pdf", f"uploads/{upload.document_id}/invoice.pdf"}
+        mock_document_repo.create.assert_not_called()
+
+    def test_magic_bytes_mismatch_deletes_object(self, use_case, mock_storage_service, mock_document_repo):
+        user_id = uuid4()
+        fake = b"MZ" + b"\x00" * 50
+        upload = use_case.initiate("invoice.pdf", len(fake), user_id)
+        _stored(mock_storage_service, fake)
+
+        with pytest.raises(ValueError, match="does not match extension"):
+            use_case.finalize(upload.upload_token, user_id)
+        assert mock_storage_service.delete_file.call_count == 2
+        mock_document_repo.create.assert_not_called()
+
+    def test_missing_object(self, use_case, mock_storage_service):
+        user_id = uuid4()
+        upload = use_case.initiate("invoice.pdf", len(PDF), user_id)
+        mock_storage_service.stat_file.side_effect = Exception("NoSuchKey")
+
+        with pytest.raises(ValueError, match="not found"):
+            use_case.finalize(upload.upload_token, user_id)
+
+    def test_token_bound_to_uploader(self, use_case, mock_storage_service, mock_document_repo):
+        upload = use_case.initiate("invoice.pdf", len(PDF), uuid4())
+        _stored(mock_storage_service, PDF)
+
+        with pytest.raises(ValueError, match="Invalid or expired"):
+            use_case.finalize(upload.upload_token, uuid4())
+        with pytest.raises(ValueError, match="Invalid or expired"):
+            use_case.finalize("not-a-token", uuid4())
+        mock_document_repo.create.assert_not_called()
+
+    def test_finalize_is_not_repeatable(self, use_case, mock_storage_service, mock_document_repo, sample_document):
+        user_id = uuid4()
+        upload = use_case.initiate("invoice.pdf", len(PDF), user_id)
+        _stored(mock_storage_service, PDF)
+        mock_document_repo.get_by_id.return_value = sample_document
+
+        with pytest.raises(ValueError, match="already finalized"):
+            use_case.finalize(upload.upload_token, user_id)
+        mock_storage_service.delete_file.assert_not_called()
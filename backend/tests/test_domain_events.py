@@ -0,0 +1,84 @@
+"""Tests for domain event recording and commit-gated publishing."""
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.document import DocumentStatus
+from src.domain.events.document_events import DocumentStatusChanged, ExtractionCompleted
+from src.infrastructure.messaging.event_publisher import (
+    DomainEventPublisher,
+    document_channel,
+    stage_domain_events,
+    user_channel,
+)
+from src.infrastructure.persistence.database import Database
+
+
+class TestDocumentEvents:
+
+    def test_update_status_records_event(self, sample_document):
+        sample_document.update_status(DocumentStatus.PROCESSING)
+        events = sample_document.pull_events()
+        assert len(events) == 1
+        assert isinstance(events[0], DocumentStatusChanged)
+        assert events[0].status == "PROCESSING"
+        assert sample_document.pull_events() == []
+
+
+@pytest.fixture
+def database():
+    return Database("sqlite://")
+
+
+@pytest.fixture
+def publisher(database):
+    publisher = DomainEventPublisher(database)
+    publisher.redis_client = MagicMock()
+    return publisher
+
+
+@pytest.fixture
+def session(database, publisher):
+    session = database.get_session()
+    # Repositories stage events after a flush, i.e. inside a transaction
+    session.begin()
+    yield session
+    session.close()
+
+
+def _published(publisher):
+    pipe = publisher.redis_client.pipeline.return_value
+    return [(c.args[0], json.loads(c.args[1])) for c in pipe.publish.call_args_list]
+
+
+class TestPublisher:
+
+    def test_publishes_to_document_and_owner_channels_on_commit(self, publisher, session, sample_document):
+        sample_document.update_status(DocumentStatus.EXTRACTED)
+        stage_domain_events(session, sample_document.uploaded_by, sample_document.pull_events())
+        assert _published(publisher) == []
+
+        session.commit()
+
+        published = _published(publisher)
+        assert [channel for channel, _ in published] == [
+            document_channel(sample_document.id),
+            user_channel(sample_document.uploaded_by),
+        ]
+        assert published[0][1]["type"] == "DocumentStatusChanged"
+        assert published[0][1]["status"] == "EXTRACTED"
+
+    def test_rollback_discards_events(self, publisher, session):
+        event = ExtractionCompleted(document_id=uuid4(), extraction_id=uuid4(), timestamp=None)
+        stage_domain_events(session, uuid4(), [event])
+        session.rollback()
+        session.commit()
+        assert _published(publisher) == []
+
+    def test_redis_failure_does_not_raise(self, publisher, session, sample_document):
+        publisher.redis_client.pipeline.return_value.execute.side_effect = ConnectionError("down")
+        sample_document.update_status(DocumentStatus.EXTRACTED)
+        stage_domain_events(session, sample_document.uploaded_by, sample_document.pull_events())
+        session.commit()
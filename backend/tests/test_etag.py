@@ -0,0 +1,49 @@
+"""Tests for conditional GET helpers (ETag / If-None-Match)."""
+from uuid import uuid4
+
+from starlette.requests import Request
+
+from src.api.etag import make_etag, is_not_modified, not_modified
+
+
+def _request(if_none_match=None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestMakeEtag:
+
+    def test_strong_quoted_and_deterministic(self):
+        document_id = uuid4()
+        etag = make_etag("document", document_id, 2)
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag("document", document_id, 2)
+
+    def test_changes_with_version(self):
+        document_id = uuid4()
+        assert make_etag("document", document_id, 1) != make_etag("document", document_id, 2)
+
+
+class TestIfNoneMatch:
+
+    def test_no_header(self):
+        assert not is_not_modified(_request(), make_etag("x"))
+
+    def test_match(self):
+        etag = make_etag("x")
+        assert is_not_modified(_request(etag), etag)
+
+    def test_mismatch(self):
+        assert not is_not_modified(_request(make_etag("y")), make_etag("x"))
+
+    def test_list_weak_and_wildcard(self):
+        etag = make_etag("x")
+        assert is_not_modified(_request(f'"other", W/{etag}'), etag)
+        assert is_not_modified(_request("*"), etag)
+
+    def test_not_modified_response(self):
+        etag = make_etag("x")
+        response = not_modified(etag)
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.body == b""
@@ -0,0 +1,310 @@
+"""Tests for the TMS export outbox relay, against a local mock TMS server."""
+import asyncio
+from datetime import datetime
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, create_autospec
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases import dispatch_exports as module
+from src.application.use_cases.dispatch_exports import DispatchExportsUseCase
+from src.domain.entities.document import Document, DocumentStatus
+from src.domain.entities.export import Export, ExportStatus
+from src.infrastructure.error_handling.retry import backoff_delay
+from src.infrastructure.external.tms.client import TMSClient
+from src.infrastructure.persistence.repositories import (
+    DocumentRepository, ExportAttemptRepository, ExportRepository,
+)
+
+
+class MockTMS:
+    """HTTP/1.1 TMS stub recording requests; rejects payloads whose data has "reject"."""
+
+    def __init__(self):
+        self.requests = []
+        self.idempotency_keys = []
+        self.fail_status = None
+        tms = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                tms.requests.append((self.path, body, self.client_address[1]))
+                tms.idempotency_keys.append(self.headers.get("Idempotency-Key"))
+                if tms.fail_status:
+                    self._reply(tms.fail_status, {"error": "unavailable"})
+                elif self.path.endswith("/batch"):
+                    self._reply(200, {"results": [
+                        {"status": "error", "error": "bad data"} if item["data"].get("reject") else {"status": "ok"}
+                        for item in body["items"]
+                    ]})
+                else:
+                    self._reply(422 if body["data"].get("reject") else 201, {})
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def connections(self):
+        return {port for _, _, port in self.requests}
+
+
+@pytest.fixture
+def mock_tms():
+    tms = MockTMS()
+    tms.thread.start()
+    yield tms
+    tms.server.shutdown()
+    tms.server.server_close()
+
+
+def _export(endpoint="shipments", **data):
+    return Export(
+        id=uuid4(),
+        document_id=uuid4(),
+        exported_to=endpoint,
+        export_payload={"document_id": "x", "data": data},
+    )
+
+
+@pytest.fixture
+def repos(monkeypatch):
+    export_repo = create_autospec(ExportRepository, instance=True)
+    document_repo = create_autospec(DocumentRepository, instance=True)
+    attempt_repo = create_autospec(ExportAttemptRepository, instance=True)
+
+    def documents_for(ids):
+        return [Document(id=i, original_filename="a.pdf", file_type="pdf", file_size=1,
+                         storage_path="a", uploaded_by=uuid4(), status=DocumentStatus.REVIEWED) for i in ids]
+
+    document_repo.get_by_ids.side_effect = documents_for
+    monkeypatch.setattr(module, "ExportRepository", lambda session: export_repo)
+    monkeypatch.setattr(module, "DocumentRepository", lambda session: document_repo)
+    monkeypatch.setattr(module, "ExportAttemptRepository", lambda session: attempt_repo)
+    export_repo.attempts = attempt_repo
+    return export_repo, document_repo
+
+
+def _dispatch(tms_url, exports, export_repo, batch_size=1, concurrency=4, max_connections=4, max_attempts=5):
+    export_repo.claim_due.return_value = exports
+    session = MagicMock()
+
+    async def run():
+        async with TMSClient(api_url=tms_url, batch_size=batch_size, max_connections=max_connections) as client:
+            use_case = DispatchExportsUseCase(lambda: session, client, concurrency=concurrency, max_attempts=max_attempts)
+            return await use_case.execute(limit=100)
+
+    return asyncio.run(run()), session
+
+
+class TestDispatchExports:
+
+    def test_single_posts_reuse_pooled_connections(self, mock_tms, repos):
+        export_repo, document_repo = repos
+        exports = [_export() for _ in range(20)]
+        counts, session = _dispatch(mock_tms.url, exports, export_repo, concurrency=2, max_connections=2)
+
+        assert counts == {"success": 20, "retry": 0, "failed": 0}
+        assert len(mock_tms.requests) == 20
+        assert all(path == "/api/shipments" for path, _, _ in mock_tms.requests)
+        assert len(mock_tms.connections) <= 2
+        # Lease committed before sending, results in a second transaction
+        assert session.commit.call_count == 2
+
+    def test_batches_per_endpoint(self, mock_tms, repos):
+        export_repo, _ = repos
+        exports = [_export("shipments") for _ in range(5)] + [_export("invoices") for _ in range(2)]
+        counts, _ = _dispatch(mock_tms.url, exports, export_repo, batch_size=3)
+
+        assert counts["success"] == 7
+        sizes = sorted((path, len(body["items"])) for path, body, _ in mock_tms.requests)
+        assert sizes == [("/api/invoices/batch", 2), ("/api/shipments/batch", 2), ("/api/shipments/batch", 3)]
+
+    def test_statuses_written_in_bulk(self, mock_tms, repos):
+        export_repo, document_repo = repos
+        exports = [_export(), _export(reject=True), _export()]
+        counts, _ = _dispatch(mock_tms.url, exports, export_repo, batch_size=10)
+
+        assert counts == {"success": 2, "retry": 0, "failed": 1}
+        export_repo.bulk_update.assert_called_once()
+        written = export_repo.bulk_update.call_args.args[0]
+        assert [e.export_status for e in written] == [ExportStatus.SUCCESS, ExportStatus.FAILED, ExportStatus.SUCCESS]
+        assert written[1].retry_count == 1
+        assert written[1].error_message == "bad data"
+
+        document_repo.bulk_update_status.assert_called_once()
+        documents = document_repo.bulk_update_status.call_args.args[0]
+        assert {d.id for d in documents} == {exports[0].document_id, exports[2].document_id}
+        assert all(d.status == DocumentStatus.EXPORTED for d in documents)
+
+    def test_transient_errors_are_rescheduled_with_backoff(self, mock_tms, repos):
+        export_repo, document_repo = repos
+        mock_tms.fail_status = 503
+        exports = [_export() for _ in range(3)]
+        before = datetime.utcnow()
+        counts, _ = _dispatch(mock_tms.url, exports, export_repo)
+
+        assert counts == {"success": 0, "retry": 3, "failed": 0}
+        written = export_repo.bulk_update.call_args.args[0]
+        assert all(e.export_status == ExportStatus.PENDING for e in written)
+        assert all(e.retry_count == 1 for e in written)
+        assert "503" in written[0].error_message
+        delay = (written[0].next_attempt_at - before).total_seconds()
+        assert module.EXPORT_RETRY_INITIAL_DELAY <= delay <= module.EXPORT_RETRY_INITIAL_DELAY * 1.25 + 1
+        document_repo.get_by_ids.assert_not_called()
+
+    def test_exports_out_of_attempts_fail(self, mock_tms, repos):
+        export_repo, _ = repos
+        mock_tms.fail_status = 503
+        export = _export()
+        export.retry_count = 4
+        counts, _ = _dispatch(mock_tms.url, [export], export_repo, max_attempts=5)
+
+        assert counts == {"success": 0, "retry": 0, "failed": 1}
+        assert export.export_status == ExportStatus.FAILED
+        assert export.retry_count == 5
+
+    def test_exports_whose_leases_used_up_the_attempts_fail_unsent(self, mock_tms, repos):
+        export_repo, _ = repos
+        exhausted, fresh = _export(), _export()
+        # Counted at each claim; the results of those deliveries were never recorded
+        exhausted.retry_count = 5
+        counts, _ = _dispatch(mock_tms.url, [exhausted, fresh], export_repo, max_attempts=5)
+
+        assert counts == {"success": 1, "retry": 0, "failed": 1}
+        assert mock_tms.idempotency_keys == [str(fresh.id)]
+        assert exhausted.export_status == ExportStatus.FAILED
+        assert exhausted.error_message == module.LEASES_EXHAUSTED_ERROR
+
+    def test_client_errors_are_permanent(self, mock_tms, repos):
+        export_repo, _ = repos
+        counts, _ = _dispatch(mock_tms.url, [_export(reject=True)], export_repo)
+        assert counts == {"success": 0, "retry": 0, "failed": 1}
+
+    def test_attempts_recorded_in_one_insert(self, mock_tms, repos):
+        export_repo, _ = repos
+        exports = [_export(), _export(reject=True)]
+        exports[1].retry_count = 2
+        _dispatch(mock_tms.url, exports, export_repo)
+
+        export_repo.attempts.bulk_create.assert_called_once()
+        attempts = export_repo.attempts.bulk_create.call_args.args[0]
+        assert [(a.export_id, a.attempt, a.success, a.status_code) for a in attempts] == [
+            (exports[0].id, 1, True, 201),
+            (exports[1].id, 3, False, 422),
+        ]
+
+    def test_claim_leases_exports_past_the_batch(self, mock_tms, repos):
+        export_repo, _ = repos
+        before = datetime.utcnow()
+        _dispatch(mock_tms.url, [_export()], export_repo)
+
+        limit, lease_until = export_repo.claim_due.call_args.args
+        assert (lease_until - before).total_seconds() >= module.EXPORT_LEASE_SECONDS - 1
+
+    def test_exports_carry_idempotency_keys(self, mock_tms, repos):
+        export_repo, _ = repos
+        exports = [_export() for _ in range(3)]
+        _dispatch(mock_tms.url, exports, export_repo)
+        assert sorted(mock_tms.idempotency_keys) == sorted(str(e.id) for e in exports)
+
+        mock_tms.requests.clear()
+        _dispatch(mock_tms.url, exports, export_repo, batch_size=10)
+        (_, body, _), = mock_tms.requests
+        assert [item["idempotency_key"] for item in body["items"]] == [str(e.id) for e in exports]
+
+    def test_nothing_due(self, mock_tms, repos):
+        export_repo, _ = repos
+        counts, session = _dispatch(mock_tms.url, [], export_repo)
+        assert counts == {"success": 0, "retry": 0, "failed": 0}
+        assert mock_tms.requests == []
+        export_repo.bulk_update.assert_not_called()
+        session.commit.assert_called_once()
+
+
+class TestBackoffDelay:
+
+    def test_exponential_and_capped(self):
+        assert [backoff_delay(n, 30, 3600, jitter=False) for n in (1, 2, 3)] == [30, 60, 120]
+        assert backoff_delay(20, 30, 3600) == 3600
+        assert 30 <= backoff_delay(1, 30, 3600) <= 37.5
+
+
+class TestApprovalOutbox:
+
+    @pytest.fixture
+    def review_repos(self, sample_document, sample_extraction):
+        from src.domain.entities.review import Review
+        from src.infrastructure.persistence.repositories import (
+            AuditTrailRepository, ExtractionRepository, ReviewRepository, ValidationResultRepository,
+        )
+        repos = {
+            "document": create_autospec(DocumentRepository, instance=True),
+            "extraction": create_autospec(ExtractionRepository, instance=True),
+            "review": create_autospec(ReviewRepository, instance=True),
+            "audit": create_autospec(AuditTrailRepository, instance=True),
+            "validation": create_autospec(ValidationResultRepository, instance=True),
+            "export": create_autospec(ExportRepository, instance=True),
+        }
+        sample_document.status = DocumentStatus.REVIEWED
+        repos["document"].get_by_id.return_value = sample_document
+        repos["extraction"].get_by_document_id.return_value = sample_extraction
+        review = Review(id=uuid4(), document_id=sample_document.id, reviewed_by=uuid4(), corrections={"x": 1})
+        repos["review"].get_by_document_id.return_value = review
+        repos["review"].update.side_effect = lambda r: r
+        repos["export"].create.side_effect = lambda e: e
+        return repos
+
+    def _use_case(self, repos, approval_export_to):
+        from src.application.use_cases.export_to_tms import ExportToTMSUseCase
+        from src.application.use_cases.review_document import ReviewDocumentUseCase
+        export_use_case = ExportToTMSUseCase(
+            document_repository=repos["document"],
+            extraction_repository=repos["extraction"],
+            review_repository=repos["review"],
+            export_repository=repos["export"],
+            audit_trail_repository=repos["audit"],
+            dispatch_async=True,
+        )
+        return ReviewDocumentUseCase(
+            document_repository=repos["document"],
+            extraction_repository=repos["extraction"],
+            review_repository=repos["review"],
+            audit_trail_repository=repos["audit"],
+            validation_result_repository=repos["validation"],
+            export_use_case=export_use_case,
+            approval_export_to=approval_export_to,
+        )
+
+    def test_approval_writes_pending_export(self, review_repos, sample_document):
+        self._use_case(review_repos, "shipments").approve(sample_document.id, uuid4())
+
+        export = review_repos["export"].create.call_args.args[0]
+        assert export.export_status == ExportStatus.PENDING
+        assert export.exported_to == "shipments"
+        assert export.export_payload["data"]["x"] == 1
+        # EXPORTED only once the relay has delivered it
+        assert sample_document.status == DocumentStatus.REVIEWED
+
+    def test_without_approval_export_pipeline_completes(self, review_repos, sample_document):
+        self._use_case(review_repos, "").approve(sample_document.id, uuid4())
+
+        review_repos["export"].create.assert_not_called()
+        assert sample_document.status == DocumentStatus.EXPORTED
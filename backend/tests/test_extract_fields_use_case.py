@@ -5,12 +5,16 @@ from uuid import uuid4
 import pytest
 
 from src.application.use_cases.extract_fields import ExtractFieldsUseCase
+from src.application.use_cases.validate_data import ValidateDataUseCase
 from src.domain.entities.document import Document, DocumentStatus, DocumentType
 from src.domain.entities.extraction import ExtractionMethod
+from src.domain.entities.validation_result import ValidationStatus
+from src.domain.events.document_events import ValidationCompleted
 from src.domain.services.document_type_classifier import DocumentTypeClassifier
 from src.domain.value_objects.classification_result import ClassificationResult
 from src.infrastructure.external.llm.base import LLMExtractionResult
 from src.infrastructure.external.ocr.base import OCRResult
+from src.infrastructure.persistence.repositories import ValidationResultRepository
 
 
 @pytest.fixture
@@ -212,3 +216,77 @@ class TestFailurePath:
         assert dto is not None
         assert dto.structured_data == {}
         assert sample_document.status == DocumentStatus.EXTRACTED
+
+
+class TestChainedValidation:
+
+    @pytest.fixture
+    def mock_validation_repo(self):
+        repo = create_autospec(ValidationResultRepository, instance=True)
+        repo.create.side_effect = lambda r: r
+        return repo
+
+    @pytest.fixture
+    def chained_use_case(
+        self,
+        mock_document_repo,
+        mock_extraction_repo,
+        mock_audit_repo,
+        mock_validation_repo,
+        mock_ocr_service,
+        mock_llm_service,
+        mock_storage_service,
+        classifier,
+        validation_engine,
+    ):
+        return ExtractFieldsUseCase(
+            document_repository=mock_document_repo,
+            extraction_repository=mock_extraction_repo,
+            audit_trail_repository=mock_audit_repo,
+            ocr_service=mock_ocr_service,
+            llm_service=mock_llm_service,
+            storage_service=mock_storage_service,
+            document_type_classifier=classifier,
+            validate_data_use_case=ValidateDataUseCase(
+                document_repository=mock_document_repo,
+                extraction_repository=mock_extraction_repo,
+                validation_result_repository=mock_validation_repo,
+                validation_engine=validation_engine,
+            ),
+        )
+
+    def test_validates_in_memory_and_ends_validated(
+        self,
+        chained_use_case,
+        mock_document_repo,
+        mock_extraction_repo,
+        mock_validation_repo,
+        mock_storage_service,
+        mock_ocr_service,
+        mock_llm_service,
+        sample_document,
+        sample_ocr_result,
+        sample_llm_result,
+    ):
+        _setup_happy_path(
+            mock_document_repo,
+            mock_extraction_repo,
+            mock_storage_service,
+            mock_ocr_service,
+            mock_llm_service,
+            sample_document,
+            sample_ocr_result,
+            sample_llm_result,
+        )
+        dto = chained_use_case.execute(sample_document.id)
+
+        assert sample_document.status == DocumentStatus.VALIDATED
+        result = mock_validation_repo.create.call_args.args[0]
+        assert result.extraction_id == dto.id
+        assert result.validation_status == ValidationStatus.PASSED
+        # No re-read of the document/extraction, and one save for both stages
+        mock_document_repo.get_by_id.assert_called_once()
+        mock_extraction_repo.get_by_document_id.assert_not_called()
+        assert mock_document_repo.update.call_count == 2
+        events = sample_document.pull_events()
+        assert any(isinstance(e, ValidationCompleted) for e in events)
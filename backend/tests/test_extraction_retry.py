@@ -0,0 +1,229 @@
+"""Tests for checkpointed extraction stages and retries rescheduled on the queue."""
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases import trigger_extraction
+from src.application.use_cases.extract_fields import ExtractFieldsUseCase
+from src.application.use_cases.trigger_extraction import TriggerExtractionUseCase
+from src.domain.entities.document import DocumentStatus
+from src.infrastructure.external.storage.extraction_checkpoints import ExtractionCheckpointStore
+from src.infrastructure.messaging.fair_queue import FairQueue, Lane
+from src.infrastructure.messaging.redis_queue import RedisQueue
+from src.infrastructure.messaging.serialization import decode_message
+
+
+@pytest.fixture
+def use_case(
+    mock_document_repo,
+    mock_extraction_repo,
+    mock_audit_repo,
+    mock_ocr_service,
+    mock_llm_service,
+    mock_storage_service,
+    classifier,
+    sample_document,
+    sample_ocr_result,
+    sample_llm_result,
+    stored,
+):
+    stored[sample_document.storage_path] = b"%PDF-fake"
+    mock_document_repo.get_by_id.return_value = sample_document
+    mock_ocr_service.extract_text_from_bytes.return_value = sample_ocr_result
+    mock_llm_service.extract_fields.return_value = sample_llm_result
+    mock_extraction_repo.create.side_effect = lambda e: e
+    return ExtractFieldsUseCase(
+        document_repository=mock_document_repo,
+        extraction_repository=mock_extraction_repo,
+        audit_trail_repository=mock_audit_repo,
+        ocr_service=mock_ocr_service,
+        llm_service=mock_llm_service,
+        storage_service=mock_storage_service,
+        document_type_classifier=classifier,
+        checkpoint_store=ExtractionCheckpointStore(mock_storage_service),
+    )
+
+
+class TestCheckpoints:
+
+    def test_success_writes_no_checkpoints(self, use_case, sample_document, stored):
+        use_case.execute(sample_document.id)
+
+        assert not [key for key in stored if "/checkpoints/" in key]
+
+    def test_persist_failure_resumes_without_ocr_or_llm(
+        self, use_case, sample_document, mock_extraction_repo, mock_ocr_service, mock_llm_service, mock_storage_service,
+    ):
+        mock_extraction_repo.create.side_effect = ConnectionError("database connection lost")
+        with pytest.raises(ConnectionError):
+            use_case.execute(sample_document.id)
+        mock_extraction_repo.create.side_effect = lambda e: e
+        mock_ocr_service.reset_mock()
+        mock_llm_service.reset_mock()
+        mock_storage_service.download_file.reset_mock()
+
+        dto = use_case.execute(sample_document.id, resume=True)
+
+        mock_ocr_service.extract_text_from_bytes.assert_not_called()
+        mock_llm_service.extract_fields.assert_not_called()
+        downloaded = [call.args[0] for call in mock_storage_service.download_file.call_args_list]
+        assert sample_document.storage_path not in downloaded
+        assert dto.structured_data["shipper_name"] == "Acme Corp"
+        assert dto.extraction_metadata["resumed_stages"] == ["classify", "llm", "ocr"]
+        assert sample_document.status == DocumentStatus.EXTRACTED
+
+    def test_transient_llm_error_resumes_at_llm(
+        self, use_case, sample_document, sample_llm_result, mock_ocr_service, mock_llm_service,
+    ):
+        mock_llm_service.extract_fields.side_effect = TimeoutError("LLM request timeout")
+        with pytest.raises(TimeoutError):
+            use_case.execute(sample_document.id, retry_llm_errors=True)
+        mock_llm_service.extract_fields.side_effect = None
+        mock_ocr_service.reset_mock()
+
+        dto = use_case.execute(sample_document.id, resume=True, retry_llm_errors=True)
+
+        mock_ocr_service.extract_text_from_bytes.assert_not_called()
+        assert mock_llm_service.extract_fields.call_count == 2
+        assert dto.raw_text.startswith("CMR CONSIGNMENT NOTE")
+        assert dto.extraction_metadata["resumed_stages"] == ["classify", "ocr"]
+
+    def test_ocr_only_fallback_is_not_checkpointed(
+        self, use_case, sample_document, mock_extraction_repo, mock_llm_service, stored,
+    ):
+        mock_llm_service.extract_fields.side_effect = ValueError("unparseable LLM output")
+        mock_extraction_repo.create.side_effect = ConnectionError("database connection lost")
+        with pytest.raises(ConnectionError):
+            use_case.execute(sample_document.id)
+
+        checkpointed = sorted(key.rsplit("/", 1)[1] for key in stored if "/checkpoints/" in key)
+        assert checkpointed == ["classify.json.gz", "ocr.json.gz"]
+
+    def test_fresh_attempt_ignores_checkpoints(self, use_case, sample_document, mock_extraction_repo, mock_ocr_service):
+        mock_extraction_repo.create.side_effect = ConnectionError("database connection lost")
+        with pytest.raises(ConnectionError):
+            use_case.execute(sample_document.id)
+        mock_extraction_repo.create.side_effect = lambda e: e
+
+        use_case.execute(sample_document.id)
+
+        assert mock_ocr_service.extract_text_from_bytes.call_count == 2
+
+
+@pytest.fixture
+def redis_queue():
+    fakeredis = pytest.importorskip("fakeredis")
+    queue = RedisQueue("redis://localhost:6379/0")
+    queue.redis_client = fakeredis.FakeRedis()
+    return queue
+
+
+@pytest.fixture
+def failing_extraction(monkeypatch, redis_queue):
+    """ExtractFieldsUseCase stand-in raising the errors in ``errors`` (one per attempt), then succeeding."""
+    errors = []
+    calls = []
+
+    class FakeExtractFields:
+        def __init__(self, **kwargs):
+            pass
+
+        def execute(self, document_id, resume=False, retry_llm_errors=False):
+            calls.append(resume)
+            if errors:
+                raise errors.pop(0)
+
+        def delete_stale_artifacts(self):
+            pass
+
+        def discard_new_artifact(self):
+            pass
+
+    monkeypatch.setattr(trigger_extraction, "ExtractFieldsUseCase", FakeExtractFields)
+    monkeypatch.setattr(trigger_extraction, "RedisQueue", lambda url: redis_queue)
+    return errors, calls
+
+
+def _trigger(retry_queue=None):
+    return TriggerExtractionUseCase(
+        database=MagicMock(),
+        storage_service=MagicMock(),
+        ocr_service=MagicMock(),
+        llm_service=MagicMock(),
+        document_type_classifier=MagicMock(),
+        checkpoint_store=MagicMock(),
+        retry_queue=retry_queue,
+    )
+
+
+class TestRetryScheduling:
+
+    def test_transient_failure_is_rescheduled_not_slept(self, failing_extraction, redis_queue, monkeypatch):
+        errors, calls = failing_extraction
+        errors.append(ConnectionError("LLM connection reset"))
+        monkeypatch.setattr(trigger_extraction.time, "sleep", MagicMock(side_effect=AssertionError("slept")))
+        queue = FairQueue(redis_queue, "extraction")
+        document_id = uuid4()
+
+        _trigger(queue).execute(document_id, Lane.UPLOAD, "u1")
+
+        assert calls == [False]
+        assert queue.delayed() == 1
+        member, _ = redis_queue.redis_client.zrange("extraction:delayed", 0, 0, withscores=True)[0]
+        entry = decode_message(member)
+        assert (entry["lane"], entry["tenant"]) == ("upload", "u1")
+        assert decode_message(entry["job"].encode()) == {"document_id": str(document_id), "attempt": 1}
+
+    def test_retry_job_resumes_and_clears_checkpoints(self, failing_extraction):
+        errors, calls = failing_extraction
+        use_case = _trigger()
+        document_id = uuid4()
+
+        use_case.execute(document_id, attempt=1)
+
+        assert calls == [True]
+        use_case.checkpoint_store.clear.assert_called_once_with(document_id)
+
+    def test_first_attempt_success_clears_checkpoints(self, failing_extraction):
+        use_case = _trigger()
+        document_id = uuid4()
+
+        use_case.execute(document_id)
+
+        use_case.checkpoint_store.clear.assert_called_once_with(document_id)
+
+    def test_without_queue_retries_in_process(self, failing_extraction, monkeypatch):
+        errors, calls = failing_extraction
+        errors += [TimeoutError("timeout"), TimeoutError("timeout")]
+        monkeypatch.setattr(trigger_extraction.time, "sleep", lambda seconds: None)
+
+        _trigger().execute(uuid4())
+
+        assert calls == [False, True, True]
+
+    def test_exhausted_retries_go_to_dlq(self, failing_extraction, redis_queue):
+        errors, calls = failing_extraction
+        errors.append(TimeoutError("timeout"))
+        queue = FairQueue(redis_queue, "extraction")
+        use_case = _trigger(queue)
+        document_id = uuid4()
+
+        use_case.execute(document_id, Lane.BULK, "u1", attempt=trigger_extraction.MAX_RETRIES)
+
+        assert queue.delayed() == 0
+        entry = decode_message(redis_queue.redis_client.lindex("dlq", 0))
+        assert entry["job_data"] == {"document_id": str(document_id)}
+        assert entry["retry_count"] == trigger_extraction.MAX_RETRIES
+        use_case.checkpoint_store.clear.assert_called_once_with(document_id)
+
+    def test_permanent_error_is_not_retried(self, failing_extraction, redis_queue):
+        errors, calls = failing_extraction
+        errors.append(ValueError("Document not found"))
+        queue = FairQueue(redis_queue, "extraction")
+
+        _trigger(queue).execute(uuid4(), Lane.UPLOAD, "u1")
+
+        assert calls == [False]
+        assert queue.delayed() == 0
+        assert redis_queue.redis_client.llen("dlq") == 1
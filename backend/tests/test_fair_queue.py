@@ -0,0 +1,184 @@
+"""Tests for the priority-lane, per-tenant fair queue."""
+import time
+from collections import Counter
+
+import pytest
+
+from src.infrastructure.messaging import fair_queue
+from src.infrastructure.messaging.fair_queue import FairQueue, Lane, parse_weights
+from src.infrastructure.messaging.redis_queue import RedisQueue
+from src.infrastructure.messaging.serialization import decode_message
+from src.infrastructure.monitoring.metrics import queue_depth
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_queue():
+    queue = RedisQueue("redis://localhost:6379/0")
+    queue.redis_client = fakeredis.FakeRedis()
+    return queue
+
+
+def _drain(queue, count):
+    return [queue.dequeue() for _ in range(count)]
+
+
+class TestLanes:
+
+    def test_interactive_jumps_the_backlog(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction")
+        queue.enqueue_many(Lane.BULK, "acme", [{"n": i} for i in range(500)])
+        queue.enqueue(Lane.INTERACTIVE, "reviewer", {"n": "retry"})
+
+        first = queue.dequeue()
+
+        assert first.lane == Lane.INTERACTIVE
+        assert first.task == {"n": "retry"}
+
+    def test_lanes_share_by_weight_without_starving_bulk(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction", lane_weights={"upload": 3, "bulk": 1})
+        queue.enqueue_many(Lane.UPLOAD, "a", [{"n": i} for i in range(100)])
+        queue.enqueue_many(Lane.BULK, "a", [{"n": i} for i in range(100)])
+
+        lanes = Counter(t.lane for t in _drain(queue, 40))
+
+        assert lanes == {Lane.UPLOAD: 30, Lane.BULK: 10}
+
+    def test_fifo_within_a_tenant(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction")
+        queue.enqueue_many(Lane.UPLOAD, "a", [{"n": i} for i in range(5)])
+
+        assert [t.task["n"] for t in _drain(queue, 5)] == [0, 1, 2, 3, 4]
+        assert queue.dequeue() is None
+
+
+class TestTenants:
+
+    def test_big_tenant_does_not_starve_others(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction")
+        queue.enqueue_many(Lane.BULK, "big", [{"n": i} for i in range(2000)])
+        queue.enqueue_many(Lane.BULK, "small", [{"n": i} for i in range(3)])
+
+        tenants = [t.tenant for t in _drain(queue, 6)]
+
+        assert tenants.count("small") == 3
+
+    def test_weighted_share(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction", tenant_weights={"gold": 3})
+        queue.enqueue_many(Lane.BULK, "gold", [{"n": i} for i in range(100)])
+        queue.enqueue_many(Lane.BULK, "basic", [{"n": i} for i in range(100)])
+
+        tenants = Counter(t.tenant for t in _drain(queue, 40))
+
+        assert tenants == {"gold": 30, "basic": 10}
+
+    def test_idle_tenant_does_not_bank_credit(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction")
+        queue.enqueue(Lane.BULK, "early", {"n": 0})
+        queue.dequeue()
+        queue.enqueue_many(Lane.BULK, "busy", [{"n": i} for i in range(50)])
+        _drain(queue, 40)
+        # Rejoins at the lane's clock instead of being owed 40 slots
+        queue.enqueue_many(Lane.BULK, "early", [{"n": i} for i in range(10)])
+
+        tenants = [t.tenant for t in _drain(queue, 4)]
+
+        assert tenants.count("busy") == 2
+
+
+class TestDepth:
+
+    def test_depth_per_lane_on_gauge(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction")
+        queue.enqueue_many(Lane.BULK, "a", [{"n": i} for i in range(4)])
+        queue.enqueue(Lane.UPLOAD, "b", {"n": 0})
+        queue.dequeue()
+
+        depths = queue.report_depths()
+
+        assert depths == {Lane.INTERACTIVE: 0, Lane.UPLOAD: 0, Lane.BULK: 4}
+        assert queue_depth.labels(queue_name="extraction:bulk")._value.get() == 4
+
+    def test_blocking_dequeue_times_out(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction")
+
+        assert queue.dequeue(timeout=1) is None
+
+
+def test_parse_weights():
+    assert parse_weights("interactive=16, bulk=0.5,") == {"interactive": 16.0, "bulk": 0.5}
+    assert parse_weights(None) == {}
+    with pytest.raises(ValueError):
+        parse_weights("bulk=0")
+
+
+class TestLeases:
+
+    def test_acked_task_is_gone(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction")
+        queue.enqueue(Lane.UPLOAD, "a", {"n": 0})
+
+        task = queue.dequeue()
+
+        assert queue.in_flight() == 1
+        assert queue.ack(task) is True
+        assert queue.in_flight() == 0
+        assert queue.reclaim() == (0, 0)
+        assert queue.ack(task) is False
+
+    def test_expired_lease_is_requeued_first(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction", visibility_timeout=-1)
+        queue.enqueue_many(Lane.UPLOAD, "a", [{"n": 0}, {"n": 1}])
+        lost = queue.dequeue()  # worker dies
+
+        assert queue.reclaim() == (1, 0)
+        again = queue.dequeue()
+
+        assert again.task == lost.task == {"n": 0}
+        assert again.deliveries == 2
+        assert queue.depths()[Lane.UPLOAD] == 1
+
+    def test_live_lease_is_not_reclaimed(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction", visibility_timeout=60)
+        queue.enqueue(Lane.UPLOAD, "a", {"n": 0})
+        task = queue.dequeue()
+
+        assert queue.extend(task) is True
+        assert queue.reclaim() == (0, 0)
+        assert queue.dequeue() is None
+
+    def test_poison_job_is_dead_lettered(self, redis_queue):
+        queue = FairQueue(redis_queue, "extraction", visibility_timeout=-1, max_deliveries=2)
+        queue.enqueue(Lane.BULK, "acme", {"document_id": "d1"})
+
+        queue.dequeue()
+        assert queue.reclaim() == (1, 0)
+        queue.dequeue()
+        assert queue.reclaim() == (0, 1)
+
+        assert queue.dequeue() is None
+        entry = decode_message(redis_queue.redis_client.lindex("dlq", 0))
+        assert entry["job_data"] == {"document_id": "d1"}
+        assert (entry["original_queue"], entry["lane"], entry["tenant"]) == ("extraction", "bulk", "acme")
+        assert entry["retry_count"] == 2
+
+
+class TestDelayed:
+
+    def test_delayed_task_waits_until_due(self, redis_queue, monkeypatch):
+        queue = FairQueue(redis_queue, "extraction")
+        queue.enqueue_delayed(Lane.UPLOAD, "a", {"n": "retry"}, delay=60)
+        queue.enqueue(Lane.UPLOAD, "a", {"n": 0})
+
+        assert queue.dequeue().task == {"n": 0}
+        assert queue.dequeue() is None
+        assert queue.delayed() == 1
+
+        now = time.time()
+        monkeypatch.setattr(fair_queue.time, "time", lambda: now + 61)
+        task = queue.dequeue()
+
+        assert (task.lane, task.tenant, task.task) == (Lane.UPLOAD, "a", {"n": "retry"})
+        assert queue.delayed() == 0
+        assert queue.depths()[Lane.UPLOAD] == 0
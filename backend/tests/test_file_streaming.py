@@ -0,0 +1,83 @@
+"""Tests for streamed, range-capable file downloads."""
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from src.api.streaming import parse_range, stream_file
+from src.infrastructure.external.storage.base import StorageService, StoredFileInfo
+
+DATA = bytes(range(256)) * 40  # 10 KiB
+
+
+@pytest.fixture
+def client(in_memory_storage):
+    in_memory_storage.objects["doc/file.pdf"] = DATA
+    app = FastAPI()
+
+    @app.get("/file")
+    def get_file(request: Request, inline: bool = False):
+        return stream_file(in_memory_storage, "doc/file.pdf", "scan 1.pdf", "pdf", request.headers.get("range"), inline)
+
+    return TestClient(app)
+
+
+class TestParseRange:
+
+    @pytest.mark.parametrize("header,expected", [
+        (None, None),
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+        ("bytes=abc-", None),
+    ])
+    def test_parse(self, header, expected):
+        assert parse_range(header, 1000) == expected
+
+    def test_unsatisfiable(self):
+        with pytest.raises(HTTPException) as exc:
+            parse_range("bytes=1000-", 1000)
+        assert exc.value.status_code == 416
+        assert exc.value.headers["Content-Range"] == "bytes */1000"
+
+
+class TestStorageDefaults:
+
+    def test_iter_chunks_respects_range_and_chunk_size(self, in_memory_storage):
+        in_memory_storage.objects["k"] = DATA
+        chunks = list(in_memory_storage.iter_chunks("k", offset=10, length=2500, chunk_size=1000))
+        assert [len(c) for c in chunks] == [1000, 1000, 500]
+        assert b"".join(chunks) == DATA[10:2510]
+
+    def test_stat_file(self, in_memory_storage):
+        in_memory_storage.objects["k"] = DATA
+        # The default, not the fake's override
+        assert StorageService.stat_file(in_memory_storage, "k") == StoredFileInfo(size=len(DATA))
+
+
+class TestStreamFile:
+
+    def test_full_download(self, client):
+        response = client.get("/file")
+        assert response.status_code == 200
+        assert response.content == DATA
+        assert response.headers["content-length"] == str(len(DATA))
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-disposition"].startswith("attachment; filename*=UTF-8''scan%201.pdf")
+
+    def test_range_request(self, client):
+        response = client.get("/file", headers={"Range": "bytes=100-199"})
+        assert response.status_code == 206
+        assert response.content == DATA[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(DATA)}"
+        assert response.headers["content-length"] == "100"
+
+    def test_inline(self, client):
+        assert client.get("/file?inline=true").headers["content-disposition"].startswith("inline")
+
+    def test_unsatisfiable_range(self, client):
+        assert client.get("/file", headers={"Range": f"bytes={len(DATA)}-"}).status_code == 416
@@ -0,0 +1,188 @@
+"""Tests for OCRArtifactStore and raw-text offloading in ExtractFieldsUseCase."""
+import gzip
+import json
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.extract_fields import ExtractFieldsUseCase
+from src.infrastructure.external.storage.ocr_artifacts import OCRArtifactStore
+
+
+class TestOCRArtifactStore:
+
+    def test_round_trip(self, mock_storage_service, stored, sample_ocr_result):
+        store = OCRArtifactStore(mock_storage_service)
+        document_id, extraction_id = uuid4(), uuid4()
+
+        key = store.save(document_id, extraction_id, sample_ocr_result)
+
+        assert key == f"{document_id}/ocr/{extraction_id}.json.gz"
+        artifact = store.load(key)
+        assert artifact["text"] == sample_ocr_result.text
+        assert artifact["layout"] == sample_ocr_result.layout
+        assert store.load_text(key) == sample_ocr_result.text
+
+    def test_artifact_is_gzip_json(self, mock_storage_service, stored, sample_ocr_result):
+        key = OCRArtifactStore(mock_storage_service).save(uuid4(), uuid4(), sample_ocr_result)
+        payload = json.loads(gzip.decompress(stored[key]))
+        assert set(payload) == {"text", "layout", "regions"}
+
+
+class TestExtractionOffload:
+
+    def test_raw_text_replaced_by_key(
+        self,
+        mock_document_repo,
+        mock_extraction_repo,
+        mock_audit_repo,
+        mock_ocr_service,
+        mock_llm_service,
+        mock_storage_service,
+        stored,
+        classifier,
+        sample_document,
+        sample_ocr_result,
+        sample_llm_result,
+    ):
+        mock_document_repo.get_by_id.return_value = sample_document
+        mock_ocr_service.extract_text_from_bytes.return_value = sample_ocr_result
+        mock_llm_service.extract_fields.return_value = sample_llm_result
+        mock_extraction_repo.create.side_effect = lambda e: e
+        stored[sample_document.storage_path] = b"%PDF-fake"
+
+        store = OCRArtifactStore(mock_storage_service)
+        use_case = ExtractFieldsUseCase(
+            document_repository=mock_document_repo,
+            extraction_repository=mock_extraction_repo,
+            audit_trail_repository=mock_audit_repo,
+            ocr_service=mock_ocr_service,
+            llm_service=mock_llm_service,
+            storage_service=mock_storage_service,
+            document_type_classifier=classifier,
+            ocr_artifact_store=store,
+        )
+        use_case.execute(sample_document.id)
+
+        extraction = mock_extraction_repo.create.call_args.args[0]
+        assert extraction.raw_text is None
+        assert extraction.raw_text_key == OCRArtifactStore.key_for(sample_document.id, extraction.id)
+        assert store.load_text(extraction.raw_text_key) == sample_ocr_result.text
+
+    def test_reprocessing_deletes_replaced_artifacts_after_commit(
+        self,
+        mock_document_repo,
+        mock_extraction_repo,
+        mock_audit_repo,
+        mock_ocr_service,
+        mock_llm_service,
+        mock_storage_service,
+        stored,
+        classifier,
+        sample_document,
+        sample_ocr_result,
+        sample_llm_result,
+    ):
+        mock_document_repo.get_by_id.return_value = sample_document
+        mock_ocr_service.extract_text_from_bytes.return_value = sample_ocr_result
+        mock_llm_service.extract_fields.return_value = sample_llm_result
+        mock_extraction_repo.create.side_effect = lambda e: e
+        stored[sample_document.storage_path] = b"%PDF-fake"
+        store = OCRArtifactStore(mock_storage_service)
+        stale_key = store.save(sample_document.id, uuid4(), sample_ocr_result)
+        mock_extraction_repo.get_raw_text_keys.return_value = [stale_key]
+        use_case = ExtractFieldsUseCase(
+            document_repository=mock_document_repo,
+            extraction_repository=mock_extraction_repo,
+            audit_trail_repository=mock_audit_repo,
+            ocr_service=mock_ocr_service,
+            llm_service=mock_llm_service,
+            storage_service=mock_storage_service,
+            document_type_classifier=classifier,
+            ocr_artifact_store=store,
+        )
+
+        use_case.execute(sample_document.id)
+        # Still there until the caller has committed
+        assert stale_key in stored
+        use_case.delete_stale_artifacts()
+
+        new_key = mock_extraction_repo.create.call_args.args[0].raw_text_key
+        assert stale_key not in stored
+        assert new_key in stored
+
+    def test_failed_insert_deletes_new_artifact(
+        self,
+        mock_document_repo,
+        mock_extraction_repo,
+        mock_audit_repo,
+        mock_ocr_service,
+        mock_llm_service,
+        mock_storage_service,
+        stored,
+        classifier,
+        sample_document,
+        sample_ocr_result,
+        sample_llm_result,
+    ):
+        mock_document_repo.get_by_id.return_value = sample_document
+        mock_ocr_service.extract_text_from_bytes.return_value = sample_ocr_result
+        mock_llm_service.extract_fields.return_value = sample_llm_result
+        mock_extraction_repo.create.side_effect = RuntimeError("insert failed")
+        stored[sample_document.storage_path] = b"%PDF-fake"
+        use_case = ExtractFieldsUseCase(
+            document_repository=mock_document_repo,
+            extraction_repository=mock_extraction_repo,
+            audit_trail_repository=mock_audit_repo,
+            ocr_service=mock_ocr_service,
+            llm_service=mock_llm_service,
+            storage_service=mock_storage_service,
+            document_type_classifier=classifier,
+            ocr_artifact_store=OCRArtifactStore(mock_storage_service),
+        )
+
+        with pytest.raises(RuntimeError):
+            use_case.execute(sample_document.id)
+
+        assert set(stored) == {sample_document.storage_path}
+
+    def test_rolled_back_extraction_discards_new_artifact(
+        self,
+        mock_document_repo,
+        mock_extraction_repo,
+        mock_audit_repo,
+        mock_ocr_service,
+        mock_llm_service,
+        mock_storage_service,
+        stored,
+        classifier,
+        sample_document,
+        sample_ocr_result,
+        sample_llm_result,
+    ):
+        mock_document_repo.get_by_id.return_value = sample_document
+        mock_ocr_service.extract_text_from_bytes.return_value = sample_ocr_result
+        mock_llm_service.extract_fields.return_value = sample_llm_result
+        mock_extraction_repo.create.side_effect = lambda e: e
+        stored[sample_document.storage_path] = b"%PDF-fake"
+        store = OCRArtifactStore(mock_storage_service)
+        stale_key = store.save(sample_document.id, uuid4(), sample_ocr_result)
+        mock_extraction_repo.get_raw_text_keys.return_value = [stale_key]
+        use_case = ExtractFieldsUseCase(
+            document_repository=mock_document_repo,
+            extraction_repository=mock_extraction_repo,
+            audit_trail_repository=mock_audit_repo,
+            ocr_service=mock_ocr_service,
+            llm_service=mock_llm_service,
+            storage_service=mock_storage_service,
+            document_type_classifier=classifier,
+            ocr_artifact_store=store,
+        )
+
+        use_case.execute(sample_document.id)
+        new_key = mock_extraction_repo.create.call_args.args[0].raw_text_key
+        # The commit failed: the new artifact goes, the replaced extraction keeps its own
+        use_case.discard_new_artifact()
+
+        assert new_key not in stored
+        assert stale_key in stored
@@ -0,0 +1,111 @@
+"""Tests for the columnar OCR Layout and its dict views."""
+import json
+import sys
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.external.ocr.base import OCRResult, merge_page_results
+from src.infrastructure.external.ocr.layout import Layout
+from src.infrastructure.external.storage.ocr_artifacts import OCRArtifactStore
+
+
+def _dense_layout(count=5000):
+    layout = Layout()
+    for i in range(count):
+        layout.append(f"word{i % 300}", 0.97, 10.0 * (i % 80), 14.0 * (i // 80), 42.5, 12.0, i // 2500)
+    return layout
+
+
+class TestLayout:
+
+    def test_entries_are_dict_views(self):
+        layout = Layout()
+        layout.append("Invoice", 0.98, 10, 20, 120.5, 18, 0)
+        layout.append("EUR 1,234.00", 0.91, 300, 20, 90, 18, 1)
+
+        assert len(layout) == 2
+        assert layout[0] == {
+            "text": "Invoice",
+            "confidence": 0.98,
+            "bbox": {"x": 10.0, "y": 20.0, "width": 120.5, "height": 18.0},
+            "page": 0,
+        }
+        assert layout[-1]["text"] == "EUR 1,234.00"
+        assert [entry["page"] for entry in layout] == [0, 1]
+        assert list(layout.texts()) == ["Invoice", "EUR 1,234.00"]
+        with pytest.raises(IndexError):
+            layout[2]
+
+    def test_extend_renumbers_pages_and_keeps_text_offsets(self):
+        first, second = Layout(), Layout()
+        first.append("CMR", 1.0, 0, 0, 10, 10, 0)
+        second.append("Consignee", 0.9, 5, 5, 10, 10, 0)
+        second.append("ACME", 0.8, 5, 25, 10, 10, 0)
+
+        merged = merge_page_results([OCRResult("CMR", layout=first), OCRResult("Consignee ACME", layout=second)])
+
+        assert list(merged.layout.texts()) == ["CMR", "Consignee", "ACME"]
+        assert [entry["page"] for entry in merged.layout] == [0, 1, 1]
+
+    def test_extend_accepts_dict_entries(self):
+        layout = Layout.from_dicts([{"text": "Total", "confidence": 0.5, "bbox": {"x": 1, "y": 2, "width": 3, "height": 4}, "page": 2}])
+
+        assert layout[0]["bbox"] == {"x": 1.0, "y": 2.0, "width": 3.0, "height": 4.0}
+        assert layout[0]["page"] == 2
+
+    def test_scale_from_offset(self):
+        layout = Layout()
+        layout.append("a", 1.0, 10, 10, 10, 10, 0)
+        layout.append("b", 1.0, 10, 10, 10, 10, 1)
+
+        layout.scale(2.0, start=1)
+
+        assert layout[0]["bbox"]["x"] == 10.0
+        assert layout[1]["bbox"] == {"x": 20.0, "y": 20.0, "width": 20.0, "height": 20.0}
+
+    def test_map_boxes_from_offset(self):
+        layout = Layout()
+        # Multi-character texts: the text buffer is longer than the entry count
+        layout.append("Invoice", 1.0, 10, 10, 10, 10, 0)
+        layout.append("No. 123", 1.0, 10, 20, 30, 40, 1)
+
+        layout.map_boxes(lambda x, y, width, height: (y, x, height, width), start=1)
+
+        assert layout[0]["bbox"]["y"] == 10.0
+        assert layout[1]["bbox"] == {"x": 20.0, "y": 10.0, "width": 40.0, "height": 30.0}
+
+    def test_columns_round_trip(self):
+        layout = _dense_layout(100)
+
+        restored = Layout.from_columns(json.loads(json.dumps(layout.to_columns())))
+
+        assert restored == layout
+        assert restored == list(layout)
+
+    def test_compact_compared_to_dicts(self):
+        layout = _dense_layout()
+        dicts = list(layout)
+
+        columnar_bytes = sum(sys.getsizeof(getattr(layout, f"_{c}")) for c in ("page", "x", "y", "width", "height", "confidence", "start", "end"))
+        columnar_bytes += sys.getsizeof(layout._buffer())
+        dict_bytes = sum(sys.getsizeof(d) + sys.getsizeof(d["bbox"]) for d in dicts)
+
+        assert columnar_bytes * 5 < dict_bytes
+        assert len(json.dumps(layout.to_columns())) < len(json.dumps(dicts)) / 2
+
+
+class TestLayoutArtifacts:
+
+    def test_artifact_round_trip_keeps_columnar_layout(self, mock_storage_service):
+        objects = {}
+        mock_storage_service.upload_file.side_effect = lambda key, data, content_type=None: objects.__setitem__(key, data)
+        mock_storage_service.download_file.side_effect = lambda key: objects[key]
+        store = OCRArtifactStore(mock_storage_service)
+        layout = _dense_layout(50)
+
+        key = store.save(uuid4(), uuid4(), OCRResult("text", layout=layout))
+        artifact = store.load(key)
+
+        assert isinstance(artifact["layout"], Layout)
+        assert artifact["layout"] == layout
@@ -0,0 +1,129 @@
+"""Tests for ImagePreprocessor — downscale, orientation, deskew and contrast before OCR."""
+import numpy as np
+import pytest
+from PIL import Image
+from prometheus_client import REGISTRY
+
+cv2 = pytest.importorskip("cv2")
+
+from src.infrastructure.external.ocr.preprocess import (  # noqa: E402
+    ImagePreprocessor, PreprocessConfig, create_image_preprocessor,
+)
+
+
+def _text_page(width=1200, height=1600, skew=0.0):
+    """White page with dark horizontal bars standing in for text lines."""
+    page = np.full((height, width), 255, dtype=np.uint8)
+    for y in range(150, height - 150, 60):
+        cv2.rectangle(page, (120, y), (width - 120, y + 18), 0, thickness=-1)
+    if skew:
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), skew, 1.0)
+        page = cv2.warpAffine(page, matrix, (width, height), borderValue=255)
+    return page
+
+
+def _ink_box(gray):
+    """(x, y, width, height) of the dark pixels."""
+    ys, xs = np.nonzero(np.asarray(gray)[..., 0] < 128 if np.asarray(gray).ndim == 3 else np.asarray(gray) < 128)
+    return xs.min(), ys.min(), xs.max() - xs.min() + 1, ys.max() - ys.min() + 1
+
+
+def _sample(stage):
+    return REGISTRY.get_sample_value("sortex_ocr_page_pixels_sum", {"stage": stage}) or 0.0
+
+
+class TestImagePreprocessor:
+
+    def test_downscales_to_target_long_edge(self):
+        preprocessor = ImagePreprocessor(PreprocessConfig(target_long_edge=1000, deskew=False, detect_orientation=False))
+        image = Image.new("RGB", (3000, 4000), "white")
+
+        page = preprocessor.process(image)
+
+        assert page.image.shape == (1000, 750, 3)
+        assert page.scale == pytest.approx(4.0)
+
+    def test_never_upscales(self):
+        page = ImagePreprocessor(PreprocessConfig(target_long_edge=4000)).process(Image.new("L", (800, 600), "white"))
+
+        assert page.image.shape == (600, 800, 3)
+        assert page.scale == 1.0
+
+    @pytest.mark.parametrize("skew", [-4.0, 2.5, 6.0])
+    def test_deskews_rotated_scan(self, skew):
+        preprocessor = ImagePreprocessor(PreprocessConfig(normalize_contrast=False))
+
+        page = preprocessor.process(_text_page(skew=skew))
+
+        # Rotating back by the opposite angle straightens the page
+        assert page.skew_degrees == pytest.approx(-skew, abs=0.3)
+        assert page.rotation == 0
+
+    def test_straight_page_is_left_alone(self):
+        page = ImagePreprocessor().process(_text_page())
+
+        assert page.skew_degrees == 0.0
+        assert page.rotation == 0
+
+    def test_turns_sideways_page_upright(self):
+        sideways = cv2.rotate(_text_page(), cv2.ROTATE_90_COUNTERCLOCKWISE)
+
+        page = ImagePreprocessor().process(sideways)
+
+        assert page.rotation == 90
+        assert page.image.shape[:2] == (1600, 1200)
+
+    def test_maps_boxes_on_sideways_page_back_to_original(self):
+        sideways = cv2.rotate(_text_page(), cv2.ROTATE_90_COUNTERCLOCKWISE)
+        preprocessor = ImagePreprocessor(PreprocessConfig(target_long_edge=800, normalize_contrast=False))
+
+        page = preprocessor.process(sideways)
+
+        assert page.rotation == 90
+        assert page.scale == pytest.approx(2.0)
+        mapped = page.box_to_original(*_ink_box(page.image))
+        assert mapped == pytest.approx(_ink_box(sideways), abs=4)
+
+    def test_maps_points_on_deskewed_page_back_to_original(self):
+        straight = _text_page()
+        # A block in the free corner: without undoing the deskew it would land ~80 px off
+        cv2.rectangle(straight, (1100, 1500), (1150, 1550), 0, thickness=-1)
+        matrix = cv2.getRotationMatrix2D((600, 800), 5.0, 1.0)
+        skewed = cv2.warpAffine(straight, matrix, (1200, 1600), borderValue=255)
+        expected = matrix @ np.array([1125.0, 1525.0, 1.0])
+
+        page = ImagePreprocessor(PreprocessConfig(normalize_contrast=False)).process(skewed)
+        ys, xs = np.nonzero(page.image[1480:, 1090:, 0] < 128)
+        centre = (xs.mean() + 1090, ys.mean() + 1480)
+
+        assert page.skew_degrees == pytest.approx(-5.0, abs=0.3)
+        # Tolerance covers the 0.1-0.3 degree error of the skew estimate
+        assert page.points_to_original([centre])[0] == pytest.approx(expected, abs=10)
+
+    def test_contrast_normalisation_stretches_faded_print(self):
+        faded = np.where(_text_page() == 0, 170, 215).astype(np.uint8)
+        preprocessor = ImagePreprocessor(PreprocessConfig(deskew=False, detect_orientation=False))
+
+        page = preprocessor.process(faded)
+
+        gray = page.image[:, :, 0]
+        assert int(gray.max()) - int(gray.min()) > 45
+
+    def test_records_pixels_per_page(self):
+        before_input, before_ocr = _sample("input"), _sample("ocr")
+        preprocessor = ImagePreprocessor(PreprocessConfig(target_long_edge=1000))
+
+        preprocessor.process(Image.new("RGB", (2000, 1000), "white"))
+
+        assert _sample("input") - before_input == 2_000_000
+        assert _sample("ocr") - before_ocr == 500_000
+
+    def test_factory_honours_env(self, monkeypatch):
+        monkeypatch.setenv("OCR_TARGET_LONG_EDGE", "1800")
+        monkeypatch.setenv("OCR_DESKEW", "false")
+        preprocessor = create_image_preprocessor()
+        assert preprocessor.config.target_long_edge == 1800
+        assert preprocessor.config.deskew is False
+
+        monkeypatch.setenv("OCR_PREPROCESS_ENABLED", "false")
+        assert create_image_preprocessor() is None
@@ -0,0 +1,48 @@
+"""Tests for Paddle engine profiles and their env overrides."""
+import pytest
+
+from src.infrastructure.external.ocr.paddle_config import PROFILES, load_paddle_config
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ("OCR_PROFILE", "PADDLE_CPU_THREADS", "PADDLE_ENABLE_MKLDNN", "PADDLE_TABLE", "PADDLE_REC_MODEL_DIR"):
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestPaddleConfig:
+
+    def test_default_profile_keeps_layout_and_tables(self):
+        config = load_paddle_config()
+
+        assert config == PROFILES["accurate"]
+        kwargs = config.structure_kwargs()
+        assert kwargs["layout"] and kwargs["table"] and kwargs["ocr"]
+        assert kwargs["use_gpu"] is False and kwargs["lang"] == "en"
+        assert "det_model_dir" not in kwargs
+
+    def test_fast_profile_from_env(self, monkeypatch):
+        monkeypatch.setenv("OCR_PROFILE", "fast")
+
+        config = load_paddle_config()
+
+        assert config.table is False
+        assert config.ocr_version == "PP-OCRv3"
+        assert config.rec_batch_num > PROFILES["accurate"].rec_batch_num
+
+    def test_env_overrides_single_settings(self, monkeypatch):
+        monkeypatch.setenv("PADDLE_CPU_THREADS", "2")
+        monkeypatch.setenv("PADDLE_ENABLE_MKLDNN", "true")
+        monkeypatch.setenv("PADDLE_REC_MODEL_DIR", "/models/rec-slim")
+
+        config = load_paddle_config("fast")
+
+        assert config.cpu_threads == 2 and config.enable_mkldnn is True
+        assert config.ocr_kwargs()["rec_model_dir"] == "/models/rec-slim"
+        assert config.ocr_kwargs()["cls_batch_num"] == config.cls_batch_num
+        # Profiles themselves are not modified
+        assert PROFILES["fast"].cpu_threads != 2
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            load_paddle_config("turbo")
@@ -0,0 +1,69 @@
+"""Tests for PaddleOCRService result parsing and mapping back to original page coordinates."""
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+from PIL import Image
+
+pytest.importorskip("cv2")
+
+from src.infrastructure.external.ocr.preprocess import PreprocessedPage  # noqa: E402
+
+LINE_BOX = [[10, 20], [110, 20], [110, 50], [10, 50]]
+
+
+def _structure_result():
+    return [
+        {"type": "Title", "bbox": [10, 20, 110, 50], "res": [[LINE_BOX, ("Invoice 123", 0.98)]]},
+        {"type": "Figure", "bbox": [0, 60, 50, 90]},
+    ]
+
+
+@pytest.fixture
+def service_module(monkeypatch):
+    # PP-Structure is replaced by a stub engine below; only the import has to resolve
+    if importlib.util.find_spec("paddleocr") is None:
+        stub = types.ModuleType("paddleocr")
+        stub.PaddleOCR = stub.PPStructure = object
+        monkeypatch.setitem(sys.modules, "paddleocr", stub)
+    module = importlib.import_module("src.infrastructure.external.ocr.paddleocr_service")
+    monkeypatch.setattr(module, "PPStructure", lambda **kwargs: lambda image: _structure_result())
+    return module
+
+
+class FixedPreprocessor:
+    """Returns pages with a fixed transform, as ImagePreprocessor would for a sideways scan."""
+
+    def __init__(self, **transform):
+        self.transform = transform
+
+    def process_pages(self, images):
+        return [PreprocessedPage(image=np.zeros((400, 300, 3), dtype=np.uint8), **self.transform) for _ in images]
+
+
+class TestExtractTextFromImages:
+
+    def test_multi_character_lines_keep_engine_coordinates(self, service_module):
+        service = service_module.PaddleOCRService()
+
+        result = service.extract_text_from_images([Image.new("RGB", (300, 400), "white")])
+
+        assert result.text == "Invoice 123"
+        assert len(result.layout) == 1
+        assert result.layout[0]["text"] == "Invoice 123"
+        assert result.layout[0]["bbox"] == {"x": 10.0, "y": 20.0, "width": 100.0, "height": 30.0}
+        assert result.regions[0]["bbox"] == {"x": 10.0, "y": 20.0, "width": 100.0, "height": 30.0}
+
+    def test_boxes_are_mapped_back_through_rotation_and_scale(self, service_module):
+        preprocessor = FixedPreprocessor(scale=2.0, rotation=90, base_size=(400, 300))
+        service = service_module.PaddleOCRService(preprocessor=preprocessor)
+
+        result = service.extract_text_from_images([Image.new("RGB", (800, 600), "white")])
+
+        # Clockwise turn undone (x = y', y = 300 - x'), then scaled by 2
+        expected = {"x": 40.0, "y": 380.0, "width": 60.0, "height": 200.0}
+        assert result.layout[0]["bbox"] == pytest.approx(expected)
+        assert result.regions[0]["bbox"] == pytest.approx(expected)
+        assert result.regions[1]["bbox"] == pytest.approx({"x": 120.0, "y": 500.0, "width": 60.0, "height": 100.0})
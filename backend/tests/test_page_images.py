@@ -0,0 +1,111 @@
+"""Tests for PageImageStore — rasterize once, reuse pages across OCR providers and previews."""
+import io
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from src.application.use_cases.extract_fields import ExtractFieldsUseCase
+from src.application.use_cases.generate_previews import GeneratePreviewsUseCase
+from src.infrastructure.external.storage import page_images
+from src.infrastructure.external.storage.page_images import PageImageStore
+from src.infrastructure.external.storage.page_previews import PagePreviewStore
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Stand-in for the poppler rasterizer that counts invocations."""
+    calls = []
+
+    def convert(file_bytes, file_type, dpi=200):
+        calls.append(dpi)
+        return [Image.new("RGB", (170, 220), color=(i * 40, 0, 0)) for i in range(3)]
+
+    monkeypatch.setattr(page_images, "convert_to_images", convert)
+    return calls
+
+
+class TestPageImageStore:
+
+    def test_renders_pdf_once_and_reuses_pages(self, mock_storage_service, stored, renders):
+        store = PageImageStore(mock_storage_service)
+        document_id = uuid4()
+
+        first = store.get_or_render(document_id, b"%PDF", "pdf")
+        second = store.get_or_render(document_id, b"%PDF", "pdf")
+
+        assert renders == [200]
+        assert len(second) == 3
+        assert [im.getpixel((0, 0)) for im in second] == [im.getpixel((0, 0)) for im in first]
+        assert f"{document_id}/pages/200/page-3.png" in stored
+        assert f"{document_id}/pages/200/manifest.json" in stored
+
+    def test_pages_are_keyed_by_dpi(self, mock_storage_service, stored, renders):
+        store = PageImageStore(mock_storage_service)
+        document_id = uuid4()
+
+        store.get_or_render(document_id, b"%PDF", "pdf", dpi=200)
+        store.get_or_render(document_id, b"%PDF", "pdf", dpi=300)
+
+        assert renders == [200, 300]
+        assert store.load(document_id, 150) is None
+
+    def test_storage_failure_still_returns_pages(self, mock_storage_service, renders):
+        mock_storage_service.file_exists.return_value = False
+        mock_storage_service.upload_file.side_effect = Exception("storage down")
+
+        images = PageImageStore(mock_storage_service).get_or_render(uuid4(), b"%PDF", "pdf")
+
+        assert len(images) == 3
+
+    def test_images_are_not_stored(self, mock_storage_service, stored):
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10)).save(buf, format="PNG")
+
+        images = PageImageStore(mock_storage_service).get_or_render(uuid4(), buf.getvalue(), "png")
+
+        assert len(images) == 1
+        assert stored == {}
+
+
+class TestConsumers:
+
+    def test_extraction_ocrs_stored_pages(
+        self, mock_document_repo, mock_extraction_repo, mock_audit_repo, mock_ocr_service,
+        mock_llm_service, mock_storage_service, classifier, sample_document, sample_ocr_result,
+        sample_llm_result, stored, renders,
+    ):
+        mock_document_repo.get_by_id.return_value = sample_document
+        stored[sample_document.storage_path] = b"%PDF-fake"
+        mock_ocr_service.extract_text_from_images.return_value = sample_ocr_result
+        mock_llm_service.extract_fields.return_value = sample_llm_result
+        mock_extraction_repo.create.side_effect = lambda e: e
+        use_case = ExtractFieldsUseCase(
+            document_repository=mock_document_repo,
+            extraction_repository=mock_extraction_repo,
+            audit_trail_repository=mock_audit_repo,
+            ocr_service=mock_ocr_service,
+            llm_service=mock_llm_service,
+            storage_service=mock_storage_service,
+            document_type_classifier=classifier,
+            page_image_store=PageImageStore(mock_storage_service),
+        )
+
+        use_case.execute(sample_document.id)
+        use_case.execute(sample_document.id)  # reprocess
+
+        assert renders == [200]
+        assert len(mock_ocr_service.extract_text_from_images.call_args.args[0]) == 3
+        mock_ocr_service.extract_text_from_bytes.assert_not_called()
+
+    def test_previews_downscale_stored_pages(self, mock_storage_service, stored, renders):
+        document_id = uuid4()
+        stored["doc/a.pdf"] = b"%PDF"
+        page_store = PageImageStore(mock_storage_service)
+        page_store.get_or_render(document_id, b"%PDF", "pdf")
+
+        use_case = GeneratePreviewsUseCase(mock_storage_service, PagePreviewStore(mock_storage_service), page_store)
+        manifest = use_case.execute(document_id, "doc/a.pdf", "pdf")
+
+        assert renders == [200]
+        assert manifest["page_count"] == 3
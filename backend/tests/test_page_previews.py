@@ -0,0 +1,79 @@
+"""Tests for PagePreviewStore / GeneratePreviewsUseCase — low-resolution page previews."""
+import io
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from src.application.dtos.document_dto import DocumentDTO
+from src.application.use_cases.generate_previews import GeneratePreviewsUseCase, enqueue_previews, PREVIEW_QUEUE
+from src.infrastructure.external.storage.page_previews import PagePreviewStore, PREVIEW_MAX_WIDTH
+
+
+def _png(width, height, mode="RGB") -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, (width, height), color=0).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestPagePreviewStore:
+
+    def test_generates_page_and_manifest(self, mock_storage_service, stored, in_memory_storage):
+        store = PagePreviewStore(mock_storage_service)
+        document_id = uuid4()
+
+        manifest = store.generate(document_id, _png(400, 300), "png")
+
+        key = f"{document_id}/previews/page-1.webp"
+        assert in_memory_storage.content_types[key] == "image/webp"
+        assert Image.open(io.BytesIO(stored[key])).format == "WEBP"
+        assert manifest == {"page_count": 1, "format": "webp", "pages": [{"page": 1, "width": 400, "height": 300}]}
+        assert json.loads(stored[f"{document_id}/previews/manifest.json"]) == manifest
+        assert store.load_manifest(document_id) == manifest
+
+    def test_large_images_are_downscaled(self, mock_storage_service, stored, in_memory_storage):
+        store = PagePreviewStore(mock_storage_service, image_format="jpeg")
+        document_id = uuid4()
+
+        manifest = store.generate(document_id, _png(3000, 4000, mode="RGBA"), "png")
+
+        page = manifest["pages"][0]
+        assert page["width"] == PREVIEW_MAX_WIDTH
+        assert page["height"] == round(4000 * PREVIEW_MAX_WIDTH / 3000)
+        key = f"{document_id}/previews/page-1.jpeg"
+        assert in_memory_storage.content_types[key] == "image/jpeg"
+        assert len(stored[key]) < len(_png(3000, 4000))
+
+    def test_missing_manifest(self, mock_storage_service, stored):
+        assert PagePreviewStore(mock_storage_service).load_manifest(uuid4()) is None
+
+    def test_rejects_unknown_format(self, mock_storage_service):
+        with pytest.raises(ValueError):
+            PagePreviewStore(mock_storage_service, image_format="gif")
+
+
+class TestGeneratePreviews:
+
+    def test_downloads_original_and_renders(self, mock_storage_service, stored):
+        document_id = uuid4()
+        stored["doc/scan.png"] = _png(200, 100)
+        use_case = GeneratePreviewsUseCase(mock_storage_service, PagePreviewStore(mock_storage_service))
+
+        manifest = use_case.execute(document_id, "doc/scan.png", "PNG")
+
+        assert manifest["page_count"] == 1
+        assert f"{document_id}/previews/page-1.webp" in stored
+
+    def test_enqueue_carries_storage_path(self, sample_document):
+        queue = MagicMock()
+        enqueue_previews(queue, [DocumentDTO.from_entity(sample_document)])
+
+        name, jobs = queue.enqueue_many.call_args.args
+        assert name == PREVIEW_QUEUE
+        assert jobs == [{
+            "document_id": str(sample_document.id),
+            "storage_path": sample_document.storage_path,
+            "file_type": sample_document.file_type,
+        }]
@@ -0,0 +1,143 @@
+"""Tests for the PDF text layer stage — born-digital pages skip OCR, sparse pages fall back to it."""
+from unittest.mock import create_autospec
+
+import pytest
+from PIL import Image
+
+from src.application.use_cases import extract_fields
+from src.application.use_cases.extract_fields import ExtractFieldsUseCase
+from src.infrastructure.external.ocr.base import OCRResult
+from src.infrastructure.external.ocr.pdf_text_layer import parse_bbox_layout
+from src.infrastructure.external.storage.page_images import PageImageStore
+
+# Trimmed `pdftotext -bbox-layout` output: page 1 is digital, page 2 is a scan
+BBOX_LAYOUT = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title></title><meta name="Producer" content="LibreOffice"/></head>
+<body>
+<doc>
+  <page width="612.000000" height="792.000000">
+    <flow>
+      <block xMin="72.000000" yMin="200.000000" xMax="300.000000" yMax="230.000000">
+        <line xMin="72.000000" yMin="200.000000" xMax="300.000000" yMax="212.000000">
+          <word xMin="72.000000" yMin="200.000000" xMax="120.000000" yMax="212.000000">Total</word>
+          <word xMin="125.000000" yMin="200.000000" xMax="180.000000" yMax="212.000000">&amp;</word>
+          <word xMin="185.000000" yMin="200.000000" xMax="300.000000" yMax="212.000000">EUR 1,234.00</word>
+        </line>
+      </block>
+      <block xMin="72.000000" yMin="72.000000" xMax="400.000000" yMax="110.000000">
+        <line xMin="72.000000" yMin="72.000000" xMax="400.000000" yMax="86.000000">
+          <word xMin="72.000000" yMin="72.000000" xMax="160.000000" yMax="86.000000">Invoice</word>
+          <word xMin="165.000000" yMin="72.000000" xMax="400.000000" yMax="86.000000">INV-2024-0042</word>
+        </line>
+        <line xMin="72.000000" yMin="96.000000" xMax="300.000000" yMax="110.000000">
+          <word xMin="72.000000" yMin="96.000000" xMax="300.000000" yMax="110.000000">ACME-Logistics-GmbH</word>
+        </line>
+      </block>
+    </flow>
+  </page>
+  <page width="612.000000" height="792.000000">
+  </page>
+</doc>
+</body>
+</html>
+"""
+
+
+class TestParseBboxLayout:
+
+    def test_lines_and_blocks_scaled_to_ocr_pixels(self):
+        layer = parse_bbox_layout(BBOX_LAYOUT, dpi=144)
+
+        assert len(layer.pages) == 2
+        page = layer.pages[0]
+        assert [r["content"] for r in page.regions] == [
+            "Invoice INV-2024-0042 ACME-Logistics-GmbH",  # sorted top-to-bottom
+            "Total & EUR 1,234.00",
+        ]
+        assert page.layout[0]["text"] == "Total & EUR 1,234.00"
+        assert page.layout[0]["bbox"] == {"x": 144.0, "y": 400.0, "width": 456.0, "height": 24.0}
+        assert page.layout[0]["page"] == 0
+
+    def test_missing_pages(self):
+        layer = parse_bbox_layout(BBOX_LAYOUT)
+
+        assert layer.missing_pages(min_chars=25) == [1]
+        assert layer.missing_pages(min_chars=1000) == [0, 1]
+
+    def test_ocr_pages_are_merged_in_page_order(self):
+        layer = parse_bbox_layout(BBOX_LAYOUT)
+        scan = OCRResult(
+            text="Delivery note",
+            layout=[{"text": "Delivery note", "confidence": 0.9, "bbox": {}, "page": 0}],
+            regions=[{"type": "text", "bbox": {}, "page": 0, "content": "Delivery note"}],
+        )
+
+        result = layer.to_ocr_result({1: scan})
+
+        assert result.text.splitlines() == [
+            "Invoice INV-2024-0042 ACME-Logistics-GmbH Total & EUR 1,234.00",
+            "Delivery note",
+        ]
+        assert result.layout[-1]["page"] == 1
+        assert result.regions[-1]["page"] == 1
+
+
+@pytest.fixture
+def use_case(
+    mock_document_repo, mock_extraction_repo, mock_audit_repo, mock_ocr_service,
+    mock_llm_service, mock_storage_service, classifier, sample_document, sample_llm_result,
+):
+    mock_document_repo.get_by_id.return_value = sample_document
+    mock_storage_service.download_file.return_value = b"%PDF-1.7"
+    mock_llm_service.extract_fields.return_value = sample_llm_result
+    mock_extraction_repo.create.side_effect = lambda e: e
+    page_store = create_autospec(PageImageStore, instance=True)
+    page_store.get_or_render.return_value = [Image.new("RGB", (10, 10)), Image.new("RGB", (10, 10))]
+    return ExtractFieldsUseCase(
+        document_repository=mock_document_repo,
+        extraction_repository=mock_extraction_repo,
+        audit_trail_repository=mock_audit_repo,
+        ocr_service=mock_ocr_service,
+        llm_service=mock_llm_service,
+        storage_service=mock_storage_service,
+        document_type_classifier=classifier,
+        page_image_store=page_store,
+    )
+
+
+class TestExtractionUsesTextLayer:
+
+    def test_digital_pdf_skips_ocr(self, use_case, mock_ocr_service, sample_document, monkeypatch):
+        layer = parse_bbox_layout(BBOX_LAYOUT)
+        layer.pages.pop()
+        monkeypatch.setattr(extract_fields, "read_text_layer", lambda data: layer)
+
+        result = use_case.execute(sample_document.id)
+
+        mock_ocr_service.extract_text_from_bytes.assert_not_called()
+        mock_ocr_service.extract_text_from_images.assert_not_called()
+        assert "INV-2024-0042" in result.raw_text
+        assert result.extraction_metadata["ocr_source"] == "text_layer"
+
+    def test_only_pages_without_text_are_ocred(self, use_case, mock_ocr_service, sample_document, monkeypatch):
+        monkeypatch.setattr(extract_fields, "read_text_layer", lambda data: parse_bbox_layout(BBOX_LAYOUT))
+        mock_ocr_service.extract_text_from_images.return_value = OCRResult(text="Delivery note")
+
+        result = use_case.execute(sample_document.id)
+
+        assert mock_ocr_service.extract_text_from_images.call_count == 1
+        assert len(mock_ocr_service.extract_text_from_images.call_args.args[0]) == 1
+        assert result.raw_text.endswith("\nDelivery note")
+        assert result.extraction_metadata["ocr_source"] == "mixed"
+        assert result.extraction_metadata["ocr_pages"] == 1
+
+    def test_unreadable_text_layer_falls_back_to_full_ocr(self, use_case, mock_ocr_service, sample_document, sample_ocr_result, monkeypatch):
+        monkeypatch.setattr(extract_fields, "read_text_layer", lambda data: None)
+        mock_ocr_service.extract_text_from_images.return_value = sample_ocr_result
+
+        result = use_case.execute(sample_document.id)
+
+        assert len(mock_ocr_service.extract_text_from_images.call_args.args[0]) == 2
+        assert result.extraction_metadata["ocr_source"] == "ocr"
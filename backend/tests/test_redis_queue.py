@@ -0,0 +1,68 @@
+"""Tests for RedisQueue batching, the versioned message format and the shared pools."""
+import json
+
+import pytest
+import redis
+
+from src.infrastructure.messaging import redis_queue as module
+from src.infrastructure.messaging.redis_client import REDIS_POOL_TIMEOUT, get_redis
+from src.infrastructure.messaging.redis_queue import RedisQueue
+from src.infrastructure.messaging.serialization import decode_message, encode_message
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_queue():
+    queue = RedisQueue("redis://localhost:6379/0")
+    queue.redis_client = fakeredis.FakeRedis()
+    return queue
+
+
+class TestSerialization:
+
+    def test_round_trip_with_version_byte(self):
+        data = encode_message({"document_id": "d1", "n": 1})
+
+        assert data[:1] == b"\x01"
+        assert decode_message(data) == {"document_id": "d1", "n": 1}
+
+    def test_decodes_legacy_json(self):
+        assert decode_message(json.dumps({"a": 1}).encode()) == {"a": 1}
+
+    def test_rejects_unknown_version(self):
+        with pytest.raises(ValueError, match="version"):
+            decode_message(b"\x07payload")
+
+
+class TestBatching:
+
+    def test_enqueue_many_in_chunks_keeps_order(self, redis_queue, monkeypatch):
+        monkeypatch.setattr(module, "ENQUEUE_CHUNK_SIZE", 3)
+
+        length = redis_queue.enqueue_many("jobs", [{"n": i} for i in range(10)])
+
+        assert length == 10
+        assert [t["n"] for t in redis_queue.dequeue_many("jobs", 100)] == list(range(10))
+
+    def test_dequeue_many_waits_for_first_task(self, redis_queue):
+        assert redis_queue.dequeue_many("jobs", 5, timeout=1) == []
+
+        redis_queue.enqueue_many("jobs", [{"n": i} for i in range(3)])
+        assert [t["n"] for t in redis_queue.dequeue_many("jobs", 2, timeout=1)] == [0, 1]
+        assert redis_queue.dequeue("jobs", timeout=1) == {"n": 2}
+
+
+def test_clients_share_one_pool_per_url():
+    first = get_redis("redis://localhost:6379/5")
+    second = get_redis("redis://localhost:6379/5")
+
+    assert first.connection_pool is second.connection_pool
+    assert get_redis("redis://localhost:6379/6").connection_pool is not first.connection_pool
+
+
+def test_exhausted_pool_waits_for_a_connection():
+    pool = get_redis("redis://localhost:6379/7").connection_pool
+
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.timeout == REDIS_POOL_TIMEOUT
@@ -0,0 +1,189 @@
+"""Tests for the resumable bulk re-validation job."""
+import copy
+from uuid import UUID
+
+import pytest
+
+from src.application.use_cases import revalidate_extractions as module
+from src.application.use_cases.revalidate_extractions import RevalidateExtractionsUseCase, validate_rows
+from src.domain.entities.revalidation_job import RevalidationJob, RevalidationJobStatus
+from src.domain.services.validation_engine import ValidationEngine
+
+
+def _id(n: int) -> UUID:
+    return UUID(int=n)
+
+
+VALID_CMR = {"shipper_name": "Acme", "consignee_name": "Beta", "date_of_consignment": "2024-01-15"}
+
+
+class FakeStore:
+    """Committed state shared by the fake sessions/repositories."""
+
+    def __init__(self, rows, fail_on_batch=None):
+        self.rows = rows
+        self.fail_on_batch = fail_on_batch
+        self.jobs = {}
+        self.results = {}
+        self.upserts = 0
+        self.pending_jobs = {}
+        self.pending_results = {}
+
+    def commit(self):
+        self.jobs.update(self.pending_jobs)
+        self.results.update(self.pending_results)
+        self.rollback()
+
+    def rollback(self):
+        self.pending_jobs = {}
+        self.pending_results = {}
+
+
+class FakeSession:
+    def __init__(self, store):
+        self.store = store
+
+    def commit(self):
+        self.store.commit()
+
+    def rollback(self):
+        self.store.rollback()
+
+    def close(self):
+        pass
+
+
+class FakeJobRepository:
+    def __init__(self, session):
+        self.store = session.store
+
+    def create(self, job):
+        self.store.pending_jobs[job.id] = copy.deepcopy(job)
+        return copy.deepcopy(job)
+
+    update = create
+
+    def get_by_id(self, job_id):
+        job = self.store.pending_jobs.get(job_id) or self.store.jobs.get(job_id)
+        return copy.deepcopy(job)
+
+    def get_resumable(self, rules_version):
+        for job in self.store.jobs.values():
+            if job.rules_version == rules_version and job.status != RevalidationJobStatus.COMPLETED:
+                return copy.deepcopy(job)
+        return None
+
+
+class FakeExtractionRepository:
+    def __init__(self, session):
+        self.store = session.store
+
+    def count(self):
+        return len(self.store.rows)
+
+    def iter_validation_batches(self, after_id=None, batch_size=2000):
+        rows = [row for row in self.store.rows if after_id is None or row[0] > after_id]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+
+class FakeResultRepository:
+    def __init__(self, session):
+        self.store = session.store
+
+    def bulk_upsert(self, results):
+        self.store.upserts += 1
+        if self.store.upserts == self.store.fail_on_batch:
+            raise RuntimeError("connection lost")
+        for result in results:
+            self.store.pending_results[result.extraction_id] = result
+        return len(results)
+
+
+@pytest.fixture
+def fake_repositories(monkeypatch):
+    monkeypatch.setattr(module, "RevalidationJobRepository", FakeJobRepository)
+    monkeypatch.setattr(module, "ExtractionRepository", FakeExtractionRepository)
+    monkeypatch.setattr(module, "ValidationResultRepository", FakeResultRepository)
+
+
+def _rows(count):
+    rows = []
+    for n in range(1, count + 1):
+        data = VALID_CMR if n % 2 else {}
+        rows.append((_id(n), "CMR", data))
+    return rows
+
+
+def _use_case(store, **kwargs):
+    return RevalidateExtractionsUseCase(lambda: FakeSession(store), ValidationEngine(), **kwargs)
+
+
+class TestValidateRows:
+
+    def test_statuses_and_errors(self):
+        outcomes = validate_rows(ValidationEngine(), [
+            (_id(1), "CMR", VALID_CMR),
+            (_id(2), "CMR", {}),
+            (_id(3), None, {}),
+        ])
+        assert [o[2] for o in outcomes] == ["PASSED", "FAILED", "PASSED"]
+        assert outcomes[2][1] == "UNKNOWN"
+        assert {e["field"] for e in outcomes[1][3]} >= {"shipper_name", "consignee_name"}
+
+
+class TestRevalidationJob:
+
+    def test_record_batch_advances_checkpoint(self):
+        job = RevalidationJob(id=_id(99), rules_version="v1", total=10)
+        job.record_batch(_id(3), {"PASSED": 2, "FAILED": 1})
+        job.record_batch(_id(5), {"PASSED": 2})
+        assert job.last_extraction_id == _id(5)
+        assert job.processed == 5
+        assert job.status_counts == {"PASSED": 4, "FAILED": 1}
+
+
+@pytest.mark.usefixtures("fake_repositories")
+class TestRevalidateExtractionsUseCase:
+
+    def test_revalidates_everything_in_batches(self):
+        store = FakeStore(_rows(7))
+        job = _use_case(store, batch_size=3).execute()
+        assert job.status == RevalidationJobStatus.COMPLETED
+        assert job.total == job.processed == 7
+        assert job.status_counts == {"PASSED": 4, "FAILED": 3}
+        assert store.upserts == 3
+        assert len(store.results) == 7
+        assert store.results[_id(1)].validation_rules["rules_version"] == ValidationEngine().rules_version
+
+    def test_failure_keeps_last_committed_checkpoint_and_resumes(self):
+        store = FakeStore(_rows(7), fail_on_batch=2)
+        with pytest.raises(RuntimeError):
+            _use_case(store, batch_size=3).execute()
+        (failed,) = store.jobs.values()
+        assert failed.status == RevalidationJobStatus.FAILED
+        assert "connection lost" in failed.error_message
+        assert failed.last_extraction_id == _id(3)
+        assert failed.processed == 3
+
+        store.fail_on_batch = None
+        job = _use_case(store, batch_size=3).execute()
+        assert job.id == failed.id
+        assert job.status == RevalidationJobStatus.COMPLETED
+        assert job.processed == 7
+        assert len(store.results) == 7
+
+    def test_explicit_job_id_must_match_rules(self):
+        store = FakeStore(_rows(1))
+        store.jobs[_id(50)] = RevalidationJob(id=_id(50), rules_version="old")
+        with pytest.raises(ValueError, match="rules"):
+            _use_case(store).execute(job_id=_id(50))
+        with pytest.raises(ValueError, match="not found"):
+            _use_case(store).execute(job_id=_id(51))
+
+    def test_process_pool_writes_batches_in_read_order(self):
+        store = FakeStore(_rows(9))
+        job = _use_case(store, batch_size=2, workers=2).execute()
+        assert job.status == RevalidationJobStatus.COMPLETED
+        assert job.last_extraction_id == _id(9)
+        assert job.processed == 9
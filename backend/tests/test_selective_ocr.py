@@ -0,0 +1,110 @@
+"""Tests for two-pass selective OCR — cheap pass scores pages, only relevant pages get full OCR."""
+from unittest.mock import create_autospec
+
+import pytest
+from PIL import Image
+
+from src.application.use_cases import extract_fields
+from src.application.use_cases.extract_fields import ExtractFieldsUseCase
+from src.domain.services.page_relevance import PageRelevanceScorer
+from src.infrastructure.external.ocr.base import OCRResult
+from src.infrastructure.external.storage.page_images import PageImageStore
+
+ANNEX = "Annex terms and conditions general provisions"
+QUICK_TEXTS = [
+    "ACME Logistics cover letter",
+    ANNEX,
+    ANNEX,
+    "INVOICE Invoice number 42 Bill to Total due Subtotal VAT",
+    ANNEX,
+    ANNEX,
+    ANNEX,
+    "Payment terms Invoice date",
+]
+
+
+class TestPageRelevanceScorer:
+
+    def test_selects_first_page_and_best_matches(self):
+        scorer = PageRelevanceScorer(budgets={"INVOICE": 3})
+
+        selected = scorer.select_pages(QUICK_TEXTS, "INVOICE", ["invoice_number", "total_amount"])
+
+        assert selected == [0, 3, 7]
+
+    def test_short_documents_are_fully_selected(self):
+        scorer = PageRelevanceScorer(budgets={"INVOICE": 3})
+
+        assert scorer.select_pages(QUICK_TEXTS[:3], "INVOICE") == [0, 1, 2]
+
+    def test_budget_override_from_env(self, monkeypatch):
+        monkeypatch.setenv("OCR_PAGE_BUDGETS", '{"invoice": 6}')
+
+        scorer = PageRelevanceScorer()
+
+        assert scorer.budget_for("INVOICE") == 6
+        assert scorer.budget_for("CMR") == 2
+        assert scorer.budget_for("SOMETHING_NEW") == 3
+
+
+@pytest.fixture
+def use_case(
+    mock_document_repo, mock_extraction_repo, mock_audit_repo, mock_ocr_service,
+    mock_llm_service, mock_storage_service, classifier, sample_document, sample_llm_result, monkeypatch,
+):
+    monkeypatch.setattr(extract_fields, "SELECTIVE_OCR_ENABLED", True)
+    monkeypatch.setattr(extract_fields, "read_text_layer", lambda data: None)
+    mock_document_repo.get_by_id.return_value = sample_document
+    mock_storage_service.download_file.return_value = b"%PDF-1.7"
+    mock_llm_service.extract_fields.return_value = sample_llm_result
+    mock_extraction_repo.create.side_effect = lambda e: e
+    page_store = create_autospec(PageImageStore, instance=True)
+    page_store.get_or_render.return_value = [Image.new("RGB", (200, 260)) for _ in QUICK_TEXTS]
+    mock_ocr_service.extract_page_texts_fast.return_value = QUICK_TEXTS
+    mock_ocr_service.extract_text_from_images.return_value = OCRResult(
+        text="full", regions=[{"type": "table", "bbox": {}, "page": 0, "content": "<table></table>"}],
+    )
+    return ExtractFieldsUseCase(
+        document_repository=mock_document_repo,
+        extraction_repository=mock_extraction_repo,
+        audit_trail_repository=mock_audit_repo,
+        ocr_service=mock_ocr_service,
+        llm_service=mock_llm_service,
+        storage_service=mock_storage_service,
+        document_type_classifier=classifier,
+        page_image_store=page_store,
+    )
+
+
+class TestSelectiveExtraction:
+
+    def test_full_ocr_only_on_budgeted_pages(self, use_case, mock_ocr_service, sample_document):
+        result = use_case.execute(sample_document.id)
+
+        # Quick pass runs at half resolution
+        quick_images = mock_ocr_service.extract_page_texts_fast.call_args.args[0]
+        assert quick_images[0].size == (100, 130)
+        assert mock_ocr_service.extract_text_from_images.call_count == 3
+        assert result.extraction_metadata["full_ocr_pages"] == [1, 4, 8]
+        assert result.extraction_metadata["selective_ocr_document_type"] == "INVOICE"
+        # Skipped pages keep their quick text; regions are renumbered to their page
+        lines = result.raw_text.splitlines()
+        assert lines[0] == "full" and lines[1] == ANNEX
+        assert result.extraction_metadata["ocr_regions_count"] == 3
+
+    def test_short_pdfs_use_single_pass(self, use_case, mock_ocr_service, sample_document, monkeypatch):
+        monkeypatch.setattr(extract_fields, "SELECTIVE_OCR_MIN_PAGES", 20)
+
+        use_case.execute(sample_document.id)
+
+        mock_ocr_service.extract_page_texts_fast.assert_not_called()
+        assert len(mock_ocr_service.extract_text_from_images.call_args.args[0]) == len(QUICK_TEXTS)
+
+    def test_provider_without_quick_mode_gets_single_pass(self, use_case, mock_ocr_service, sample_document):
+        mock_ocr_service.extract_page_texts_fast.return_value = None
+
+        result = use_case.execute(sample_document.id)
+
+        mock_ocr_service.extract_text_from_images.assert_called_once()
+        assert len(mock_ocr_service.extract_text_from_images.call_args.args[0]) == len(QUICK_TEXTS)
+        assert "full_ocr_pages" not in result.extraction_metadata
@@ -0,0 +1,106 @@
+"""Tests for DiskCacheStorageService — ETag-validated on-disk LRU in front of storage."""
+import os
+
+import pytest
+
+from src.infrastructure.external.storage.disk_cache import DiskCacheStorageService, create_disk_cache
+
+
+@pytest.fixture
+def inner(in_memory_storage):
+    in_memory_storage.objects["doc-1/a.pdf"] = b"%PDF-" + b"a" * 100
+    in_memory_storage.objects["doc-2/b.pdf"] = b"%PDF-" + b"b" * 100
+    return in_memory_storage
+
+
+@pytest.fixture
+def cache(inner, tmp_path):
+    return DiskCacheStorageService(inner, str(tmp_path), max_bytes=1024)
+
+
+def _entries(path):
+    return [n for n in os.listdir(path) if not n.startswith(".")]
+
+
+class TestDiskCache:
+
+    def test_repeated_downloads_hit_disk(self, cache, inner):
+        first = cache.download_file("doc-1/a.pdf")
+        second = cache.download_file("doc-1/a.pdf")
+
+        assert first == second == inner.objects["doc-1/a.pdf"]
+        assert inner.gets == 1
+
+    def test_changed_etag_refetches_and_replaces_entry(self, cache, inner, tmp_path):
+        cache.download_file("doc-1/a.pdf")
+        inner.objects["doc-1/a.pdf"] = b"%PDF-new"
+
+        assert cache.download_file("doc-1/a.pdf") == b"%PDF-new"
+        assert inner.gets == 2
+        assert len(_entries(tmp_path)) == 1
+
+    def test_ranged_stream_from_cache(self, cache, inner):
+        cache.download_file("doc-1/a.pdf")
+        stream = cache.open_stream("doc-1/a.pdf", offset=0, length=5)
+
+        assert stream.read() == b"%PDF-"
+        assert inner.gets == 1
+
+    def test_writes_invalidate(self, cache, inner, tmp_path):
+        cache.download_file("doc-1/a.pdf")
+        cache.upload_file("doc-1/a.pdf", b"%PDF-replaced")
+        assert _entries(tmp_path) == []
+
+        cache.download_file("doc-1/a.pdf")
+        cache.delete_file("doc-1/a.pdf")
+        assert _entries(tmp_path) == []
+        assert not inner.file_exists("doc-1/a.pdf")
+
+    def test_delete_prefix_removes_objects_and_cache_entries(self, cache, inner, tmp_path):
+        inner.objects["doc-1/ocr/e1.json.gz"] = b"{}"
+        cache.download_file("doc-1/a.pdf")
+        cache.download_file("doc-2/b.pdf")
+
+        assert cache.delete_prefix("doc-1/") == 2
+
+        assert sorted(inner.objects) == ["doc-2/b.pdf"]
+        assert len(_entries(tmp_path)) == 1
+
+    def test_evicts_least_recently_used(self, inner, tmp_path):
+        cache = DiskCacheStorageService(inner, str(tmp_path), max_bytes=250)
+        inner.objects["doc-3/c.pdf"] = b"%PDF-" + b"c" * 100
+
+        cache.download_file("doc-1/a.pdf")
+        cache.download_file("doc-2/b.pdf")
+        cache.download_file("doc-1/a.pdf")  # a is now most recently used
+        cache.download_file("doc-3/c.pdf")  # evicts b
+        inner.gets = 0
+
+        cache.download_file("doc-1/a.pdf")
+        cache.download_file("doc-3/c.pdf")
+        assert inner.gets == 0
+        cache.download_file("doc-2/b.pdf")
+        assert inner.gets == 1
+
+    def test_objects_larger_than_cache_bypass_it(self, inner, tmp_path):
+        cache = DiskCacheStorageService(inner, str(tmp_path), max_bytes=50)
+
+        assert cache.download_file("doc-1/a.pdf") == inner.objects["doc-1/a.pdf"]
+        assert _entries(tmp_path) == []
+
+    def test_index_survives_restart_and_cleans_temp_files(self, cache, inner, tmp_path):
+        cache.download_file("doc-1/a.pdf")
+        (tmp_path / ".tmp-partial").write_bytes(b"half")
+
+        restarted = DiskCacheStorageService(inner, str(tmp_path), max_bytes=1024)
+        restarted.download_file("doc-1/a.pdf")
+
+        assert inner.gets == 1
+        assert not (tmp_path / ".tmp-partial").exists()
+
+    def test_factory_is_opt_in(self, inner, tmp_path, monkeypatch):
+        monkeypatch.delenv("STORAGE_CACHE_DIR", raising=False)
+        assert create_disk_cache(inner) is inner
+
+        monkeypatch.setenv("STORAGE_CACHE_DIR", str(tmp_path / "cache"))
+        assert isinstance(create_disk_cache(inner), DiskCacheStorageService)
@@ -4,6 +4,7 @@ import pytest
 from src.domain.entities.document import DocumentType
 from src.domain.entities.validation_result import ValidationStatus
 from src.domain.services.validation_engine import ValidationEngine
+from src.domain.services.validation_rules import compile_rule_set, parse_number
 
 
 class TestCMRValidation:
@@ -176,6 +177,95 @@ class TestConfigDrivenValidation:
         assert errors == []
 
 
+class TestRuleDSL:
+    """Compiled declarative rules: formats, ranges, patterns, cross-field checks, batches."""
+
+    INVOICE = {"invoice_number": "INV-001", "invoice_date": "15.01.2024"}
+
+    def test_invoice_totals_add_up(self, validation_engine):
+        data = {**self.INVOICE, "subtotal": "€1,000.00", "tax_amount": "190.00", "total_amount": "EUR 1,190.00"}
+        assert validation_engine.validate(DocumentType.INVOICE, data) == []
+
+    def test_invoice_totals_mismatch_is_warning(self, validation_engine):
+        data = {**self.INVOICE, "subtotal": "1000", "tax_amount": "190", "total_amount": "1290"}
+
+        errors = validation_engine.validate(DocumentType.INVOICE, data)
+
+        assert [(e.field, e.severity) for e in errors] == [("total_amount", "warning")]
+        assert validation_engine.get_validation_status(errors) == ValidationStatus.WARNING
+
+    def test_cross_check_skipped_when_a_field_is_missing(self, validation_engine):
+        data = {**self.INVOICE, "tax_amount": "190", "total_amount": "1290"}
+        assert validation_engine.validate(DocumentType.INVOICE, data) == []
+
+    def test_negative_amount_out_of_range(self, validation_engine):
+        errors = validation_engine.validate(DocumentType.INVOICE, {**self.INVOICE, "total_amount": "-5"})
+        assert [(e.field, e.severity) for e in errors] == [("total_amount", "warning")]
+        assert "at least 0" in errors[0].message
+
+    def test_invoice_amount_checks_only_warn_except_unparseable_total(self, validation_engine):
+        data = {**self.INVOICE, "subtotal": "n/a", "tax_amount": "-1", "total_amount": "1000"}
+        errors = validation_engine.validate(DocumentType.INVOICE, data)
+        assert [(e.field, e.severity) for e in errors] == [("subtotal", "warning"), ("tax_amount", "warning")]
+
+        errors = validation_engine.validate(DocumentType.INVOICE, {**self.INVOICE, "total_amount": "n/a"})
+        assert [(e.field, e.severity) for e in errors] == [("total_amount", "error")]
+
+    def test_unrecognised_date_format_is_warning(self, validation_engine):
+        data = {**self.INVOICE, "invoice_date": "sometime in spring", "total_amount": "10"}
+
+        errors = validation_engine.validate(DocumentType.INVOICE, data)
+
+        assert [(e.field, e.severity) for e in errors] == [("invoice_date", "warning")]
+
+    def test_pattern_mismatch_is_warning(self, validation_engine):
+        data = {
+            "awb_number": "020-1234 5675",
+            "shipper_name": "Acme",
+            "consignee_name": "Beta",
+            "airport_of_departure": "FRA",
+        }
+        assert validation_engine.validate(DocumentType.AIR_WAYBILL, data) == []
+
+        errors = validation_engine.validate(DocumentType.AIR_WAYBILL, {**data, "awb_number": "ABC"})
+        assert [(e.field, e.severity) for e in errors] == [("awb_number", "warning")]
+
+    def test_net_weight_above_gross_weight(self, validation_engine):
+        data = {"packing_list_number": "PL-1", "shipper_name": "Acme", "gross_weight": "400", "net_weight": "450"}
+
+        errors = validation_engine.validate(DocumentType.PACKING_LIST, data)
+
+        assert [e.field for e in errors] == ["net_weight"]
+
+    def test_validate_batch_keeps_order(self, validation_engine):
+        results = validation_engine.validate_batch([
+            (DocumentType.DELIVERY_NOTE, {"delivery_date": "2024-03-15", "recipient_name": "Beta"}),
+            (DocumentType.INVOICE, {}),
+            (DocumentType.UNKNOWN, {}),
+        ])
+
+        assert results[0] == []
+        assert {e.field for e in results[1]} == {"invoice_number", "invoice_date", "total_amount"}
+        assert results[2] == []
+
+    def test_custom_rules(self):
+        engine = ValidationEngine(rules={"CMR": {"required_fields": ["reference_number"], "patterns": {"reference_number": r"^CMR-\d+$"}}})
+
+        assert engine.validate(DocumentType.CMR, {"reference_number": "CMR-7"}) == []
+        assert [e.severity for e in engine.validate(DocumentType.CMR, {"reference_number": "7"})] == ["warning"]
+        assert engine.validate(DocumentType.INVOICE, {}) == []
+
+    def test_unknown_cross_check_rejected_at_compile_time(self):
+        with pytest.raises(ValueError):
+            compile_rule_set({"cross_field": [{"check": "avg", "fields": []}]})
+
+    @pytest.mark.parametrize("value,expected", [
+        ("€1,500.00", 1500.0), ("USD 500", 500.0), (42, 42.0), ("12.5 CHF", 12.5), ("n/a", None), (True, None),
+    ])
+    def test_parse_number(self, value, expected):
+        assert parse_number(value) == expected
+
+
 class TestValidationStatus:
     """Test get_validation_status logic."""
 
@@ -57,4 +57,29 @@ client.interceptors.response.use(
   }
 );
 
+// Last ETag + body per URL, for conditional GETs on polled endpoints
+const etagCache = new Map<string, { etag: string; data: unknown }>();
+
+/**
+ * GET with If-None-Match: on 304 the previously cached body is returned,
+ * so callers always receive data without the server re-serializing it.
+ */
+export async function getConditional<T>(url: string): Promise<T> {
+  const cached = etagCache.get(url);
+  const res = await client.get<T>(url, {
+    headers: cached ? { 'If-None-Match': cached.etag } : undefined,
+    validateStatus: (s) => (s >= 200 && s < 300) || (s === 304 && !!cached),
+  });
+  if (res.status === 304 && cached) {
+    return cached.data as T;
+  }
+  const etag = res.headers.etag as string | undefined;
+  if (etag) {
+    etagCache.set(url, { etag, data: res.data });
+  } else {
+    etagCache.delete(url);
+  }
+  return res.data;
+}
+
 export default client;
@@ -0,0 +1,83 @@
+import React, { useEffect, useState } from 'react';
+import { ChevronLeft, ChevronRight } from 'lucide-react';
+import { getPagePreviews, getPagePreviewUrl, PagePreviewManifest } from '../../services/documents';
+import Button from './Button';
+import { Card } from './Card';
+import { Skeleton } from './Skeleton';
+
+interface PagePreviewProps {
+  documentId: string;
+  /** Change to re-check for previews (e.g. the document status). */
+  refreshKey?: string;
+}
+
+/** Low-resolution page images of a document; renders nothing until previews exist. */
+const PagePreview: React.FC<PagePreviewProps> = ({ documentId, refreshKey }) => {
+  const [manifest, setManifest] = useState<PagePreviewManifest | null>(null);
+  const [page, setPage] = useState(1);
+  const [imageUrl, setImageUrl] = useState<string | null>(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    getPagePreviews(documentId)
+      .then((m) => { if (!cancelled) setManifest(m); })
+      .catch(() => { /* not rendered yet */ });
+    return () => { cancelled = true; };
+  }, [documentId, refreshKey]);
+
+  useEffect(() => {
+    if (!manifest) return;
+    let cancelled = false;
+    let url: string | null = null;
+    setImageUrl(null);
+    getPagePreviewUrl(documentId, page)
+      .then((u) => {
+        url = u;
+        if (!cancelled) setImageUrl(u);
+      })
+      .catch(() => { /* leave the placeholder */ });
+    return () => {
+      cancelled = true;
+      if (url) URL.revokeObjectURL(url);
+    };
+  }, [documentId, manifest, page]);
+
+  if (!manifest || manifest.page_count === 0) return null;
+
+  return (
+    <Card className="mb-4">
+      <div className="flex items-center justify-between mb-3">
+        <span className="text-sm font-medium text-slate-700">
+          Page {page} of {manifest.page_count}
+        </span>
+        <div className="flex items-center gap-2">
+          <Button
+            variant="ghost"
+            size="sm"
+            disabled={page <= 1}
+            onClick={() => setPage((p) => p - 1)}
+            icon={<ChevronLeft className="h-4 w-4" />}
+          >
+            Prev
+          </Button>
+          <Button
+            variant="ghost"
+            size="sm"
+            disabled={page >= manifest.page_count}
+            onClick={() => setPage((p) => p + 1)}
+            icon={<ChevronRight className="h-4 w-4" />}
+          >
+            Next
+          </Button>
+        </div>
+      </div>
+      {imageUrl ? (
+        <img src={imageUrl} alt={`Page ${page}`} className="mx-auto max-h-[70vh] border border-slate-200 rounded" />
+      ) : (
+        <Skeleton className="h-96 w-full" />
+      )}
+    </Card>
+  );
+};
+
+export default PagePreview;
@@ -2,6 +2,8 @@ import { useState, useEffect, useCallback, useMemo } from 'react';
 import * as extractionsService from '../services/extractions';
 import * as validationService from '../services/validation';
 import * as reviewsService from '../services/reviews';
+import { documentEventsUrl, DocumentEvent } from '../services/events';
+import { useEventStream } from './useEventStream';
 import { EXTRACTION_REFRESH_DELAY_MS } from '../constants';
 
 const REVIEW_STATUSES = new Set(['REVIEWED', 'EXPORTED']);
@@ -13,18 +15,22 @@ export function useDocumentReview(documentId: string | undefined, documentStatus
   const [corrections, setCorrections] = useState<Record<string, string>>({});
   const [loading, setLoading] = useState(true);
   const [saving, setSaving] = useState(false);
+  const [lastEvent, setLastEvent] = useState<DocumentEvent | null>(null);
 
   const fetchData = useCallback(async () => {
     if (!documentId) return;
     setLoading(true);
     try {
-      const ext = await extractionsService.getExtraction(documentId).catch(() => null);
+      const ext = await extractionsService.getExtractionSummary(documentId).catch(() => null);
       if (ext) {
         setExtraction(ext);
         setCorrections((ext.structured_data as Record<string, string>) || {});
         const hasStructured = ext.structured_data && Object.keys(ext.structured_data).length > 0;
         if (hasStructured) {
           validationService.getValidation(documentId).then((v) => setValidation(v)).catch(() => {});
+        } else {
+          // Raw text and metadata are only shown when nothing was extracted
+          extractionsService.getExtraction(documentId).then((full) => setExtraction(full)).catch(() => {});
         }
       } else {
         setExtraction(null);
@@ -55,6 +61,15 @@ export function useDocumentReview(documentId: string | undefined, documentStatus
     fetchData();
   }, [fetchData]);
 
+  // Pipeline events pushed by the server replace polling while connected
+  const live = useEventStream(documentId ? documentEventsUrl(documentId) : null, (event) => {
+    setLastEvent(event);
+    if (event.type === 'ExtractionCompleted') {
+      setValidation(null);
+      fetchData();
+    }
+  });
+
   useEffect(() => {
     if (documentStatus && REVIEW_STATUSES.has(documentStatus)) {
       fetchReview();
@@ -122,5 +137,7 @@ export function useDocumentReview(documentId: string | undefined, documentStatus
     loading,
     saving,
     canSave,
+    lastEvent,
+    live,
   };
 }
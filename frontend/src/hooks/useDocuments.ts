@@ -1,5 +1,7 @@
 import { useState, useEffect, useCallback } from 'react';
 import * as documentsService from '../services/documents';
+import { myEventsUrl } from '../services/events';
+import { useEventStream } from './useEventStream';
 
 export interface DocumentFilters {
   status?: string;
@@ -36,6 +38,16 @@ export function useDocuments(params?: { limit?: number; filters?: DocumentFilter
     refresh();
   }, [refresh]);
 
+  // Apply status changes of the user's documents in place; reload the list on new uploads
+  useEventStream(myEventsUrl(), (event) => {
+    if (event.type === 'DocumentStatusChanged' && event.status) {
+      const status = event.status;
+      setDocuments((prev) => prev.map((d) => (d.id === event.document_id ? { ...d, status } : d)));
+    } else if (event.type === 'DocumentUploaded') {
+      refresh();
+    }
+  });
+
   const deleteDocument = useCallback(async (id: string) => {
     await documentsService.deleteDocument(id);
     await refresh();
@@ -0,0 +1,33 @@
+import { useState, useEffect, useRef } from 'react';
+import type { DocumentEvent } from '../services/events';
+
+/**
+ * Subscribes to a server-sent event stream and calls `onEvent` for every event.
+ * Returns whether the stream is currently connected, so callers can fall back
+ * to polling while it is not. Pass `null` to stay unsubscribed.
+ */
+export function useEventStream(url: string | null, onEvent: (event: DocumentEvent) => void): boolean {
+  const [connected, setConnected] = useState(false);
+  const onEventRef = useRef(onEvent);
+  onEventRef.current = onEvent;
+
+  useEffect(() => {
+    if (!url || typeof EventSource === 'undefined') return;
+    const source = new EventSource(url);
+    source.onopen = () => setConnected(true);
+    source.onerror = () => setConnected(false); // browser reconnects on its own
+    source.onmessage = (msg) => {
+      try {
+        onEventRef.current(JSON.parse(msg.data) as DocumentEvent);
+      } catch {
+        // ignore malformed events
+      }
+    };
+    return () => {
+      source.close();
+      setConnected(false);
+    };
+  }, [url]);
+
+  return connected;
+}
@@ -22,6 +22,7 @@ import TopBar from '../components/layout/TopBar';
 import { Card } from '../components/ui/Card';
 import Button from '../components/ui/Button';
 import PipelineSteps from '../components/ui/PipelineSteps';
+import PagePreview from '../components/ui/PagePreview';
 import ConfidenceBar from '../components/ui/ConfidenceBar';
 import { Skeleton } from '../components/ui/Skeleton';
 
@@ -101,6 +102,8 @@ const DocumentReview: React.FC = () => {
     loading,
     saving,
     canSave,
+    lastEvent,
+    live,
   } = useDocumentReview(documentId, documentStatus);
   const [documentFilename, setDocumentFilename] = useState<string | null>(null);
   const [refreshing, setRefreshing] = useState(false);
@@ -132,10 +135,17 @@ const DocumentReview: React.FC = () => {
   }, [refreshDocumentStatus]);
 
   useEffect(() => {
-    if (documentStatus !== 'PROCESSING') return;
+    if (lastEvent?.type === 'DocumentStatusChanged' && lastEvent.status) {
+      setDocumentStatus(lastEvent.status);
+    }
+  }, [lastEvent]);
+
+  // Fallback polling, only while the event stream is unavailable
+  useEffect(() => {
+    if (documentStatus !== 'PROCESSING' || live) return;
     const t = setInterval(refreshData, 5000);
     return () => clearInterval(t);
-  }, [documentStatus, refreshData]);
+  }, [documentStatus, live, refreshData]);
 
   const handleRestartProcessing = useCallback(async () => {
     if (!documentId) return;
@@ -242,6 +252,9 @@ const DocumentReview: React.FC = () => {
         <PipelineSteps stages={PIPELINE_STAGES} currentStatus={documentStatus} />
       </Card>
 
+      {/* Page previews */}
+      {documentId && <PagePreview documentId={documentId} refreshKey={documentStatus ?? undefined} />}
+
       {/* Processing banner */}
       {isProcessing && (
         <div className="mb-4 flex items-center gap-3 px-4 py-3 rounded-xl bg-brand-50 border border-brand-200 text-brand-700">
@@ -21,7 +21,7 @@ const DocumentUpload: React.FC = () => {
     }
     setUploading(true);
     try {
-      await documentsService.uploadDocument(file);
+      await documentsService.uploadDocumentDirect(file);
       toast.success('Document uploaded successfully');
       navigate('/dashboard');
     } catch (err) {
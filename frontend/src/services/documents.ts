@@ -1,4 +1,4 @@
-import client from '../api/client';
+import client, { getConditional } from '../api/client';
 
 export interface Document {
   id: string;
@@ -41,8 +41,70 @@ export function uploadDocument(file: File): Promise<Document> {
   return client.post<Document>('/documents', form, { headers: { 'Content-Type': 'multipart/form-data' } }).then((r) => r.data);
 }
 
+export interface BulkUploadResponse {
+  documents: Document[];
+  rejected: { filename: string; error: string }[];
+  total_files: number;
+  accepted: number;
+  total_bytes: number;
+  elapsed_seconds: number;
+  files_per_second: number;
+  megabytes_per_second: number;
+}
+
+/** Upload many files and/or .zip archives in one request. */
+export function uploadDocumentsBulk(files: File[]): Promise<BulkUploadResponse> {
+  const form = new FormData();
+  files.forEach((f) => form.append('files', f));
+  return client.post<BulkUploadResponse>('/documents/bulk', form, { headers: { 'Content-Type': 'multipart/form-data' } }).then((r) => r.data);
+}
+
+export interface DirectUpload {
+  document_id: string;
+  upload_url: string;
+  method: string;
+  upload_token: string;
+  expires_at: string;
+}
+
+/**
+ * Upload a file straight to object storage via a presigned URL, then let the
+ * API validate it and create the document. Falls back to a regular upload
+ * when direct uploads are not configured (501).
+ */
+export async function uploadDocumentDirect(file: File): Promise<Document> {
+  let upload: DirectUpload;
+  try {
+    upload = (await client.post<DirectUpload>('/documents/uploads', { filename: file.name, file_size: file.size })).data;
+  } catch (err: any) {
+    if (err?.response?.status === 501) return uploadDocument(file);
+    throw err;
+  }
+  const put = await fetch(upload.upload_url, { method: upload.method, body: file });
+  if (!put.ok) throw new Error(`Upload to storage failed (${put.status})`);
+  return client.post<Document>('/documents/uploads/finalize', { upload_token: upload.upload_token }).then((r) => r.data);
+}
+
 export function getDocument(id: string): Promise<Document> {
-  return client.get<Document>(`/documents/${id}`).then((r) => r.data);
+  return getConditional<Document>(`/documents/${id}`);
+}
+
+export interface PagePreviewManifest {
+  page_count: number;
+  format: string;
+  pages: { page: number; width: number; height: number }[];
+}
+
+/** Preview manifest; rejects with 404 until the preview worker has rendered the pages. */
+export function getPagePreviews(id: string): Promise<PagePreviewManifest> {
+  return client.get<PagePreviewManifest>(`/documents/${id}/previews`).then((r) => r.data);
+}
+
+/** Fetch one page preview (1-based) and return an object URL; revoke it when done. */
+export function getPagePreviewUrl(id: string, page: number): Promise<string> {
+  return client
+    .get<Blob>(`/documents/${id}/previews/${page}`, { responseType: 'blob' })
+    .then((r) => URL.createObjectURL(r.data));
 }
 
 export function deleteDocument(id: string): Promise<{ message: string }> {
@@ -0,0 +1,23 @@
+/** Server-sent document pipeline events (see backend api/routes/events.py). */
+
+export interface DocumentEvent {
+  type: string; // DocumentStatusChanged | DocumentUploaded | ExtractionCompleted | ValidationCompleted | ...
+  document_id: string;
+  status?: string;
+  timestamp: string;
+  [key: string]: unknown;
+}
+
+function streamUrl(path: string): string {
+  // EventSource cannot send an Authorization header
+  const token = localStorage.getItem('access_token') ?? '';
+  return `/api/v1${path}?access_token=${encodeURIComponent(token)}`;
+}
+
+export function documentEventsUrl(documentId: string): string {
+  return streamUrl(`/events/documents/${documentId}`);
+}
+
+export function myEventsUrl(): string {
+  return streamUrl('/events/me');
+}
@@ -1,4 +1,4 @@
-import client from '../api/client';
+import client, { getConditional } from '../api/client';
 
 export interface Extraction {
   id: string;
@@ -11,8 +11,15 @@ export interface Extraction {
   extraction_metadata?: Record<string, unknown>;
 }
 
+export type ExtractionSummary = Omit<Extraction, 'raw_text' | 'extraction_metadata'>;
+
 export function getExtraction(documentId: string): Promise<Extraction> {
-  return client.get<Extraction>(`/documents/${documentId}/extraction`).then((r) => r.data);
+  return getConditional<Extraction>(`/documents/${documentId}/extraction`);
+}
+
+/** Extraction without raw OCR text and metadata; cheap enough to poll. */
+export function getExtractionSummary(documentId: string): Promise<ExtractionSummary> {
+  return getConditional<ExtractionSummary>(`/documents/${documentId}/extraction/summary`);
 }
 
 export function retryExtraction(documentId: string): Promise<Extraction> {
@@ -1,4 +1,4 @@
-import client from '../api/client';
+import { getConditional } from '../api/client';
 
 export interface ValidationErrorItem {
   field: string;
@@ -12,5 +12,5 @@ export interface ValidationResult {
 }
 
 export function getValidation(documentId: string): Promise<ValidationResult> {
-  return client.get<ValidationResult>(`/documents/${documentId}/validation`).then((r) => r.data);
+  return getConditional<ValidationResult>(`/documents/${documentId}/validation`);
 }